@@ -90,8 +90,11 @@ type AnalyzeDataResponse struct {
 	Error              *ErrorDetails                  `protobuf:"bytes,5,opt,name=error,proto3" json:"error,omitempty"`
 	// Добавляем результаты тестов Вилкоксона
 	WilcoxonTests *WilcoxonTestsResponse `protobuf:"bytes,6,opt,name=wilcoxon_tests,json=wilcoxonTests,proto3" json:"wilcoxon_tests,omitempty"`
-	unknownFields protoimpl.UnknownFields
-	sizeCache     protoimpl.SizeCache
+	// Разделы, вычисленные приближенно: упрощенным вариантом из-за ограничения времени (time_budget_ms)
+	// или по случайной выборке строк (sample_size)
+	Approximations []*ApproximationInfo `protobuf:"bytes,7,rep,name=approximations,proto3" json:"approximations,omitempty"`
+	unknownFields  protoimpl.UnknownFields
+	sizeCache      protoimpl.SizeCache
 }
 
 func (x *AnalyzeDataResponse) Reset() {
@@ -166,30 +169,42 @@ func (x *AnalyzeDataResponse) GetWilcoxonTests() *WilcoxonTestsResponse {
 	return nil
 }
 
-// Ошибка, которая может возникнуть при анализе данных
-type ErrorDetails struct {
-	state         protoimpl.MessageState `protogen:"open.v1"`
-	Code          string                 `protobuf:"bytes,1,opt,name=code,proto3" json:"code,omitempty"`       // Код ошибки
-	Message       string                 `protobuf:"bytes,2,opt,name=message,proto3" json:"message,omitempty"` // Сообщение об ошибке
-	Details       []string               `protobuf:"bytes,3,rep,name=details,proto3" json:"details,omitempty"` // Дополнительные детали (например, стек вызовов)
-	unknownFields protoimpl.UnknownFields
-	sizeCache     protoimpl.SizeCache
+func (x *AnalyzeDataResponse) GetApproximations() []*ApproximationInfo {
+	if x != nil {
+		return x.Approximations
+	}
+	return nil
 }
 
-func (x *ErrorDetails) Reset() {
-	*x = ErrorDetails{}
+// Отметка о приближенном результате раздела анализа
+type ApproximationInfo struct {
+	state          protoimpl.MessageState `protogen:"open.v1"`
+	Section        string                 `protobuf:"bytes,1,opt,name=section,proto3" json:"section,omitempty"`                                      // Раздел анализа (normality_test, regression, ...)
+	Variant        string                 `protobuf:"bytes,2,opt,name=variant,proto3" json:"variant,omitempty"`                                      // Упрощенный вариант (sampled, single_start, linear_only) или метод выборки строк (reservoir, stratified)
+	Description    string                 `protobuf:"bytes,3,opt,name=description,proto3" json:"description,omitempty"`                              // Что именно упрощено
+	Variables      []string               `protobuf:"bytes,4,rep,name=variables,proto3" json:"variables,omitempty"`                                  // Переменные, результаты по которым приближенные (пусто - весь раздел)
+	SampleSize     int64                  `protobuf:"varint,5,opt,name=sample_size,json=sampleSize,proto3" json:"sample_size,omitempty"`             // Размер выборки, если вычисления велись по выборке
+	PopulationSize int64                  `protobuf:"varint,6,opt,name=population_size,json=populationSize,proto3" json:"population_size,omitempty"` // Количество строк исходных данных при выборке строк
+	Estimates      []*EstimateError       `protobuf:"bytes,7,rep,name=estimates,proto3" json:"estimates,omitempty"`                                  // Стандартные ошибки и границы оценок по выборке строк
+	RankError      float64                `protobuf:"fixed64,8,opt,name=rank_error,json=rankError,proto3" json:"rank_error,omitempty"`               // Граница нормированной ошибки ранга квантилей, оцененных скетчем (0 - квантили точные)
+	unknownFields  protoimpl.UnknownFields
+	sizeCache      protoimpl.SizeCache
+}
+
+func (x *ApproximationInfo) Reset() {
+	*x = ApproximationInfo{}
 	mi := &file_proto_analysis_proto_msgTypes[2]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *ErrorDetails) String() string {
+func (x *ApproximationInfo) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*ErrorDetails) ProtoMessage() {}
+func (*ApproximationInfo) ProtoMessage() {}
 
-func (x *ErrorDetails) ProtoReflect() protoreflect.Message {
+func (x *ApproximationInfo) ProtoReflect() protoreflect.Message {
 	mi := &file_proto_analysis_proto_msgTypes[2]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -201,56 +216,94 @@ func (x *ErrorDetails) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use ErrorDetails.ProtoReflect.Descriptor instead.
-func (*ErrorDetails) Descriptor() ([]byte, []int) {
+// Deprecated: Use ApproximationInfo.ProtoReflect.Descriptor instead.
+func (*ApproximationInfo) Descriptor() ([]byte, []int) {
 	return file_proto_analysis_proto_rawDescGZIP(), []int{2}
 }
 
-func (x *ErrorDetails) GetCode() string {
+func (x *ApproximationInfo) GetSection() string {
 	if x != nil {
-		return x.Code
+		return x.Section
 	}
 	return ""
 }
 
-func (x *ErrorDetails) GetMessage() string {
+func (x *ApproximationInfo) GetVariant() string {
 	if x != nil {
-		return x.Message
+		return x.Variant
 	}
 	return ""
 }
 
-func (x *ErrorDetails) GetDetails() []string {
+func (x *ApproximationInfo) GetDescription() string {
 	if x != nil {
-		return x.Details
+		return x.Description
+	}
+	return ""
+}
+
+func (x *ApproximationInfo) GetVariables() []string {
+	if x != nil {
+		return x.Variables
 	}
 	return nil
 }
 
-// ------------------ Описательные статистики ------------------
-type DescriptiveStatisticsResponse struct {
-	state               protoimpl.MessageState   `protogen:"open.v1"`
-	Descriptives        []*DescriptiveStatistics `protobuf:"bytes,1,rep,name=descriptives,proto3" json:"descriptives,omitempty"`
-	Histograms          []*HistogramData         `protobuf:"bytes,2,rep,name=histograms,proto3" json:"histograms,omitempty"`
-	ConfidenceIntervals []*ConfidenceInterval    `protobuf:"bytes,4,rep,name=confidence_intervals,json=confidenceIntervals,proto3" json:"confidence_intervals,omitempty"`
-	unknownFields       protoimpl.UnknownFields
-	sizeCache           protoimpl.SizeCache
+func (x *ApproximationInfo) GetSampleSize() int64 {
+	if x != nil {
+		return x.SampleSize
+	}
+	return 0
 }
 
-func (x *DescriptiveStatisticsResponse) Reset() {
-	*x = DescriptiveStatisticsResponse{}
+func (x *ApproximationInfo) GetPopulationSize() int64 {
+	if x != nil {
+		return x.PopulationSize
+	}
+	return 0
+}
+
+func (x *ApproximationInfo) GetEstimates() []*EstimateError {
+	if x != nil {
+		return x.Estimates
+	}
+	return nil
+}
+
+func (x *ApproximationInfo) GetRankError() float64 {
+	if x != nil {
+		return x.RankError
+	}
+	return 0
+}
+
+// Погрешность оценки, вычисленной по выборке строк
+type EstimateError struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	VariableName  string                 `protobuf:"bytes,1,opt,name=variable_name,json=variableName,proto3" json:"variable_name,omitempty"`
+	Statistic     string                 `protobuf:"bytes,2,opt,name=statistic,proto3" json:"statistic,omitempty"` // mean, std_dev, q1, median, q3, correlation, intercept, slope
+	Estimate      float64                `protobuf:"fixed64,3,opt,name=estimate,proto3" json:"estimate,omitempty"`
+	StandardError float64                `protobuf:"fixed64,4,opt,name=standard_error,json=standardError,proto3" json:"standard_error,omitempty"`
+	LowerBound    float64                `protobuf:"fixed64,5,opt,name=lower_bound,json=lowerBound,proto3" json:"lower_bound,omitempty"` // Границы 95% интервала (для скетча квантилей - значения на рангах p ± rank_error)
+	UpperBound    float64                `protobuf:"fixed64,6,opt,name=upper_bound,json=upperBound,proto3" json:"upper_bound,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *EstimateError) Reset() {
+	*x = EstimateError{}
 	mi := &file_proto_analysis_proto_msgTypes[3]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
 
-func (x *DescriptiveStatisticsResponse) String() string {
+func (x *EstimateError) String() string {
 	return protoimpl.X.MessageStringOf(x)
 }
 
-func (*DescriptiveStatisticsResponse) ProtoMessage() {}
+func (*EstimateError) ProtoMessage() {}
 
-func (x *DescriptiveStatisticsResponse) ProtoReflect() protoreflect.Message {
+func (x *EstimateError) ProtoReflect() protoreflect.Message {
 	mi := &file_proto_analysis_proto_msgTypes[3]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
@@ -262,28 +315,745 @@ func (x *DescriptiveStatisticsResponse) ProtoReflect() protoreflect.Message {
 	return mi.MessageOf(x)
 }
 
-// Deprecated: Use DescriptiveStatisticsResponse.ProtoReflect.Descriptor instead.
-func (*DescriptiveStatisticsResponse) Descriptor() ([]byte, []int) {
+// Deprecated: Use EstimateError.ProtoReflect.Descriptor instead.
+func (*EstimateError) Descriptor() ([]byte, []int) {
 	return file_proto_analysis_proto_rawDescGZIP(), []int{3}
 }
 
-func (x *DescriptiveStatisticsResponse) GetDescriptives() []*DescriptiveStatistics {
+func (x *EstimateError) GetVariableName() string {
+	if x != nil {
+		return x.VariableName
+	}
+	return ""
+}
+
+func (x *EstimateError) GetStatistic() string {
+	if x != nil {
+		return x.Statistic
+	}
+	return ""
+}
+
+func (x *EstimateError) GetEstimate() float64 {
+	if x != nil {
+		return x.Estimate
+	}
+	return 0
+}
+
+func (x *EstimateError) GetStandardError() float64 {
+	if x != nil {
+		return x.StandardError
+	}
+	return 0
+}
+
+func (x *EstimateError) GetLowerBound() float64 {
+	if x != nil {
+		return x.LowerBound
+	}
+	return 0
+}
+
+func (x *EstimateError) GetUpperBound() float64 {
+	if x != nil {
+		return x.UpperBound
+	}
+	return 0
+}
+
+// Промежуточный результат онлайн-агрегации
+type ProgressiveUpdate struct {
+	state          protoimpl.MessageState `protogen:"open.v1"`
+	RowsProcessed  int64                  `protobuf:"varint,1,opt,name=rows_processed,json=rowsProcessed,proto3" json:"rows_processed,omitempty"`    // Обработано строк (в случайном порядке)
+	PopulationSize int64                  `protobuf:"varint,2,opt,name=population_size,json=populationSize,proto3" json:"population_size,omitempty"` // Всего строк в данных
+	Estimates      []*EstimateError       `protobuf:"bytes,3,rep,name=estimates,proto3" json:"estimates,omitempty"`                                  // Оценки и 95% границы с поправкой на конечную совокупность
+	Final          bool                   `protobuf:"varint,4,opt,name=final,proto3" json:"final,omitempty"`                                         // Обработаны все строки: оценки точные
+	ProcessingLog  []string               `protobuf:"bytes,5,rep,name=processing_log,json=processingLog,proto3" json:"processing_log,omitempty"`
+	Error          *ErrorDetails          `protobuf:"bytes,6,opt,name=error,proto3" json:"error,omitempty"`
+	unknownFields  protoimpl.UnknownFields
+	sizeCache      protoimpl.SizeCache
+}
+
+func (x *ProgressiveUpdate) Reset() {
+	*x = ProgressiveUpdate{}
+	mi := &file_proto_analysis_proto_msgTypes[4]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ProgressiveUpdate) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ProgressiveUpdate) ProtoMessage() {}
+
+func (x *ProgressiveUpdate) ProtoReflect() protoreflect.Message {
+	mi := &file_proto_analysis_proto_msgTypes[4]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ProgressiveUpdate.ProtoReflect.Descriptor instead.
+func (*ProgressiveUpdate) Descriptor() ([]byte, []int) {
+	return file_proto_analysis_proto_rawDescGZIP(), []int{4}
+}
+
+func (x *ProgressiveUpdate) GetRowsProcessed() int64 {
+	if x != nil {
+		return x.RowsProcessed
+	}
+	return 0
+}
+
+func (x *ProgressiveUpdate) GetPopulationSize() int64 {
+	if x != nil {
+		return x.PopulationSize
+	}
+	return 0
+}
+
+func (x *ProgressiveUpdate) GetEstimates() []*EstimateError {
+	if x != nil {
+		return x.Estimates
+	}
+	return nil
+}
+
+func (x *ProgressiveUpdate) GetFinal() bool {
+	if x != nil {
+		return x.Final
+	}
+	return false
+}
+
+func (x *ProgressiveUpdate) GetProcessingLog() []string {
+	if x != nil {
+		return x.ProcessingLog
+	}
+	return nil
+}
+
+func (x *ProgressiveUpdate) GetError() *ErrorDetails {
+	if x != nil {
+		return x.Error
+	}
+	return nil
+}
+
+// Запрос к набору данных, хранимому на сервере
+type DatasetRequest struct {
+	state            protoimpl.MessageState `protogen:"open.v1"`
+	DatasetId        string                 `protobuf:"bytes,1,opt,name=dataset_id,json=datasetId,proto3" json:"dataset_id,omitempty"`       // Пусто при создании - идентификатор генерируется
+	FileContent      []byte                 `protobuf:"bytes,2,opt,name=file_content,json=fileContent,proto3" json:"file_content,omitempty"` // Исходные (CreateDataset) или добавляемые (AppendRows) строки
+	FileName         string                 `protobuf:"bytes,3,opt,name=file_name,json=fileName,proto3" json:"file_name,omitempty"`
+	SelectedAnalyses []string               `protobuf:"bytes,4,rep,name=selected_analyses,json=selectedAnalyses,proto3" json:"selected_analyses,omitempty"` // regression_dependent:/regression_independent: - пара для регрессии МНК
+	unknownFields    protoimpl.UnknownFields
+	sizeCache        protoimpl.SizeCache
+}
+
+func (x *DatasetRequest) Reset() {
+	*x = DatasetRequest{}
+	mi := &file_proto_analysis_proto_msgTypes[5]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *DatasetRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*DatasetRequest) ProtoMessage() {}
+
+func (x *DatasetRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_proto_analysis_proto_msgTypes[5]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use DatasetRequest.ProtoReflect.Descriptor instead.
+func (*DatasetRequest) Descriptor() ([]byte, []int) {
+	return file_proto_analysis_proto_rawDescGZIP(), []int{5}
+}
+
+func (x *DatasetRequest) GetDatasetId() string {
+	if x != nil {
+		return x.DatasetId
+	}
+	return ""
+}
+
+func (x *DatasetRequest) GetFileContent() []byte {
+	if x != nil {
+		return x.FileContent
+	}
+	return nil
+}
+
+func (x *DatasetRequest) GetFileName() string {
+	if x != nil {
+		return x.FileName
+	}
+	return ""
+}
+
+func (x *DatasetRequest) GetSelectedAnalyses() []string {
+	if x != nil {
+		return x.SelectedAnalyses
+	}
+	return nil
+}
+
+// Статистики набора данных после создания или добавления строк
+type DatasetResponse struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	DatasetId     string                 `protobuf:"bytes,1,opt,name=dataset_id,json=datasetId,proto3" json:"dataset_id,omitempty"`
+	RowCount      int64                  `protobuf:"varint,2,opt,name=row_count,json=rowCount,proto3" json:"row_count,omitempty"`             // Всего строк в наборе данных
+	AppendedRows  int64                  `protobuf:"varint,3,opt,name=appended_rows,json=appendedRows,proto3" json:"appended_rows,omitempty"` // Строк добавлено этим запросом
+	Analysis      *AnalyzeDataResponse   `protobuf:"bytes,4,opt,name=analysis,proto3" json:"analysis,omitempty"`                              // Описательные статистики, гистограммы, регрессия, журнал и ошибка
+	Correlations  []*CorrelationResult   `protobuf:"bytes,5,rep,name=correlations,proto3" json:"correlations,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *DatasetResponse) Reset() {
+	*x = DatasetResponse{}
+	mi := &file_proto_analysis_proto_msgTypes[6]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *DatasetResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*DatasetResponse) ProtoMessage() {}
+
+func (x *DatasetResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_proto_analysis_proto_msgTypes[6]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use DatasetResponse.ProtoReflect.Descriptor instead.
+func (*DatasetResponse) Descriptor() ([]byte, []int) {
+	return file_proto_analysis_proto_rawDescGZIP(), []int{6}
+}
+
+func (x *DatasetResponse) GetDatasetId() string {
+	if x != nil {
+		return x.DatasetId
+	}
+	return ""
+}
+
+func (x *DatasetResponse) GetRowCount() int64 {
+	if x != nil {
+		return x.RowCount
+	}
+	return 0
+}
+
+func (x *DatasetResponse) GetAppendedRows() int64 {
+	if x != nil {
+		return x.AppendedRows
+	}
+	return 0
+}
+
+func (x *DatasetResponse) GetAnalysis() *AnalyzeDataResponse {
+	if x != nil {
+		return x.Analysis
+	}
+	return nil
+}
+
+func (x *DatasetResponse) GetCorrelations() []*CorrelationResult {
+	if x != nil {
+		return x.Correlations
+	}
+	return nil
+}
+
+// Коэффициент корреляции Пирсона пары переменных
+type CorrelationResult struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	VariableX     string                 `protobuf:"bytes,1,opt,name=variable_x,json=variableX,proto3" json:"variable_x,omitempty"`
+	VariableY     string                 `protobuf:"bytes,2,opt,name=variable_y,json=variableY,proto3" json:"variable_y,omitempty"`
+	Count         int64                  `protobuf:"varint,3,opt,name=count,proto3" json:"count,omitempty"` // Строк, где заданы обе переменные
+	Correlation   float64                `protobuf:"fixed64,4,opt,name=correlation,proto3" json:"correlation,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *CorrelationResult) Reset() {
+	*x = CorrelationResult{}
+	mi := &file_proto_analysis_proto_msgTypes[7]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *CorrelationResult) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*CorrelationResult) ProtoMessage() {}
+
+func (x *CorrelationResult) ProtoReflect() protoreflect.Message {
+	mi := &file_proto_analysis_proto_msgTypes[7]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use CorrelationResult.ProtoReflect.Descriptor instead.
+func (*CorrelationResult) Descriptor() ([]byte, []int) {
+	return file_proto_analysis_proto_rawDescGZIP(), []int{7}
+}
+
+func (x *CorrelationResult) GetVariableX() string {
+	if x != nil {
+		return x.VariableX
+	}
+	return ""
+}
+
+func (x *CorrelationResult) GetVariableY() string {
+	if x != nil {
+		return x.VariableY
+	}
+	return ""
+}
+
+func (x *CorrelationResult) GetCount() int64 {
+	if x != nil {
+		return x.Count
+	}
+	return 0
+}
+
+func (x *CorrelationResult) GetCorrelation() float64 {
+	if x != nil {
+		return x.Correlation
+	}
+	return 0
+}
+
+// Ошибка, которая может возникнуть при анализе данных
+type ErrorDetails struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Code          string                 `protobuf:"bytes,1,opt,name=code,proto3" json:"code,omitempty"`       // Код ошибки
+	Message       string                 `protobuf:"bytes,2,opt,name=message,proto3" json:"message,omitempty"` // Сообщение об ошибке
+	Details       []string               `protobuf:"bytes,3,rep,name=details,proto3" json:"details,omitempty"` // Дополнительные детали (например, стек вызовов)
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *ErrorDetails) Reset() {
+	*x = ErrorDetails{}
+	mi := &file_proto_analysis_proto_msgTypes[8]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ErrorDetails) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ErrorDetails) ProtoMessage() {}
+
+func (x *ErrorDetails) ProtoReflect() protoreflect.Message {
+	mi := &file_proto_analysis_proto_msgTypes[8]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ErrorDetails.ProtoReflect.Descriptor instead.
+func (*ErrorDetails) Descriptor() ([]byte, []int) {
+	return file_proto_analysis_proto_rawDescGZIP(), []int{8}
+}
+
+func (x *ErrorDetails) GetCode() string {
+	if x != nil {
+		return x.Code
+	}
+	return ""
+}
+
+func (x *ErrorDetails) GetMessage() string {
+	if x != nil {
+		return x.Message
+	}
+	return ""
+}
+
+func (x *ErrorDetails) GetDetails() []string {
+	if x != nil {
+		return x.Details
+	}
+	return nil
+}
+
+// ------------------ Описательные статистики ------------------
+type DescriptiveStatisticsResponse struct {
+	state               protoimpl.MessageState          `protogen:"open.v1"`
+	Descriptives        []*DescriptiveStatistics        `protobuf:"bytes,1,rep,name=descriptives,proto3" json:"descriptives,omitempty"`
+	Histograms          []*HistogramData                `protobuf:"bytes,2,rep,name=histograms,proto3" json:"histograms,omitempty"`
+	ConfidenceIntervals []*ConfidenceInterval           `protobuf:"bytes,4,rep,name=confidence_intervals,json=confidenceIntervals,proto3" json:"confidence_intervals,omitempty"`
+	GroupedDescriptives []*GroupedDescriptiveStatistics `protobuf:"bytes,5,rep,name=grouped_descriptives,json=groupedDescriptives,proto3" json:"grouped_descriptives,omitempty"` // Заполняется при параметре group_by:<столбец>
+	Outliers            []*OutlierSummary               `protobuf:"bytes,6,rep,name=outliers,proto3" json:"outliers,omitempty"`
+	unknownFields       protoimpl.UnknownFields
+	sizeCache           protoimpl.SizeCache
+}
+
+func (x *DescriptiveStatisticsResponse) Reset() {
+	*x = DescriptiveStatisticsResponse{}
+	mi := &file_proto_analysis_proto_msgTypes[9]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *DescriptiveStatisticsResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*DescriptiveStatisticsResponse) ProtoMessage() {}
+
+func (x *DescriptiveStatisticsResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_proto_analysis_proto_msgTypes[9]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use DescriptiveStatisticsResponse.ProtoReflect.Descriptor instead.
+func (*DescriptiveStatisticsResponse) Descriptor() ([]byte, []int) {
+	return file_proto_analysis_proto_rawDescGZIP(), []int{9}
+}
+
+func (x *DescriptiveStatisticsResponse) GetDescriptives() []*DescriptiveStatistics {
+	if x != nil {
+		return x.Descriptives
+	}
+	return nil
+}
+
+func (x *DescriptiveStatisticsResponse) GetHistograms() []*HistogramData {
+	if x != nil {
+		return x.Histograms
+	}
+	return nil
+}
+
+func (x *DescriptiveStatisticsResponse) GetConfidenceIntervals() []*ConfidenceInterval {
+	if x != nil {
+		return x.ConfidenceIntervals
+	}
+	return nil
+}
+
+func (x *DescriptiveStatisticsResponse) GetGroupedDescriptives() []*GroupedDescriptiveStatistics {
+	if x != nil {
+		return x.GroupedDescriptives
+	}
+	return nil
+}
+
+func (x *DescriptiveStatisticsResponse) GetOutliers() []*OutlierSummary {
+	if x != nil {
+		return x.Outliers
+	}
+	return nil
+}
+
+// Выбросы переменной для диаграммы размаха: границы и количества по правилам IQR, z-оценки и MAD
+type OutlierSummary struct {
+	state           protoimpl.MessageState `protogen:"open.v1"`
+	VariableName    string                 `protobuf:"bytes,1,opt,name=variable_name,json=variableName,proto3" json:"variable_name,omitempty"`
+	IqrMultiplier   float64                `protobuf:"fixed64,2,opt,name=iqr_multiplier,json=iqrMultiplier,proto3" json:"iqr_multiplier,omitempty"`
+	LowerFence      float64                `protobuf:"fixed64,3,opt,name=lower_fence,json=lowerFence,proto3" json:"lower_fence,omitempty"`       // Q1 - iqr_multiplier * IQR
+	UpperFence      float64                `protobuf:"fixed64,4,opt,name=upper_fence,json=upperFence,proto3" json:"upper_fence,omitempty"`       // Q3 + iqr_multiplier * IQR
+	LowerWhisker    float64                `protobuf:"fixed64,5,opt,name=lower_whisker,json=lowerWhisker,proto3" json:"lower_whisker,omitempty"` // Наименьшее значение внутри границ
+	UpperWhisker    float64                `protobuf:"fixed64,6,opt,name=upper_whisker,json=upperWhisker,proto3" json:"upper_whisker,omitempty"` // Наибольшее значение внутри границ
+	IqrOutlierCount int64                  `protobuf:"varint,7,opt,name=iqr_outlier_count,json=iqrOutlierCount,proto3" json:"iqr_outlier_count,omitempty"`
+	ZThreshold      float64                `protobuf:"fixed64,8,opt,name=z_threshold,json=zThreshold,proto3" json:"z_threshold,omitempty"`
+	ZLowerBound     float64                `protobuf:"fixed64,9,opt,name=z_lower_bound,json=zLowerBound,proto3" json:"z_lower_bound,omitempty"` // Среднее -/+ z_threshold * s
+	ZUpperBound     float64                `protobuf:"fixed64,10,opt,name=z_upper_bound,json=zUpperBound,proto3" json:"z_upper_bound,omitempty"`
+	ZOutlierCount   int64                  `protobuf:"varint,11,opt,name=z_outlier_count,json=zOutlierCount,proto3" json:"z_outlier_count,omitempty"`
+	Mad             float64                `protobuf:"fixed64,12,opt,name=mad,proto3" json:"mad,omitempty"` // Медианное абсолютное отклонение
+	MadThreshold    float64                `protobuf:"fixed64,13,opt,name=mad_threshold,json=madThreshold,proto3" json:"mad_threshold,omitempty"`
+	MadLowerBound   float64                `protobuf:"fixed64,14,opt,name=mad_lower_bound,json=madLowerBound,proto3" json:"mad_lower_bound,omitempty"` // Медиана -/+ mad_threshold * MAD / 0.6745
+	MadUpperBound   float64                `protobuf:"fixed64,15,opt,name=mad_upper_bound,json=madUpperBound,proto3" json:"mad_upper_bound,omitempty"`
+	MadOutlierCount int64                  `protobuf:"varint,16,opt,name=mad_outlier_count,json=madOutlierCount,proto3" json:"mad_outlier_count,omitempty"`
+	OutlierRows     []int64                `protobuf:"varint,17,rep,packed,name=outlier_rows,json=outlierRows,proto3" json:"outlier_rows,omitempty"` // Номера строк выбросов по IQR (не больше 100, наиболее удаленные от границ)
+	OutlierValues   []float64              `protobuf:"fixed64,18,rep,packed,name=outlier_values,json=outlierValues,proto3" json:"outlier_values,omitempty"`
+	MissingFields   []string               `protobuf:"bytes,19,rep,name=missing_fields,json=missingFields,proto3" json:"missing_fields,omitempty"` // Поля, значение которых не определено (NaN); в самих полях передается 0
+	unknownFields   protoimpl.UnknownFields
+	sizeCache       protoimpl.SizeCache
+}
+
+func (x *OutlierSummary) Reset() {
+	*x = OutlierSummary{}
+	mi := &file_proto_analysis_proto_msgTypes[10]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *OutlierSummary) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*OutlierSummary) ProtoMessage() {}
+
+func (x *OutlierSummary) ProtoReflect() protoreflect.Message {
+	mi := &file_proto_analysis_proto_msgTypes[10]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use OutlierSummary.ProtoReflect.Descriptor instead.
+func (*OutlierSummary) Descriptor() ([]byte, []int) {
+	return file_proto_analysis_proto_rawDescGZIP(), []int{10}
+}
+
+func (x *OutlierSummary) GetVariableName() string {
+	if x != nil {
+		return x.VariableName
+	}
+	return ""
+}
+
+func (x *OutlierSummary) GetIqrMultiplier() float64 {
+	if x != nil {
+		return x.IqrMultiplier
+	}
+	return 0
+}
+
+func (x *OutlierSummary) GetLowerFence() float64 {
+	if x != nil {
+		return x.LowerFence
+	}
+	return 0
+}
+
+func (x *OutlierSummary) GetUpperFence() float64 {
+	if x != nil {
+		return x.UpperFence
+	}
+	return 0
+}
+
+func (x *OutlierSummary) GetLowerWhisker() float64 {
+	if x != nil {
+		return x.LowerWhisker
+	}
+	return 0
+}
+
+func (x *OutlierSummary) GetUpperWhisker() float64 {
+	if x != nil {
+		return x.UpperWhisker
+	}
+	return 0
+}
+
+func (x *OutlierSummary) GetIqrOutlierCount() int64 {
+	if x != nil {
+		return x.IqrOutlierCount
+	}
+	return 0
+}
+
+func (x *OutlierSummary) GetZThreshold() float64 {
+	if x != nil {
+		return x.ZThreshold
+	}
+	return 0
+}
+
+func (x *OutlierSummary) GetZLowerBound() float64 {
+	if x != nil {
+		return x.ZLowerBound
+	}
+	return 0
+}
+
+func (x *OutlierSummary) GetZUpperBound() float64 {
+	if x != nil {
+		return x.ZUpperBound
+	}
+	return 0
+}
+
+func (x *OutlierSummary) GetZOutlierCount() int64 {
+	if x != nil {
+		return x.ZOutlierCount
+	}
+	return 0
+}
+
+func (x *OutlierSummary) GetMad() float64 {
+	if x != nil {
+		return x.Mad
+	}
+	return 0
+}
+
+func (x *OutlierSummary) GetMadThreshold() float64 {
+	if x != nil {
+		return x.MadThreshold
+	}
+	return 0
+}
+
+func (x *OutlierSummary) GetMadLowerBound() float64 {
+	if x != nil {
+		return x.MadLowerBound
+	}
+	return 0
+}
+
+func (x *OutlierSummary) GetMadUpperBound() float64 {
+	if x != nil {
+		return x.MadUpperBound
+	}
+	return 0
+}
+
+func (x *OutlierSummary) GetMadOutlierCount() int64 {
+	if x != nil {
+		return x.MadOutlierCount
+	}
+	return 0
+}
+
+func (x *OutlierSummary) GetOutlierRows() []int64 {
+	if x != nil {
+		return x.OutlierRows
+	}
+	return nil
+}
+
+func (x *OutlierSummary) GetOutlierValues() []float64 {
+	if x != nil {
+		return x.OutlierValues
+	}
+	return nil
+}
+
+func (x *OutlierSummary) GetMissingFields() []string {
+	if x != nil {
+		return x.MissingFields
+	}
+	return nil
+}
+
+// Описательные статистики переменной в одной группе строк
+type GroupedDescriptiveStatistics struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	GroupColumn   string                 `protobuf:"bytes,1,opt,name=group_column,json=groupColumn,proto3" json:"group_column,omitempty"`
+	Group         string                 `protobuf:"bytes,2,opt,name=group,proto3" json:"group,omitempty"`                           // Значение столбца групп (строкой)
+	GroupSize     int64                  `protobuf:"varint,3,opt,name=group_size,json=groupSize,proto3" json:"group_size,omitempty"` // Количество строк группы
+	Statistics    *DescriptiveStatistics `protobuf:"bytes,4,opt,name=statistics,proto3" json:"statistics,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *GroupedDescriptiveStatistics) Reset() {
+	*x = GroupedDescriptiveStatistics{}
+	mi := &file_proto_analysis_proto_msgTypes[11]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *GroupedDescriptiveStatistics) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*GroupedDescriptiveStatistics) ProtoMessage() {}
+
+func (x *GroupedDescriptiveStatistics) ProtoReflect() protoreflect.Message {
+	mi := &file_proto_analysis_proto_msgTypes[11]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use GroupedDescriptiveStatistics.ProtoReflect.Descriptor instead.
+func (*GroupedDescriptiveStatistics) Descriptor() ([]byte, []int) {
+	return file_proto_analysis_proto_rawDescGZIP(), []int{11}
+}
+
+func (x *GroupedDescriptiveStatistics) GetGroupColumn() string {
+	if x != nil {
+		return x.GroupColumn
+	}
+	return ""
+}
+
+func (x *GroupedDescriptiveStatistics) GetGroup() string {
 	if x != nil {
-		return x.Descriptives
+		return x.Group
 	}
-	return nil
+	return ""
 }
 
-func (x *DescriptiveStatisticsResponse) GetHistograms() []*HistogramData {
+func (x *GroupedDescriptiveStatistics) GetGroupSize() int64 {
 	if x != nil {
-		return x.Histograms
+		return x.GroupSize
 	}
-	return nil
+	return 0
 }
 
-func (x *DescriptiveStatisticsResponse) GetConfidenceIntervals() []*ConfidenceInterval {
+func (x *GroupedDescriptiveStatistics) GetStatistics() *DescriptiveStatistics {
 	if x != nil {
-		return x.ConfidenceIntervals
+		return x.Statistics
 	}
 	return nil
 }
@@ -303,16 +1073,20 @@ type DescriptiveStatistics struct {
 	Kurtosis             float64                `protobuf:"fixed64,10,opt,name=kurtosis,proto3" json:"kurtosis,omitempty"`
 	MinValue             float64                `protobuf:"fixed64,11,opt,name=min_value,json=minValue,proto3" json:"min_value,omitempty"`
 	MaxValue             float64                `protobuf:"fixed64,12,opt,name=max_value,json=maxValue,proto3" json:"max_value,omitempty"`
-	Q1                   float64                `protobuf:"fixed64,13,opt,name=q1,proto3" json:"q1,omitempty"`   // Первый квартиль (25%)
-	Q3                   float64                `protobuf:"fixed64,14,opt,name=q3,proto3" json:"q3,omitempty"`   // Третий квартиль (75%)
-	Iqr                  float64                `protobuf:"fixed64,15,opt,name=iqr,proto3" json:"iqr,omitempty"` // Межквартильный размах (IQR)
+	Q1                   float64                `protobuf:"fixed64,13,opt,name=q1,proto3" json:"q1,omitempty"`                                                                // Первый квартиль (25%)
+	Q3                   float64                `protobuf:"fixed64,14,opt,name=q3,proto3" json:"q3,omitempty"`                                                                // Третий квартиль (75%)
+	Iqr                  float64                `protobuf:"fixed64,15,opt,name=iqr,proto3" json:"iqr,omitempty"`                                                              // Межквартильный размах (IQR)
+	MissingFields        []string               `protobuf:"bytes,16,rep,name=missing_fields,json=missingFields,proto3" json:"missing_fields,omitempty"`                       // Поля, значение которых не определено (NaN); в самих полях передается 0
+	ModeFrequency        int64                  `protobuf:"varint,17,opt,name=mode_frequency,json=modeFrequency,proto3" json:"mode_frequency,omitempty"`                      // Частота моды
+	ModeCount            int64                  `protobuf:"varint,18,opt,name=mode_count,json=modeCount,proto3" json:"mode_count,omitempty"`                                  // Количество значений с наибольшей частотой (в mode передаются не больше 10 из них)
+	EffectiveSampleSize  float64                `protobuf:"fixed64,19,opt,name=effective_sample_size,json=effectiveSampleSize,proto3" json:"effective_sample_size,omitempty"` // Эффективный объем выборки Киша при параметре weight_column (0 - без весов)
 	unknownFields        protoimpl.UnknownFields
 	sizeCache            protoimpl.SizeCache
 }
 
 func (x *DescriptiveStatistics) Reset() {
 	*x = DescriptiveStatistics{}
-	mi := &file_proto_analysis_proto_msgTypes[4]
+	mi := &file_proto_analysis_proto_msgTypes[12]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -324,7 +1098,7 @@ func (x *DescriptiveStatistics) String() string {
 func (*DescriptiveStatistics) ProtoMessage() {}
 
 func (x *DescriptiveStatistics) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_analysis_proto_msgTypes[4]
+	mi := &file_proto_analysis_proto_msgTypes[12]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -337,7 +1111,7 @@ func (x *DescriptiveStatistics) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use DescriptiveStatistics.ProtoReflect.Descriptor instead.
 func (*DescriptiveStatistics) Descriptor() ([]byte, []int) {
-	return file_proto_analysis_proto_rawDescGZIP(), []int{4}
+	return file_proto_analysis_proto_rawDescGZIP(), []int{12}
 }
 
 func (x *DescriptiveStatistics) GetVariableName() string {
@@ -445,6 +1219,34 @@ func (x *DescriptiveStatistics) GetIqr() float64 {
 	return 0
 }
 
+func (x *DescriptiveStatistics) GetMissingFields() []string {
+	if x != nil {
+		return x.MissingFields
+	}
+	return nil
+}
+
+func (x *DescriptiveStatistics) GetModeFrequency() int64 {
+	if x != nil {
+		return x.ModeFrequency
+	}
+	return 0
+}
+
+func (x *DescriptiveStatistics) GetModeCount() int64 {
+	if x != nil {
+		return x.ModeCount
+	}
+	return 0
+}
+
+func (x *DescriptiveStatistics) GetEffectiveSampleSize() float64 {
+	if x != nil {
+		return x.EffectiveSampleSize
+	}
+	return 0
+}
+
 // Данные гистограммы для построения графика
 type HistogramData struct {
 	state       protoimpl.MessageState `protogen:"open.v1"`
@@ -452,17 +1254,21 @@ type HistogramData struct {
 	Bins        []float64              `protobuf:"fixed64,2,rep,packed,name=bins,proto3" json:"bins,omitempty"`                      // Границы бинов (N+1 для N бинов)
 	Frequencies []int32                `protobuf:"varint,3,rep,packed,name=frequencies,proto3" json:"frequencies,omitempty"`         // Частоты в каждом бине
 	// Данные для нормальной кривой
-	NormalCurveX  []float64 `protobuf:"fixed64,4,rep,packed,name=normal_curve_x,json=normalCurveX,proto3" json:"normal_curve_x,omitempty"` // X-координаты точек нормальной кривой
-	NormalCurveY  []float64 `protobuf:"fixed64,5,rep,packed,name=normal_curve_y,json=normalCurveY,proto3" json:"normal_curve_y,omitempty"` // Y-координаты точек нормальной кривой
-	Mean          float64   `protobuf:"fixed64,6,opt,name=mean,proto3" json:"mean,omitempty"`                                              // Среднее значение для нормальной кривой
-	StdDev        float64   `protobuf:"fixed64,7,opt,name=std_dev,json=stdDev,proto3" json:"std_dev,omitempty"`                            // Стандартное отклонение для нормальной кривой
+	NormalCurveX []float64 `protobuf:"fixed64,4,rep,packed,name=normal_curve_x,json=normalCurveX,proto3" json:"normal_curve_x,omitempty"` // X-координаты точек нормальной кривой
+	NormalCurveY []float64 `protobuf:"fixed64,5,rep,packed,name=normal_curve_y,json=normalCurveY,proto3" json:"normal_curve_y,omitempty"` // Y-координаты точек нормальной кривой
+	Mean         float64   `protobuf:"fixed64,6,opt,name=mean,proto3" json:"mean,omitempty"`                                              // Среднее значение для нормальной кривой
+	StdDev       float64   `protobuf:"fixed64,7,opt,name=std_dev,json=stdDev,proto3" json:"std_dev,omitempty"`                            // Стандартное отклонение для нормальной кривой
+	// Ядерная оценка плотности (в масштабе частот гистограммы, как нормальная кривая)
+	KdeX          []float64 `protobuf:"fixed64,8,rep,packed,name=kde_x,json=kdeX,proto3" json:"kde_x,omitempty"`
+	KdeY          []float64 `protobuf:"fixed64,9,rep,packed,name=kde_y,json=kdeY,proto3" json:"kde_y,omitempty"`
+	KdeBandwidth  float64   `protobuf:"fixed64,10,opt,name=kde_bandwidth,json=kdeBandwidth,proto3" json:"kde_bandwidth,omitempty"` // Ширина окна гауссова ядра
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
 func (x *HistogramData) Reset() {
 	*x = HistogramData{}
-	mi := &file_proto_analysis_proto_msgTypes[5]
+	mi := &file_proto_analysis_proto_msgTypes[13]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -474,7 +1280,7 @@ func (x *HistogramData) String() string {
 func (*HistogramData) ProtoMessage() {}
 
 func (x *HistogramData) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_analysis_proto_msgTypes[5]
+	mi := &file_proto_analysis_proto_msgTypes[13]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -487,7 +1293,7 @@ func (x *HistogramData) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use HistogramData.ProtoReflect.Descriptor instead.
 func (*HistogramData) Descriptor() ([]byte, []int) {
-	return file_proto_analysis_proto_rawDescGZIP(), []int{5}
+	return file_proto_analysis_proto_rawDescGZIP(), []int{13}
 }
 
 func (x *HistogramData) GetColumnName() string {
@@ -539,22 +1345,45 @@ func (x *HistogramData) GetStdDev() float64 {
 	return 0
 }
 
+func (x *HistogramData) GetKdeX() []float64 {
+	if x != nil {
+		return x.KdeX
+	}
+	return nil
+}
+
+func (x *HistogramData) GetKdeY() []float64 {
+	if x != nil {
+		return x.KdeY
+	}
+	return nil
+}
+
+func (x *HistogramData) GetKdeBandwidth() float64 {
+	if x != nil {
+		return x.KdeBandwidth
+	}
+	return 0
+}
+
 // Доверительные интервалы
 type ConfidenceInterval struct {
-	state           protoimpl.MessageState `protogen:"open.v1"`
-	ColumnName      string                 `protobuf:"bytes,1,opt,name=column_name,json=columnName,proto3" json:"column_name,omitempty"`                  // Изменено с variable_name
-	ConfidenceLevel float64                `protobuf:"fixed64,2,opt,name=confidence_level,json=confidenceLevel,proto3" json:"confidence_level,omitempty"` // например, 0.95 для 95%
-	LowerBound      float64                `protobuf:"fixed64,3,opt,name=lower_bound,json=lowerBound,proto3" json:"lower_bound,omitempty"`
-	UpperBound      float64                `protobuf:"fixed64,4,opt,name=upper_bound,json=upperBound,proto3" json:"upper_bound,omitempty"`
-	Mean            float64                `protobuf:"fixed64,5,opt,name=mean,proto3" json:"mean,omitempty"`                                        // Добавлено для CI
-	StandardError   float64                `protobuf:"fixed64,6,opt,name=standard_error,json=standardError,proto3" json:"standard_error,omitempty"` // Добавлено для CI
-	unknownFields   protoimpl.UnknownFields
-	sizeCache       protoimpl.SizeCache
+	state               protoimpl.MessageState `protogen:"open.v1"`
+	ColumnName          string                 `protobuf:"bytes,1,opt,name=column_name,json=columnName,proto3" json:"column_name,omitempty"`                  // Изменено с variable_name
+	ConfidenceLevel     float64                `protobuf:"fixed64,2,opt,name=confidence_level,json=confidenceLevel,proto3" json:"confidence_level,omitempty"` // например, 0.95 для 95%
+	LowerBound          float64                `protobuf:"fixed64,3,opt,name=lower_bound,json=lowerBound,proto3" json:"lower_bound,omitempty"`
+	UpperBound          float64                `protobuf:"fixed64,4,opt,name=upper_bound,json=upperBound,proto3" json:"upper_bound,omitempty"`
+	Mean                float64                `protobuf:"fixed64,5,opt,name=mean,proto3" json:"mean,omitempty"`                                                            // Добавлено для CI
+	StandardError       float64                `protobuf:"fixed64,6,opt,name=standard_error,json=standardError,proto3" json:"standard_error,omitempty"`                     // Добавлено для CI
+	MissingFields       []string               `protobuf:"bytes,7,rep,name=missing_fields,json=missingFields,proto3" json:"missing_fields,omitempty"`                       // Поля, значение которых не определено (NaN); в самих полях передается 0
+	EffectiveSampleSize float64                `protobuf:"fixed64,8,opt,name=effective_sample_size,json=effectiveSampleSize,proto3" json:"effective_sample_size,omitempty"` // Эффективный объем выборки Киша при параметре weight_column (0 - без весов)
+	unknownFields       protoimpl.UnknownFields
+	sizeCache           protoimpl.SizeCache
 }
 
 func (x *ConfidenceInterval) Reset() {
 	*x = ConfidenceInterval{}
-	mi := &file_proto_analysis_proto_msgTypes[6]
+	mi := &file_proto_analysis_proto_msgTypes[14]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -566,7 +1395,7 @@ func (x *ConfidenceInterval) String() string {
 func (*ConfidenceInterval) ProtoMessage() {}
 
 func (x *ConfidenceInterval) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_analysis_proto_msgTypes[6]
+	mi := &file_proto_analysis_proto_msgTypes[14]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -579,7 +1408,7 @@ func (x *ConfidenceInterval) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ConfidenceInterval.ProtoReflect.Descriptor instead.
 func (*ConfidenceInterval) Descriptor() ([]byte, []int) {
-	return file_proto_analysis_proto_rawDescGZIP(), []int{6}
+	return file_proto_analysis_proto_rawDescGZIP(), []int{14}
 }
 
 func (x *ConfidenceInterval) GetColumnName() string {
@@ -624,6 +1453,20 @@ func (x *ConfidenceInterval) GetStandardError() float64 {
 	return 0
 }
 
+func (x *ConfidenceInterval) GetMissingFields() []string {
+	if x != nil {
+		return x.MissingFields
+	}
+	return nil
+}
+
+func (x *ConfidenceInterval) GetEffectiveSampleSize() float64 {
+	if x != nil {
+		return x.EffectiveSampleSize
+	}
+	return 0
+}
+
 // ------------------ Тесты на нормальность ------------------
 type NormalityTestsResponse struct {
 	state              protoimpl.MessageState    `protogen:"open.v1"`
@@ -635,7 +1478,7 @@ type NormalityTestsResponse struct {
 
 func (x *NormalityTestsResponse) Reset() {
 	*x = NormalityTestsResponse{}
-	mi := &file_proto_analysis_proto_msgTypes[7]
+	mi := &file_proto_analysis_proto_msgTypes[15]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -647,7 +1490,7 @@ func (x *NormalityTestsResponse) String() string {
 func (*NormalityTestsResponse) ProtoMessage() {}
 
 func (x *NormalityTestsResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_analysis_proto_msgTypes[7]
+	mi := &file_proto_analysis_proto_msgTypes[15]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -660,7 +1503,7 @@ func (x *NormalityTestsResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use NormalityTestsResponse.ProtoReflect.Descriptor instead.
 func (*NormalityTestsResponse) Descriptor() ([]byte, []int) {
-	return file_proto_analysis_proto_rawDescGZIP(), []int{7}
+	return file_proto_analysis_proto_rawDescGZIP(), []int{15}
 }
 
 func (x *NormalityTestsResponse) GetShapiroWilkResults() []*NormalityTestResult {
@@ -684,14 +1527,15 @@ type NormalityTestResult struct {
 	TestName      string                 `protobuf:"bytes,2,opt,name=test_name,json=testName,proto3" json:"test_name,omitempty"`       // например, "Shapiro-Wilk"
 	Statistic     float64                `protobuf:"fixed64,3,opt,name=statistic,proto3" json:"statistic,omitempty"`
 	PValue        float64                `protobuf:"fixed64,4,opt,name=p_value,json=pValue,proto3" json:"p_value,omitempty"`
-	IsNormal      bool                   `protobuf:"varint,5,opt,name=is_normal,json=isNormal,proto3" json:"is_normal,omitempty"` // Возвращаем тег на 5
+	IsNormal      bool                   `protobuf:"varint,5,opt,name=is_normal,json=isNormal,proto3" json:"is_normal,omitempty"`               // Возвращаем тег на 5
+	MissingFields []string               `protobuf:"bytes,6,rep,name=missing_fields,json=missingFields,proto3" json:"missing_fields,omitempty"` // Поля, значение которых не определено (NaN); в самих полях передается 0
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
 func (x *NormalityTestResult) Reset() {
 	*x = NormalityTestResult{}
-	mi := &file_proto_analysis_proto_msgTypes[8]
+	mi := &file_proto_analysis_proto_msgTypes[16]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -703,7 +1547,7 @@ func (x *NormalityTestResult) String() string {
 func (*NormalityTestResult) ProtoMessage() {}
 
 func (x *NormalityTestResult) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_analysis_proto_msgTypes[8]
+	mi := &file_proto_analysis_proto_msgTypes[16]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -716,7 +1560,7 @@ func (x *NormalityTestResult) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use NormalityTestResult.ProtoReflect.Descriptor instead.
 func (*NormalityTestResult) Descriptor() ([]byte, []int) {
-	return file_proto_analysis_proto_rawDescGZIP(), []int{8}
+	return file_proto_analysis_proto_rawDescGZIP(), []int{16}
 }
 
 func (x *NormalityTestResult) GetColumnName() string {
@@ -754,6 +1598,13 @@ func (x *NormalityTestResult) GetIsNormal() bool {
 	return false
 }
 
+func (x *NormalityTestResult) GetMissingFields() []string {
+	if x != nil {
+		return x.MissingFields
+	}
+	return nil
+}
+
 // Результаты теста хи-квадрат на соответствие распределению
 type PearsonChiSquareResult struct {
 	state            protoimpl.MessageState `protogen:"open.v1"`
@@ -761,15 +1612,16 @@ type PearsonChiSquareResult struct {
 	Statistic        float64                `protobuf:"fixed64,2,opt,name=statistic,proto3" json:"statistic,omitempty"`
 	PValue           float64                `protobuf:"fixed64,3,opt,name=p_value,json=pValue,proto3" json:"p_value,omitempty"`
 	DegreesOfFreedom int32                  `protobuf:"varint,4,opt,name=degrees_of_freedom,json=degreesOfFreedom,proto3" json:"degrees_of_freedom,omitempty"`
-	Intervals        int32                  `protobuf:"varint,5,opt,name=intervals,proto3" json:"intervals,omitempty"`               // Добавлено: количество интервалов
-	IsNormal         bool                   `protobuf:"varint,6,opt,name=is_normal,json=isNormal,proto3" json:"is_normal,omitempty"` // Добавлено: вывод теста
+	Intervals        int32                  `protobuf:"varint,5,opt,name=intervals,proto3" json:"intervals,omitempty"`                             // Добавлено: количество интервалов
+	IsNormal         bool                   `protobuf:"varint,6,opt,name=is_normal,json=isNormal,proto3" json:"is_normal,omitempty"`               // Добавлено: вывод теста
+	MissingFields    []string               `protobuf:"bytes,7,rep,name=missing_fields,json=missingFields,proto3" json:"missing_fields,omitempty"` // Поля, значение которых не определено (NaN); в самих полях передается 0
 	unknownFields    protoimpl.UnknownFields
 	sizeCache        protoimpl.SizeCache
 }
 
 func (x *PearsonChiSquareResult) Reset() {
 	*x = PearsonChiSquareResult{}
-	mi := &file_proto_analysis_proto_msgTypes[9]
+	mi := &file_proto_analysis_proto_msgTypes[17]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -781,7 +1633,7 @@ func (x *PearsonChiSquareResult) String() string {
 func (*PearsonChiSquareResult) ProtoMessage() {}
 
 func (x *PearsonChiSquareResult) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_analysis_proto_msgTypes[9]
+	mi := &file_proto_analysis_proto_msgTypes[17]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -794,7 +1646,7 @@ func (x *PearsonChiSquareResult) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use PearsonChiSquareResult.ProtoReflect.Descriptor instead.
 func (*PearsonChiSquareResult) Descriptor() ([]byte, []int) {
-	return file_proto_analysis_proto_rawDescGZIP(), []int{9}
+	return file_proto_analysis_proto_rawDescGZIP(), []int{17}
 }
 
 func (x *PearsonChiSquareResult) GetColumnName() string {
@@ -839,6 +1691,13 @@ func (x *PearsonChiSquareResult) GetIsNormal() bool {
 	return false
 }
 
+func (x *PearsonChiSquareResult) GetMissingFields() []string {
+	if x != nil {
+		return x.MissingFields
+	}
+	return nil
+}
+
 // ------------------ Критерии Вилкоксона ------------------
 type WilcoxonTestsResponse struct {
 	state              protoimpl.MessageState          `protogen:"open.v1"`
@@ -850,7 +1709,7 @@ type WilcoxonTestsResponse struct {
 
 func (x *WilcoxonTestsResponse) Reset() {
 	*x = WilcoxonTestsResponse{}
-	mi := &file_proto_analysis_proto_msgTypes[10]
+	mi := &file_proto_analysis_proto_msgTypes[18]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -862,7 +1721,7 @@ func (x *WilcoxonTestsResponse) String() string {
 func (*WilcoxonTestsResponse) ProtoMessage() {}
 
 func (x *WilcoxonTestsResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_analysis_proto_msgTypes[10]
+	mi := &file_proto_analysis_proto_msgTypes[18]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -875,7 +1734,7 @@ func (x *WilcoxonTestsResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use WilcoxonTestsResponse.ProtoReflect.Descriptor instead.
 func (*WilcoxonTestsResponse) Descriptor() ([]byte, []int) {
-	return file_proto_analysis_proto_rawDescGZIP(), []int{10}
+	return file_proto_analysis_proto_rawDescGZIP(), []int{18}
 }
 
 func (x *WilcoxonTestsResponse) GetSignedRankResults() []*WilcoxonSignedRankTestResult {
@@ -895,20 +1754,21 @@ func (x *WilcoxonTestsResponse) GetMannWhitneyResults() []*MannWhitneyTestResult
 // Результаты критерия знаковых рангов Вилкоксона
 type WilcoxonSignedRankTestResult struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	TestType      string                 `protobuf:"bytes,1,opt,name=test_type,json=testType,proto3" json:"test_type,omitempty"`        // например, "Wilcoxon signed-rank test"
-	Variable1     string                 `protobuf:"bytes,2,opt,name=variable1,proto3" json:"variable1,omitempty"`                      // первая переменная
-	Variable2     string                 `protobuf:"bytes,3,opt,name=variable2,proto3" json:"variable2,omitempty"`                      // вторая переменная
-	Statistic     float64                `protobuf:"fixed64,4,opt,name=statistic,proto3" json:"statistic,omitempty"`                    // значение W-статистики
-	PValue        float64                `protobuf:"fixed64,5,opt,name=p_value,json=pValue,proto3" json:"p_value,omitempty"`            // p-значение
-	Conclusion    string                 `protobuf:"bytes,6,opt,name=conclusion,proto3" json:"conclusion,omitempty"`                    // вывод по результатам теста
-	SampleSize    int32                  `protobuf:"varint,7,opt,name=sample_size,json=sampleSize,proto3" json:"sample_size,omitempty"` // размер выборки
+	TestType      string                 `protobuf:"bytes,1,opt,name=test_type,json=testType,proto3" json:"test_type,omitempty"`                // например, "Wilcoxon signed-rank test"
+	Variable1     string                 `protobuf:"bytes,2,opt,name=variable1,proto3" json:"variable1,omitempty"`                              // первая переменная
+	Variable2     string                 `protobuf:"bytes,3,opt,name=variable2,proto3" json:"variable2,omitempty"`                              // вторая переменная
+	Statistic     float64                `protobuf:"fixed64,4,opt,name=statistic,proto3" json:"statistic,omitempty"`                            // значение W-статистики
+	PValue        float64                `protobuf:"fixed64,5,opt,name=p_value,json=pValue,proto3" json:"p_value,omitempty"`                    // p-значение
+	Conclusion    string                 `protobuf:"bytes,6,opt,name=conclusion,proto3" json:"conclusion,omitempty"`                            // вывод по результатам теста
+	SampleSize    int32                  `protobuf:"varint,7,opt,name=sample_size,json=sampleSize,proto3" json:"sample_size,omitempty"`         // размер выборки
+	MissingFields []string               `protobuf:"bytes,8,rep,name=missing_fields,json=missingFields,proto3" json:"missing_fields,omitempty"` // поля, значение которых не определено (NaN); в самих полях передается 0
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
 func (x *WilcoxonSignedRankTestResult) Reset() {
 	*x = WilcoxonSignedRankTestResult{}
-	mi := &file_proto_analysis_proto_msgTypes[11]
+	mi := &file_proto_analysis_proto_msgTypes[19]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -920,7 +1780,7 @@ func (x *WilcoxonSignedRankTestResult) String() string {
 func (*WilcoxonSignedRankTestResult) ProtoMessage() {}
 
 func (x *WilcoxonSignedRankTestResult) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_analysis_proto_msgTypes[11]
+	mi := &file_proto_analysis_proto_msgTypes[19]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -933,7 +1793,7 @@ func (x *WilcoxonSignedRankTestResult) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use WilcoxonSignedRankTestResult.ProtoReflect.Descriptor instead.
 func (*WilcoxonSignedRankTestResult) Descriptor() ([]byte, []int) {
-	return file_proto_analysis_proto_rawDescGZIP(), []int{11}
+	return file_proto_analysis_proto_rawDescGZIP(), []int{19}
 }
 
 func (x *WilcoxonSignedRankTestResult) GetTestType() string {
@@ -985,28 +1845,36 @@ func (x *WilcoxonSignedRankTestResult) GetSampleSize() int32 {
 	return 0
 }
 
+func (x *WilcoxonSignedRankTestResult) GetMissingFields() []string {
+	if x != nil {
+		return x.MissingFields
+	}
+	return nil
+}
+
 // Результаты критерия Манна-Уитни (U-тест, критерий суммы рангов Вилкоксона)
 type MannWhitneyTestResult struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
-	TestType      string                 `protobuf:"bytes,1,opt,name=test_type,json=testType,proto3" json:"test_type,omitempty"`               // например, "Mann-Whitney U test"
-	GroupColumn   string                 `protobuf:"bytes,2,opt,name=group_column,json=groupColumn,proto3" json:"group_column,omitempty"`      // группировочная переменная
-	ValueColumn   string                 `protobuf:"bytes,3,opt,name=value_column,json=valueColumn,proto3" json:"value_column,omitempty"`      // тестируемая переменная
-	Group1        string                 `protobuf:"bytes,4,opt,name=group1,proto3" json:"group1,omitempty"`                                   // название первой группы
-	Group2        string                 `protobuf:"bytes,5,opt,name=group2,proto3" json:"group2,omitempty"`                                   // название второй группы
-	Group1Size    int32                  `protobuf:"varint,6,opt,name=group1_size,json=group1Size,proto3" json:"group1_size,omitempty"`        // размер первой группы
-	Group2Size    int32                  `protobuf:"varint,7,opt,name=group2_size,json=group2Size,proto3" json:"group2_size,omitempty"`        // размер второй группы
-	Group1Median  float64                `protobuf:"fixed64,8,opt,name=group1_median,json=group1Median,proto3" json:"group1_median,omitempty"` // медиана первой группы
-	Group2Median  float64                `protobuf:"fixed64,9,opt,name=group2_median,json=group2Median,proto3" json:"group2_median,omitempty"` // медиана второй группы
-	Statistic     float64                `protobuf:"fixed64,10,opt,name=statistic,proto3" json:"statistic,omitempty"`                          // значение U-статистики
-	PValue        float64                `protobuf:"fixed64,11,opt,name=p_value,json=pValue,proto3" json:"p_value,omitempty"`                  // p-значение
-	Conclusion    string                 `protobuf:"bytes,12,opt,name=conclusion,proto3" json:"conclusion,omitempty"`                          // вывод по результатам теста
+	TestType      string                 `protobuf:"bytes,1,opt,name=test_type,json=testType,proto3" json:"test_type,omitempty"`                 // например, "Mann-Whitney U test"
+	GroupColumn   string                 `protobuf:"bytes,2,opt,name=group_column,json=groupColumn,proto3" json:"group_column,omitempty"`        // группировочная переменная
+	ValueColumn   string                 `protobuf:"bytes,3,opt,name=value_column,json=valueColumn,proto3" json:"value_column,omitempty"`        // тестируемая переменная
+	Group1        string                 `protobuf:"bytes,4,opt,name=group1,proto3" json:"group1,omitempty"`                                     // название первой группы
+	Group2        string                 `protobuf:"bytes,5,opt,name=group2,proto3" json:"group2,omitempty"`                                     // название второй группы
+	Group1Size    int32                  `protobuf:"varint,6,opt,name=group1_size,json=group1Size,proto3" json:"group1_size,omitempty"`          // размер первой группы
+	Group2Size    int32                  `protobuf:"varint,7,opt,name=group2_size,json=group2Size,proto3" json:"group2_size,omitempty"`          // размер второй группы
+	Group1Median  float64                `protobuf:"fixed64,8,opt,name=group1_median,json=group1Median,proto3" json:"group1_median,omitempty"`   // медиана первой группы
+	Group2Median  float64                `protobuf:"fixed64,9,opt,name=group2_median,json=group2Median,proto3" json:"group2_median,omitempty"`   // медиана второй группы
+	Statistic     float64                `protobuf:"fixed64,10,opt,name=statistic,proto3" json:"statistic,omitempty"`                            // значение U-статистики
+	PValue        float64                `protobuf:"fixed64,11,opt,name=p_value,json=pValue,proto3" json:"p_value,omitempty"`                    // p-значение
+	Conclusion    string                 `protobuf:"bytes,12,opt,name=conclusion,proto3" json:"conclusion,omitempty"`                            // вывод по результатам теста
+	MissingFields []string               `protobuf:"bytes,13,rep,name=missing_fields,json=missingFields,proto3" json:"missing_fields,omitempty"` // поля, значение которых не определено (NaN); в самих полях передается 0
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
 
 func (x *MannWhitneyTestResult) Reset() {
 	*x = MannWhitneyTestResult{}
-	mi := &file_proto_analysis_proto_msgTypes[12]
+	mi := &file_proto_analysis_proto_msgTypes[20]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1018,7 +1886,7 @@ func (x *MannWhitneyTestResult) String() string {
 func (*MannWhitneyTestResult) ProtoMessage() {}
 
 func (x *MannWhitneyTestResult) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_analysis_proto_msgTypes[12]
+	mi := &file_proto_analysis_proto_msgTypes[20]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1031,7 +1899,7 @@ func (x *MannWhitneyTestResult) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use MannWhitneyTestResult.ProtoReflect.Descriptor instead.
 func (*MannWhitneyTestResult) Descriptor() ([]byte, []int) {
-	return file_proto_analysis_proto_rawDescGZIP(), []int{12}
+	return file_proto_analysis_proto_rawDescGZIP(), []int{20}
 }
 
 func (x *MannWhitneyTestResult) GetTestType() string {
@@ -1118,6 +1986,13 @@ func (x *MannWhitneyTestResult) GetConclusion() string {
 	return ""
 }
 
+func (x *MannWhitneyTestResult) GetMissingFields() []string {
+	if x != nil {
+		return x.MissingFields
+	}
+	return nil
+}
+
 // ------------------ Регрессионный анализ ------------------
 type RegressionAnalysisResponse struct {
 	state                protoimpl.MessageState `protogen:"open.v1"`
@@ -1125,13 +2000,14 @@ type RegressionAnalysisResponse struct {
 	IndependentVariables []string               `protobuf:"bytes,2,rep,name=independent_variables,json=independentVariables,proto3" json:"independent_variables,omitempty"`
 	DataPoints           []*DataPoint           `protobuf:"bytes,3,rep,name=data_points,json=dataPoints,proto3" json:"data_points,omitempty"` // Точки данных для построения графика
 	Models               []*RegressionModel     `protobuf:"bytes,4,rep,name=models,proto3" json:"models,omitempty"`                           // Несколько моделей регрессии
+	Density              *DensityGrid           `protobuf:"bytes,5,opt,name=density,proto3" json:"density,omitempty"`                         // Агрегированная плотность точек (вместо data_points при regression_aggregation)
 	unknownFields        protoimpl.UnknownFields
 	sizeCache            protoimpl.SizeCache
 }
 
 func (x *RegressionAnalysisResponse) Reset() {
 	*x = RegressionAnalysisResponse{}
-	mi := &file_proto_analysis_proto_msgTypes[13]
+	mi := &file_proto_analysis_proto_msgTypes[21]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1143,7 +2019,7 @@ func (x *RegressionAnalysisResponse) String() string {
 func (*RegressionAnalysisResponse) ProtoMessage() {}
 
 func (x *RegressionAnalysisResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_analysis_proto_msgTypes[13]
+	mi := &file_proto_analysis_proto_msgTypes[21]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1156,7 +2032,7 @@ func (x *RegressionAnalysisResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use RegressionAnalysisResponse.ProtoReflect.Descriptor instead.
 func (*RegressionAnalysisResponse) Descriptor() ([]byte, []int) {
-	return file_proto_analysis_proto_rawDescGZIP(), []int{13}
+	return file_proto_analysis_proto_rawDescGZIP(), []int{21}
 }
 
 func (x *RegressionAnalysisResponse) GetDependentVariable() string {
@@ -1187,6 +2063,138 @@ func (x *RegressionAnalysisResponse) GetModels() []*RegressionModel {
 	return nil
 }
 
+func (x *RegressionAnalysisResponse) GetDensity() *DensityGrid {
+	if x != nil {
+		return x.Density
+	}
+	return nil
+}
+
+// Агрегированная плотность точек диаграммы рассеяния
+type DensityGrid struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Kind          string                 `protobuf:"bytes,1,opt,name=kind,proto3" json:"kind,omitempty"` // "grid" или "hexbin"
+	XBins         int32                  `protobuf:"varint,2,opt,name=x_bins,json=xBins,proto3" json:"x_bins,omitempty"`
+	YBins         int32                  `protobuf:"varint,3,opt,name=y_bins,json=yBins,proto3" json:"y_bins,omitempty"`
+	XEdges        []float64              `protobuf:"fixed64,4,rep,packed,name=x_edges,json=xEdges,proto3" json:"x_edges,omitempty"`       // Границы интервалов по X (grid)
+	YEdges        []float64              `protobuf:"fixed64,5,rep,packed,name=y_edges,json=yEdges,proto3" json:"y_edges,omitempty"`       // Границы интервалов по Y (grid)
+	Counts        []int64                `protobuf:"varint,6,rep,packed,name=counts,proto3" json:"counts,omitempty"`                      // grid: построчно, индекс = iy * x_bins + ix; hexbin: частоты непустых ячеек
+	CentersX      []float64              `protobuf:"fixed64,7,rep,packed,name=centers_x,json=centersX,proto3" json:"centers_x,omitempty"` // Центры непустых ячеек (hexbin)
+	CentersY      []float64              `protobuf:"fixed64,8,rep,packed,name=centers_y,json=centersY,proto3" json:"centers_y,omitempty"`
+	StepX         float64                `protobuf:"fixed64,9,opt,name=step_x,json=stepX,proto3" json:"step_x,omitempty"` // Шаг решетки шестиугольников (hexbin)
+	StepY         float64                `protobuf:"fixed64,10,opt,name=step_y,json=stepY,proto3" json:"step_y,omitempty"`
+	TotalPoints   int64                  `protobuf:"varint,11,opt,name=total_points,json=totalPoints,proto3" json:"total_points,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *DensityGrid) Reset() {
+	*x = DensityGrid{}
+	mi := &file_proto_analysis_proto_msgTypes[22]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *DensityGrid) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*DensityGrid) ProtoMessage() {}
+
+func (x *DensityGrid) ProtoReflect() protoreflect.Message {
+	mi := &file_proto_analysis_proto_msgTypes[22]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use DensityGrid.ProtoReflect.Descriptor instead.
+func (*DensityGrid) Descriptor() ([]byte, []int) {
+	return file_proto_analysis_proto_rawDescGZIP(), []int{22}
+}
+
+func (x *DensityGrid) GetKind() string {
+	if x != nil {
+		return x.Kind
+	}
+	return ""
+}
+
+func (x *DensityGrid) GetXBins() int32 {
+	if x != nil {
+		return x.XBins
+	}
+	return 0
+}
+
+func (x *DensityGrid) GetYBins() int32 {
+	if x != nil {
+		return x.YBins
+	}
+	return 0
+}
+
+func (x *DensityGrid) GetXEdges() []float64 {
+	if x != nil {
+		return x.XEdges
+	}
+	return nil
+}
+
+func (x *DensityGrid) GetYEdges() []float64 {
+	if x != nil {
+		return x.YEdges
+	}
+	return nil
+}
+
+func (x *DensityGrid) GetCounts() []int64 {
+	if x != nil {
+		return x.Counts
+	}
+	return nil
+}
+
+func (x *DensityGrid) GetCentersX() []float64 {
+	if x != nil {
+		return x.CentersX
+	}
+	return nil
+}
+
+func (x *DensityGrid) GetCentersY() []float64 {
+	if x != nil {
+		return x.CentersY
+	}
+	return nil
+}
+
+func (x *DensityGrid) GetStepX() float64 {
+	if x != nil {
+		return x.StepX
+	}
+	return 0
+}
+
+func (x *DensityGrid) GetStepY() float64 {
+	if x != nil {
+		return x.StepY
+	}
+	return 0
+}
+
+func (x *DensityGrid) GetTotalPoints() int64 {
+	if x != nil {
+		return x.TotalPoints
+	}
+	return 0
+}
+
 // Модель регрессии
 type RegressionModel struct {
 	state             protoimpl.MessageState   `protogen:"open.v1"`
@@ -1199,13 +2207,15 @@ type RegressionModel struct {
 	Coefficients      []*RegressionCoefficient `protobuf:"bytes,7,rep,name=coefficients,proto3" json:"coefficients,omitempty"`
 	Residuals         []float64                `protobuf:"fixed64,8,rep,packed,name=residuals,proto3" json:"residuals,omitempty"`                                 // Остатки регрессии для проверки на нормальность
 	ResidualsAnalysis *ResidualsAnalysisResult `protobuf:"bytes,9,opt,name=residuals_analysis,json=residualsAnalysis,proto3" json:"residuals_analysis,omitempty"` // Результаты анализа остатков
+	FittedCurve       []*DataPoint             `protobuf:"bytes,10,rep,name=fitted_curve,json=fittedCurve,proto3" json:"fitted_curve,omitempty"`                  // Значения модели на сетке по X (при regression_aggregation)
+	MissingFields     []string                 `protobuf:"bytes,11,rep,name=missing_fields,json=missingFields,proto3" json:"missing_fields,omitempty"`            // Поля, значение которых не определено (NaN); в самих полях передается 0
 	unknownFields     protoimpl.UnknownFields
 	sizeCache         protoimpl.SizeCache
 }
 
 func (x *RegressionModel) Reset() {
 	*x = RegressionModel{}
-	mi := &file_proto_analysis_proto_msgTypes[14]
+	mi := &file_proto_analysis_proto_msgTypes[23]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1217,7 +2227,7 @@ func (x *RegressionModel) String() string {
 func (*RegressionModel) ProtoMessage() {}
 
 func (x *RegressionModel) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_analysis_proto_msgTypes[14]
+	mi := &file_proto_analysis_proto_msgTypes[23]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1230,7 +2240,7 @@ func (x *RegressionModel) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use RegressionModel.ProtoReflect.Descriptor instead.
 func (*RegressionModel) Descriptor() ([]byte, []int) {
-	return file_proto_analysis_proto_rawDescGZIP(), []int{14}
+	return file_proto_analysis_proto_rawDescGZIP(), []int{23}
 }
 
 func (x *RegressionModel) GetRegressionType() string {
@@ -1296,6 +2306,20 @@ func (x *RegressionModel) GetResidualsAnalysis() *ResidualsAnalysisResult {
 	return nil
 }
 
+func (x *RegressionModel) GetFittedCurve() []*DataPoint {
+	if x != nil {
+		return x.FittedCurve
+	}
+	return nil
+}
+
+func (x *RegressionModel) GetMissingFields() []string {
+	if x != nil {
+		return x.MissingFields
+	}
+	return nil
+}
+
 // Коэффициент регрессии
 type RegressionCoefficient struct {
 	state                   protoimpl.MessageState `protogen:"open.v1"`
@@ -1306,13 +2330,14 @@ type RegressionCoefficient struct {
 	PValue                  float64                `protobuf:"fixed64,5,opt,name=p_value,json=pValue,proto3" json:"p_value,omitempty"`
 	ConfidenceIntervalLower float64                `protobuf:"fixed64,6,opt,name=confidence_interval_lower,json=confidenceIntervalLower,proto3" json:"confidence_interval_lower,omitempty"` // Добавлено для CI коэффициентов
 	ConfidenceIntervalUpper float64                `protobuf:"fixed64,7,opt,name=confidence_interval_upper,json=confidenceIntervalUpper,proto3" json:"confidence_interval_upper,omitempty"` // Добавлено для CI коэффициентов
+	MissingFields           []string               `protobuf:"bytes,8,rep,name=missing_fields,json=missingFields,proto3" json:"missing_fields,omitempty"`                                   // Поля, значение которых не определено (NaN); в самих полях передается 0
 	unknownFields           protoimpl.UnknownFields
 	sizeCache               protoimpl.SizeCache
 }
 
 func (x *RegressionCoefficient) Reset() {
 	*x = RegressionCoefficient{}
-	mi := &file_proto_analysis_proto_msgTypes[15]
+	mi := &file_proto_analysis_proto_msgTypes[24]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1324,7 +2349,7 @@ func (x *RegressionCoefficient) String() string {
 func (*RegressionCoefficient) ProtoMessage() {}
 
 func (x *RegressionCoefficient) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_analysis_proto_msgTypes[15]
+	mi := &file_proto_analysis_proto_msgTypes[24]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1337,7 +2362,7 @@ func (x *RegressionCoefficient) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use RegressionCoefficient.ProtoReflect.Descriptor instead.
 func (*RegressionCoefficient) Descriptor() ([]byte, []int) {
-	return file_proto_analysis_proto_rawDescGZIP(), []int{15}
+	return file_proto_analysis_proto_rawDescGZIP(), []int{24}
 }
 
 func (x *RegressionCoefficient) GetVariableName() string {
@@ -1389,6 +2414,13 @@ func (x *RegressionCoefficient) GetConfidenceIntervalUpper() float64 {
 	return 0
 }
 
+func (x *RegressionCoefficient) GetMissingFields() []string {
+	if x != nil {
+		return x.MissingFields
+	}
+	return nil
+}
+
 // Точка данных для графика регрессии
 type DataPoint struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
@@ -1400,7 +2432,7 @@ type DataPoint struct {
 
 func (x *DataPoint) Reset() {
 	*x = DataPoint{}
-	mi := &file_proto_analysis_proto_msgTypes[16]
+	mi := &file_proto_analysis_proto_msgTypes[25]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1412,7 +2444,7 @@ func (x *DataPoint) String() string {
 func (*DataPoint) ProtoMessage() {}
 
 func (x *DataPoint) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_analysis_proto_msgTypes[16]
+	mi := &file_proto_analysis_proto_msgTypes[25]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1425,7 +2457,7 @@ func (x *DataPoint) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use DataPoint.ProtoReflect.Descriptor instead.
 func (*DataPoint) Descriptor() ([]byte, []int) {
-	return file_proto_analysis_proto_rawDescGZIP(), []int{16}
+	return file_proto_analysis_proto_rawDescGZIP(), []int{25}
 }
 
 func (x *DataPoint) GetX() float64 {
@@ -1454,7 +2486,7 @@ type ResidualsAnalysisResult struct {
 
 func (x *ResidualsAnalysisResult) Reset() {
 	*x = ResidualsAnalysisResult{}
-	mi := &file_proto_analysis_proto_msgTypes[17]
+	mi := &file_proto_analysis_proto_msgTypes[26]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1466,7 +2498,7 @@ func (x *ResidualsAnalysisResult) String() string {
 func (*ResidualsAnalysisResult) ProtoMessage() {}
 
 func (x *ResidualsAnalysisResult) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_analysis_proto_msgTypes[17]
+	mi := &file_proto_analysis_proto_msgTypes[26]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1479,7 +2511,7 @@ func (x *ResidualsAnalysisResult) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ResidualsAnalysisResult.ProtoReflect.Descriptor instead.
 func (*ResidualsAnalysisResult) Descriptor() ([]byte, []int) {
-	return file_proto_analysis_proto_rawDescGZIP(), []int{17}
+	return file_proto_analysis_proto_rawDescGZIP(), []int{26}
 }
 
 func (x *ResidualsAnalysisResult) GetShapiroTest() *NormalityTestResult {
@@ -1514,7 +2546,7 @@ type QQPlotData struct {
 
 func (x *QQPlotData) Reset() {
 	*x = QQPlotData{}
-	mi := &file_proto_analysis_proto_msgTypes[18]
+	mi := &file_proto_analysis_proto_msgTypes[27]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -1526,7 +2558,7 @@ func (x *QQPlotData) String() string {
 func (*QQPlotData) ProtoMessage() {}
 
 func (x *QQPlotData) ProtoReflect() protoreflect.Message {
-	mi := &file_proto_analysis_proto_msgTypes[18]
+	mi := &file_proto_analysis_proto_msgTypes[27]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -1539,7 +2571,7 @@ func (x *QQPlotData) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use QQPlotData.ProtoReflect.Descriptor instead.
 func (*QQPlotData) Descriptor() ([]byte, []int) {
-	return file_proto_analysis_proto_rawDescGZIP(), []int{18}
+	return file_proto_analysis_proto_rawDescGZIP(), []int{27}
 }
 
 func (x *QQPlotData) GetTheoreticalQuantiles() []float64 {
@@ -1569,7 +2601,7 @@ var file_proto_analysis_proto_rawDesc = []byte{
 	0x61, 0x6d, 0x65, 0x12, 0x2b, 0x0a, 0x11, 0x73, 0x65, 0x6c, 0x65, 0x63, 0x74, 0x65, 0x64, 0x5f,
 	0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x65, 0x73, 0x18, 0x03, 0x20, 0x03, 0x28, 0x09, 0x52, 0x10,
 	0x73, 0x65, 0x6c, 0x65, 0x63, 0x74, 0x65, 0x64, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x65, 0x73,
-	0x22, 0xaa, 0x03, 0x0a, 0x13, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x7a, 0x65, 0x44, 0x61, 0x74, 0x61,
+	0x22, 0xef, 0x03, 0x0a, 0x13, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x7a, 0x65, 0x44, 0x61, 0x74, 0x61,
 	0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x54, 0x0a, 0x11, 0x64, 0x65, 0x73, 0x63,
 	0x72, 0x69, 0x70, 0x74, 0x69, 0x76, 0x65, 0x5f, 0x73, 0x74, 0x61, 0x74, 0x73, 0x18, 0x01, 0x20,
 	0x01, 0x28, 0x0b, 0x32, 0x27, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x44,
@@ -1595,260 +2627,486 @@ var file_proto_analysis_proto_rawDesc = []byte{
 	0x6e, 0x5f, 0x74, 0x65, 0x73, 0x74, 0x73, 0x18, 0x06, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1f, 0x2e,
 	0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x57, 0x69, 0x6c, 0x63, 0x6f, 0x78, 0x6f,
 	0x6e, 0x54, 0x65, 0x73, 0x74, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x52, 0x0d,
-	0x77, 0x69, 0x6c, 0x63, 0x6f, 0x78, 0x6f, 0x6e, 0x54, 0x65, 0x73, 0x74, 0x73, 0x22, 0x56, 0x0a,
-	0x0c, 0x45, 0x72, 0x72, 0x6f, 0x72, 0x44, 0x65, 0x74, 0x61, 0x69, 0x6c, 0x73, 0x12, 0x12, 0x0a,
-	0x04, 0x63, 0x6f, 0x64, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x63, 0x6f, 0x64,
-	0x65, 0x12, 0x18, 0x0a, 0x07, 0x6d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x18, 0x02, 0x20, 0x01,
-	0x28, 0x09, 0x52, 0x07, 0x6d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x12, 0x18, 0x0a, 0x07, 0x64,
-	0x65, 0x74, 0x61, 0x69, 0x6c, 0x73, 0x18, 0x03, 0x20, 0x03, 0x28, 0x09, 0x52, 0x07, 0x64, 0x65,
-	0x74, 0x61, 0x69, 0x6c, 0x73, 0x22, 0xee, 0x01, 0x0a, 0x1d, 0x44, 0x65, 0x73, 0x63, 0x72, 0x69,
-	0x70, 0x74, 0x69, 0x76, 0x65, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x73, 0x52,
-	0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x43, 0x0a, 0x0c, 0x64, 0x65, 0x73, 0x63, 0x72,
-	0x69, 0x70, 0x74, 0x69, 0x76, 0x65, 0x73, 0x18, 0x01, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x1f, 0x2e,
+	0x77, 0x69, 0x6c, 0x63, 0x6f, 0x78, 0x6f, 0x6e, 0x54, 0x65, 0x73, 0x74, 0x73, 0x12, 0x43, 0x0a,
+	0x0e, 0x61, 0x70, 0x70, 0x72, 0x6f, 0x78, 0x69, 0x6d, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x73, 0x18,
+	0x07, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x1b, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73,
+	0x2e, 0x41, 0x70, 0x70, 0x72, 0x6f, 0x78, 0x69, 0x6d, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x49, 0x6e,
+	0x66, 0x6f, 0x52, 0x0e, 0x61, 0x70, 0x70, 0x72, 0x6f, 0x78, 0x69, 0x6d, 0x61, 0x74, 0x69, 0x6f,
+	0x6e, 0x73, 0x22, 0xa7, 0x02, 0x0a, 0x11, 0x41, 0x70, 0x70, 0x72, 0x6f, 0x78, 0x69, 0x6d, 0x61,
+	0x74, 0x69, 0x6f, 0x6e, 0x49, 0x6e, 0x66, 0x6f, 0x12, 0x18, 0x0a, 0x07, 0x73, 0x65, 0x63, 0x74,
+	0x69, 0x6f, 0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x07, 0x73, 0x65, 0x63, 0x74, 0x69,
+	0x6f, 0x6e, 0x12, 0x18, 0x0a, 0x07, 0x76, 0x61, 0x72, 0x69, 0x61, 0x6e, 0x74, 0x18, 0x02, 0x20,
+	0x01, 0x28, 0x09, 0x52, 0x07, 0x76, 0x61, 0x72, 0x69, 0x61, 0x6e, 0x74, 0x12, 0x20, 0x0a, 0x0b,
+	0x64, 0x65, 0x73, 0x63, 0x72, 0x69, 0x70, 0x74, 0x69, 0x6f, 0x6e, 0x18, 0x03, 0x20, 0x01, 0x28,
+	0x09, 0x52, 0x0b, 0x64, 0x65, 0x73, 0x63, 0x72, 0x69, 0x70, 0x74, 0x69, 0x6f, 0x6e, 0x12, 0x1c,
+	0x0a, 0x09, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x73, 0x18, 0x04, 0x20, 0x03, 0x28,
+	0x09, 0x52, 0x09, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x73, 0x12, 0x1f, 0x0a, 0x0b,
+	0x73, 0x61, 0x6d, 0x70, 0x6c, 0x65, 0x5f, 0x73, 0x69, 0x7a, 0x65, 0x18, 0x05, 0x20, 0x01, 0x28,
+	0x03, 0x52, 0x0a, 0x73, 0x61, 0x6d, 0x70, 0x6c, 0x65, 0x53, 0x69, 0x7a, 0x65, 0x12, 0x27, 0x0a,
+	0x0f, 0x70, 0x6f, 0x70, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x5f, 0x73, 0x69, 0x7a, 0x65,
+	0x18, 0x06, 0x20, 0x01, 0x28, 0x03, 0x52, 0x0e, 0x70, 0x6f, 0x70, 0x75, 0x6c, 0x61, 0x74, 0x69,
+	0x6f, 0x6e, 0x53, 0x69, 0x7a, 0x65, 0x12, 0x35, 0x0a, 0x09, 0x65, 0x73, 0x74, 0x69, 0x6d, 0x61,
+	0x74, 0x65, 0x73, 0x18, 0x07, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x17, 0x2e, 0x61, 0x6e, 0x61, 0x6c,
+	0x79, 0x73, 0x69, 0x73, 0x2e, 0x45, 0x73, 0x74, 0x69, 0x6d, 0x61, 0x74, 0x65, 0x45, 0x72, 0x72,
+	0x6f, 0x72, 0x52, 0x09, 0x65, 0x73, 0x74, 0x69, 0x6d, 0x61, 0x74, 0x65, 0x73, 0x12, 0x1d, 0x0a,
+	0x0a, 0x72, 0x61, 0x6e, 0x6b, 0x5f, 0x65, 0x72, 0x72, 0x6f, 0x72, 0x18, 0x08, 0x20, 0x01, 0x28,
+	0x01, 0x52, 0x09, 0x72, 0x61, 0x6e, 0x6b, 0x45, 0x72, 0x72, 0x6f, 0x72, 0x22, 0xd7, 0x01, 0x0a,
+	0x0d, 0x45, 0x73, 0x74, 0x69, 0x6d, 0x61, 0x74, 0x65, 0x45, 0x72, 0x72, 0x6f, 0x72, 0x12, 0x23,
+	0x0a, 0x0d, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x5f, 0x6e, 0x61, 0x6d, 0x65, 0x18,
+	0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0c, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x4e,
+	0x61, 0x6d, 0x65, 0x12, 0x1c, 0x0a, 0x09, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63,
+	0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x09, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69,
+	0x63, 0x12, 0x1a, 0x0a, 0x08, 0x65, 0x73, 0x74, 0x69, 0x6d, 0x61, 0x74, 0x65, 0x18, 0x03, 0x20,
+	0x01, 0x28, 0x01, 0x52, 0x08, 0x65, 0x73, 0x74, 0x69, 0x6d, 0x61, 0x74, 0x65, 0x12, 0x25, 0x0a,
+	0x0e, 0x73, 0x74, 0x61, 0x6e, 0x64, 0x61, 0x72, 0x64, 0x5f, 0x65, 0x72, 0x72, 0x6f, 0x72, 0x18,
+	0x04, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0d, 0x73, 0x74, 0x61, 0x6e, 0x64, 0x61, 0x72, 0x64, 0x45,
+	0x72, 0x72, 0x6f, 0x72, 0x12, 0x1f, 0x0a, 0x0b, 0x6c, 0x6f, 0x77, 0x65, 0x72, 0x5f, 0x62, 0x6f,
+	0x75, 0x6e, 0x64, 0x18, 0x05, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0a, 0x6c, 0x6f, 0x77, 0x65, 0x72,
+	0x42, 0x6f, 0x75, 0x6e, 0x64, 0x12, 0x1f, 0x0a, 0x0b, 0x75, 0x70, 0x70, 0x65, 0x72, 0x5f, 0x62,
+	0x6f, 0x75, 0x6e, 0x64, 0x18, 0x06, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0a, 0x75, 0x70, 0x70, 0x65,
+	0x72, 0x42, 0x6f, 0x75, 0x6e, 0x64, 0x22, 0x85, 0x02, 0x0a, 0x11, 0x50, 0x72, 0x6f, 0x67, 0x72,
+	0x65, 0x73, 0x73, 0x69, 0x76, 0x65, 0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x12, 0x25, 0x0a, 0x0e,
+	0x72, 0x6f, 0x77, 0x73, 0x5f, 0x70, 0x72, 0x6f, 0x63, 0x65, 0x73, 0x73, 0x65, 0x64, 0x18, 0x01,
+	0x20, 0x01, 0x28, 0x03, 0x52, 0x0d, 0x72, 0x6f, 0x77, 0x73, 0x50, 0x72, 0x6f, 0x63, 0x65, 0x73,
+	0x73, 0x65, 0x64, 0x12, 0x27, 0x0a, 0x0f, 0x70, 0x6f, 0x70, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f,
+	0x6e, 0x5f, 0x73, 0x69, 0x7a, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x03, 0x52, 0x0e, 0x70, 0x6f,
+	0x70, 0x75, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x53, 0x69, 0x7a, 0x65, 0x12, 0x35, 0x0a, 0x09,
+	0x65, 0x73, 0x74, 0x69, 0x6d, 0x61, 0x74, 0x65, 0x73, 0x18, 0x03, 0x20, 0x03, 0x28, 0x0b, 0x32,
+	0x17, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x45, 0x73, 0x74, 0x69, 0x6d,
+	0x61, 0x74, 0x65, 0x45, 0x72, 0x72, 0x6f, 0x72, 0x52, 0x09, 0x65, 0x73, 0x74, 0x69, 0x6d, 0x61,
+	0x74, 0x65, 0x73, 0x12, 0x14, 0x0a, 0x05, 0x66, 0x69, 0x6e, 0x61, 0x6c, 0x18, 0x04, 0x20, 0x01,
+	0x28, 0x08, 0x52, 0x05, 0x66, 0x69, 0x6e, 0x61, 0x6c, 0x12, 0x25, 0x0a, 0x0e, 0x70, 0x72, 0x6f,
+	0x63, 0x65, 0x73, 0x73, 0x69, 0x6e, 0x67, 0x5f, 0x6c, 0x6f, 0x67, 0x18, 0x05, 0x20, 0x03, 0x28,
+	0x09, 0x52, 0x0d, 0x70, 0x72, 0x6f, 0x63, 0x65, 0x73, 0x73, 0x69, 0x6e, 0x67, 0x4c, 0x6f, 0x67,
+	0x12, 0x2c, 0x0a, 0x05, 0x65, 0x72, 0x72, 0x6f, 0x72, 0x18, 0x06, 0x20, 0x01, 0x28, 0x0b, 0x32,
+	0x16, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x45, 0x72, 0x72, 0x6f, 0x72,
+	0x44, 0x65, 0x74, 0x61, 0x69, 0x6c, 0x73, 0x52, 0x05, 0x65, 0x72, 0x72, 0x6f, 0x72, 0x22, 0x9c,
+	0x01, 0x0a, 0x0e, 0x44, 0x61, 0x74, 0x61, 0x73, 0x65, 0x74, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73,
+	0x74, 0x12, 0x1d, 0x0a, 0x0a, 0x64, 0x61, 0x74, 0x61, 0x73, 0x65, 0x74, 0x5f, 0x69, 0x64, 0x18,
+	0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x09, 0x64, 0x61, 0x74, 0x61, 0x73, 0x65, 0x74, 0x49, 0x64,
+	0x12, 0x21, 0x0a, 0x0c, 0x66, 0x69, 0x6c, 0x65, 0x5f, 0x63, 0x6f, 0x6e, 0x74, 0x65, 0x6e, 0x74,
+	0x18, 0x02, 0x20, 0x01, 0x28, 0x0c, 0x52, 0x0b, 0x66, 0x69, 0x6c, 0x65, 0x43, 0x6f, 0x6e, 0x74,
+	0x65, 0x6e, 0x74, 0x12, 0x1b, 0x0a, 0x09, 0x66, 0x69, 0x6c, 0x65, 0x5f, 0x6e, 0x61, 0x6d, 0x65,
+	0x18, 0x03, 0x20, 0x01, 0x28, 0x09, 0x52, 0x08, 0x66, 0x69, 0x6c, 0x65, 0x4e, 0x61, 0x6d, 0x65,
+	0x12, 0x2b, 0x0a, 0x11, 0x73, 0x65, 0x6c, 0x65, 0x63, 0x74, 0x65, 0x64, 0x5f, 0x61, 0x6e, 0x61,
+	0x6c, 0x79, 0x73, 0x65, 0x73, 0x18, 0x04, 0x20, 0x03, 0x28, 0x09, 0x52, 0x10, 0x73, 0x65, 0x6c,
+	0x65, 0x63, 0x74, 0x65, 0x64, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x65, 0x73, 0x22, 0xee, 0x01,
+	0x0a, 0x0f, 0x44, 0x61, 0x74, 0x61, 0x73, 0x65, 0x74, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73,
+	0x65, 0x12, 0x1d, 0x0a, 0x0a, 0x64, 0x61, 0x74, 0x61, 0x73, 0x65, 0x74, 0x5f, 0x69, 0x64, 0x18,
+	0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x09, 0x64, 0x61, 0x74, 0x61, 0x73, 0x65, 0x74, 0x49, 0x64,
+	0x12, 0x1b, 0x0a, 0x09, 0x72, 0x6f, 0x77, 0x5f, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x18, 0x02, 0x20,
+	0x01, 0x28, 0x03, 0x52, 0x08, 0x72, 0x6f, 0x77, 0x43, 0x6f, 0x75, 0x6e, 0x74, 0x12, 0x23, 0x0a,
+	0x0d, 0x61, 0x70, 0x70, 0x65, 0x6e, 0x64, 0x65, 0x64, 0x5f, 0x72, 0x6f, 0x77, 0x73, 0x18, 0x03,
+	0x20, 0x01, 0x28, 0x03, 0x52, 0x0c, 0x61, 0x70, 0x70, 0x65, 0x6e, 0x64, 0x65, 0x64, 0x52, 0x6f,
+	0x77, 0x73, 0x12, 0x39, 0x0a, 0x08, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x18, 0x04,
+	0x20, 0x01, 0x28, 0x0b, 0x32, 0x1d, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e,
+	0x41, 0x6e, 0x61, 0x6c, 0x79, 0x7a, 0x65, 0x44, 0x61, 0x74, 0x61, 0x52, 0x65, 0x73, 0x70, 0x6f,
+	0x6e, 0x73, 0x65, 0x52, 0x08, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x12, 0x3f, 0x0a,
+	0x0c, 0x63, 0x6f, 0x72, 0x72, 0x65, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x73, 0x18, 0x05, 0x20,
+	0x03, 0x28, 0x0b, 0x32, 0x1b, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x43,
+	0x6f, 0x72, 0x72, 0x65, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74,
+	0x52, 0x0c, 0x63, 0x6f, 0x72, 0x72, 0x65, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x73, 0x22, 0x89,
+	0x01, 0x0a, 0x11, 0x43, 0x6f, 0x72, 0x72, 0x65, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x52, 0x65,
+	0x73, 0x75, 0x6c, 0x74, 0x12, 0x1d, 0x0a, 0x0a, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65,
+	0x5f, 0x78, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x09, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62,
+	0x6c, 0x65, 0x58, 0x12, 0x1d, 0x0a, 0x0a, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x5f,
+	0x79, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x09, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c,
+	0x65, 0x59, 0x12, 0x14, 0x0a, 0x05, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x18, 0x03, 0x20, 0x01, 0x28,
+	0x03, 0x52, 0x05, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x12, 0x20, 0x0a, 0x0b, 0x63, 0x6f, 0x72, 0x72,
+	0x65, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x18, 0x04, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0b, 0x63,
+	0x6f, 0x72, 0x72, 0x65, 0x6c, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x22, 0x56, 0x0a, 0x0c, 0x45, 0x72,
+	0x72, 0x6f, 0x72, 0x44, 0x65, 0x74, 0x61, 0x69, 0x6c, 0x73, 0x12, 0x12, 0x0a, 0x04, 0x63, 0x6f,
+	0x64, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x63, 0x6f, 0x64, 0x65, 0x12, 0x18,
+	0x0a, 0x07, 0x6d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52,
+	0x07, 0x6d, 0x65, 0x73, 0x73, 0x61, 0x67, 0x65, 0x12, 0x18, 0x0a, 0x07, 0x64, 0x65, 0x74, 0x61,
+	0x69, 0x6c, 0x73, 0x18, 0x03, 0x20, 0x03, 0x28, 0x09, 0x52, 0x07, 0x64, 0x65, 0x74, 0x61, 0x69,
+	0x6c, 0x73, 0x22, 0xff, 0x02, 0x0a, 0x1d, 0x44, 0x65, 0x73, 0x63, 0x72, 0x69, 0x70, 0x74, 0x69,
+	0x76, 0x65, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x73, 0x52, 0x65, 0x73, 0x70,
+	0x6f, 0x6e, 0x73, 0x65, 0x12, 0x43, 0x0a, 0x0c, 0x64, 0x65, 0x73, 0x63, 0x72, 0x69, 0x70, 0x74,
+	0x69, 0x76, 0x65, 0x73, 0x18, 0x01, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x1f, 0x2e, 0x61, 0x6e, 0x61,
+	0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x44, 0x65, 0x73, 0x63, 0x72, 0x69, 0x70, 0x74, 0x69, 0x76,
+	0x65, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x73, 0x52, 0x0c, 0x64, 0x65, 0x73,
+	0x63, 0x72, 0x69, 0x70, 0x74, 0x69, 0x76, 0x65, 0x73, 0x12, 0x37, 0x0a, 0x0a, 0x68, 0x69, 0x73,
+	0x74, 0x6f, 0x67, 0x72, 0x61, 0x6d, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x17, 0x2e,
+	0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x48, 0x69, 0x73, 0x74, 0x6f, 0x67, 0x72,
+	0x61, 0x6d, 0x44, 0x61, 0x74, 0x61, 0x52, 0x0a, 0x68, 0x69, 0x73, 0x74, 0x6f, 0x67, 0x72, 0x61,
+	0x6d, 0x73, 0x12, 0x4f, 0x0a, 0x14, 0x63, 0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65, 0x6e, 0x63, 0x65,
+	0x5f, 0x69, 0x6e, 0x74, 0x65, 0x72, 0x76, 0x61, 0x6c, 0x73, 0x18, 0x04, 0x20, 0x03, 0x28, 0x0b,
+	0x32, 0x1c, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x43, 0x6f, 0x6e, 0x66,
+	0x69, 0x64, 0x65, 0x6e, 0x63, 0x65, 0x49, 0x6e, 0x74, 0x65, 0x72, 0x76, 0x61, 0x6c, 0x52, 0x13,
+	0x63, 0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65, 0x6e, 0x63, 0x65, 0x49, 0x6e, 0x74, 0x65, 0x72, 0x76,
+	0x61, 0x6c, 0x73, 0x12, 0x59, 0x0a, 0x14, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x65, 0x64, 0x5f, 0x64,
+	0x65, 0x73, 0x63, 0x72, 0x69, 0x70, 0x74, 0x69, 0x76, 0x65, 0x73, 0x18, 0x05, 0x20, 0x03, 0x28,
+	0x0b, 0x32, 0x26, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x47, 0x72, 0x6f,
+	0x75, 0x70, 0x65, 0x64, 0x44, 0x65, 0x73, 0x63, 0x72, 0x69, 0x70, 0x74, 0x69, 0x76, 0x65, 0x53,
+	0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x73, 0x52, 0x13, 0x67, 0x72, 0x6f, 0x75, 0x70,
+	0x65, 0x64, 0x44, 0x65, 0x73, 0x63, 0x72, 0x69, 0x70, 0x74, 0x69, 0x76, 0x65, 0x73, 0x12, 0x34,
+	0x0a, 0x08, 0x6f, 0x75, 0x74, 0x6c, 0x69, 0x65, 0x72, 0x73, 0x18, 0x06, 0x20, 0x03, 0x28, 0x0b,
+	0x32, 0x18, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x4f, 0x75, 0x74, 0x6c,
+	0x69, 0x65, 0x72, 0x53, 0x75, 0x6d, 0x6d, 0x61, 0x72, 0x79, 0x52, 0x08, 0x6f, 0x75, 0x74, 0x6c,
+	0x69, 0x65, 0x72, 0x73, 0x22, 0xc9, 0x05, 0x0a, 0x0e, 0x4f, 0x75, 0x74, 0x6c, 0x69, 0x65, 0x72,
+	0x53, 0x75, 0x6d, 0x6d, 0x61, 0x72, 0x79, 0x12, 0x23, 0x0a, 0x0d, 0x76, 0x61, 0x72, 0x69, 0x61,
+	0x62, 0x6c, 0x65, 0x5f, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0c,
+	0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x4e, 0x61, 0x6d, 0x65, 0x12, 0x25, 0x0a, 0x0e,
+	0x69, 0x71, 0x72, 0x5f, 0x6d, 0x75, 0x6c, 0x74, 0x69, 0x70, 0x6c, 0x69, 0x65, 0x72, 0x18, 0x02,
+	0x20, 0x01, 0x28, 0x01, 0x52, 0x0d, 0x69, 0x71, 0x72, 0x4d, 0x75, 0x6c, 0x74, 0x69, 0x70, 0x6c,
+	0x69, 0x65, 0x72, 0x12, 0x1f, 0x0a, 0x0b, 0x6c, 0x6f, 0x77, 0x65, 0x72, 0x5f, 0x66, 0x65, 0x6e,
+	0x63, 0x65, 0x18, 0x03, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0a, 0x6c, 0x6f, 0x77, 0x65, 0x72, 0x46,
+	0x65, 0x6e, 0x63, 0x65, 0x12, 0x1f, 0x0a, 0x0b, 0x75, 0x70, 0x70, 0x65, 0x72, 0x5f, 0x66, 0x65,
+	0x6e, 0x63, 0x65, 0x18, 0x04, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0a, 0x75, 0x70, 0x70, 0x65, 0x72,
+	0x46, 0x65, 0x6e, 0x63, 0x65, 0x12, 0x23, 0x0a, 0x0d, 0x6c, 0x6f, 0x77, 0x65, 0x72, 0x5f, 0x77,
+	0x68, 0x69, 0x73, 0x6b, 0x65, 0x72, 0x18, 0x05, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0c, 0x6c, 0x6f,
+	0x77, 0x65, 0x72, 0x57, 0x68, 0x69, 0x73, 0x6b, 0x65, 0x72, 0x12, 0x23, 0x0a, 0x0d, 0x75, 0x70,
+	0x70, 0x65, 0x72, 0x5f, 0x77, 0x68, 0x69, 0x73, 0x6b, 0x65, 0x72, 0x18, 0x06, 0x20, 0x01, 0x28,
+	0x01, 0x52, 0x0c, 0x75, 0x70, 0x70, 0x65, 0x72, 0x57, 0x68, 0x69, 0x73, 0x6b, 0x65, 0x72, 0x12,
+	0x2a, 0x0a, 0x11, 0x69, 0x71, 0x72, 0x5f, 0x6f, 0x75, 0x74, 0x6c, 0x69, 0x65, 0x72, 0x5f, 0x63,
+	0x6f, 0x75, 0x6e, 0x74, 0x18, 0x07, 0x20, 0x01, 0x28, 0x03, 0x52, 0x0f, 0x69, 0x71, 0x72, 0x4f,
+	0x75, 0x74, 0x6c, 0x69, 0x65, 0x72, 0x43, 0x6f, 0x75, 0x6e, 0x74, 0x12, 0x1f, 0x0a, 0x0b, 0x7a,
+	0x5f, 0x74, 0x68, 0x72, 0x65, 0x73, 0x68, 0x6f, 0x6c, 0x64, 0x18, 0x08, 0x20, 0x01, 0x28, 0x01,
+	0x52, 0x0a, 0x7a, 0x54, 0x68, 0x72, 0x65, 0x73, 0x68, 0x6f, 0x6c, 0x64, 0x12, 0x22, 0x0a, 0x0d,
+	0x7a, 0x5f, 0x6c, 0x6f, 0x77, 0x65, 0x72, 0x5f, 0x62, 0x6f, 0x75, 0x6e, 0x64, 0x18, 0x09, 0x20,
+	0x01, 0x28, 0x01, 0x52, 0x0b, 0x7a, 0x4c, 0x6f, 0x77, 0x65, 0x72, 0x42, 0x6f, 0x75, 0x6e, 0x64,
+	0x12, 0x22, 0x0a, 0x0d, 0x7a, 0x5f, 0x75, 0x70, 0x70, 0x65, 0x72, 0x5f, 0x62, 0x6f, 0x75, 0x6e,
+	0x64, 0x18, 0x0a, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0b, 0x7a, 0x55, 0x70, 0x70, 0x65, 0x72, 0x42,
+	0x6f, 0x75, 0x6e, 0x64, 0x12, 0x26, 0x0a, 0x0f, 0x7a, 0x5f, 0x6f, 0x75, 0x74, 0x6c, 0x69, 0x65,
+	0x72, 0x5f, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x18, 0x0b, 0x20, 0x01, 0x28, 0x03, 0x52, 0x0d, 0x7a,
+	0x4f, 0x75, 0x74, 0x6c, 0x69, 0x65, 0x72, 0x43, 0x6f, 0x75, 0x6e, 0x74, 0x12, 0x10, 0x0a, 0x03,
+	0x6d, 0x61, 0x64, 0x18, 0x0c, 0x20, 0x01, 0x28, 0x01, 0x52, 0x03, 0x6d, 0x61, 0x64, 0x12, 0x23,
+	0x0a, 0x0d, 0x6d, 0x61, 0x64, 0x5f, 0x74, 0x68, 0x72, 0x65, 0x73, 0x68, 0x6f, 0x6c, 0x64, 0x18,
+	0x0d, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0c, 0x6d, 0x61, 0x64, 0x54, 0x68, 0x72, 0x65, 0x73, 0x68,
+	0x6f, 0x6c, 0x64, 0x12, 0x26, 0x0a, 0x0f, 0x6d, 0x61, 0x64, 0x5f, 0x6c, 0x6f, 0x77, 0x65, 0x72,
+	0x5f, 0x62, 0x6f, 0x75, 0x6e, 0x64, 0x18, 0x0e, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0d, 0x6d, 0x61,
+	0x64, 0x4c, 0x6f, 0x77, 0x65, 0x72, 0x42, 0x6f, 0x75, 0x6e, 0x64, 0x12, 0x26, 0x0a, 0x0f, 0x6d,
+	0x61, 0x64, 0x5f, 0x75, 0x70, 0x70, 0x65, 0x72, 0x5f, 0x62, 0x6f, 0x75, 0x6e, 0x64, 0x18, 0x0f,
+	0x20, 0x01, 0x28, 0x01, 0x52, 0x0d, 0x6d, 0x61, 0x64, 0x55, 0x70, 0x70, 0x65, 0x72, 0x42, 0x6f,
+	0x75, 0x6e, 0x64, 0x12, 0x2a, 0x0a, 0x11, 0x6d, 0x61, 0x64, 0x5f, 0x6f, 0x75, 0x74, 0x6c, 0x69,
+	0x65, 0x72, 0x5f, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x18, 0x10, 0x20, 0x01, 0x28, 0x03, 0x52, 0x0f,
+	0x6d, 0x61, 0x64, 0x4f, 0x75, 0x74, 0x6c, 0x69, 0x65, 0x72, 0x43, 0x6f, 0x75, 0x6e, 0x74, 0x12,
+	0x21, 0x0a, 0x0c, 0x6f, 0x75, 0x74, 0x6c, 0x69, 0x65, 0x72, 0x5f, 0x72, 0x6f, 0x77, 0x73, 0x18,
+	0x11, 0x20, 0x03, 0x28, 0x03, 0x52, 0x0b, 0x6f, 0x75, 0x74, 0x6c, 0x69, 0x65, 0x72, 0x52, 0x6f,
+	0x77, 0x73, 0x12, 0x25, 0x0a, 0x0e, 0x6f, 0x75, 0x74, 0x6c, 0x69, 0x65, 0x72, 0x5f, 0x76, 0x61,
+	0x6c, 0x75, 0x65, 0x73, 0x18, 0x12, 0x20, 0x03, 0x28, 0x01, 0x52, 0x0d, 0x6f, 0x75, 0x74, 0x6c,
+	0x69, 0x65, 0x72, 0x56, 0x61, 0x6c, 0x75, 0x65, 0x73, 0x12, 0x25, 0x0a, 0x0e, 0x6d, 0x69, 0x73,
+	0x73, 0x69, 0x6e, 0x67, 0x5f, 0x66, 0x69, 0x65, 0x6c, 0x64, 0x73, 0x18, 0x13, 0x20, 0x03, 0x28,
+	0x09, 0x52, 0x0d, 0x6d, 0x69, 0x73, 0x73, 0x69, 0x6e, 0x67, 0x46, 0x69, 0x65, 0x6c, 0x64, 0x73,
+	0x22, 0xb7, 0x01, 0x0a, 0x1c, 0x47, 0x72, 0x6f, 0x75, 0x70, 0x65, 0x64, 0x44, 0x65, 0x73, 0x63,
+	0x72, 0x69, 0x70, 0x74, 0x69, 0x76, 0x65, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63,
+	0x73, 0x12, 0x21, 0x0a, 0x0c, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x5f, 0x63, 0x6f, 0x6c, 0x75, 0x6d,
+	0x6e, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0b, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x43, 0x6f,
+	0x6c, 0x75, 0x6d, 0x6e, 0x12, 0x14, 0x0a, 0x05, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x18, 0x02, 0x20,
+	0x01, 0x28, 0x09, 0x52, 0x05, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x12, 0x1d, 0x0a, 0x0a, 0x67, 0x72,
+	0x6f, 0x75, 0x70, 0x5f, 0x73, 0x69, 0x7a, 0x65, 0x18, 0x03, 0x20, 0x01, 0x28, 0x03, 0x52, 0x09,
+	0x67, 0x72, 0x6f, 0x75, 0x70, 0x53, 0x69, 0x7a, 0x65, 0x12, 0x3f, 0x0a, 0x0a, 0x73, 0x74, 0x61,
+	0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x73, 0x18, 0x04, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1f, 0x2e,
 	0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x44, 0x65, 0x73, 0x63, 0x72, 0x69, 0x70,
-	0x74, 0x69, 0x76, 0x65, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x73, 0x52, 0x0c,
-	0x64, 0x65, 0x73, 0x63, 0x72, 0x69, 0x70, 0x74, 0x69, 0x76, 0x65, 0x73, 0x12, 0x37, 0x0a, 0x0a,
-	0x68, 0x69, 0x73, 0x74, 0x6f, 0x67, 0x72, 0x61, 0x6d, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x0b,
-	0x32, 0x17, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x48, 0x69, 0x73, 0x74,
-	0x6f, 0x67, 0x72, 0x61, 0x6d, 0x44, 0x61, 0x74, 0x61, 0x52, 0x0a, 0x68, 0x69, 0x73, 0x74, 0x6f,
-	0x67, 0x72, 0x61, 0x6d, 0x73, 0x12, 0x4f, 0x0a, 0x14, 0x63, 0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65,
-	0x6e, 0x63, 0x65, 0x5f, 0x69, 0x6e, 0x74, 0x65, 0x72, 0x76, 0x61, 0x6c, 0x73, 0x18, 0x04, 0x20,
-	0x03, 0x28, 0x0b, 0x32, 0x1c, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x43,
-	0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65, 0x6e, 0x63, 0x65, 0x49, 0x6e, 0x74, 0x65, 0x72, 0x76, 0x61,
-	0x6c, 0x52, 0x13, 0x63, 0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65, 0x6e, 0x63, 0x65, 0x49, 0x6e, 0x74,
-	0x65, 0x72, 0x76, 0x61, 0x6c, 0x73, 0x22, 0xa0, 0x03, 0x0a, 0x15, 0x44, 0x65, 0x73, 0x63, 0x72,
-	0x69, 0x70, 0x74, 0x69, 0x76, 0x65, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x73,
-	0x12, 0x23, 0x0a, 0x0d, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x5f, 0x6e, 0x61, 0x6d,
-	0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0c, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c,
-	0x65, 0x4e, 0x61, 0x6d, 0x65, 0x12, 0x14, 0x0a, 0x05, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x18, 0x02,
-	0x20, 0x01, 0x28, 0x09, 0x52, 0x05, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x12, 0x12, 0x0a, 0x04, 0x6d,
-	0x65, 0x61, 0x6e, 0x18, 0x03, 0x20, 0x01, 0x28, 0x01, 0x52, 0x04, 0x6d, 0x65, 0x61, 0x6e, 0x12,
-	0x16, 0x0a, 0x06, 0x6d, 0x65, 0x64, 0x69, 0x61, 0x6e, 0x18, 0x04, 0x20, 0x01, 0x28, 0x01, 0x52,
-	0x06, 0x6d, 0x65, 0x64, 0x69, 0x61, 0x6e, 0x12, 0x12, 0x0a, 0x04, 0x6d, 0x6f, 0x64, 0x65, 0x18,
-	0x05, 0x20, 0x03, 0x28, 0x09, 0x52, 0x04, 0x6d, 0x6f, 0x64, 0x65, 0x12, 0x1a, 0x0a, 0x08, 0x76,
-	0x61, 0x72, 0x69, 0x61, 0x6e, 0x63, 0x65, 0x18, 0x06, 0x20, 0x01, 0x28, 0x01, 0x52, 0x08, 0x76,
-	0x61, 0x72, 0x69, 0x61, 0x6e, 0x63, 0x65, 0x12, 0x17, 0x0a, 0x07, 0x73, 0x74, 0x64, 0x5f, 0x64,
+	0x74, 0x69, 0x76, 0x65, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x73, 0x52, 0x0a,
+	0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x73, 0x22, 0xc1, 0x04, 0x0a, 0x15, 0x44,
+	0x65, 0x73, 0x63, 0x72, 0x69, 0x70, 0x74, 0x69, 0x76, 0x65, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73,
+	0x74, 0x69, 0x63, 0x73, 0x12, 0x23, 0x0a, 0x0d, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65,
+	0x5f, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0c, 0x76, 0x61, 0x72,
+	0x69, 0x61, 0x62, 0x6c, 0x65, 0x4e, 0x61, 0x6d, 0x65, 0x12, 0x14, 0x0a, 0x05, 0x63, 0x6f, 0x75,
+	0x6e, 0x74, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x05, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x12,
+	0x12, 0x0a, 0x04, 0x6d, 0x65, 0x61, 0x6e, 0x18, 0x03, 0x20, 0x01, 0x28, 0x01, 0x52, 0x04, 0x6d,
+	0x65, 0x61, 0x6e, 0x12, 0x16, 0x0a, 0x06, 0x6d, 0x65, 0x64, 0x69, 0x61, 0x6e, 0x18, 0x04, 0x20,
+	0x01, 0x28, 0x01, 0x52, 0x06, 0x6d, 0x65, 0x64, 0x69, 0x61, 0x6e, 0x12, 0x12, 0x0a, 0x04, 0x6d,
+	0x6f, 0x64, 0x65, 0x18, 0x05, 0x20, 0x03, 0x28, 0x09, 0x52, 0x04, 0x6d, 0x6f, 0x64, 0x65, 0x12,
+	0x1a, 0x0a, 0x08, 0x76, 0x61, 0x72, 0x69, 0x61, 0x6e, 0x63, 0x65, 0x18, 0x06, 0x20, 0x01, 0x28,
+	0x01, 0x52, 0x08, 0x76, 0x61, 0x72, 0x69, 0x61, 0x6e, 0x63, 0x65, 0x12, 0x17, 0x0a, 0x07, 0x73,
+	0x74, 0x64, 0x5f, 0x64, 0x65, 0x76, 0x18, 0x07, 0x20, 0x01, 0x28, 0x01, 0x52, 0x06, 0x73, 0x74,
+	0x64, 0x44, 0x65, 0x76, 0x12, 0x33, 0x0a, 0x15, 0x76, 0x61, 0x72, 0x69, 0x61, 0x74, 0x69, 0x6f,
+	0x6e, 0x5f, 0x63, 0x6f, 0x65, 0x66, 0x66, 0x69, 0x63, 0x69, 0x65, 0x6e, 0x74, 0x18, 0x08, 0x20,
+	0x01, 0x28, 0x01, 0x52, 0x14, 0x76, 0x61, 0x72, 0x69, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x43, 0x6f,
+	0x65, 0x66, 0x66, 0x69, 0x63, 0x69, 0x65, 0x6e, 0x74, 0x12, 0x1a, 0x0a, 0x08, 0x73, 0x6b, 0x65,
+	0x77, 0x6e, 0x65, 0x73, 0x73, 0x18, 0x09, 0x20, 0x01, 0x28, 0x01, 0x52, 0x08, 0x73, 0x6b, 0x65,
+	0x77, 0x6e, 0x65, 0x73, 0x73, 0x12, 0x1a, 0x0a, 0x08, 0x6b, 0x75, 0x72, 0x74, 0x6f, 0x73, 0x69,
+	0x73, 0x18, 0x0a, 0x20, 0x01, 0x28, 0x01, 0x52, 0x08, 0x6b, 0x75, 0x72, 0x74, 0x6f, 0x73, 0x69,
+	0x73, 0x12, 0x1b, 0x0a, 0x09, 0x6d, 0x69, 0x6e, 0x5f, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x18, 0x0b,
+	0x20, 0x01, 0x28, 0x01, 0x52, 0x08, 0x6d, 0x69, 0x6e, 0x56, 0x61, 0x6c, 0x75, 0x65, 0x12, 0x1b,
+	0x0a, 0x09, 0x6d, 0x61, 0x78, 0x5f, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x18, 0x0c, 0x20, 0x01, 0x28,
+	0x01, 0x52, 0x08, 0x6d, 0x61, 0x78, 0x56, 0x61, 0x6c, 0x75, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x71,
+	0x31, 0x18, 0x0d, 0x20, 0x01, 0x28, 0x01, 0x52, 0x02, 0x71, 0x31, 0x12, 0x0e, 0x0a, 0x02, 0x71,
+	0x33, 0x18, 0x0e, 0x20, 0x01, 0x28, 0x01, 0x52, 0x02, 0x71, 0x33, 0x12, 0x10, 0x0a, 0x03, 0x69,
+	0x71, 0x72, 0x18, 0x0f, 0x20, 0x01, 0x28, 0x01, 0x52, 0x03, 0x69, 0x71, 0x72, 0x12, 0x25, 0x0a,
+	0x0e, 0x6d, 0x69, 0x73, 0x73, 0x69, 0x6e, 0x67, 0x5f, 0x66, 0x69, 0x65, 0x6c, 0x64, 0x73, 0x18,
+	0x10, 0x20, 0x03, 0x28, 0x09, 0x52, 0x0d, 0x6d, 0x69, 0x73, 0x73, 0x69, 0x6e, 0x67, 0x46, 0x69,
+	0x65, 0x6c, 0x64, 0x73, 0x12, 0x25, 0x0a, 0x0e, 0x6d, 0x6f, 0x64, 0x65, 0x5f, 0x66, 0x72, 0x65,
+	0x71, 0x75, 0x65, 0x6e, 0x63, 0x79, 0x18, 0x11, 0x20, 0x01, 0x28, 0x03, 0x52, 0x0d, 0x6d, 0x6f,
+	0x64, 0x65, 0x46, 0x72, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x63, 0x79, 0x12, 0x1d, 0x0a, 0x0a, 0x6d,
+	0x6f, 0x64, 0x65, 0x5f, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x18, 0x12, 0x20, 0x01, 0x28, 0x03, 0x52,
+	0x09, 0x6d, 0x6f, 0x64, 0x65, 0x43, 0x6f, 0x75, 0x6e, 0x74, 0x12, 0x32, 0x0a, 0x15, 0x65, 0x66,
+	0x66, 0x65, 0x63, 0x74, 0x69, 0x76, 0x65, 0x5f, 0x73, 0x61, 0x6d, 0x70, 0x6c, 0x65, 0x5f, 0x73,
+	0x69, 0x7a, 0x65, 0x18, 0x13, 0x20, 0x01, 0x28, 0x01, 0x52, 0x13, 0x65, 0x66, 0x66, 0x65, 0x63,
+	0x74, 0x69, 0x76, 0x65, 0x53, 0x61, 0x6d, 0x70, 0x6c, 0x65, 0x53, 0x69, 0x7a, 0x65, 0x22, 0xae,
+	0x02, 0x0a, 0x0d, 0x48, 0x69, 0x73, 0x74, 0x6f, 0x67, 0x72, 0x61, 0x6d, 0x44, 0x61, 0x74, 0x61,
+	0x12, 0x1f, 0x0a, 0x0b, 0x63, 0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x5f, 0x6e, 0x61, 0x6d, 0x65, 0x18,
+	0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x63, 0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x4e, 0x61, 0x6d,
+	0x65, 0x12, 0x12, 0x0a, 0x04, 0x62, 0x69, 0x6e, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x01, 0x52,
+	0x04, 0x62, 0x69, 0x6e, 0x73, 0x12, 0x20, 0x0a, 0x0b, 0x66, 0x72, 0x65, 0x71, 0x75, 0x65, 0x6e,
+	0x63, 0x69, 0x65, 0x73, 0x18, 0x03, 0x20, 0x03, 0x28, 0x05, 0x52, 0x0b, 0x66, 0x72, 0x65, 0x71,
+	0x75, 0x65, 0x6e, 0x63, 0x69, 0x65, 0x73, 0x12, 0x24, 0x0a, 0x0e, 0x6e, 0x6f, 0x72, 0x6d, 0x61,
+	0x6c, 0x5f, 0x63, 0x75, 0x72, 0x76, 0x65, 0x5f, 0x78, 0x18, 0x04, 0x20, 0x03, 0x28, 0x01, 0x52,
+	0x0c, 0x6e, 0x6f, 0x72, 0x6d, 0x61, 0x6c, 0x43, 0x75, 0x72, 0x76, 0x65, 0x58, 0x12, 0x24, 0x0a,
+	0x0e, 0x6e, 0x6f, 0x72, 0x6d, 0x61, 0x6c, 0x5f, 0x63, 0x75, 0x72, 0x76, 0x65, 0x5f, 0x79, 0x18,
+	0x05, 0x20, 0x03, 0x28, 0x01, 0x52, 0x0c, 0x6e, 0x6f, 0x72, 0x6d, 0x61, 0x6c, 0x43, 0x75, 0x72,
+	0x76, 0x65, 0x59, 0x12, 0x12, 0x0a, 0x04, 0x6d, 0x65, 0x61, 0x6e, 0x18, 0x06, 0x20, 0x01, 0x28,
+	0x01, 0x52, 0x04, 0x6d, 0x65, 0x61, 0x6e, 0x12, 0x17, 0x0a, 0x07, 0x73, 0x74, 0x64, 0x5f, 0x64,
 	0x65, 0x76, 0x18, 0x07, 0x20, 0x01, 0x28, 0x01, 0x52, 0x06, 0x73, 0x74, 0x64, 0x44, 0x65, 0x76,
-	0x12, 0x33, 0x0a, 0x15, 0x76, 0x61, 0x72, 0x69, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x5f, 0x63, 0x6f,
-	0x65, 0x66, 0x66, 0x69, 0x63, 0x69, 0x65, 0x6e, 0x74, 0x18, 0x08, 0x20, 0x01, 0x28, 0x01, 0x52,
-	0x14, 0x76, 0x61, 0x72, 0x69, 0x61, 0x74, 0x69, 0x6f, 0x6e, 0x43, 0x6f, 0x65, 0x66, 0x66, 0x69,
-	0x63, 0x69, 0x65, 0x6e, 0x74, 0x12, 0x1a, 0x0a, 0x08, 0x73, 0x6b, 0x65, 0x77, 0x6e, 0x65, 0x73,
-	0x73, 0x18, 0x09, 0x20, 0x01, 0x28, 0x01, 0x52, 0x08, 0x73, 0x6b, 0x65, 0x77, 0x6e, 0x65, 0x73,
-	0x73, 0x12, 0x1a, 0x0a, 0x08, 0x6b, 0x75, 0x72, 0x74, 0x6f, 0x73, 0x69, 0x73, 0x18, 0x0a, 0x20,
-	0x01, 0x28, 0x01, 0x52, 0x08, 0x6b, 0x75, 0x72, 0x74, 0x6f, 0x73, 0x69, 0x73, 0x12, 0x1b, 0x0a,
-	0x09, 0x6d, 0x69, 0x6e, 0x5f, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x18, 0x0b, 0x20, 0x01, 0x28, 0x01,
-	0x52, 0x08, 0x6d, 0x69, 0x6e, 0x56, 0x61, 0x6c, 0x75, 0x65, 0x12, 0x1b, 0x0a, 0x09, 0x6d, 0x61,
-	0x78, 0x5f, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x18, 0x0c, 0x20, 0x01, 0x28, 0x01, 0x52, 0x08, 0x6d,
-	0x61, 0x78, 0x56, 0x61, 0x6c, 0x75, 0x65, 0x12, 0x0e, 0x0a, 0x02, 0x71, 0x31, 0x18, 0x0d, 0x20,
-	0x01, 0x28, 0x01, 0x52, 0x02, 0x71, 0x31, 0x12, 0x0e, 0x0a, 0x02, 0x71, 0x33, 0x18, 0x0e, 0x20,
-	0x01, 0x28, 0x01, 0x52, 0x02, 0x71, 0x33, 0x12, 0x10, 0x0a, 0x03, 0x69, 0x71, 0x72, 0x18, 0x0f,
-	0x20, 0x01, 0x28, 0x01, 0x52, 0x03, 0x69, 0x71, 0x72, 0x22, 0xdf, 0x01, 0x0a, 0x0d, 0x48, 0x69,
-	0x73, 0x74, 0x6f, 0x67, 0x72, 0x61, 0x6d, 0x44, 0x61, 0x74, 0x61, 0x12, 0x1f, 0x0a, 0x0b, 0x63,
-	0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x5f, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09,
-	0x52, 0x0a, 0x63, 0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x4e, 0x61, 0x6d, 0x65, 0x12, 0x12, 0x0a, 0x04,
-	0x62, 0x69, 0x6e, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x01, 0x52, 0x04, 0x62, 0x69, 0x6e, 0x73,
-	0x12, 0x20, 0x0a, 0x0b, 0x66, 0x72, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x63, 0x69, 0x65, 0x73, 0x18,
-	0x03, 0x20, 0x03, 0x28, 0x05, 0x52, 0x0b, 0x66, 0x72, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x63, 0x69,
-	0x65, 0x73, 0x12, 0x24, 0x0a, 0x0e, 0x6e, 0x6f, 0x72, 0x6d, 0x61, 0x6c, 0x5f, 0x63, 0x75, 0x72,
-	0x76, 0x65, 0x5f, 0x78, 0x18, 0x04, 0x20, 0x03, 0x28, 0x01, 0x52, 0x0c, 0x6e, 0x6f, 0x72, 0x6d,
-	0x61, 0x6c, 0x43, 0x75, 0x72, 0x76, 0x65, 0x58, 0x12, 0x24, 0x0a, 0x0e, 0x6e, 0x6f, 0x72, 0x6d,
-	0x61, 0x6c, 0x5f, 0x63, 0x75, 0x72, 0x76, 0x65, 0x5f, 0x79, 0x18, 0x05, 0x20, 0x03, 0x28, 0x01,
-	0x52, 0x0c, 0x6e, 0x6f, 0x72, 0x6d, 0x61, 0x6c, 0x43, 0x75, 0x72, 0x76, 0x65, 0x59, 0x12, 0x12,
-	0x0a, 0x04, 0x6d, 0x65, 0x61, 0x6e, 0x18, 0x06, 0x20, 0x01, 0x28, 0x01, 0x52, 0x04, 0x6d, 0x65,
-	0x61, 0x6e, 0x12, 0x17, 0x0a, 0x07, 0x73, 0x74, 0x64, 0x5f, 0x64, 0x65, 0x76, 0x18, 0x07, 0x20,
-	0x01, 0x28, 0x01, 0x52, 0x06, 0x73, 0x74, 0x64, 0x44, 0x65, 0x76, 0x22, 0xdd, 0x01, 0x0a, 0x12,
-	0x43, 0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65, 0x6e, 0x63, 0x65, 0x49, 0x6e, 0x74, 0x65, 0x72, 0x76,
-	0x61, 0x6c, 0x12, 0x1f, 0x0a, 0x0b, 0x63, 0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x5f, 0x6e, 0x61, 0x6d,
+	0x12, 0x13, 0x0a, 0x05, 0x6b, 0x64, 0x65, 0x5f, 0x78, 0x18, 0x08, 0x20, 0x03, 0x28, 0x01, 0x52,
+	0x04, 0x6b, 0x64, 0x65, 0x58, 0x12, 0x13, 0x0a, 0x05, 0x6b, 0x64, 0x65, 0x5f, 0x79, 0x18, 0x09,
+	0x20, 0x03, 0x28, 0x01, 0x52, 0x04, 0x6b, 0x64, 0x65, 0x59, 0x12, 0x23, 0x0a, 0x0d, 0x6b, 0x64,
+	0x65, 0x5f, 0x62, 0x61, 0x6e, 0x64, 0x77, 0x69, 0x64, 0x74, 0x68, 0x18, 0x0a, 0x20, 0x01, 0x28,
+	0x01, 0x52, 0x0c, 0x6b, 0x64, 0x65, 0x42, 0x61, 0x6e, 0x64, 0x77, 0x69, 0x64, 0x74, 0x68, 0x22,
+	0xb8, 0x02, 0x0a, 0x12, 0x43, 0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65, 0x6e, 0x63, 0x65, 0x49, 0x6e,
+	0x74, 0x65, 0x72, 0x76, 0x61, 0x6c, 0x12, 0x1f, 0x0a, 0x0b, 0x63, 0x6f, 0x6c, 0x75, 0x6d, 0x6e,
+	0x5f, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x63, 0x6f, 0x6c,
+	0x75, 0x6d, 0x6e, 0x4e, 0x61, 0x6d, 0x65, 0x12, 0x29, 0x0a, 0x10, 0x63, 0x6f, 0x6e, 0x66, 0x69,
+	0x64, 0x65, 0x6e, 0x63, 0x65, 0x5f, 0x6c, 0x65, 0x76, 0x65, 0x6c, 0x18, 0x02, 0x20, 0x01, 0x28,
+	0x01, 0x52, 0x0f, 0x63, 0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65, 0x6e, 0x63, 0x65, 0x4c, 0x65, 0x76,
+	0x65, 0x6c, 0x12, 0x1f, 0x0a, 0x0b, 0x6c, 0x6f, 0x77, 0x65, 0x72, 0x5f, 0x62, 0x6f, 0x75, 0x6e,
+	0x64, 0x18, 0x03, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0a, 0x6c, 0x6f, 0x77, 0x65, 0x72, 0x42, 0x6f,
+	0x75, 0x6e, 0x64, 0x12, 0x1f, 0x0a, 0x0b, 0x75, 0x70, 0x70, 0x65, 0x72, 0x5f, 0x62, 0x6f, 0x75,
+	0x6e, 0x64, 0x18, 0x04, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0a, 0x75, 0x70, 0x70, 0x65, 0x72, 0x42,
+	0x6f, 0x75, 0x6e, 0x64, 0x12, 0x12, 0x0a, 0x04, 0x6d, 0x65, 0x61, 0x6e, 0x18, 0x05, 0x20, 0x01,
+	0x28, 0x01, 0x52, 0x04, 0x6d, 0x65, 0x61, 0x6e, 0x12, 0x25, 0x0a, 0x0e, 0x73, 0x74, 0x61, 0x6e,
+	0x64, 0x61, 0x72, 0x64, 0x5f, 0x65, 0x72, 0x72, 0x6f, 0x72, 0x18, 0x06, 0x20, 0x01, 0x28, 0x01,
+	0x52, 0x0d, 0x73, 0x74, 0x61, 0x6e, 0x64, 0x61, 0x72, 0x64, 0x45, 0x72, 0x72, 0x6f, 0x72, 0x12,
+	0x25, 0x0a, 0x0e, 0x6d, 0x69, 0x73, 0x73, 0x69, 0x6e, 0x67, 0x5f, 0x66, 0x69, 0x65, 0x6c, 0x64,
+	0x73, 0x18, 0x07, 0x20, 0x03, 0x28, 0x09, 0x52, 0x0d, 0x6d, 0x69, 0x73, 0x73, 0x69, 0x6e, 0x67,
+	0x46, 0x69, 0x65, 0x6c, 0x64, 0x73, 0x12, 0x32, 0x0a, 0x15, 0x65, 0x66, 0x66, 0x65, 0x63, 0x74,
+	0x69, 0x76, 0x65, 0x5f, 0x73, 0x61, 0x6d, 0x70, 0x6c, 0x65, 0x5f, 0x73, 0x69, 0x7a, 0x65, 0x18,
+	0x08, 0x20, 0x01, 0x28, 0x01, 0x52, 0x13, 0x65, 0x66, 0x66, 0x65, 0x63, 0x74, 0x69, 0x76, 0x65,
+	0x53, 0x61, 0x6d, 0x70, 0x6c, 0x65, 0x53, 0x69, 0x7a, 0x65, 0x22, 0xb9, 0x01, 0x0a, 0x16, 0x4e,
+	0x6f, 0x72, 0x6d, 0x61, 0x6c, 0x69, 0x74, 0x79, 0x54, 0x65, 0x73, 0x74, 0x73, 0x52, 0x65, 0x73,
+	0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x4f, 0x0a, 0x14, 0x73, 0x68, 0x61, 0x70, 0x69, 0x72, 0x6f,
+	0x5f, 0x77, 0x69, 0x6c, 0x6b, 0x5f, 0x72, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x18, 0x01, 0x20,
+	0x03, 0x28, 0x0b, 0x32, 0x1d, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x4e,
+	0x6f, 0x72, 0x6d, 0x61, 0x6c, 0x69, 0x74, 0x79, 0x54, 0x65, 0x73, 0x74, 0x52, 0x65, 0x73, 0x75,
+	0x6c, 0x74, 0x52, 0x12, 0x73, 0x68, 0x61, 0x70, 0x69, 0x72, 0x6f, 0x57, 0x69, 0x6c, 0x6b, 0x52,
+	0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x12, 0x4e, 0x0a, 0x12, 0x63, 0x68, 0x69, 0x5f, 0x73, 0x71,
+	0x75, 0x61, 0x72, 0x65, 0x5f, 0x72, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x18, 0x02, 0x20, 0x03,
+	0x28, 0x0b, 0x32, 0x20, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x50, 0x65,
+	0x61, 0x72, 0x73, 0x6f, 0x6e, 0x43, 0x68, 0x69, 0x53, 0x71, 0x75, 0x61, 0x72, 0x65, 0x52, 0x65,
+	0x73, 0x75, 0x6c, 0x74, 0x52, 0x10, 0x63, 0x68, 0x69, 0x53, 0x71, 0x75, 0x61, 0x72, 0x65, 0x52,
+	0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x22, 0xce, 0x01, 0x0a, 0x13, 0x4e, 0x6f, 0x72, 0x6d, 0x61,
+	0x6c, 0x69, 0x74, 0x79, 0x54, 0x65, 0x73, 0x74, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x12, 0x1f,
+	0x0a, 0x0b, 0x63, 0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x5f, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x01, 0x20,
+	0x01, 0x28, 0x09, 0x52, 0x0a, 0x63, 0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x4e, 0x61, 0x6d, 0x65, 0x12,
+	0x1b, 0x0a, 0x09, 0x74, 0x65, 0x73, 0x74, 0x5f, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x02, 0x20, 0x01,
+	0x28, 0x09, 0x52, 0x08, 0x74, 0x65, 0x73, 0x74, 0x4e, 0x61, 0x6d, 0x65, 0x12, 0x1c, 0x0a, 0x09,
+	0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x18, 0x03, 0x20, 0x01, 0x28, 0x01, 0x52,
+	0x09, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x12, 0x17, 0x0a, 0x07, 0x70, 0x5f,
+	0x76, 0x61, 0x6c, 0x75, 0x65, 0x18, 0x04, 0x20, 0x01, 0x28, 0x01, 0x52, 0x06, 0x70, 0x56, 0x61,
+	0x6c, 0x75, 0x65, 0x12, 0x1b, 0x0a, 0x09, 0x69, 0x73, 0x5f, 0x6e, 0x6f, 0x72, 0x6d, 0x61, 0x6c,
+	0x18, 0x05, 0x20, 0x01, 0x28, 0x08, 0x52, 0x08, 0x69, 0x73, 0x4e, 0x6f, 0x72, 0x6d, 0x61, 0x6c,
+	0x12, 0x25, 0x0a, 0x0e, 0x6d, 0x69, 0x73, 0x73, 0x69, 0x6e, 0x67, 0x5f, 0x66, 0x69, 0x65, 0x6c,
+	0x64, 0x73, 0x18, 0x06, 0x20, 0x03, 0x28, 0x09, 0x52, 0x0d, 0x6d, 0x69, 0x73, 0x73, 0x69, 0x6e,
+	0x67, 0x46, 0x69, 0x65, 0x6c, 0x64, 0x73, 0x22, 0x80, 0x02, 0x0a, 0x16, 0x50, 0x65, 0x61, 0x72,
+	0x73, 0x6f, 0x6e, 0x43, 0x68, 0x69, 0x53, 0x71, 0x75, 0x61, 0x72, 0x65, 0x52, 0x65, 0x73, 0x75,
+	0x6c, 0x74, 0x12, 0x1f, 0x0a, 0x0b, 0x63, 0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x5f, 0x6e, 0x61, 0x6d,
 	0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x63, 0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x4e,
-	0x61, 0x6d, 0x65, 0x12, 0x29, 0x0a, 0x10, 0x63, 0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65, 0x6e, 0x63,
-	0x65, 0x5f, 0x6c, 0x65, 0x76, 0x65, 0x6c, 0x18, 0x02, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0f, 0x63,
-	0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65, 0x6e, 0x63, 0x65, 0x4c, 0x65, 0x76, 0x65, 0x6c, 0x12, 0x1f,
-	0x0a, 0x0b, 0x6c, 0x6f, 0x77, 0x65, 0x72, 0x5f, 0x62, 0x6f, 0x75, 0x6e, 0x64, 0x18, 0x03, 0x20,
-	0x01, 0x28, 0x01, 0x52, 0x0a, 0x6c, 0x6f, 0x77, 0x65, 0x72, 0x42, 0x6f, 0x75, 0x6e, 0x64, 0x12,
-	0x1f, 0x0a, 0x0b, 0x75, 0x70, 0x70, 0x65, 0x72, 0x5f, 0x62, 0x6f, 0x75, 0x6e, 0x64, 0x18, 0x04,
-	0x20, 0x01, 0x28, 0x01, 0x52, 0x0a, 0x75, 0x70, 0x70, 0x65, 0x72, 0x42, 0x6f, 0x75, 0x6e, 0x64,
-	0x12, 0x12, 0x0a, 0x04, 0x6d, 0x65, 0x61, 0x6e, 0x18, 0x05, 0x20, 0x01, 0x28, 0x01, 0x52, 0x04,
-	0x6d, 0x65, 0x61, 0x6e, 0x12, 0x25, 0x0a, 0x0e, 0x73, 0x74, 0x61, 0x6e, 0x64, 0x61, 0x72, 0x64,
-	0x5f, 0x65, 0x72, 0x72, 0x6f, 0x72, 0x18, 0x06, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0d, 0x73, 0x74,
-	0x61, 0x6e, 0x64, 0x61, 0x72, 0x64, 0x45, 0x72, 0x72, 0x6f, 0x72, 0x22, 0xb9, 0x01, 0x0a, 0x16,
-	0x4e, 0x6f, 0x72, 0x6d, 0x61, 0x6c, 0x69, 0x74, 0x79, 0x54, 0x65, 0x73, 0x74, 0x73, 0x52, 0x65,
-	0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x4f, 0x0a, 0x14, 0x73, 0x68, 0x61, 0x70, 0x69, 0x72,
-	0x6f, 0x5f, 0x77, 0x69, 0x6c, 0x6b, 0x5f, 0x72, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x18, 0x01,
-	0x20, 0x03, 0x28, 0x0b, 0x32, 0x1d, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e,
-	0x4e, 0x6f, 0x72, 0x6d, 0x61, 0x6c, 0x69, 0x74, 0x79, 0x54, 0x65, 0x73, 0x74, 0x52, 0x65, 0x73,
-	0x75, 0x6c, 0x74, 0x52, 0x12, 0x73, 0x68, 0x61, 0x70, 0x69, 0x72, 0x6f, 0x57, 0x69, 0x6c, 0x6b,
-	0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x12, 0x4e, 0x0a, 0x12, 0x63, 0x68, 0x69, 0x5f, 0x73,
-	0x71, 0x75, 0x61, 0x72, 0x65, 0x5f, 0x72, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x18, 0x02, 0x20,
-	0x03, 0x28, 0x0b, 0x32, 0x20, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x50,
-	0x65, 0x61, 0x72, 0x73, 0x6f, 0x6e, 0x43, 0x68, 0x69, 0x53, 0x71, 0x75, 0x61, 0x72, 0x65, 0x52,
-	0x65, 0x73, 0x75, 0x6c, 0x74, 0x52, 0x10, 0x63, 0x68, 0x69, 0x53, 0x71, 0x75, 0x61, 0x72, 0x65,
-	0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x22, 0xa7, 0x01, 0x0a, 0x13, 0x4e, 0x6f, 0x72, 0x6d,
-	0x61, 0x6c, 0x69, 0x74, 0x79, 0x54, 0x65, 0x73, 0x74, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x12,
-	0x1f, 0x0a, 0x0b, 0x63, 0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x5f, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x01,
-	0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x63, 0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x4e, 0x61, 0x6d, 0x65,
-	0x12, 0x1b, 0x0a, 0x09, 0x74, 0x65, 0x73, 0x74, 0x5f, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x02, 0x20,
-	0x01, 0x28, 0x09, 0x52, 0x08, 0x74, 0x65, 0x73, 0x74, 0x4e, 0x61, 0x6d, 0x65, 0x12, 0x1c, 0x0a,
-	0x09, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x18, 0x03, 0x20, 0x01, 0x28, 0x01,
-	0x52, 0x09, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x12, 0x17, 0x0a, 0x07, 0x70,
-	0x5f, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x18, 0x04, 0x20, 0x01, 0x28, 0x01, 0x52, 0x06, 0x70, 0x56,
-	0x61, 0x6c, 0x75, 0x65, 0x12, 0x1b, 0x0a, 0x09, 0x69, 0x73, 0x5f, 0x6e, 0x6f, 0x72, 0x6d, 0x61,
-	0x6c, 0x18, 0x05, 0x20, 0x01, 0x28, 0x08, 0x52, 0x08, 0x69, 0x73, 0x4e, 0x6f, 0x72, 0x6d, 0x61,
-	0x6c, 0x22, 0xd9, 0x01, 0x0a, 0x16, 0x50, 0x65, 0x61, 0x72, 0x73, 0x6f, 0x6e, 0x43, 0x68, 0x69,
-	0x53, 0x71, 0x75, 0x61, 0x72, 0x65, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x12, 0x1f, 0x0a, 0x0b,
-	0x63, 0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x5f, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28,
-	0x09, 0x52, 0x0a, 0x63, 0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x4e, 0x61, 0x6d, 0x65, 0x12, 0x1c, 0x0a,
-	0x09, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x18, 0x02, 0x20, 0x01, 0x28, 0x01,
-	0x52, 0x09, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x12, 0x17, 0x0a, 0x07, 0x70,
-	0x5f, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x18, 0x03, 0x20, 0x01, 0x28, 0x01, 0x52, 0x06, 0x70, 0x56,
-	0x61, 0x6c, 0x75, 0x65, 0x12, 0x2c, 0x0a, 0x12, 0x64, 0x65, 0x67, 0x72, 0x65, 0x65, 0x73, 0x5f,
-	0x6f, 0x66, 0x5f, 0x66, 0x72, 0x65, 0x65, 0x64, 0x6f, 0x6d, 0x18, 0x04, 0x20, 0x01, 0x28, 0x05,
-	0x52, 0x10, 0x64, 0x65, 0x67, 0x72, 0x65, 0x65, 0x73, 0x4f, 0x66, 0x46, 0x72, 0x65, 0x65, 0x64,
-	0x6f, 0x6d, 0x12, 0x1c, 0x0a, 0x09, 0x69, 0x6e, 0x74, 0x65, 0x72, 0x76, 0x61, 0x6c, 0x73, 0x18,
-	0x05, 0x20, 0x01, 0x28, 0x05, 0x52, 0x09, 0x69, 0x6e, 0x74, 0x65, 0x72, 0x76, 0x61, 0x6c, 0x73,
-	0x12, 0x1b, 0x0a, 0x09, 0x69, 0x73, 0x5f, 0x6e, 0x6f, 0x72, 0x6d, 0x61, 0x6c, 0x18, 0x06, 0x20,
-	0x01, 0x28, 0x08, 0x52, 0x08, 0x69, 0x73, 0x4e, 0x6f, 0x72, 0x6d, 0x61, 0x6c, 0x22, 0xc2, 0x01,
-	0x0a, 0x15, 0x57, 0x69, 0x6c, 0x63, 0x6f, 0x78, 0x6f, 0x6e, 0x54, 0x65, 0x73, 0x74, 0x73, 0x52,
-	0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x56, 0x0a, 0x13, 0x73, 0x69, 0x67, 0x6e, 0x65,
-	0x64, 0x5f, 0x72, 0x61, 0x6e, 0x6b, 0x5f, 0x72, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x18, 0x01,
-	0x20, 0x03, 0x28, 0x0b, 0x32, 0x26, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e,
-	0x57, 0x69, 0x6c, 0x63, 0x6f, 0x78, 0x6f, 0x6e, 0x53, 0x69, 0x67, 0x6e, 0x65, 0x64, 0x52, 0x61,
-	0x6e, 0x6b, 0x54, 0x65, 0x73, 0x74, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x52, 0x11, 0x73, 0x69,
-	0x67, 0x6e, 0x65, 0x64, 0x52, 0x61, 0x6e, 0x6b, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x12,
-	0x51, 0x0a, 0x14, 0x6d, 0x61, 0x6e, 0x6e, 0x5f, 0x77, 0x68, 0x69, 0x74, 0x6e, 0x65, 0x79, 0x5f,
-	0x72, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x1f, 0x2e,
-	0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x4d, 0x61, 0x6e, 0x6e, 0x57, 0x68, 0x69,
-	0x74, 0x6e, 0x65, 0x79, 0x54, 0x65, 0x73, 0x74, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x52, 0x12,
-	0x6d, 0x61, 0x6e, 0x6e, 0x57, 0x68, 0x69, 0x74, 0x6e, 0x65, 0x79, 0x52, 0x65, 0x73, 0x75, 0x6c,
-	0x74, 0x73, 0x22, 0xef, 0x01, 0x0a, 0x1c, 0x57, 0x69, 0x6c, 0x63, 0x6f, 0x78, 0x6f, 0x6e, 0x53,
-	0x69, 0x67, 0x6e, 0x65, 0x64, 0x52, 0x61, 0x6e, 0x6b, 0x54, 0x65, 0x73, 0x74, 0x52, 0x65, 0x73,
-	0x75, 0x6c, 0x74, 0x12, 0x1b, 0x0a, 0x09, 0x74, 0x65, 0x73, 0x74, 0x5f, 0x74, 0x79, 0x70, 0x65,
-	0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x08, 0x74, 0x65, 0x73, 0x74, 0x54, 0x79, 0x70, 0x65,
-	0x12, 0x1c, 0x0a, 0x09, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x31, 0x18, 0x02, 0x20,
-	0x01, 0x28, 0x09, 0x52, 0x09, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x31, 0x12, 0x1c,
-	0x0a, 0x09, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x32, 0x18, 0x03, 0x20, 0x01, 0x28,
-	0x09, 0x52, 0x09, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x32, 0x12, 0x1c, 0x0a, 0x09,
+	0x61, 0x6d, 0x65, 0x12, 0x1c, 0x0a, 0x09, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63,
+	0x18, 0x02, 0x20, 0x01, 0x28, 0x01, 0x52, 0x09, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69,
+	0x63, 0x12, 0x17, 0x0a, 0x07, 0x70, 0x5f, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x18, 0x03, 0x20, 0x01,
+	0x28, 0x01, 0x52, 0x06, 0x70, 0x56, 0x61, 0x6c, 0x75, 0x65, 0x12, 0x2c, 0x0a, 0x12, 0x64, 0x65,
+	0x67, 0x72, 0x65, 0x65, 0x73, 0x5f, 0x6f, 0x66, 0x5f, 0x66, 0x72, 0x65, 0x65, 0x64, 0x6f, 0x6d,
+	0x18, 0x04, 0x20, 0x01, 0x28, 0x05, 0x52, 0x10, 0x64, 0x65, 0x67, 0x72, 0x65, 0x65, 0x73, 0x4f,
+	0x66, 0x46, 0x72, 0x65, 0x65, 0x64, 0x6f, 0x6d, 0x12, 0x1c, 0x0a, 0x09, 0x69, 0x6e, 0x74, 0x65,
+	0x72, 0x76, 0x61, 0x6c, 0x73, 0x18, 0x05, 0x20, 0x01, 0x28, 0x05, 0x52, 0x09, 0x69, 0x6e, 0x74,
+	0x65, 0x72, 0x76, 0x61, 0x6c, 0x73, 0x12, 0x1b, 0x0a, 0x09, 0x69, 0x73, 0x5f, 0x6e, 0x6f, 0x72,
+	0x6d, 0x61, 0x6c, 0x18, 0x06, 0x20, 0x01, 0x28, 0x08, 0x52, 0x08, 0x69, 0x73, 0x4e, 0x6f, 0x72,
+	0x6d, 0x61, 0x6c, 0x12, 0x25, 0x0a, 0x0e, 0x6d, 0x69, 0x73, 0x73, 0x69, 0x6e, 0x67, 0x5f, 0x66,
+	0x69, 0x65, 0x6c, 0x64, 0x73, 0x18, 0x07, 0x20, 0x03, 0x28, 0x09, 0x52, 0x0d, 0x6d, 0x69, 0x73,
+	0x73, 0x69, 0x6e, 0x67, 0x46, 0x69, 0x65, 0x6c, 0x64, 0x73, 0x22, 0xc2, 0x01, 0x0a, 0x15, 0x57,
+	0x69, 0x6c, 0x63, 0x6f, 0x78, 0x6f, 0x6e, 0x54, 0x65, 0x73, 0x74, 0x73, 0x52, 0x65, 0x73, 0x70,
+	0x6f, 0x6e, 0x73, 0x65, 0x12, 0x56, 0x0a, 0x13, 0x73, 0x69, 0x67, 0x6e, 0x65, 0x64, 0x5f, 0x72,
+	0x61, 0x6e, 0x6b, 0x5f, 0x72, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x18, 0x01, 0x20, 0x03, 0x28,
+	0x0b, 0x32, 0x26, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x57, 0x69, 0x6c,
+	0x63, 0x6f, 0x78, 0x6f, 0x6e, 0x53, 0x69, 0x67, 0x6e, 0x65, 0x64, 0x52, 0x61, 0x6e, 0x6b, 0x54,
+	0x65, 0x73, 0x74, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x52, 0x11, 0x73, 0x69, 0x67, 0x6e, 0x65,
+	0x64, 0x52, 0x61, 0x6e, 0x6b, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x12, 0x51, 0x0a, 0x14,
+	0x6d, 0x61, 0x6e, 0x6e, 0x5f, 0x77, 0x68, 0x69, 0x74, 0x6e, 0x65, 0x79, 0x5f, 0x72, 0x65, 0x73,
+	0x75, 0x6c, 0x74, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x1f, 0x2e, 0x61, 0x6e, 0x61,
+	0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x4d, 0x61, 0x6e, 0x6e, 0x57, 0x68, 0x69, 0x74, 0x6e, 0x65,
+	0x79, 0x54, 0x65, 0x73, 0x74, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x52, 0x12, 0x6d, 0x61, 0x6e,
+	0x6e, 0x57, 0x68, 0x69, 0x74, 0x6e, 0x65, 0x79, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x73, 0x22,
+	0x96, 0x02, 0x0a, 0x1c, 0x57, 0x69, 0x6c, 0x63, 0x6f, 0x78, 0x6f, 0x6e, 0x53, 0x69, 0x67, 0x6e,
+	0x65, 0x64, 0x52, 0x61, 0x6e, 0x6b, 0x54, 0x65, 0x73, 0x74, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74,
+	0x12, 0x1b, 0x0a, 0x09, 0x74, 0x65, 0x73, 0x74, 0x5f, 0x74, 0x79, 0x70, 0x65, 0x18, 0x01, 0x20,
+	0x01, 0x28, 0x09, 0x52, 0x08, 0x74, 0x65, 0x73, 0x74, 0x54, 0x79, 0x70, 0x65, 0x12, 0x1c, 0x0a,
+	0x09, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x31, 0x18, 0x02, 0x20, 0x01, 0x28, 0x09,
+	0x52, 0x09, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x31, 0x12, 0x1c, 0x0a, 0x09, 0x76,
+	0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x32, 0x18, 0x03, 0x20, 0x01, 0x28, 0x09, 0x52, 0x09,
+	0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x32, 0x12, 0x1c, 0x0a, 0x09, 0x73, 0x74, 0x61,
+	0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x18, 0x04, 0x20, 0x01, 0x28, 0x01, 0x52, 0x09, 0x73, 0x74,
+	0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x12, 0x17, 0x0a, 0x07, 0x70, 0x5f, 0x76, 0x61, 0x6c,
+	0x75, 0x65, 0x18, 0x05, 0x20, 0x01, 0x28, 0x01, 0x52, 0x06, 0x70, 0x56, 0x61, 0x6c, 0x75, 0x65,
+	0x12, 0x1e, 0x0a, 0x0a, 0x63, 0x6f, 0x6e, 0x63, 0x6c, 0x75, 0x73, 0x69, 0x6f, 0x6e, 0x18, 0x06,
+	0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x63, 0x6f, 0x6e, 0x63, 0x6c, 0x75, 0x73, 0x69, 0x6f, 0x6e,
+	0x12, 0x1f, 0x0a, 0x0b, 0x73, 0x61, 0x6d, 0x70, 0x6c, 0x65, 0x5f, 0x73, 0x69, 0x7a, 0x65, 0x18,
+	0x07, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0a, 0x73, 0x61, 0x6d, 0x70, 0x6c, 0x65, 0x53, 0x69, 0x7a,
+	0x65, 0x12, 0x25, 0x0a, 0x0e, 0x6d, 0x69, 0x73, 0x73, 0x69, 0x6e, 0x67, 0x5f, 0x66, 0x69, 0x65,
+	0x6c, 0x64, 0x73, 0x18, 0x08, 0x20, 0x03, 0x28, 0x09, 0x52, 0x0d, 0x6d, 0x69, 0x73, 0x73, 0x69,
+	0x6e, 0x67, 0x46, 0x69, 0x65, 0x6c, 0x64, 0x73, 0x22, 0xb4, 0x03, 0x0a, 0x15, 0x4d, 0x61, 0x6e,
+	0x6e, 0x57, 0x68, 0x69, 0x74, 0x6e, 0x65, 0x79, 0x54, 0x65, 0x73, 0x74, 0x52, 0x65, 0x73, 0x75,
+	0x6c, 0x74, 0x12, 0x1b, 0x0a, 0x09, 0x74, 0x65, 0x73, 0x74, 0x5f, 0x74, 0x79, 0x70, 0x65, 0x18,
+	0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x08, 0x74, 0x65, 0x73, 0x74, 0x54, 0x79, 0x70, 0x65, 0x12,
+	0x21, 0x0a, 0x0c, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x5f, 0x63, 0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x18,
+	0x02, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0b, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x43, 0x6f, 0x6c, 0x75,
+	0x6d, 0x6e, 0x12, 0x21, 0x0a, 0x0c, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x5f, 0x63, 0x6f, 0x6c, 0x75,
+	0x6d, 0x6e, 0x18, 0x03, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0b, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x43,
+	0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x12, 0x16, 0x0a, 0x06, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x31, 0x18,
+	0x04, 0x20, 0x01, 0x28, 0x09, 0x52, 0x06, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x31, 0x12, 0x16, 0x0a,
+	0x06, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x32, 0x18, 0x05, 0x20, 0x01, 0x28, 0x09, 0x52, 0x06, 0x67,
+	0x72, 0x6f, 0x75, 0x70, 0x32, 0x12, 0x1f, 0x0a, 0x0b, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x31, 0x5f,
+	0x73, 0x69, 0x7a, 0x65, 0x18, 0x06, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0a, 0x67, 0x72, 0x6f, 0x75,
+	0x70, 0x31, 0x53, 0x69, 0x7a, 0x65, 0x12, 0x1f, 0x0a, 0x0b, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x32,
+	0x5f, 0x73, 0x69, 0x7a, 0x65, 0x18, 0x07, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0a, 0x67, 0x72, 0x6f,
+	0x75, 0x70, 0x32, 0x53, 0x69, 0x7a, 0x65, 0x12, 0x23, 0x0a, 0x0d, 0x67, 0x72, 0x6f, 0x75, 0x70,
+	0x31, 0x5f, 0x6d, 0x65, 0x64, 0x69, 0x61, 0x6e, 0x18, 0x08, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0c,
+	0x67, 0x72, 0x6f, 0x75, 0x70, 0x31, 0x4d, 0x65, 0x64, 0x69, 0x61, 0x6e, 0x12, 0x23, 0x0a, 0x0d,
+	0x67, 0x72, 0x6f, 0x75, 0x70, 0x32, 0x5f, 0x6d, 0x65, 0x64, 0x69, 0x61, 0x6e, 0x18, 0x09, 0x20,
+	0x01, 0x28, 0x01, 0x52, 0x0c, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x32, 0x4d, 0x65, 0x64, 0x69, 0x61,
+	0x6e, 0x12, 0x1c, 0x0a, 0x09, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x18, 0x0a,
+	0x20, 0x01, 0x28, 0x01, 0x52, 0x09, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x12,
+	0x17, 0x0a, 0x07, 0x70, 0x5f, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x18, 0x0b, 0x20, 0x01, 0x28, 0x01,
+	0x52, 0x06, 0x70, 0x56, 0x61, 0x6c, 0x75, 0x65, 0x12, 0x1e, 0x0a, 0x0a, 0x63, 0x6f, 0x6e, 0x63,
+	0x6c, 0x75, 0x73, 0x69, 0x6f, 0x6e, 0x18, 0x0c, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x63, 0x6f,
+	0x6e, 0x63, 0x6c, 0x75, 0x73, 0x69, 0x6f, 0x6e, 0x12, 0x25, 0x0a, 0x0e, 0x6d, 0x69, 0x73, 0x73,
+	0x69, 0x6e, 0x67, 0x5f, 0x66, 0x69, 0x65, 0x6c, 0x64, 0x73, 0x18, 0x0d, 0x20, 0x03, 0x28, 0x09,
+	0x52, 0x0d, 0x6d, 0x69, 0x73, 0x73, 0x69, 0x6e, 0x67, 0x46, 0x69, 0x65, 0x6c, 0x64, 0x73, 0x22,
+	0x9a, 0x02, 0x0a, 0x1a, 0x52, 0x65, 0x67, 0x72, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x41, 0x6e,
+	0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x2d,
+	0x0a, 0x12, 0x64, 0x65, 0x70, 0x65, 0x6e, 0x64, 0x65, 0x6e, 0x74, 0x5f, 0x76, 0x61, 0x72, 0x69,
+	0x61, 0x62, 0x6c, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x11, 0x64, 0x65, 0x70, 0x65,
+	0x6e, 0x64, 0x65, 0x6e, 0x74, 0x56, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x12, 0x33, 0x0a,
+	0x15, 0x69, 0x6e, 0x64, 0x65, 0x70, 0x65, 0x6e, 0x64, 0x65, 0x6e, 0x74, 0x5f, 0x76, 0x61, 0x72,
+	0x69, 0x61, 0x62, 0x6c, 0x65, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x09, 0x52, 0x14, 0x69, 0x6e,
+	0x64, 0x65, 0x70, 0x65, 0x6e, 0x64, 0x65, 0x6e, 0x74, 0x56, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c,
+	0x65, 0x73, 0x12, 0x34, 0x0a, 0x0b, 0x64, 0x61, 0x74, 0x61, 0x5f, 0x70, 0x6f, 0x69, 0x6e, 0x74,
+	0x73, 0x18, 0x03, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x13, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73,
+	0x69, 0x73, 0x2e, 0x44, 0x61, 0x74, 0x61, 0x50, 0x6f, 0x69, 0x6e, 0x74, 0x52, 0x0a, 0x64, 0x61,
+	0x74, 0x61, 0x50, 0x6f, 0x69, 0x6e, 0x74, 0x73, 0x12, 0x31, 0x0a, 0x06, 0x6d, 0x6f, 0x64, 0x65,
+	0x6c, 0x73, 0x18, 0x04, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x19, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79,
+	0x73, 0x69, 0x73, 0x2e, 0x52, 0x65, 0x67, 0x72, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x4d, 0x6f,
+	0x64, 0x65, 0x6c, 0x52, 0x06, 0x6d, 0x6f, 0x64, 0x65, 0x6c, 0x73, 0x12, 0x2f, 0x0a, 0x07, 0x64,
+	0x65, 0x6e, 0x73, 0x69, 0x74, 0x79, 0x18, 0x05, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x15, 0x2e, 0x61,
+	0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x44, 0x65, 0x6e, 0x73, 0x69, 0x74, 0x79, 0x47,
+	0x72, 0x69, 0x64, 0x52, 0x07, 0x64, 0x65, 0x6e, 0x73, 0x69, 0x74, 0x79, 0x22, 0xa4, 0x02, 0x0a,
+	0x0b, 0x44, 0x65, 0x6e, 0x73, 0x69, 0x74, 0x79, 0x47, 0x72, 0x69, 0x64, 0x12, 0x12, 0x0a, 0x04,
+	0x6b, 0x69, 0x6e, 0x64, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x04, 0x6b, 0x69, 0x6e, 0x64,
+	0x12, 0x15, 0x0a, 0x06, 0x78, 0x5f, 0x62, 0x69, 0x6e, 0x73, 0x18, 0x02, 0x20, 0x01, 0x28, 0x05,
+	0x52, 0x05, 0x78, 0x42, 0x69, 0x6e, 0x73, 0x12, 0x15, 0x0a, 0x06, 0x79, 0x5f, 0x62, 0x69, 0x6e,
+	0x73, 0x18, 0x03, 0x20, 0x01, 0x28, 0x05, 0x52, 0x05, 0x79, 0x42, 0x69, 0x6e, 0x73, 0x12, 0x17,
+	0x0a, 0x07, 0x78, 0x5f, 0x65, 0x64, 0x67, 0x65, 0x73, 0x18, 0x04, 0x20, 0x03, 0x28, 0x01, 0x52,
+	0x06, 0x78, 0x45, 0x64, 0x67, 0x65, 0x73, 0x12, 0x17, 0x0a, 0x07, 0x79, 0x5f, 0x65, 0x64, 0x67,
+	0x65, 0x73, 0x18, 0x05, 0x20, 0x03, 0x28, 0x01, 0x52, 0x06, 0x79, 0x45, 0x64, 0x67, 0x65, 0x73,
+	0x12, 0x16, 0x0a, 0x06, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x73, 0x18, 0x06, 0x20, 0x03, 0x28, 0x03,
+	0x52, 0x06, 0x63, 0x6f, 0x75, 0x6e, 0x74, 0x73, 0x12, 0x1b, 0x0a, 0x09, 0x63, 0x65, 0x6e, 0x74,
+	0x65, 0x72, 0x73, 0x5f, 0x78, 0x18, 0x07, 0x20, 0x03, 0x28, 0x01, 0x52, 0x08, 0x63, 0x65, 0x6e,
+	0x74, 0x65, 0x72, 0x73, 0x58, 0x12, 0x1b, 0x0a, 0x09, 0x63, 0x65, 0x6e, 0x74, 0x65, 0x72, 0x73,
+	0x5f, 0x79, 0x18, 0x08, 0x20, 0x03, 0x28, 0x01, 0x52, 0x08, 0x63, 0x65, 0x6e, 0x74, 0x65, 0x72,
+	0x73, 0x59, 0x12, 0x15, 0x0a, 0x06, 0x73, 0x74, 0x65, 0x70, 0x5f, 0x78, 0x18, 0x09, 0x20, 0x01,
+	0x28, 0x01, 0x52, 0x05, 0x73, 0x74, 0x65, 0x70, 0x58, 0x12, 0x15, 0x0a, 0x06, 0x73, 0x74, 0x65,
+	0x70, 0x5f, 0x79, 0x18, 0x0a, 0x20, 0x01, 0x28, 0x01, 0x52, 0x05, 0x73, 0x74, 0x65, 0x70, 0x59,
+	0x12, 0x21, 0x0a, 0x0c, 0x74, 0x6f, 0x74, 0x61, 0x6c, 0x5f, 0x70, 0x6f, 0x69, 0x6e, 0x74, 0x73,
+	0x18, 0x0b, 0x20, 0x01, 0x28, 0x03, 0x52, 0x0b, 0x74, 0x6f, 0x74, 0x61, 0x6c, 0x50, 0x6f, 0x69,
+	0x6e, 0x74, 0x73, 0x22, 0xf6, 0x03, 0x0a, 0x0f, 0x52, 0x65, 0x67, 0x72, 0x65, 0x73, 0x73, 0x69,
+	0x6f, 0x6e, 0x4d, 0x6f, 0x64, 0x65, 0x6c, 0x12, 0x27, 0x0a, 0x0f, 0x72, 0x65, 0x67, 0x72, 0x65,
+	0x73, 0x73, 0x69, 0x6f, 0x6e, 0x5f, 0x74, 0x79, 0x70, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09,
+	0x52, 0x0e, 0x72, 0x65, 0x67, 0x72, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x54, 0x79, 0x70, 0x65,
+	0x12, 0x1b, 0x0a, 0x09, 0x72, 0x5f, 0x73, 0x71, 0x75, 0x61, 0x72, 0x65, 0x64, 0x18, 0x02, 0x20,
+	0x01, 0x28, 0x01, 0x52, 0x08, 0x72, 0x53, 0x71, 0x75, 0x61, 0x72, 0x65, 0x64, 0x12, 0x2c, 0x0a,
+	0x12, 0x61, 0x64, 0x6a, 0x75, 0x73, 0x74, 0x65, 0x64, 0x5f, 0x72, 0x5f, 0x73, 0x71, 0x75, 0x61,
+	0x72, 0x65, 0x64, 0x18, 0x03, 0x20, 0x01, 0x28, 0x01, 0x52, 0x10, 0x61, 0x64, 0x6a, 0x75, 0x73,
+	0x74, 0x65, 0x64, 0x52, 0x53, 0x71, 0x75, 0x61, 0x72, 0x65, 0x64, 0x12, 0x1f, 0x0a, 0x0b, 0x66,
+	0x5f, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x18, 0x04, 0x20, 0x01, 0x28, 0x01,
+	0x52, 0x0a, 0x66, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x12, 0x28, 0x0a, 0x10,
+	0x70, 0x72, 0x6f, 0x62, 0x5f, 0x66, 0x5f, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63,
+	0x18, 0x05, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0e, 0x70, 0x72, 0x6f, 0x62, 0x46, 0x53, 0x74, 0x61,
+	0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x12, 0x10, 0x0a, 0x03, 0x73, 0x73, 0x65, 0x18, 0x06, 0x20,
+	0x01, 0x28, 0x01, 0x52, 0x03, 0x73, 0x73, 0x65, 0x12, 0x43, 0x0a, 0x0c, 0x63, 0x6f, 0x65, 0x66,
+	0x66, 0x69, 0x63, 0x69, 0x65, 0x6e, 0x74, 0x73, 0x18, 0x07, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x1f,
+	0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x52, 0x65, 0x67, 0x72, 0x65, 0x73,
+	0x73, 0x69, 0x6f, 0x6e, 0x43, 0x6f, 0x65, 0x66, 0x66, 0x69, 0x63, 0x69, 0x65, 0x6e, 0x74, 0x52,
+	0x0c, 0x63, 0x6f, 0x65, 0x66, 0x66, 0x69, 0x63, 0x69, 0x65, 0x6e, 0x74, 0x73, 0x12, 0x1c, 0x0a,
+	0x09, 0x72, 0x65, 0x73, 0x69, 0x64, 0x75, 0x61, 0x6c, 0x73, 0x18, 0x08, 0x20, 0x03, 0x28, 0x01,
+	0x52, 0x09, 0x72, 0x65, 0x73, 0x69, 0x64, 0x75, 0x61, 0x6c, 0x73, 0x12, 0x50, 0x0a, 0x12, 0x72,
+	0x65, 0x73, 0x69, 0x64, 0x75, 0x61, 0x6c, 0x73, 0x5f, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69,
+	0x73, 0x18, 0x09, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x21, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73,
+	0x69, 0x73, 0x2e, 0x52, 0x65, 0x73, 0x69, 0x64, 0x75, 0x61, 0x6c, 0x73, 0x41, 0x6e, 0x61, 0x6c,
+	0x79, 0x73, 0x69, 0x73, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x52, 0x11, 0x72, 0x65, 0x73, 0x69,
+	0x64, 0x75, 0x61, 0x6c, 0x73, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x12, 0x36, 0x0a,
+	0x0c, 0x66, 0x69, 0x74, 0x74, 0x65, 0x64, 0x5f, 0x63, 0x75, 0x72, 0x76, 0x65, 0x18, 0x0a, 0x20,
+	0x03, 0x28, 0x0b, 0x32, 0x13, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x44,
+	0x61, 0x74, 0x61, 0x50, 0x6f, 0x69, 0x6e, 0x74, 0x52, 0x0b, 0x66, 0x69, 0x74, 0x74, 0x65, 0x64,
+	0x43, 0x75, 0x72, 0x76, 0x65, 0x12, 0x25, 0x0a, 0x0e, 0x6d, 0x69, 0x73, 0x73, 0x69, 0x6e, 0x67,
+	0x5f, 0x66, 0x69, 0x65, 0x6c, 0x64, 0x73, 0x18, 0x0b, 0x20, 0x03, 0x28, 0x09, 0x52, 0x0d, 0x6d,
+	0x69, 0x73, 0x73, 0x69, 0x6e, 0x67, 0x46, 0x69, 0x65, 0x6c, 0x64, 0x73, 0x22, 0xd4, 0x02, 0x0a,
+	0x15, 0x52, 0x65, 0x67, 0x72, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x43, 0x6f, 0x65, 0x66, 0x66,
+	0x69, 0x63, 0x69, 0x65, 0x6e, 0x74, 0x12, 0x23, 0x0a, 0x0d, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62,
+	0x6c, 0x65, 0x5f, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0c, 0x76,
+	0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x4e, 0x61, 0x6d, 0x65, 0x12, 0x20, 0x0a, 0x0b, 0x63,
+	0x6f, 0x65, 0x66, 0x66, 0x69, 0x63, 0x69, 0x65, 0x6e, 0x74, 0x18, 0x02, 0x20, 0x01, 0x28, 0x01,
+	0x52, 0x0b, 0x63, 0x6f, 0x65, 0x66, 0x66, 0x69, 0x63, 0x69, 0x65, 0x6e, 0x74, 0x12, 0x1b, 0x0a,
+	0x09, 0x73, 0x74, 0x64, 0x5f, 0x65, 0x72, 0x72, 0x6f, 0x72, 0x18, 0x03, 0x20, 0x01, 0x28, 0x01,
+	0x52, 0x08, 0x73, 0x74, 0x64, 0x45, 0x72, 0x72, 0x6f, 0x72, 0x12, 0x1f, 0x0a, 0x0b, 0x74, 0x5f,
 	0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x18, 0x04, 0x20, 0x01, 0x28, 0x01, 0x52,
-	0x09, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x12, 0x17, 0x0a, 0x07, 0x70, 0x5f,
-	0x76, 0x61, 0x6c, 0x75, 0x65, 0x18, 0x05, 0x20, 0x01, 0x28, 0x01, 0x52, 0x06, 0x70, 0x56, 0x61,
-	0x6c, 0x75, 0x65, 0x12, 0x1e, 0x0a, 0x0a, 0x63, 0x6f, 0x6e, 0x63, 0x6c, 0x75, 0x73, 0x69, 0x6f,
-	0x6e, 0x18, 0x06, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x63, 0x6f, 0x6e, 0x63, 0x6c, 0x75, 0x73,
-	0x69, 0x6f, 0x6e, 0x12, 0x1f, 0x0a, 0x0b, 0x73, 0x61, 0x6d, 0x70, 0x6c, 0x65, 0x5f, 0x73, 0x69,
-	0x7a, 0x65, 0x18, 0x07, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0a, 0x73, 0x61, 0x6d, 0x70, 0x6c, 0x65,
-	0x53, 0x69, 0x7a, 0x65, 0x22, 0x8d, 0x03, 0x0a, 0x15, 0x4d, 0x61, 0x6e, 0x6e, 0x57, 0x68, 0x69,
-	0x74, 0x6e, 0x65, 0x79, 0x54, 0x65, 0x73, 0x74, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x12, 0x1b,
-	0x0a, 0x09, 0x74, 0x65, 0x73, 0x74, 0x5f, 0x74, 0x79, 0x70, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28,
-	0x09, 0x52, 0x08, 0x74, 0x65, 0x73, 0x74, 0x54, 0x79, 0x70, 0x65, 0x12, 0x21, 0x0a, 0x0c, 0x67,
-	0x72, 0x6f, 0x75, 0x70, 0x5f, 0x63, 0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x18, 0x02, 0x20, 0x01, 0x28,
-	0x09, 0x52, 0x0b, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x43, 0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x12, 0x21,
-	0x0a, 0x0c, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x5f, 0x63, 0x6f, 0x6c, 0x75, 0x6d, 0x6e, 0x18, 0x03,
-	0x20, 0x01, 0x28, 0x09, 0x52, 0x0b, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x43, 0x6f, 0x6c, 0x75, 0x6d,
-	0x6e, 0x12, 0x16, 0x0a, 0x06, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x31, 0x18, 0x04, 0x20, 0x01, 0x28,
-	0x09, 0x52, 0x06, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x31, 0x12, 0x16, 0x0a, 0x06, 0x67, 0x72, 0x6f,
-	0x75, 0x70, 0x32, 0x18, 0x05, 0x20, 0x01, 0x28, 0x09, 0x52, 0x06, 0x67, 0x72, 0x6f, 0x75, 0x70,
-	0x32, 0x12, 0x1f, 0x0a, 0x0b, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x31, 0x5f, 0x73, 0x69, 0x7a, 0x65,
-	0x18, 0x06, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0a, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x31, 0x53, 0x69,
-	0x7a, 0x65, 0x12, 0x1f, 0x0a, 0x0b, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x32, 0x5f, 0x73, 0x69, 0x7a,
-	0x65, 0x18, 0x07, 0x20, 0x01, 0x28, 0x05, 0x52, 0x0a, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x32, 0x53,
-	0x69, 0x7a, 0x65, 0x12, 0x23, 0x0a, 0x0d, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x31, 0x5f, 0x6d, 0x65,
-	0x64, 0x69, 0x61, 0x6e, 0x18, 0x08, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0c, 0x67, 0x72, 0x6f, 0x75,
-	0x70, 0x31, 0x4d, 0x65, 0x64, 0x69, 0x61, 0x6e, 0x12, 0x23, 0x0a, 0x0d, 0x67, 0x72, 0x6f, 0x75,
-	0x70, 0x32, 0x5f, 0x6d, 0x65, 0x64, 0x69, 0x61, 0x6e, 0x18, 0x09, 0x20, 0x01, 0x28, 0x01, 0x52,
-	0x0c, 0x67, 0x72, 0x6f, 0x75, 0x70, 0x32, 0x4d, 0x65, 0x64, 0x69, 0x61, 0x6e, 0x12, 0x1c, 0x0a,
-	0x09, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x18, 0x0a, 0x20, 0x01, 0x28, 0x01,
-	0x52, 0x09, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x12, 0x17, 0x0a, 0x07, 0x70,
-	0x5f, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x18, 0x0b, 0x20, 0x01, 0x28, 0x01, 0x52, 0x06, 0x70, 0x56,
-	0x61, 0x6c, 0x75, 0x65, 0x12, 0x1e, 0x0a, 0x0a, 0x63, 0x6f, 0x6e, 0x63, 0x6c, 0x75, 0x73, 0x69,
-	0x6f, 0x6e, 0x18, 0x0c, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0a, 0x63, 0x6f, 0x6e, 0x63, 0x6c, 0x75,
-	0x73, 0x69, 0x6f, 0x6e, 0x22, 0xe9, 0x01, 0x0a, 0x1a, 0x52, 0x65, 0x67, 0x72, 0x65, 0x73, 0x73,
-	0x69, 0x6f, 0x6e, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x52, 0x65, 0x73, 0x70, 0x6f,
-	0x6e, 0x73, 0x65, 0x12, 0x2d, 0x0a, 0x12, 0x64, 0x65, 0x70, 0x65, 0x6e, 0x64, 0x65, 0x6e, 0x74,
-	0x5f, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52,
-	0x11, 0x64, 0x65, 0x70, 0x65, 0x6e, 0x64, 0x65, 0x6e, 0x74, 0x56, 0x61, 0x72, 0x69, 0x61, 0x62,
-	0x6c, 0x65, 0x12, 0x33, 0x0a, 0x15, 0x69, 0x6e, 0x64, 0x65, 0x70, 0x65, 0x6e, 0x64, 0x65, 0x6e,
-	0x74, 0x5f, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28,
-	0x09, 0x52, 0x14, 0x69, 0x6e, 0x64, 0x65, 0x70, 0x65, 0x6e, 0x64, 0x65, 0x6e, 0x74, 0x56, 0x61,
-	0x72, 0x69, 0x61, 0x62, 0x6c, 0x65, 0x73, 0x12, 0x34, 0x0a, 0x0b, 0x64, 0x61, 0x74, 0x61, 0x5f,
-	0x70, 0x6f, 0x69, 0x6e, 0x74, 0x73, 0x18, 0x03, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x13, 0x2e, 0x61,
-	0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x44, 0x61, 0x74, 0x61, 0x50, 0x6f, 0x69, 0x6e,
-	0x74, 0x52, 0x0a, 0x64, 0x61, 0x74, 0x61, 0x50, 0x6f, 0x69, 0x6e, 0x74, 0x73, 0x12, 0x31, 0x0a,
-	0x06, 0x6d, 0x6f, 0x64, 0x65, 0x6c, 0x73, 0x18, 0x04, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x19, 0x2e,
-	0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x52, 0x65, 0x67, 0x72, 0x65, 0x73, 0x73,
-	0x69, 0x6f, 0x6e, 0x4d, 0x6f, 0x64, 0x65, 0x6c, 0x52, 0x06, 0x6d, 0x6f, 0x64, 0x65, 0x6c, 0x73,
-	0x22, 0x97, 0x03, 0x0a, 0x0f, 0x52, 0x65, 0x67, 0x72, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x4d,
-	0x6f, 0x64, 0x65, 0x6c, 0x12, 0x27, 0x0a, 0x0f, 0x72, 0x65, 0x67, 0x72, 0x65, 0x73, 0x73, 0x69,
-	0x6f, 0x6e, 0x5f, 0x74, 0x79, 0x70, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0e, 0x72,
-	0x65, 0x67, 0x72, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x54, 0x79, 0x70, 0x65, 0x12, 0x1b, 0x0a,
-	0x09, 0x72, 0x5f, 0x73, 0x71, 0x75, 0x61, 0x72, 0x65, 0x64, 0x18, 0x02, 0x20, 0x01, 0x28, 0x01,
-	0x52, 0x08, 0x72, 0x53, 0x71, 0x75, 0x61, 0x72, 0x65, 0x64, 0x12, 0x2c, 0x0a, 0x12, 0x61, 0x64,
-	0x6a, 0x75, 0x73, 0x74, 0x65, 0x64, 0x5f, 0x72, 0x5f, 0x73, 0x71, 0x75, 0x61, 0x72, 0x65, 0x64,
-	0x18, 0x03, 0x20, 0x01, 0x28, 0x01, 0x52, 0x10, 0x61, 0x64, 0x6a, 0x75, 0x73, 0x74, 0x65, 0x64,
-	0x52, 0x53, 0x71, 0x75, 0x61, 0x72, 0x65, 0x64, 0x12, 0x1f, 0x0a, 0x0b, 0x66, 0x5f, 0x73, 0x74,
-	0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x18, 0x04, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0a, 0x66,
-	0x53, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x12, 0x28, 0x0a, 0x10, 0x70, 0x72, 0x6f,
-	0x62, 0x5f, 0x66, 0x5f, 0x73, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x18, 0x05, 0x20,
-	0x01, 0x28, 0x01, 0x52, 0x0e, 0x70, 0x72, 0x6f, 0x62, 0x46, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73,
-	0x74, 0x69, 0x63, 0x12, 0x10, 0x0a, 0x03, 0x73, 0x73, 0x65, 0x18, 0x06, 0x20, 0x01, 0x28, 0x01,
-	0x52, 0x03, 0x73, 0x73, 0x65, 0x12, 0x43, 0x0a, 0x0c, 0x63, 0x6f, 0x65, 0x66, 0x66, 0x69, 0x63,
-	0x69, 0x65, 0x6e, 0x74, 0x73, 0x18, 0x07, 0x20, 0x03, 0x28, 0x0b, 0x32, 0x1f, 0x2e, 0x61, 0x6e,
-	0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x52, 0x65, 0x67, 0x72, 0x65, 0x73, 0x73, 0x69, 0x6f,
-	0x6e, 0x43, 0x6f, 0x65, 0x66, 0x66, 0x69, 0x63, 0x69, 0x65, 0x6e, 0x74, 0x52, 0x0c, 0x63, 0x6f,
-	0x65, 0x66, 0x66, 0x69, 0x63, 0x69, 0x65, 0x6e, 0x74, 0x73, 0x12, 0x1c, 0x0a, 0x09, 0x72, 0x65,
-	0x73, 0x69, 0x64, 0x75, 0x61, 0x6c, 0x73, 0x18, 0x08, 0x20, 0x03, 0x28, 0x01, 0x52, 0x09, 0x72,
-	0x65, 0x73, 0x69, 0x64, 0x75, 0x61, 0x6c, 0x73, 0x12, 0x50, 0x0a, 0x12, 0x72, 0x65, 0x73, 0x69,
-	0x64, 0x75, 0x61, 0x6c, 0x73, 0x5f, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x18, 0x09,
-	0x20, 0x01, 0x28, 0x0b, 0x32, 0x21, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e,
-	0x52, 0x65, 0x73, 0x69, 0x64, 0x75, 0x61, 0x6c, 0x73, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69,
-	0x73, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x52, 0x11, 0x72, 0x65, 0x73, 0x69, 0x64, 0x75, 0x61,
-	0x6c, 0x73, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x22, 0xad, 0x02, 0x0a, 0x15, 0x52,
-	0x65, 0x67, 0x72, 0x65, 0x73, 0x73, 0x69, 0x6f, 0x6e, 0x43, 0x6f, 0x65, 0x66, 0x66, 0x69, 0x63,
-	0x69, 0x65, 0x6e, 0x74, 0x12, 0x23, 0x0a, 0x0d, 0x76, 0x61, 0x72, 0x69, 0x61, 0x62, 0x6c, 0x65,
-	0x5f, 0x6e, 0x61, 0x6d, 0x65, 0x18, 0x01, 0x20, 0x01, 0x28, 0x09, 0x52, 0x0c, 0x76, 0x61, 0x72,
-	0x69, 0x61, 0x62, 0x6c, 0x65, 0x4e, 0x61, 0x6d, 0x65, 0x12, 0x20, 0x0a, 0x0b, 0x63, 0x6f, 0x65,
-	0x66, 0x66, 0x69, 0x63, 0x69, 0x65, 0x6e, 0x74, 0x18, 0x02, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0b,
-	0x63, 0x6f, 0x65, 0x66, 0x66, 0x69, 0x63, 0x69, 0x65, 0x6e, 0x74, 0x12, 0x1b, 0x0a, 0x09, 0x73,
-	0x74, 0x64, 0x5f, 0x65, 0x72, 0x72, 0x6f, 0x72, 0x18, 0x03, 0x20, 0x01, 0x28, 0x01, 0x52, 0x08,
-	0x73, 0x74, 0x64, 0x45, 0x72, 0x72, 0x6f, 0x72, 0x12, 0x1f, 0x0a, 0x0b, 0x74, 0x5f, 0x73, 0x74,
-	0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x18, 0x04, 0x20, 0x01, 0x28, 0x01, 0x52, 0x0a, 0x74,
-	0x53, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x12, 0x17, 0x0a, 0x07, 0x70, 0x5f, 0x76,
-	0x61, 0x6c, 0x75, 0x65, 0x18, 0x05, 0x20, 0x01, 0x28, 0x01, 0x52, 0x06, 0x70, 0x56, 0x61, 0x6c,
-	0x75, 0x65, 0x12, 0x3a, 0x0a, 0x19, 0x63, 0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65, 0x6e, 0x63, 0x65,
-	0x5f, 0x69, 0x6e, 0x74, 0x65, 0x72, 0x76, 0x61, 0x6c, 0x5f, 0x6c, 0x6f, 0x77, 0x65, 0x72, 0x18,
-	0x06, 0x20, 0x01, 0x28, 0x01, 0x52, 0x17, 0x63, 0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65, 0x6e, 0x63,
-	0x65, 0x49, 0x6e, 0x74, 0x65, 0x72, 0x76, 0x61, 0x6c, 0x4c, 0x6f, 0x77, 0x65, 0x72, 0x12, 0x3a,
-	0x0a, 0x19, 0x63, 0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65, 0x6e, 0x63, 0x65, 0x5f, 0x69, 0x6e, 0x74,
-	0x65, 0x72, 0x76, 0x61, 0x6c, 0x5f, 0x75, 0x70, 0x70, 0x65, 0x72, 0x18, 0x07, 0x20, 0x01, 0x28,
-	0x01, 0x52, 0x17, 0x63, 0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65, 0x6e, 0x63, 0x65, 0x49, 0x6e, 0x74,
-	0x65, 0x72, 0x76, 0x61, 0x6c, 0x55, 0x70, 0x70, 0x65, 0x72, 0x22, 0x27, 0x0a, 0x09, 0x44, 0x61,
-	0x74, 0x61, 0x50, 0x6f, 0x69, 0x6e, 0x74, 0x12, 0x0c, 0x0a, 0x01, 0x78, 0x18, 0x01, 0x20, 0x01,
-	0x28, 0x01, 0x52, 0x01, 0x78, 0x12, 0x0c, 0x0a, 0x01, 0x79, 0x18, 0x02, 0x20, 0x01, 0x28, 0x01,
-	0x52, 0x01, 0x79, 0x22, 0xc1, 0x01, 0x0a, 0x17, 0x52, 0x65, 0x73, 0x69, 0x64, 0x75, 0x61, 0x6c,
-	0x73, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x12,
-	0x40, 0x0a, 0x0c, 0x73, 0x68, 0x61, 0x70, 0x69, 0x72, 0x6f, 0x5f, 0x74, 0x65, 0x73, 0x74, 0x18,
-	0x01, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1d, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73,
-	0x2e, 0x4e, 0x6f, 0x72, 0x6d, 0x61, 0x6c, 0x69, 0x74, 0x79, 0x54, 0x65, 0x73, 0x74, 0x52, 0x65,
-	0x73, 0x75, 0x6c, 0x74, 0x52, 0x0b, 0x73, 0x68, 0x61, 0x70, 0x69, 0x72, 0x6f, 0x54, 0x65, 0x73,
-	0x74, 0x12, 0x35, 0x0a, 0x09, 0x68, 0x69, 0x73, 0x74, 0x6f, 0x67, 0x72, 0x61, 0x6d, 0x18, 0x02,
-	0x20, 0x01, 0x28, 0x0b, 0x32, 0x17, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e,
-	0x48, 0x69, 0x73, 0x74, 0x6f, 0x67, 0x72, 0x61, 0x6d, 0x44, 0x61, 0x74, 0x61, 0x52, 0x09, 0x68,
-	0x69, 0x73, 0x74, 0x6f, 0x67, 0x72, 0x61, 0x6d, 0x12, 0x2d, 0x0a, 0x07, 0x71, 0x71, 0x5f, 0x70,
-	0x6c, 0x6f, 0x74, 0x18, 0x03, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x14, 0x2e, 0x61, 0x6e, 0x61, 0x6c,
-	0x79, 0x73, 0x69, 0x73, 0x2e, 0x51, 0x51, 0x50, 0x6c, 0x6f, 0x74, 0x44, 0x61, 0x74, 0x61, 0x52,
-	0x06, 0x71, 0x71, 0x50, 0x6c, 0x6f, 0x74, 0x22, 0x6c, 0x0a, 0x0a, 0x51, 0x51, 0x50, 0x6c, 0x6f,
-	0x74, 0x44, 0x61, 0x74, 0x61, 0x12, 0x33, 0x0a, 0x15, 0x74, 0x68, 0x65, 0x6f, 0x72, 0x65, 0x74,
-	0x69, 0x63, 0x61, 0x6c, 0x5f, 0x71, 0x75, 0x61, 0x6e, 0x74, 0x69, 0x6c, 0x65, 0x73, 0x18, 0x01,
-	0x20, 0x03, 0x28, 0x01, 0x52, 0x14, 0x74, 0x68, 0x65, 0x6f, 0x72, 0x65, 0x74, 0x69, 0x63, 0x61,
-	0x6c, 0x51, 0x75, 0x61, 0x6e, 0x74, 0x69, 0x6c, 0x65, 0x73, 0x12, 0x29, 0x0a, 0x10, 0x73, 0x61,
-	0x6d, 0x70, 0x6c, 0x65, 0x5f, 0x71, 0x75, 0x61, 0x6e, 0x74, 0x69, 0x6c, 0x65, 0x73, 0x18, 0x02,
-	0x20, 0x03, 0x28, 0x01, 0x52, 0x0f, 0x73, 0x61, 0x6d, 0x70, 0x6c, 0x65, 0x51, 0x75, 0x61, 0x6e,
-	0x74, 0x69, 0x6c, 0x65, 0x73, 0x32, 0x5a, 0x0a, 0x0f, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69,
-	0x73, 0x53, 0x65, 0x72, 0x76, 0x69, 0x63, 0x65, 0x12, 0x47, 0x0a, 0x0b, 0x41, 0x6e, 0x61, 0x6c,
-	0x79, 0x7a, 0x65, 0x44, 0x61, 0x74, 0x61, 0x12, 0x19, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73,
-	0x69, 0x73, 0x2e, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65,
-	0x73, 0x74, 0x1a, 0x1d, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x41, 0x6e,
-	0x61, 0x6c, 0x79, 0x7a, 0x65, 0x44, 0x61, 0x74, 0x61, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73,
-	0x65, 0x42, 0x17, 0x5a, 0x15, 0x2e, 0x2f, 0x67, 0x6f, 0x2d, 0x73, 0x65, 0x72, 0x76, 0x65, 0x72,
-	0x2f, 0x67, 0x65, 0x6e, 0x65, 0x72, 0x61, 0x74, 0x65, 0x64, 0x62, 0x06, 0x70, 0x72, 0x6f, 0x74,
-	0x6f, 0x33,
+	0x0a, 0x74, 0x53, 0x74, 0x61, 0x74, 0x69, 0x73, 0x74, 0x69, 0x63, 0x12, 0x17, 0x0a, 0x07, 0x70,
+	0x5f, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x18, 0x05, 0x20, 0x01, 0x28, 0x01, 0x52, 0x06, 0x70, 0x56,
+	0x61, 0x6c, 0x75, 0x65, 0x12, 0x3a, 0x0a, 0x19, 0x63, 0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65, 0x6e,
+	0x63, 0x65, 0x5f, 0x69, 0x6e, 0x74, 0x65, 0x72, 0x76, 0x61, 0x6c, 0x5f, 0x6c, 0x6f, 0x77, 0x65,
+	0x72, 0x18, 0x06, 0x20, 0x01, 0x28, 0x01, 0x52, 0x17, 0x63, 0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65,
+	0x6e, 0x63, 0x65, 0x49, 0x6e, 0x74, 0x65, 0x72, 0x76, 0x61, 0x6c, 0x4c, 0x6f, 0x77, 0x65, 0x72,
+	0x12, 0x3a, 0x0a, 0x19, 0x63, 0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65, 0x6e, 0x63, 0x65, 0x5f, 0x69,
+	0x6e, 0x74, 0x65, 0x72, 0x76, 0x61, 0x6c, 0x5f, 0x75, 0x70, 0x70, 0x65, 0x72, 0x18, 0x07, 0x20,
+	0x01, 0x28, 0x01, 0x52, 0x17, 0x63, 0x6f, 0x6e, 0x66, 0x69, 0x64, 0x65, 0x6e, 0x63, 0x65, 0x49,
+	0x6e, 0x74, 0x65, 0x72, 0x76, 0x61, 0x6c, 0x55, 0x70, 0x70, 0x65, 0x72, 0x12, 0x25, 0x0a, 0x0e,
+	0x6d, 0x69, 0x73, 0x73, 0x69, 0x6e, 0x67, 0x5f, 0x66, 0x69, 0x65, 0x6c, 0x64, 0x73, 0x18, 0x08,
+	0x20, 0x03, 0x28, 0x09, 0x52, 0x0d, 0x6d, 0x69, 0x73, 0x73, 0x69, 0x6e, 0x67, 0x46, 0x69, 0x65,
+	0x6c, 0x64, 0x73, 0x22, 0x27, 0x0a, 0x09, 0x44, 0x61, 0x74, 0x61, 0x50, 0x6f, 0x69, 0x6e, 0x74,
+	0x12, 0x0c, 0x0a, 0x01, 0x78, 0x18, 0x01, 0x20, 0x01, 0x28, 0x01, 0x52, 0x01, 0x78, 0x12, 0x0c,
+	0x0a, 0x01, 0x79, 0x18, 0x02, 0x20, 0x01, 0x28, 0x01, 0x52, 0x01, 0x79, 0x22, 0xc1, 0x01, 0x0a,
+	0x17, 0x52, 0x65, 0x73, 0x69, 0x64, 0x75, 0x61, 0x6c, 0x73, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x73,
+	0x69, 0x73, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x12, 0x40, 0x0a, 0x0c, 0x73, 0x68, 0x61, 0x70,
+	0x69, 0x72, 0x6f, 0x5f, 0x74, 0x65, 0x73, 0x74, 0x18, 0x01, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x1d,
+	0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x4e, 0x6f, 0x72, 0x6d, 0x61, 0x6c,
+	0x69, 0x74, 0x79, 0x54, 0x65, 0x73, 0x74, 0x52, 0x65, 0x73, 0x75, 0x6c, 0x74, 0x52, 0x0b, 0x73,
+	0x68, 0x61, 0x70, 0x69, 0x72, 0x6f, 0x54, 0x65, 0x73, 0x74, 0x12, 0x35, 0x0a, 0x09, 0x68, 0x69,
+	0x73, 0x74, 0x6f, 0x67, 0x72, 0x61, 0x6d, 0x18, 0x02, 0x20, 0x01, 0x28, 0x0b, 0x32, 0x17, 0x2e,
+	0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x48, 0x69, 0x73, 0x74, 0x6f, 0x67, 0x72,
+	0x61, 0x6d, 0x44, 0x61, 0x74, 0x61, 0x52, 0x09, 0x68, 0x69, 0x73, 0x74, 0x6f, 0x67, 0x72, 0x61,
+	0x6d, 0x12, 0x2d, 0x0a, 0x07, 0x71, 0x71, 0x5f, 0x70, 0x6c, 0x6f, 0x74, 0x18, 0x03, 0x20, 0x01,
+	0x28, 0x0b, 0x32, 0x14, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x51, 0x51,
+	0x50, 0x6c, 0x6f, 0x74, 0x44, 0x61, 0x74, 0x61, 0x52, 0x06, 0x71, 0x71, 0x50, 0x6c, 0x6f, 0x74,
+	0x22, 0x6c, 0x0a, 0x0a, 0x51, 0x51, 0x50, 0x6c, 0x6f, 0x74, 0x44, 0x61, 0x74, 0x61, 0x12, 0x33,
+	0x0a, 0x15, 0x74, 0x68, 0x65, 0x6f, 0x72, 0x65, 0x74, 0x69, 0x63, 0x61, 0x6c, 0x5f, 0x71, 0x75,
+	0x61, 0x6e, 0x74, 0x69, 0x6c, 0x65, 0x73, 0x18, 0x01, 0x20, 0x03, 0x28, 0x01, 0x52, 0x14, 0x74,
+	0x68, 0x65, 0x6f, 0x72, 0x65, 0x74, 0x69, 0x63, 0x61, 0x6c, 0x51, 0x75, 0x61, 0x6e, 0x74, 0x69,
+	0x6c, 0x65, 0x73, 0x12, 0x29, 0x0a, 0x10, 0x73, 0x61, 0x6d, 0x70, 0x6c, 0x65, 0x5f, 0x71, 0x75,
+	0x61, 0x6e, 0x74, 0x69, 0x6c, 0x65, 0x73, 0x18, 0x02, 0x20, 0x03, 0x28, 0x01, 0x52, 0x0f, 0x73,
+	0x61, 0x6d, 0x70, 0x6c, 0x65, 0x51, 0x75, 0x61, 0x6e, 0x74, 0x69, 0x6c, 0x65, 0x73, 0x32, 0xb7,
+	0x02, 0x0a, 0x0f, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x53, 0x65, 0x72, 0x76, 0x69,
+	0x63, 0x65, 0x12, 0x47, 0x0a, 0x0b, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x7a, 0x65, 0x44, 0x61, 0x74,
+	0x61, 0x12, 0x19, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x41, 0x6e, 0x61,
+	0x6c, 0x79, 0x73, 0x69, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x1d, 0x2e, 0x61,
+	0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x7a, 0x65, 0x44,
+	0x61, 0x74, 0x61, 0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x52, 0x0a, 0x16, 0x41,
+	0x6e, 0x61, 0x6c, 0x79, 0x7a, 0x65, 0x44, 0x61, 0x74, 0x61, 0x50, 0x72, 0x6f, 0x67, 0x72, 0x65,
+	0x73, 0x73, 0x69, 0x76, 0x65, 0x12, 0x19, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73,
+	0x2e, 0x41, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74,
+	0x1a, 0x1b, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x50, 0x72, 0x6f, 0x67,
+	0x72, 0x65, 0x73, 0x73, 0x69, 0x76, 0x65, 0x55, 0x70, 0x64, 0x61, 0x74, 0x65, 0x30, 0x01, 0x12,
+	0x44, 0x0a, 0x0d, 0x43, 0x72, 0x65, 0x61, 0x74, 0x65, 0x44, 0x61, 0x74, 0x61, 0x73, 0x65, 0x74,
+	0x12, 0x18, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x44, 0x61, 0x74, 0x61,
+	0x73, 0x65, 0x74, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x19, 0x2e, 0x61, 0x6e, 0x61,
+	0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x44, 0x61, 0x74, 0x61, 0x73, 0x65, 0x74, 0x52, 0x65, 0x73,
+	0x70, 0x6f, 0x6e, 0x73, 0x65, 0x12, 0x41, 0x0a, 0x0a, 0x41, 0x70, 0x70, 0x65, 0x6e, 0x64, 0x52,
+	0x6f, 0x77, 0x73, 0x12, 0x18, 0x2e, 0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x44,
+	0x61, 0x74, 0x61, 0x73, 0x65, 0x74, 0x52, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x1a, 0x19, 0x2e,
+	0x61, 0x6e, 0x61, 0x6c, 0x79, 0x73, 0x69, 0x73, 0x2e, 0x44, 0x61, 0x74, 0x61, 0x73, 0x65, 0x74,
+	0x52, 0x65, 0x73, 0x70, 0x6f, 0x6e, 0x73, 0x65, 0x42, 0x17, 0x5a, 0x15, 0x2e, 0x2f, 0x67, 0x6f,
+	0x2d, 0x73, 0x65, 0x72, 0x76, 0x65, 0x72, 0x2f, 0x67, 0x65, 0x6e, 0x65, 0x72, 0x61, 0x74, 0x65,
+	0x64, 0x62, 0x06, 0x70, 0x72, 0x6f, 0x74, 0x6f, 0x33,
 }
 
 var (
@@ -1863,55 +3121,81 @@ func file_proto_analysis_proto_rawDescGZIP() []byte {
 	return file_proto_analysis_proto_rawDescData
 }
 
-var file_proto_analysis_proto_msgTypes = make([]protoimpl.MessageInfo, 19)
+var file_proto_analysis_proto_msgTypes = make([]protoimpl.MessageInfo, 28)
 var file_proto_analysis_proto_goTypes = []any{
 	(*AnalysisRequest)(nil),               // 0: analysis.AnalysisRequest
 	(*AnalyzeDataResponse)(nil),           // 1: analysis.AnalyzeDataResponse
-	(*ErrorDetails)(nil),                  // 2: analysis.ErrorDetails
-	(*DescriptiveStatisticsResponse)(nil), // 3: analysis.DescriptiveStatisticsResponse
-	(*DescriptiveStatistics)(nil),         // 4: analysis.DescriptiveStatistics
-	(*HistogramData)(nil),                 // 5: analysis.HistogramData
-	(*ConfidenceInterval)(nil),            // 6: analysis.ConfidenceInterval
-	(*NormalityTestsResponse)(nil),        // 7: analysis.NormalityTestsResponse
-	(*NormalityTestResult)(nil),           // 8: analysis.NormalityTestResult
-	(*PearsonChiSquareResult)(nil),        // 9: analysis.PearsonChiSquareResult
-	(*WilcoxonTestsResponse)(nil),         // 10: analysis.WilcoxonTestsResponse
-	(*WilcoxonSignedRankTestResult)(nil),  // 11: analysis.WilcoxonSignedRankTestResult
-	(*MannWhitneyTestResult)(nil),         // 12: analysis.MannWhitneyTestResult
-	(*RegressionAnalysisResponse)(nil),    // 13: analysis.RegressionAnalysisResponse
-	(*RegressionModel)(nil),               // 14: analysis.RegressionModel
-	(*RegressionCoefficient)(nil),         // 15: analysis.RegressionCoefficient
-	(*DataPoint)(nil),                     // 16: analysis.DataPoint
-	(*ResidualsAnalysisResult)(nil),       // 17: analysis.ResidualsAnalysisResult
-	(*QQPlotData)(nil),                    // 18: analysis.QQPlotData
+	(*ApproximationInfo)(nil),             // 2: analysis.ApproximationInfo
+	(*EstimateError)(nil),                 // 3: analysis.EstimateError
+	(*ProgressiveUpdate)(nil),             // 4: analysis.ProgressiveUpdate
+	(*DatasetRequest)(nil),                // 5: analysis.DatasetRequest
+	(*DatasetResponse)(nil),               // 6: analysis.DatasetResponse
+	(*CorrelationResult)(nil),             // 7: analysis.CorrelationResult
+	(*ErrorDetails)(nil),                  // 8: analysis.ErrorDetails
+	(*DescriptiveStatisticsResponse)(nil), // 9: analysis.DescriptiveStatisticsResponse
+	(*OutlierSummary)(nil),                // 10: analysis.OutlierSummary
+	(*GroupedDescriptiveStatistics)(nil),  // 11: analysis.GroupedDescriptiveStatistics
+	(*DescriptiveStatistics)(nil),         // 12: analysis.DescriptiveStatistics
+	(*HistogramData)(nil),                 // 13: analysis.HistogramData
+	(*ConfidenceInterval)(nil),            // 14: analysis.ConfidenceInterval
+	(*NormalityTestsResponse)(nil),        // 15: analysis.NormalityTestsResponse
+	(*NormalityTestResult)(nil),           // 16: analysis.NormalityTestResult
+	(*PearsonChiSquareResult)(nil),        // 17: analysis.PearsonChiSquareResult
+	(*WilcoxonTestsResponse)(nil),         // 18: analysis.WilcoxonTestsResponse
+	(*WilcoxonSignedRankTestResult)(nil),  // 19: analysis.WilcoxonSignedRankTestResult
+	(*MannWhitneyTestResult)(nil),         // 20: analysis.MannWhitneyTestResult
+	(*RegressionAnalysisResponse)(nil),    // 21: analysis.RegressionAnalysisResponse
+	(*DensityGrid)(nil),                   // 22: analysis.DensityGrid
+	(*RegressionModel)(nil),               // 23: analysis.RegressionModel
+	(*RegressionCoefficient)(nil),         // 24: analysis.RegressionCoefficient
+	(*DataPoint)(nil),                     // 25: analysis.DataPoint
+	(*ResidualsAnalysisResult)(nil),       // 26: analysis.ResidualsAnalysisResult
+	(*QQPlotData)(nil),                    // 27: analysis.QQPlotData
 }
 var file_proto_analysis_proto_depIdxs = []int32{
-	3,  // 0: analysis.AnalyzeDataResponse.descriptive_stats:type_name -> analysis.DescriptiveStatisticsResponse
-	7,  // 1: analysis.AnalyzeDataResponse.normality_tests:type_name -> analysis.NormalityTestsResponse
-	13, // 2: analysis.AnalyzeDataResponse.regression_analysis:type_name -> analysis.RegressionAnalysisResponse
-	2,  // 3: analysis.AnalyzeDataResponse.error:type_name -> analysis.ErrorDetails
-	10, // 4: analysis.AnalyzeDataResponse.wilcoxon_tests:type_name -> analysis.WilcoxonTestsResponse
-	4,  // 5: analysis.DescriptiveStatisticsResponse.descriptives:type_name -> analysis.DescriptiveStatistics
-	5,  // 6: analysis.DescriptiveStatisticsResponse.histograms:type_name -> analysis.HistogramData
-	6,  // 7: analysis.DescriptiveStatisticsResponse.confidence_intervals:type_name -> analysis.ConfidenceInterval
-	8,  // 8: analysis.NormalityTestsResponse.shapiro_wilk_results:type_name -> analysis.NormalityTestResult
-	9,  // 9: analysis.NormalityTestsResponse.chi_square_results:type_name -> analysis.PearsonChiSquareResult
-	11, // 10: analysis.WilcoxonTestsResponse.signed_rank_results:type_name -> analysis.WilcoxonSignedRankTestResult
-	12, // 11: analysis.WilcoxonTestsResponse.mann_whitney_results:type_name -> analysis.MannWhitneyTestResult
-	16, // 12: analysis.RegressionAnalysisResponse.data_points:type_name -> analysis.DataPoint
-	14, // 13: analysis.RegressionAnalysisResponse.models:type_name -> analysis.RegressionModel
-	15, // 14: analysis.RegressionModel.coefficients:type_name -> analysis.RegressionCoefficient
-	17, // 15: analysis.RegressionModel.residuals_analysis:type_name -> analysis.ResidualsAnalysisResult
-	8,  // 16: analysis.ResidualsAnalysisResult.shapiro_test:type_name -> analysis.NormalityTestResult
-	5,  // 17: analysis.ResidualsAnalysisResult.histogram:type_name -> analysis.HistogramData
-	18, // 18: analysis.ResidualsAnalysisResult.qq_plot:type_name -> analysis.QQPlotData
-	0,  // 19: analysis.AnalysisService.AnalyzeData:input_type -> analysis.AnalysisRequest
-	1,  // 20: analysis.AnalysisService.AnalyzeData:output_type -> analysis.AnalyzeDataResponse
-	20, // [20:21] is the sub-list for method output_type
-	19, // [19:20] is the sub-list for method input_type
-	19, // [19:19] is the sub-list for extension type_name
-	19, // [19:19] is the sub-list for extension extendee
-	0,  // [0:19] is the sub-list for field type_name
+	9,  // 0: analysis.AnalyzeDataResponse.descriptive_stats:type_name -> analysis.DescriptiveStatisticsResponse
+	15, // 1: analysis.AnalyzeDataResponse.normality_tests:type_name -> analysis.NormalityTestsResponse
+	21, // 2: analysis.AnalyzeDataResponse.regression_analysis:type_name -> analysis.RegressionAnalysisResponse
+	8,  // 3: analysis.AnalyzeDataResponse.error:type_name -> analysis.ErrorDetails
+	18, // 4: analysis.AnalyzeDataResponse.wilcoxon_tests:type_name -> analysis.WilcoxonTestsResponse
+	2,  // 5: analysis.AnalyzeDataResponse.approximations:type_name -> analysis.ApproximationInfo
+	3,  // 6: analysis.ApproximationInfo.estimates:type_name -> analysis.EstimateError
+	3,  // 7: analysis.ProgressiveUpdate.estimates:type_name -> analysis.EstimateError
+	8,  // 8: analysis.ProgressiveUpdate.error:type_name -> analysis.ErrorDetails
+	1,  // 9: analysis.DatasetResponse.analysis:type_name -> analysis.AnalyzeDataResponse
+	7,  // 10: analysis.DatasetResponse.correlations:type_name -> analysis.CorrelationResult
+	12, // 11: analysis.DescriptiveStatisticsResponse.descriptives:type_name -> analysis.DescriptiveStatistics
+	13, // 12: analysis.DescriptiveStatisticsResponse.histograms:type_name -> analysis.HistogramData
+	14, // 13: analysis.DescriptiveStatisticsResponse.confidence_intervals:type_name -> analysis.ConfidenceInterval
+	11, // 14: analysis.DescriptiveStatisticsResponse.grouped_descriptives:type_name -> analysis.GroupedDescriptiveStatistics
+	10, // 15: analysis.DescriptiveStatisticsResponse.outliers:type_name -> analysis.OutlierSummary
+	12, // 16: analysis.GroupedDescriptiveStatistics.statistics:type_name -> analysis.DescriptiveStatistics
+	16, // 17: analysis.NormalityTestsResponse.shapiro_wilk_results:type_name -> analysis.NormalityTestResult
+	17, // 18: analysis.NormalityTestsResponse.chi_square_results:type_name -> analysis.PearsonChiSquareResult
+	19, // 19: analysis.WilcoxonTestsResponse.signed_rank_results:type_name -> analysis.WilcoxonSignedRankTestResult
+	20, // 20: analysis.WilcoxonTestsResponse.mann_whitney_results:type_name -> analysis.MannWhitneyTestResult
+	25, // 21: analysis.RegressionAnalysisResponse.data_points:type_name -> analysis.DataPoint
+	23, // 22: analysis.RegressionAnalysisResponse.models:type_name -> analysis.RegressionModel
+	22, // 23: analysis.RegressionAnalysisResponse.density:type_name -> analysis.DensityGrid
+	24, // 24: analysis.RegressionModel.coefficients:type_name -> analysis.RegressionCoefficient
+	26, // 25: analysis.RegressionModel.residuals_analysis:type_name -> analysis.ResidualsAnalysisResult
+	25, // 26: analysis.RegressionModel.fitted_curve:type_name -> analysis.DataPoint
+	16, // 27: analysis.ResidualsAnalysisResult.shapiro_test:type_name -> analysis.NormalityTestResult
+	13, // 28: analysis.ResidualsAnalysisResult.histogram:type_name -> analysis.HistogramData
+	27, // 29: analysis.ResidualsAnalysisResult.qq_plot:type_name -> analysis.QQPlotData
+	0,  // 30: analysis.AnalysisService.AnalyzeData:input_type -> analysis.AnalysisRequest
+	0,  // 31: analysis.AnalysisService.AnalyzeDataProgressive:input_type -> analysis.AnalysisRequest
+	5,  // 32: analysis.AnalysisService.CreateDataset:input_type -> analysis.DatasetRequest
+	5,  // 33: analysis.AnalysisService.AppendRows:input_type -> analysis.DatasetRequest
+	1,  // 34: analysis.AnalysisService.AnalyzeData:output_type -> analysis.AnalyzeDataResponse
+	4,  // 35: analysis.AnalysisService.AnalyzeDataProgressive:output_type -> analysis.ProgressiveUpdate
+	6,  // 36: analysis.AnalysisService.CreateDataset:output_type -> analysis.DatasetResponse
+	6,  // 37: analysis.AnalysisService.AppendRows:output_type -> analysis.DatasetResponse
+	34, // [34:38] is the sub-list for method output_type
+	30, // [30:34] is the sub-list for method input_type
+	30, // [30:30] is the sub-list for extension type_name
+	30, // [30:30] is the sub-list for extension extendee
+	0,  // [0:30] is the sub-list for field type_name
 }
 
 func init() { file_proto_analysis_proto_init() }
@@ -1925,7 +3209,7 @@ func file_proto_analysis_proto_init() {
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: file_proto_analysis_proto_rawDesc,
 			NumEnums:      0,
-			NumMessages:   19,
+			NumMessages:   28,
 			NumExtensions: 0,
 			NumServices:   1,
 		},
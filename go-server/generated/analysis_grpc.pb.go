@@ -19,7 +19,10 @@ import (
 const _ = grpc.SupportPackageIsVersion9
 
 const (
-	AnalysisService_AnalyzeData_FullMethodName = "/analysis.AnalysisService/AnalyzeData"
+	AnalysisService_AnalyzeData_FullMethodName            = "/analysis.AnalysisService/AnalyzeData"
+	AnalysisService_AnalyzeDataProgressive_FullMethodName = "/analysis.AnalysisService/AnalyzeDataProgressive"
+	AnalysisService_CreateDataset_FullMethodName          = "/analysis.AnalysisService/CreateDataset"
+	AnalysisService_AppendRows_FullMethodName             = "/analysis.AnalysisService/AppendRows"
 )
 
 // AnalysisServiceClient is the client API for AnalysisService service.
@@ -27,6 +30,12 @@ const (
 // For semantics around ctx use and closing/ending streaming RPCs, please refer to https://pkg.go.dev/google.golang.org/grpc/?tab=doc#ClientConn.NewStream.
 type AnalysisServiceClient interface {
 	AnalyzeData(ctx context.Context, in *AnalysisRequest, opts ...grpc.CallOption) (*AnalyzeDataResponse, error)
+	// Онлайн-агрегация: уточняющиеся оценки после каждого блока строк, обработанных в случайном порядке.
+	// Клиент может прекратить чтение потока (отменить вызов), когда оценки стабилизировались
+	AnalyzeDataProgressive(ctx context.Context, in *AnalysisRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[ProgressiveUpdate], error)
+	// Пополняемые наборы данных, хранимые на сервере: статистики обновляются только по добавленным строкам
+	CreateDataset(ctx context.Context, in *DatasetRequest, opts ...grpc.CallOption) (*DatasetResponse, error)
+	AppendRows(ctx context.Context, in *DatasetRequest, opts ...grpc.CallOption) (*DatasetResponse, error)
 }
 
 type analysisServiceClient struct {
@@ -47,11 +56,56 @@ func (c *analysisServiceClient) AnalyzeData(ctx context.Context, in *AnalysisReq
 	return out, nil
 }
 
+func (c *analysisServiceClient) AnalyzeDataProgressive(ctx context.Context, in *AnalysisRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[ProgressiveUpdate], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &AnalysisService_ServiceDesc.Streams[0], AnalysisService_AnalyzeDataProgressive_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[AnalysisRequest, ProgressiveUpdate]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type AnalysisService_AnalyzeDataProgressiveClient = grpc.ServerStreamingClient[ProgressiveUpdate]
+
+func (c *analysisServiceClient) CreateDataset(ctx context.Context, in *DatasetRequest, opts ...grpc.CallOption) (*DatasetResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(DatasetResponse)
+	err := c.cc.Invoke(ctx, AnalysisService_CreateDataset_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *analysisServiceClient) AppendRows(ctx context.Context, in *DatasetRequest, opts ...grpc.CallOption) (*DatasetResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(DatasetResponse)
+	err := c.cc.Invoke(ctx, AnalysisService_AppendRows_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 // AnalysisServiceServer is the server API for AnalysisService service.
 // All implementations must embed UnimplementedAnalysisServiceServer
 // for forward compatibility.
 type AnalysisServiceServer interface {
 	AnalyzeData(context.Context, *AnalysisRequest) (*AnalyzeDataResponse, error)
+	// Онлайн-агрегация: уточняющиеся оценки после каждого блока строк, обработанных в случайном порядке.
+	// Клиент может прекратить чтение потока (отменить вызов), когда оценки стабилизировались
+	AnalyzeDataProgressive(*AnalysisRequest, grpc.ServerStreamingServer[ProgressiveUpdate]) error
+	// Пополняемые наборы данных, хранимые на сервере: статистики обновляются только по добавленным строкам
+	CreateDataset(context.Context, *DatasetRequest) (*DatasetResponse, error)
+	AppendRows(context.Context, *DatasetRequest) (*DatasetResponse, error)
 	mustEmbedUnimplementedAnalysisServiceServer()
 }
 
@@ -65,6 +119,15 @@ type UnimplementedAnalysisServiceServer struct{}
 func (UnimplementedAnalysisServiceServer) AnalyzeData(context.Context, *AnalysisRequest) (*AnalyzeDataResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method AnalyzeData not implemented")
 }
+func (UnimplementedAnalysisServiceServer) AnalyzeDataProgressive(*AnalysisRequest, grpc.ServerStreamingServer[ProgressiveUpdate]) error {
+	return status.Errorf(codes.Unimplemented, "method AnalyzeDataProgressive not implemented")
+}
+func (UnimplementedAnalysisServiceServer) CreateDataset(context.Context, *DatasetRequest) (*DatasetResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method CreateDataset not implemented")
+}
+func (UnimplementedAnalysisServiceServer) AppendRows(context.Context, *DatasetRequest) (*DatasetResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method AppendRows not implemented")
+}
 func (UnimplementedAnalysisServiceServer) mustEmbedUnimplementedAnalysisServiceServer() {}
 func (UnimplementedAnalysisServiceServer) testEmbeddedByValue()                         {}
 
@@ -104,6 +167,53 @@ func _AnalysisService_AnalyzeData_Handler(srv interface{}, ctx context.Context,
 	return interceptor(ctx, in, info, handler)
 }
 
+func _AnalysisService_AnalyzeDataProgressive_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(AnalysisRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(AnalysisServiceServer).AnalyzeDataProgressive(m, &grpc.GenericServerStream[AnalysisRequest, ProgressiveUpdate]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type AnalysisService_AnalyzeDataProgressiveServer = grpc.ServerStreamingServer[ProgressiveUpdate]
+
+func _AnalysisService_CreateDataset_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(DatasetRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(AnalysisServiceServer).CreateDataset(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: AnalysisService_CreateDataset_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(AnalysisServiceServer).CreateDataset(ctx, req.(*DatasetRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _AnalysisService_AppendRows_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(DatasetRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(AnalysisServiceServer).AppendRows(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: AnalysisService_AppendRows_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(AnalysisServiceServer).AppendRows(ctx, req.(*DatasetRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 // AnalysisService_ServiceDesc is the grpc.ServiceDesc for AnalysisService service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -115,7 +225,21 @@ var AnalysisService_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "AnalyzeData",
 			Handler:    _AnalysisService_AnalyzeData_Handler,
 		},
+		{
+			MethodName: "CreateDataset",
+			Handler:    _AnalysisService_CreateDataset_Handler,
+		},
+		{
+			MethodName: "AppendRows",
+			Handler:    _AnalysisService_AppendRows_Handler,
+		},
+	},
+	Streams: []grpc.StreamDesc{
+		{
+			StreamName:    "AnalyzeDataProgressive",
+			Handler:       _AnalysisService_AnalyzeDataProgressive_Handler,
+			ServerStreams: true,
+		},
 	},
-	Streams:  []grpc.StreamDesc{},
 	Metadata: "proto/analysis.proto",
 }
@@ -0,0 +1,181 @@
+# python-server/analysis_modules/column_artifacts.py
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from analysis_modules.column_block import block_statistics, sorted_modes, stack_column_blocks
+from analysis_modules.histogram_engine import StreamingHistogram
+
+# Промежуточные результаты по столбцам и их зависимости:
+# clean -> sorted -> quantiles, sorted -> mode, clean -> moments, moments + quantiles -> histogram
+COLUMN_ARTIFACTS = ("clean", "sorted", "quantiles", "mode", "moments", "histogram")
+
+
+class ColumnArtifacts:
+    """
+    Ленивое хранилище промежуточных результатов по столбцам одного DataFrame.
+    Каждый результат (очищенный от NaN столбец, отсортированный массив, моменты, квантили, гистограмма)
+    вычисляется один раз при первом обращении и затем используется всеми анализами запроса.
+    Безопасно для одновременного использования из нескольких потоков.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._values: Dict[Tuple, Any] = {}
+        self._key_locks: Dict[Tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._computed: Counter = Counter()
+        self._reused: Counter = Counter()
+        self._numerical_columns: List[str] = df.select_dtypes(include=np.number).columns.tolist()
+
+    def _get(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        kind = key[0]
+        with self._lock:
+            if key in self._values:
+                self._reused[kind] += 1
+                return self._values[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # Один и тот же результат не вычисляется параллельно двумя потоками
+        with key_lock:
+            with self._lock:
+                if key in self._values:
+                    self._reused[kind] += 1
+                    return self._values[key]
+            value = compute()
+            with self._lock:
+                self._values[key] = value
+                self._computed[kind] += 1
+        return value
+
+    def _put(self, key: Tuple, value: Any) -> None:
+        """Сохраняет результат, вычисленный вне _get (если другой поток не успел вычислить его раньше)."""
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = value
+                self._computed[key[0]] += 1
+
+    def compute_block(self, col_names: List[str]) -> None:
+        """
+        Вычисляет моменты, отсортированные значения, квантили и моды сразу для группы столбцов:
+        значения столбцов собираются в двумерные блоки, и статистики всех столбцов блока
+        вычисляются несколькими векторными проходами вместо отдельных вызовов pandas/scipy для каждого столбца.
+        Уже вычисленные столбцы пропускаются, остальные результаты затем возвращаются методами
+        moments/sorted/quantiles/mode из кэша.
+        """
+        with self._lock:
+            pending = [col_name for col_name in col_names if ("moments", col_name) not in self._values]
+        for columns, block in stack_column_blocks(self.df, pending):
+            statistics = block_statistics(block)
+            for index, col_name in enumerate(columns):
+                self._put(("sorted", col_name), statistics["sorted"][index])
+                self._put(("quantiles", col_name), {name: float(statistics[name][index])
+                                                     for name in ("median", "q1", "q3")})
+                self._put(("mode", col_name), statistics["mode"][index])
+                self._put(("moments", col_name), {
+                    "count": statistics["count"],
+                    **{name: statistics[name][index]
+                       for name in ("mean", "variance", "std_dev", "sem", "skewness", "kurtosis")},
+                    "min": float(statistics["min"][index]),
+                    "max": float(statistics["max"][index]),
+                })
+
+    def numerical_columns(self) -> List[str]:
+        """Возвращает имена числовых столбцов."""
+        return list(self._numerical_columns)
+
+    def clean(self, col_name: str) -> pd.Series:
+        """Столбец без пропущенных значений."""
+        return self._get(("clean", col_name), lambda: self.df[col_name].dropna())
+
+    def sorted(self, col_name: str) -> np.ndarray:
+        """Значения столбца без пропусков, отсортированные по возрастанию."""
+        return self._get(("sorted", col_name), lambda: np.sort(self.clean(col_name).to_numpy()))
+
+    def quantiles(self, col_name: str) -> Dict[str, float]:
+        """Медиана и квартили (линейная интерполяция, как в pandas.Series.median/quantile)."""
+        def compute():
+            sorted_values = self.sorted(col_name)
+            if len(sorted_values) == 0:
+                return {"median": np.nan, "q1": np.nan, "q3": np.nan}
+            q1, q3 = np.quantile(sorted_values, [0.25, 0.75])
+            return {"median": float(np.median(sorted_values)), "q1": float(q1), "q3": float(q3)}
+        return self._get(("quantiles", col_name), compute)
+
+    def mode(self, col_name: str) -> Dict[str, Any]:
+        """
+        Моды столбца по возрастанию (значения с наибольшей частотой, как pandas.Series.mode, не больше DEFAULT_MAX_MODES)
+        с частотой и общим количеством таких значений.
+        """
+        def compute():
+            sorted_values = self.sorted(col_name)
+            if len(sorted_values) == 0:
+                return {"values": sorted_values, "frequency": 0, "count": 0, "frequency_error": 0}
+            return sorted_modes(sorted_values.reshape(1, -1))[0]
+        return self._get(("mode", col_name), compute)
+
+    def moments(self, col_name: str) -> Dict[str, Any]:
+        """
+        Количество, среднее, дисперсия и стандартное отклонение (ddof=1), стандартная ошибка среднего,
+        асимметрия и эксцесс (bias=True), минимум и максимум.
+        """
+        def compute():
+            col_data = self.clean(col_name)
+            count = int(col_data.count())
+            result = {
+                "count": count,
+                "mean": col_data.mean(),
+                "variance": col_data.var(ddof=1),
+                "std_dev": col_data.std(ddof=1),
+                "sem": np.nan,
+                "skewness": np.nan,
+                "kurtosis": np.nan,
+                "min": np.nan,
+                "max": np.nan,
+            }
+            if count > 0:
+                result["skewness"] = stats.skew(col_data)
+                result["kurtosis"] = stats.kurtosis(col_data, bias=True)
+                result["min"] = float(col_data.min())
+                result["max"] = float(col_data.max())
+            if count > 1:
+                result["sem"] = stats.sem(col_data)
+            return result
+        return self._get(("moments", col_name), compute)
+
+    def histogram(self, col_name: str, bins: Union[int, str] = "auto") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Частоты и границы интервалов гистограммы для заданного правила разбиения или количества интервалов
+        (результат совпадает с numpy.histogram). Интервалы выбираются по уже вычисленным моментам
+        и квартилям столбца, после чего значения подсчитываются одним проходом.
+        """
+        def compute():
+            values = self.clean(col_name).to_numpy()
+            moments = self.moments(col_name)
+            iqr = None
+            if bins in ("auto", "fd"):
+                quantiles = self.quantiles(col_name)
+                iqr = quantiles["q3"] - quantiles["q1"]
+            histogram = StreamingHistogram.from_summary(
+                bins, moments["count"], moments["min"], moments["max"], iqr=iqr, std_dev=moments["std_dev"],
+                integer=np.issubdtype(values.dtype, np.integer))
+            histogram.update(values)
+            return histogram.result()
+        return self._get(("histogram", col_name, bins), compute)
+
+    def usage(self) -> Dict[str, Tuple[int, int]]:
+        """Возвращает для каждого вида результата пару (вычислено, использовано повторно)."""
+        with self._lock:
+            return {kind: (self._computed[kind], self._reused[kind])
+                    for kind in COLUMN_ARTIFACTS if self._computed[kind] or self._reused[kind]}
+
+    def usage_summary(self) -> str:
+        """Строка для журнала обработки с количеством вычисленных и повторно использованных результатов."""
+        usage = self.usage()
+        if not usage:
+            return "Column artifacts: none computed"
+        parts = [f"{kind} computed {computed}, reused {reused}" for kind, (computed, reused) in usage.items()]
+        return "Column artifacts: " + "; ".join(parts)
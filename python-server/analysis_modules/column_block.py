@@ -0,0 +1,142 @@
+# python-server/analysis_modules/column_block.py
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from analysis_modules.mode_counter import DEFAULT_MAX_MODES
+
+
+def stack_column_blocks(df: pd.DataFrame, columns: List[str]) -> List[Tuple[List[str], np.ndarray]]:
+    """
+    Собирает значения числовых столбцов без пропусков в двумерные блоки (столбцы x значения).
+    В один блок попадают столбцы с одинаковым количеством непустых значений, порядок значений
+    в строке блока совпадает с порядком строк DataFrame. Полностью пустые столбцы пропускаются.
+
+    Args:
+        df: Входной DataFrame.
+        columns: Имена числовых столбцов.
+
+    Returns:
+        Список пар (имена столбцов блока, массив float64 формы (столбцы, значения)).
+    """
+    if not columns or df.empty:
+        return []
+    # Строка массива - один столбец DataFrame, значения столбца лежат в памяти подряд
+    values = np.ascontiguousarray(df[columns].to_numpy(dtype=float, na_value=np.nan).T)
+    finite = ~np.isnan(values)
+    counts = finite.sum(axis=1)
+
+    blocks = []
+    for count in np.unique(counts):
+        if count == 0:
+            continue
+        rows = np.flatnonzero(counts == count)
+        block = values[rows]
+        if count < values.shape[1]:
+            # Каждая строка содержит ровно count непустых значений, поэтому после отбора они снова образуют матрицу
+            block = block[finite[rows]].reshape(len(rows), count)
+        blocks.append(([columns[row] for row in rows], block))
+    return blocks
+
+
+def block_statistics(block: np.ndarray) -> Dict[str, Any]:
+    """
+    Описательные статистики всех столбцов блока за несколько векторных проходов по массиву:
+    одна сортировка дает минимум, максимум, медиану, квартили и моды, суммы по строкам - моменты.
+    Формулы повторяют pandas (среднее, дисперсия и стандартное отклонение с ddof=1) и scipy
+    (стандартная ошибка среднего, асимметрия и эксцесс с bias=True), поэтому результаты совпадают
+    с вычислениями по отдельным столбцам.
+
+    Args:
+        block: Массив float64 формы (столбцы, значения) без пропусков.
+
+    Returns:
+        Словарь массивов по столбцам блока: "count", "mean", "variance", "std_dev", "sem", "skewness",
+        "kurtosis", "min", "max", "median", "q1", "q3", "sorted" (отсортированные значения)
+        и список мод столбцов "mode" (см. sorted_modes).
+    """
+    n_columns, count = block.shape
+    mean = block.sum(axis=1) / count
+    squares = (mean[:, None] - block) ** 2
+    with np.errstate(invalid="ignore", divide="ignore"):
+        variance = squares.sum(axis=1) / (count - 1) if count > 1 else np.full(n_columns, np.nan)
+    std_dev = np.sqrt(variance)
+    skewness, kurtosis = _shape_moments(block, mean)
+
+    sorted_block = np.sort(block, axis=1)
+    half = count // 2
+    if count % 2:
+        median = sorted_block[:, half].copy()
+    else:
+        median = (sorted_block[:, half - 1] + sorted_block[:, half]) / 2.0
+    q1, q3 = np.quantile(sorted_block, [0.25, 0.75], axis=1)
+
+    return {
+        "count": count,
+        "mean": mean,
+        "variance": variance,
+        "std_dev": std_dev,
+        "sem": std_dev / np.sqrt(count) if count > 1 else np.full(n_columns, np.nan),
+        "skewness": skewness,
+        "kurtosis": kurtosis,
+        "min": sorted_block[:, 0],
+        "max": sorted_block[:, -1],
+        "median": median,
+        "q1": q1,
+        "q3": q3,
+        "sorted": sorted_block,
+        "mode": sorted_modes(sorted_block),
+    }
+
+
+def _shape_moments(block: np.ndarray, mean: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Асимметрия и эксцесс (bias=True) по центральным моментам, как scipy.stats.skew/kurtosis.
+    Моменты вычисляются для всего блока, а возведение в дробную степень - для каждого столбца
+    скалярно: векторная степень numpy может отличаться от скалярной в последнем знаке.
+    """
+    deviations = block - mean[:, None]
+    squares = deviations ** 2
+    m2 = squares.mean(axis=1)
+    m3 = (squares * deviations).mean(axis=1)
+    m4 = (squares ** 2).mean(axis=1)
+    # Почти постоянный столбец: моменты определяются ошибками округления
+    zero = m2 <= (np.finfo(float).eps * mean) ** 2
+    skewness = np.full(len(m2), np.nan)
+    kurtosis = np.full(len(m2), np.nan)
+    for index in np.flatnonzero(~zero):
+        skewness[index] = float(m3[index]) / float(m2[index]) ** 1.5
+        kurtosis[index] = float(m4[index]) / float(m2[index]) ** 2.0 - 3.0
+    return skewness, kurtosis
+
+
+def sorted_modes(sorted_block: np.ndarray, max_modes: int = DEFAULT_MAX_MODES) -> List[Dict[str, Any]]:
+    """
+    Моды строк отсортированного блока: значения с наибольшей длиной серии одинаковых элементов
+    (по возрастанию, как pandas.Series.mode), не больше max_modes для каждой строки.
+
+    Returns:
+        Для каждой строки словарь {"values": массив мод, "frequency": частота моды,
+        "count": количество значений с этой частотой, "frequency_error": 0}.
+    """
+    n_columns, count = sorted_block.shape
+    starts = np.ones((n_columns, count), dtype=bool)
+    starts[:, 1:] = sorted_block[:, 1:] != sorted_block[:, :-1]
+    flat_starts = starts.ravel()
+    # Номера серий сквозные по всему блоку, поэтому длины всех серий дает один bincount
+    run_lengths = np.bincount(np.cumsum(flat_starts) - 1)
+    run_values = sorted_block.ravel()[flat_starts]
+    run_rows = np.repeat(np.arange(n_columns), starts.sum(axis=1))
+
+    longest = np.zeros(n_columns, dtype=run_lengths.dtype)
+    np.maximum.at(longest, run_rows, run_lengths)
+    is_mode = run_lengths == longest[run_rows]
+    mode_rows = run_rows[is_mode]
+    mode_counts = np.bincount(mode_rows, minlength=n_columns)
+    # Порядковый номер моды внутри строки: у столбца с уникальными значениями модой является каждое значение
+    mode_ranks = np.arange(len(mode_rows)) - np.repeat(np.cumsum(mode_counts) - mode_counts, mode_counts)
+    kept = mode_ranks < max_modes
+    mode_values = np.split(run_values[is_mode][kept], np.cumsum(np.minimum(mode_counts, max_modes))[:-1])
+    return [{"values": values, "frequency": int(frequency), "count": int(n_modes), "frequency_error": 0}
+            for values, frequency, n_modes in zip(mode_values, longest, mode_counts)]
@@ -0,0 +1,136 @@
+# python-server/analysis_modules/column_partition.py
+import hashlib
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from analysis_modules.column_artifacts import ColumnArtifacts
+
+# Количество столбцов в одной порции, передаваемой рабочему процессу
+DEFAULT_COLUMN_CHUNK_SIZE = 64
+# Объем данных порций, промежуточные результаты которых хранит один рабочий процесс
+WORKER_ARTIFACTS_MAX_BYTES = 256 * 1024 * 1024
+
+# Промежуточные результаты порций в рабочем процессе: разделы одного запроса
+# (описательные статистики, тесты, интервалы) получают одну и ту же порцию и используют их повторно
+_worker_artifacts: "OrderedDict[str, Tuple[ColumnArtifacts, int]]" = OrderedDict()
+_worker_artifacts_lock = threading.Lock()
+
+
+def column_chunks(columns: List[str], chunk_size: int) -> List[List[str]]:
+    """Разбивает список столбцов на последовательные порции не более chunk_size столбцов."""
+    chunk_size = max(1, int(chunk_size))
+    return [columns[start:start + chunk_size] for start in range(0, len(columns), chunk_size)]
+
+
+def _chunk_artifacts(df_chunk: pd.DataFrame) -> ColumnArtifacts:
+    """Возвращает промежуточные результаты порции из кэша рабочего процесса (по отпечатку содержимого)."""
+    digest = hashlib.sha1()
+    digest.update(repr((list(df_chunk.columns), [str(dtype) for dtype in df_chunk.dtypes])).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df_chunk, index=True).to_numpy().tobytes())
+    key = digest.hexdigest()
+
+    with _worker_artifacts_lock:
+        cached = _worker_artifacts.get(key)
+        if cached is not None:
+            _worker_artifacts.move_to_end(key)
+            return cached[0]
+        artifacts = ColumnArtifacts(df_chunk)
+        _worker_artifacts[key] = (artifacts, int(df_chunk.memory_usage(deep=False).sum()))
+        total_bytes = sum(size for _, size in _worker_artifacts.values())
+        while len(_worker_artifacts) > 1 and total_bytes > WORKER_ARTIFACTS_MAX_BYTES:
+            _, (_, size) = _worker_artifacts.popitem(last=False)
+            total_bytes -= size
+        return artifacts
+
+
+def _analyze_chunk(func: Callable[..., Tuple], df_chunk: pd.DataFrame, kwargs: Dict[str, Any]) -> Tuple:
+    """Выполняется в рабочем процессе: анализ одной порции столбцов."""
+    return func(df_chunk, artifacts=_chunk_artifacts(df_chunk), **kwargs)
+
+
+class ColumnWorkerPool(Executor):
+    """
+    Пул однопоточных рабочих процессов с закреплением порций столбцов за процессами.
+    Порция с номером i всегда обрабатывается процессом i % processes, поэтому разные разделы
+    одного запроса попадают в процесс, где промежуточные результаты по этой порции уже вычислены.
+    """
+
+    def __init__(self, processes: int, mp_context=None):
+        """
+        Args:
+            processes: Количество рабочих процессов.
+            mp_context: Контекст multiprocessing для запуска процессов.
+        """
+        self._workers = [ProcessPoolExecutor(max_workers=1, mp_context=mp_context)
+                         for _ in range(max(1, int(processes)))]
+        self._round_robin = itertools.count()
+
+    def submit_partition(self, partition_index: int, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        """Отправляет задачу процессу, закрепленному за порцией partition_index."""
+        return self._workers[partition_index % len(self._workers)].submit(fn, *args, **kwargs)
+
+    def submit(self, fn: Callable, /, *args: Any, **kwargs: Any) -> Future:
+        return self.submit_partition(next(self._round_robin), fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        for worker in self._workers:
+            worker.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+def map_column_chunks(func: Callable[..., Tuple], df: pd.DataFrame,
+                      artifacts: Optional[ColumnArtifacts] = None,
+                      executor: Optional[Executor] = None,
+                      chunk_size: int = DEFAULT_COLUMN_CHUNK_SIZE,
+                      **kwargs: Any) -> Tuple:
+    """
+    Выполняет постолбцовый анализ, распределяя числовые столбцы порциями по пулу рабочих процессов.
+    Анализ каждого столбца не зависит от остальных, поэтому результаты порций объединяются
+    в исходном порядке столбцов и совпадают с результатом последовательного выполнения.
+    Если пул не задан или столбцов не больше одной порции, функция выполняется в текущем потоке
+    с общими промежуточными результатами artifacts.
+
+    Args:
+        func: Функция модуля анализа вида func(df, ..., artifacts=None) -> (список, ..., логи),
+              объявленная на уровне модуля (передается в рабочий процесс по имени).
+        df: Входной DataFrame.
+        artifacts: Общие промежуточные результаты по столбцам для выполнения в текущем потоке.
+        executor: Пул процессов (None - без разбиения); для ColumnWorkerPool порции закрепляются за процессами.
+        chunk_size: Количество столбцов в одной порции.
+        **kwargs: Дополнительные параметры функции.
+
+    Returns:
+        Кортеж той же структуры, что возвращает func: списки результатов порций объединяются поэлементно.
+    """
+    numerical_cols = (artifacts.numerical_columns() if artifacts is not None
+                      else df.select_dtypes(include=np.number).columns.tolist())
+    if executor is None or len(numerical_cols) <= chunk_size:
+        return func(df, artifacts=artifacts, **kwargs)
+
+    chunks = column_chunks(numerical_cols, chunk_size)
+    submit_partition = getattr(executor, "submit_partition", None)
+    futures = []
+    for index, chunk in enumerate(chunks):
+        # В рабочий процесс передаются только столбцы порции
+        if submit_partition is not None:
+            futures.append(submit_partition(index, _analyze_chunk, func, df[chunk], kwargs))
+        else:
+            futures.append(executor.submit(_analyze_chunk, func, df[chunk], kwargs))
+
+    merged = None
+    for future in futures:
+        part = future.result()
+        if merged is None:
+            merged = tuple([] for _ in part)
+        for target, values in zip(merged, part):
+            target.extend(values)
+
+    logs = merged[-1]
+    logs.insert(0, f"Partitioned {len(numerical_cols)} numerical columns into {len(chunks)} chunks "
+                   f"of up to {chunk_size} columns.")
+    return merged
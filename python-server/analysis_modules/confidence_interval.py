@@ -2,15 +2,22 @@
 import pandas as pd
 import numpy as np
 from scipy import stats
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional
+from analysis_modules.column_artifacts import ColumnArtifacts
+from analysis_modules.sampling import finite_population_correction
 
-def calculate_confidence_intervals(df: pd.DataFrame, confidence: float = 0.95) -> Tuple[List[Dict[str, Any]], List[str]]:
+def calculate_confidence_intervals(df: pd.DataFrame, confidence: float = 0.95,
+                                   artifacts: Optional[ColumnArtifacts] = None,
+                                   population_size: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
     """
     Вычисляет доверительные интервалы для среднего значения числовых столбцов.
 
     Args:
         df: Входной DataFrame.
         confidence: Уровень доверия (например, 0.95 для 95%).
+        artifacts: Общие промежуточные результаты по столбцам (создаются, если не переданы).
+        population_size: Количество строк исходных данных, если df - случайная выборка без возвращения.
+                         Стандартная ошибка тогда умножается на поправку sqrt(1 - m/N).
 
     Returns:
         Кортеж:
@@ -19,23 +26,30 @@ def calculate_confidence_intervals(df: pd.DataFrame, confidence: float = 0.95) -
     """
     results = []
     logs = []
-    numerical_cols = df.select_dtypes(include=np.number).columns.tolist()
+    if artifacts is None:
+        artifacts = ColumnArtifacts(df)
+    numerical_cols = artifacts.numerical_columns()
 
     if not numerical_cols:
         logs.append("No numerical columns found for confidence intervals.")
         return [], logs
 
     logs.append(f"Found numerical columns for confidence intervals: {', '.join(numerical_cols)}")
+    fpc = 1.0
+    if population_size:
+        fpc = finite_population_correction(len(df), population_size)
+        logs.append(f"Applying finite population correction {fpc:.4f} (sample of {len(df)} of {population_size} rows).")
 
     for col_name in numerical_cols:
-        col_data = df[col_name].dropna()
-        count = col_data.count()
-        mean_val = col_data.mean()
+        moments = artifacts.moments(col_name)
+        count = moments["count"]
+        mean_val = moments["mean"]
 
         ci_result = {
             "variable_name": col_name,
             "parameter_name": "Mean",
             "confidence_level": confidence,
+            "point_estimate": mean_val,
             "lower_bound": np.nan, # Используем NaN по умолчанию
             "upper_bound": np.nan
         }
@@ -48,7 +62,7 @@ def calculate_confidence_intervals(df: pd.DataFrame, confidence: float = 0.95) -
         else:
             try:
                 # Стандартная ошибка среднего
-                sem_val = stats.sem(col_data)
+                sem_val = moments["sem"] * fpc if population_size else moments["sem"]
                 if pd.notna(sem_val) and sem_val >= 0:
                     # Степени свободы
                     df_ci = count - 1
@@ -0,0 +1,125 @@
+# python-server/analysis_modules/density.py
+import math
+import numpy as np
+from typing import Dict, Any, List
+
+DENSITY_AGGREGATIONS = ("grid", "hexbin")
+DEFAULT_DENSITY_BINS = 50
+
+
+def grid_density(x_data: np.ndarray, y_data: np.ndarray, bins: int = DEFAULT_DENSITY_BINS) -> Dict[str, Any]:
+    """
+    Строит прямоугольную сетку частот точек (x, y) за один векторизованный проход.
+
+    Args:
+        x_data: Значения X.
+        y_data: Значения Y.
+        bins: Количество интервалов по каждой оси.
+
+    Returns:
+        Словарь с границами интервалов по осям и частотами,
+        развернутыми построчно (индекс = iy * x_bins + ix).
+    """
+    counts, x_edges, y_edges = np.histogram2d(x_data, y_data, bins=bins)
+    return {
+        "kind": "grid",
+        "x_bins": int(len(x_edges) - 1),
+        "y_bins": int(len(y_edges) - 1),
+        "x_edges": x_edges.tolist(),
+        "y_edges": y_edges.tolist(),
+        # histogram2d возвращает матрицу [ix, iy]; транспонируем, чтобы строки соответствовали оси Y
+        "counts": counts.T.astype(np.int64).ravel().tolist(),
+        "total_points": int(len(x_data)),
+    }
+
+
+def hexbin_density(x_data: np.ndarray, y_data: np.ndarray, gridsize: int = DEFAULT_DENSITY_BINS) -> Dict[str, Any]:
+    """
+    Строит шестиугольную сетку частот точек (x, y).
+    Каждая точка относится к ближайшему центру одной из двух смещенных прямоугольных решеток
+    (та же схема, что и в matplotlib.hexbin). Возвращаются только непустые ячейки.
+
+    Args:
+        x_data: Значения X.
+        y_data: Значения Y.
+        gridsize: Количество шестиугольников по оси X.
+
+    Returns:
+        Словарь с центрами непустых ячеек, их частотами и размерами шага решетки.
+    """
+    x = np.asarray(x_data, dtype=float)
+    y = np.asarray(y_data, dtype=float)
+    nx = max(1, int(gridsize))
+    ny = max(1, int(nx / math.sqrt(3)))
+
+    x_min, x_max = float(np.min(x)), float(np.max(x))
+    y_min, y_max = float(np.min(y)), float(np.max(y))
+    # Немного расширяем диапазон, чтобы крайние точки не попадали на границу решетки
+    padding_x = 1e-9 * max(1.0, abs(x_max - x_min))
+    padding_y = 1e-9 * max(1.0, abs(y_max - y_min))
+    x_min, x_max = x_min - padding_x, x_max + padding_x
+    y_min, y_max = y_min - padding_y, y_max + padding_y
+    step_x = (x_max - x_min) / nx
+    step_y = (y_max - y_min) / ny
+
+    x_scaled = (x - x_min) / step_x
+    y_scaled = (y - y_min) / step_y
+
+    # Решетка 1: центры в целых узлах; решетка 2: центры смещены на половину шага
+    ix1 = np.round(x_scaled).astype(np.int64)
+    iy1 = np.round(y_scaled).astype(np.int64)
+    ix2 = np.floor(x_scaled).astype(np.int64)
+    iy2 = np.floor(y_scaled).astype(np.int64)
+
+    d1 = (x_scaled - ix1) ** 2 + 3.0 * (y_scaled - iy1) ** 2
+    d2 = (x_scaled - ix2 - 0.5) ** 2 + 3.0 * (y_scaled - iy2 - 0.5) ** 2
+    in_first = d1 < d2
+
+    n1 = (nx + 1) * (ny + 1)
+    n2 = nx * ny
+    cell_index = np.where(
+        in_first,
+        ix1 * (ny + 1) + iy1,
+        n1 + np.clip(ix2, 0, nx - 1) * ny + np.clip(iy2, 0, ny - 1)
+    )
+    counts = np.bincount(cell_index, minlength=n1 + n2)
+
+    i1, j1 = np.meshgrid(np.arange(nx + 1), np.arange(ny + 1), indexing="ij")
+    i2, j2 = np.meshgrid(np.arange(nx), np.arange(ny), indexing="ij")
+    centers_x = np.concatenate([x_min + i1.ravel() * step_x, x_min + (i2.ravel() + 0.5) * step_x])
+    centers_y = np.concatenate([y_min + j1.ravel() * step_y, y_min + (j2.ravel() + 0.5) * step_y])
+
+    non_empty = counts > 0
+    return {
+        "kind": "hexbin",
+        "x_bins": nx,
+        "y_bins": ny,
+        "step_x": float(step_x),
+        "step_y": float(step_y),
+        "centers_x": centers_x[non_empty].tolist(),
+        "centers_y": centers_y[non_empty].tolist(),
+        "counts": counts[non_empty].astype(np.int64).tolist(),
+        "total_points": int(len(x)),
+    }
+
+
+def build_density(x_data: np.ndarray, y_data: np.ndarray, kind: str = "grid",
+                  bins: int = DEFAULT_DENSITY_BINS) -> Dict[str, Any]:
+    """Строит агрегированную плотность точек выбранного вида ("grid" или "hexbin")."""
+    if kind == "hexbin":
+        return hexbin_density(x_data, y_data, gridsize=bins)
+    return grid_density(x_data, y_data, bins=bins)
+
+
+def evaluate_curve(func, params, x_min: float, x_max: float, num_points: int = 200) -> List[Dict[str, float]]:
+    """
+    Вычисляет значения подогнанной модели на фиксированной равномерной сетке по X.
+
+    Returns:
+        Список словарей {"x": ..., "y": ...} (точки с нечисловыми значениями отбрасываются).
+    """
+    curve_x = np.linspace(x_min, x_max, num_points)
+    with np.errstate(all="ignore"):
+        curve_y = np.asarray(func(curve_x, *params), dtype=float)
+    finite = np.isfinite(curve_y)
+    return [{"x": xv, "y": yv} for xv, yv in zip(curve_x[finite].tolist(), curve_y[finite].tolist())]
@@ -1,10 +1,18 @@
 # python-server/analysis_modules/descriptive.py
+import logging
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional, Union
 # Импортируем сгенерированные классы protobuf
 import analysis_pb2 
 from scipy import stats
+from analysis_modules.column_artifacts import ColumnArtifacts
+from analysis_modules.histogram_engine import DEFAULT_HISTOGRAM_BIN_RULE, histogram_bin_count
+from analysis_modules.kde import kde_curve_points
+from analysis_modules.mode_counter import ModeCounter
+from analysis_modules.quantile_sketch import KLLSketch
+
+logger = logging.getLogger(__name__)
 
 # Define a type hint for the histogram data dictionary
 HistogramResultDict = Dict[str, Any]
@@ -25,7 +33,7 @@ def generate_normal_curve_points(mean: float, std_dev: float, min_val: float, ma
         Кортеж из двух списков: x_values и y_values.
     """
     if std_dev <= 0:
-        print(f"Warning: std_dev <= 0 ({std_dev}), skipping normal curve generation")
+        logger.warning("std_dev <= 0 (%s), skipping normal curve generation", std_dev)
         return [], []
     
     # Расширяем диапазон для лучшего отображения
@@ -39,20 +47,30 @@ def generate_normal_curve_points(mean: float, std_dev: float, min_val: float, ma
     # Вычисляем значения плотности вероятности для нормального распределения
     try:
         y_values = stats.norm.pdf(x_values, loc=mean, scale=std_dev).tolist()
-        print(f"Generated normal curve with {len(x_values)} points. Mean: {mean}, StdDev: {std_dev}")
-        print(f"X range: [{x_values[0]:.2f}, {x_values[-1]:.2f}], Y range: [{min(y_values):.6f}, {max(y_values):.6f}]")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Generated normal curve with %d points. Mean: %s, StdDev: %s, X range: [%.2f, %.2f], Y range: [%.6f, %.6f]",
+                         len(x_values), mean, std_dev, x_values[0], x_values[-1], min(y_values), max(y_values))
         return x_values, y_values
     except Exception as e:
-        print(f"Error generating normal curve: {e}")
+        logger.warning("Error generating normal curve: %s", e)
         return [], []
 
 # Updated return type hint to remove box plot data
-def calculate_descriptive_stats(df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], List[HistogramResultDict], List[str]]:
+def calculate_descriptive_stats(df: pd.DataFrame,
+                                artifacts: Optional[ColumnArtifacts] = None,
+                                quantile_sketch_k: Optional[int] = None,
+                                histogram_bins: Union[int, str] = DEFAULT_HISTOGRAM_BIN_RULE) -> Tuple[List[Dict[str, Any]], List[HistogramResultDict], List[str]]:
     """
     Вычисляет описательные статистики и данные гистограмм для числовых столбцов DataFrame.
 
     Args:
         df: Входной DataFrame.
+        artifacts: Общие промежуточные результаты по столбцам (создаются, если не переданы).
+        quantile_sketch_k: Параметр точности KLL-скетча. Если задан, медиана, квартили, IQR и интервалы
+            гистограммы определяются по скетчу без сортировки столбцов, мода - по счетчикам Мисры-Гриса
+            (ModeCounter), а в словарь статистик добавляются "quantile_sketch" с границей ошибки ранга
+            и диапазонами значений квантилей и "mode_frequency_error" - граница занижения частоты моды.
+        histogram_bins: Правило выбора интервалов гистограмм (HISTOGRAM_BIN_RULES) или их количество.
 
     Returns:
         Кортеж:
@@ -63,36 +81,66 @@ def calculate_descriptive_stats(df: pd.DataFrame) -> Tuple[List[Dict[str, Any]],
     descriptive_results = []
     histogram_results = [] # New list for histogram data
     logs = []
-    numerical_cols = df.select_dtypes(include=np.number).columns.tolist()
+    if artifacts is None:
+        artifacts = ColumnArtifacts(df)
+    numerical_cols = artifacts.numerical_columns()
 
     if not numerical_cols:
         logs.append("No numerical columns found for descriptive statistics.")
         return [], [], logs # Return empty lists for all results
 
     logs.append(f"Found numerical columns for descriptives: {', '.join(numerical_cols)}")
+    if quantile_sketch_k is None:
+        # Моменты и порядковые статистики всех столбцов вычисляются одним блоком
+        artifacts.compute_block(numerical_cols)
+    else:
+        logs.append(f"Estimating median, quartiles and histogram bins with KLL quantile sketches (k={quantile_sketch_k}).")
 
     for col_name in numerical_cols:
-        col_data = df[col_name].dropna()
+        col_data = artifacts.clean(col_name)
 
         if col_data.empty:
             logs.append(f"Skipping descriptive statistics and histogram for column '{col_name}' (all values are NaN).")
             continue
 
         # --- Descriptive Stats ---    
-        count = int(col_data.count()) # Приводим к int
-        mean_val = float(col_data.mean())
-        median_val = float(col_data.median())
-        mode_result = col_data.mode()
-        variance_val = col_data.var(ddof=1)
-        std_dev_val = col_data.std(ddof=1)
-        skewness_val = stats.skew(col_data)
-        kurtosis_val = stats.kurtosis(col_data, bias=True)
-        min_val = float(col_data.min())
-        max_val = float(col_data.max())
+        moments = artifacts.moments(col_name)
+        sketch_info = None
+        if quantile_sketch_k is None:
+            quantiles = artifacts.quantiles(col_name)
+            mode_info = artifacts.mode(col_name)
+        else:
+            sketch = KLLSketch(quantile_sketch_k)
+            sketch.update(col_data.to_numpy(dtype=float))
+            bounds = sketch.quantile_bounds([0.25, 0.5, 0.75])
+            quantiles = dict(zip(("q1", "median", "q3"), bounds["estimate"].tolist()))
+            sketch_info = {
+                "k": sketch.k,
+                "rank_error": sketch.rank_error(),
+                "estimates": [
+                    {"statistic": name, "estimate": float(bounds["estimate"][index]),
+                     "lower_bound": float(bounds["lower_bound"][index]),
+                     "upper_bound": float(bounds["upper_bound"][index])}
+                    for index, name in enumerate(("q1", "median", "q3"))
+                ],
+            }
+            # Мода по ограниченному числу счетчиков частот, без сортировки
+            mode_counter = ModeCounter()
+            mode_counter.update(col_data.to_numpy(dtype=float))
+            mode_info = mode_counter.modes()
+        count = moments["count"]
+        mean_val = float(moments["mean"])
+        median_val = quantiles["median"]
+        variance_val = moments["variance"]
+        std_dev_val = moments["std_dev"]
+        skewness_val = moments["skewness"]
+        kurtosis_val = moments["kurtosis"]
+        min_val = moments["min"]
+        max_val = moments["max"]
         
         # Добавляем расчет квартилей и межквартильного размаха
-        q1_val = float(col_data.quantile(0.25))
-        q3_val = float(col_data.quantile(0.75))
+        q1_val = quantiles["q1"]
+        q3_val = quantiles["q3"]
         iqr_val = float(q3_val - q1_val)
 
         variation_coefficient_val = 0.0
@@ -107,7 +155,9 @@ def calculate_descriptive_stats(df: pd.DataFrame) -> Tuple[List[Dict[str, Any]],
             "count": count,
             "mean": mean_val if pd.notna(mean_val) else np.nan, # Используем NaN для неопределенных
             "median": median_val if pd.notna(median_val) else np.nan,
-            "mode": [] if mode_result.empty else mode_result.astype(float).tolist(), # Приводим к float
+            "mode": np.asarray(mode_info["values"], dtype=float).tolist(), # Не больше DEFAULT_MAX_MODES значений
+            "mode_frequency": mode_info["frequency"],
+            "mode_count": mode_info["count"],
             "variance": float(variance_val) if pd.notna(variance_val) else np.nan,
             "std_dev": float(std_dev_val) if pd.notna(std_dev_val) else np.nan,
             "variation_coefficient": variation_coefficient_val, # Уже обработали выше
@@ -119,19 +169,26 @@ def calculate_descriptive_stats(df: pd.DataFrame) -> Tuple[List[Dict[str, Any]],
             "q3": q3_val if pd.notna(q3_val) else np.nan,
             "iqr": iqr_val if pd.notna(iqr_val) else np.nan,
         }
+        if sketch_info is not None:
+            stats_dict["quantile_sketch"] = sketch_info
+            stats_dict["mode_frequency_error"] = mode_info["frequency_error"]
         descriptive_results.append(stats_dict)
         logs.append(f"Calculated descriptives for '{col_name}'.")
 
         # --- Histogram Calculation --- 
         try:
-            # Use numpy.histogram. Let numpy determine the optimal bins ('auto')
-            # We need frequencies (counts in each bin) and bin_edges
-            frequencies, bin_edges = np.histogram(col_data, bins='auto')
+            # Интервалы выбираются по уже вычисленной сводке столбца (при скетче - по IQR скетча),
+            # затем значения подсчитываются одним проходом
+            if sketch_info is None:
+                frequencies, bin_edges = artifacts.histogram(col_name, bins=histogram_bins)
+            else:
+                n_bins = histogram_bin_count(histogram_bins, count, min_val, max_val, iqr=iqr_val, std_dev=std_dev_val,
+                                             integer=pd.api.types.is_integer_dtype(col_data.dtype))
+                frequencies, bin_edges = artifacts.histogram(col_name, bins=n_bins)
             
             # Генерируем данные для нормальной кривой
             normal_curve_x, normal_curve_y = [], []
             if pd.notna(mean_val) and pd.notna(std_dev_val) and std_dev_val > 0:
-                print(f"\nGenerating normal curve for '{col_name}'. Mean: {mean_val}, StdDev: {std_dev_val}")
                 normal_curve_x, normal_curve_y = generate_normal_curve_points(
                     mean=mean_val, 
                     std_dev=std_dev_val, 
@@ -146,9 +203,15 @@ def calculate_descriptive_stats(df: pd.DataFrame) -> Tuple[List[Dict[str, Any]],
                     bin_width = (bin_edges[-1] - bin_edges[0]) / len(frequencies)
                     scale_factor = total_frequency * bin_width
                     normal_curve_y = [y * scale_factor for y in normal_curve_y]
-                    print(f"Scaled Y values with factor {scale_factor:.2f}. New Y range: [{min(normal_curve_y):.2f}, {max(normal_curve_y):.2f}]")
+                    logger.debug("Scaled normal curve for '%s' with factor %.2f", col_name, scale_factor)
             else:
-                print(f"\nSkipping normal curve for '{col_name}'. Invalid parameters: mean={mean_val}, std_dev={std_dev_val}")
+                logger.debug("Skipping normal curve for '%s'. Invalid parameters: mean=%s, std_dev=%s", col_name, mean_val, std_dev_val)
+
+            # Оценка плотности (линейный биннинг и свертка через БПФ) в том же масштабе, что и нормальная кривая
+            kde_x, kde_y, kde_bandwidth = kde_curve_points(col_data.to_numpy(dtype=float), std_dev_val, iqr_val,
+                                                           min_val, max_val)
+            if len(kde_x):
+                kde_y = kde_y * (frequencies.sum() * (bin_edges[-1] - bin_edges[0]) / len(frequencies))
             
             # Prepare histogram data dictionary
             hist_dict: HistogramResultDict = {
@@ -157,20 +220,22 @@ def calculate_descriptive_stats(df: pd.DataFrame) -> Tuple[List[Dict[str, Any]],
                  "frequencies": frequencies.tolist(), # Convert numpy array to list
                  "normal_curve_x": normal_curve_x,
                  "normal_curve_y": normal_curve_y,
+                 "kde_x": kde_x.tolist(),
+                 "kde_y": kde_y.tolist(),
+                 "kde_bandwidth": kde_bandwidth,
                  "mean": mean_val if pd.notna(mean_val) else 0.0,
                  "std_dev": std_dev_val if pd.notna(std_dev_val) else 0.0
             }
             
-            # Отладочный вывод для проверки данных
-            print(f"Histogram data for '{col_name}':")
-            print(f"- Bins: {len(hist_dict['bins'])} values, range [{hist_dict['bins'][0]:.2f}, {hist_dict['bins'][-1]:.2f}]")
-            print(f"- Frequencies: {len(hist_dict['frequencies'])} values, sum: {sum(hist_dict['frequencies'])}")
-            print(f"- Normal curve: {len(hist_dict['normal_curve_x'])} points")
+            logger.debug("Histogram data for '%s': %d bins in [%.2f, %.2f], %d normal curve points",
+                         col_name, len(frequencies), bin_edges[0], bin_edges[-1], len(normal_curve_x))
             
             histogram_results.append(hist_dict)
             logs.append(f"Calculated histogram data for '{col_name}' (bins: {len(frequencies)}).")
             if normal_curve_x:
                 logs.append(f"Generated normal curve data for '{col_name}' (points: {len(normal_curve_x)}).")
+            if len(kde_x):
+                logs.append(f"Generated density estimate for '{col_name}' (bandwidth: {kde_bandwidth:.4g}).")
         except Exception as e:
             logs.append(f"Warning: Could not calculate histogram for '{col_name}': {e}")
             # Optionally append a placeholder or skip if histogram fails
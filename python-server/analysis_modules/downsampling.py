@@ -0,0 +1,115 @@
+# python-server/analysis_modules/downsampling.py
+import numpy as np
+from typing import List, Dict, Optional
+
+DOWNSAMPLING_METHODS = ("lttb", "stratified")
+
+# Браузер не в состоянии отрисовать больше нескольких тысяч точек на диаграмме рассеяния
+DEFAULT_MAX_CHART_POINTS = 2000
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Выбирает точки алгоритмом Largest-Triangle-Three-Buckets.
+    Данные должны быть отсортированы по x. Первая и последняя точки сохраняются всегда,
+    из каждой корзины берется точка, образующая наибольший треугольник с предыдущей выбранной точкой
+    и средней точкой следующей корзины.
+
+    Args:
+        x: Значения X, отсортированные по возрастанию.
+        y: Соответствующие значения Y.
+        n_out: Требуемое количество точек.
+
+    Returns:
+        Индексы выбранных точек (по возрастанию).
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    every = (n - 2) / (n_out - 2)
+    # Границы корзин для внутренних точек: [edges[i], edges[i + 1])
+    edges = (np.floor(np.arange(n_out - 1) * every) + 1).astype(np.int64)
+    edges[-1] = n - 1
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    selected = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start = end
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        bucket_x = x[start:end]
+        bucket_y = y[start:end]
+        areas = np.abs((x[selected] - avg_x) * (bucket_y - y[selected])
+                       - (x[selected] - bucket_x) * (avg_y - y[selected]))
+        selected = start + int(np.argmax(areas))
+        indices[i + 1] = selected
+    return indices
+
+
+def stratified_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Стратифицированная выборка по x с сохранением экстремумов:
+    данные делятся на корзины равного размера, из каждой корзины берутся точки с минимальным и максимальным y.
+    Данные должны быть отсортированы по x.
+
+    Args:
+        x: Значения X, отсортированные по возрастанию.
+        y: Соответствующие значения Y.
+        n_out: Требуемое количество точек (не более).
+
+    Returns:
+        Индексы выбранных точек (по возрастанию).
+    """
+    n = len(x)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+
+    n_buckets = (n_out - 2) // 2
+    edges = np.linspace(1, n - 1, n_buckets + 1).astype(np.int64)
+    chosen = [0, n - 1]
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end <= start:
+            continue
+        bucket_y = y[start:end]
+        chosen.append(start + int(np.argmin(bucket_y)))
+        chosen.append(start + int(np.argmax(bucket_y)))
+    return np.unique(np.asarray(chosen, dtype=np.int64))
+
+
+def build_chart_points(x_data: np.ndarray, y_data: np.ndarray,
+                       max_points: Optional[int] = DEFAULT_MAX_CHART_POINTS,
+                       method: str = "lttb") -> List[Dict[str, float]]:
+    """
+    Формирует точки для диаграммы рассеяния, при необходимости уменьшая их количество до max_points.
+    Прореженные точки возвращаются в порядке возрастания x.
+
+    Args:
+        x_data: Значения X.
+        y_data: Значения Y.
+        max_points: Бюджет точек. None или 0 - без прореживания.
+        method: Метод прореживания: "lttb" или "stratified".
+
+    Returns:
+        Список словарей {"x": ..., "y": ...}.
+    """
+    x_arr = np.asarray(x_data, dtype=float)
+    y_arr = np.asarray(y_data, dtype=float)
+
+    if max_points and len(x_arr) > max_points:
+        order = np.argsort(x_arr, kind="stable")
+        x_arr = x_arr[order]
+        y_arr = y_arr[order]
+        if method == "stratified":
+            keep = stratified_indices(x_arr, y_arr, max_points)
+        else:
+            keep = lttb_indices(x_arr, y_arr, max_points)
+        x_arr = x_arr[keep]
+        y_arr = y_arr[keep]
+
+    return [{"x": xv, "y": yv} for xv, yv in zip(x_arr.tolist(), y_arr.tolist())]
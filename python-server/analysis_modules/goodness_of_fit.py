@@ -2,9 +2,11 @@
 import pandas as pd
 import numpy as np
 from scipy import stats
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional
+from analysis_modules.column_artifacts import ColumnArtifacts
 
-def perform_chi_square_test(df: pd.DataFrame, distribution: str = 'norm', alpha: float = 0.05) -> Tuple[List[Dict[str, Any]], List[str]]:
+def perform_chi_square_test(df: pd.DataFrame, distribution: str = 'norm', alpha: float = 0.05,
+                            artifacts: Optional[ColumnArtifacts] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
     """
     Выполняет критерий согласия Хи-квадрат Пирсона для числовых столбцов.
     По умолчанию проверяет гипотезу о нормальности распределения.
@@ -14,6 +16,7 @@ def perform_chi_square_test(df: pd.DataFrame, distribution: str = 'norm', alpha:
         distribution: Строка, указывающая теоретическое распределение ('norm', etc.).
                       Пока поддерживается только 'norm'.
         alpha: Уровень значимости.
+        artifacts: Общие промежуточные результаты по столбцам (создаются, если не переданы).
 
     Returns:
         Кортеж:
@@ -22,7 +25,9 @@ def perform_chi_square_test(df: pd.DataFrame, distribution: str = 'norm', alpha:
     """
     results = []
     logs = []
-    numerical_cols = df.select_dtypes(include=np.number).columns.tolist()
+    if artifacts is None:
+        artifacts = ColumnArtifacts(df)
+    numerical_cols = artifacts.numerical_columns()
 
     if not numerical_cols:
         logs.append("No numerical columns found for Chi-square goodness-of-fit test.")
@@ -31,8 +36,8 @@ def perform_chi_square_test(df: pd.DataFrame, distribution: str = 'norm', alpha:
     logs.append(f"Found numerical columns for Chi-square test: {', '.join(numerical_cols)}")
 
     for col_name in numerical_cols:
-        col_data = df[col_name].dropna()
-        n = len(col_data)
+        moments = artifacts.moments(col_name)
+        n = moments["count"]
 
         test_result = {
             "variable_name": col_name,
@@ -61,12 +66,12 @@ def perform_chi_square_test(df: pd.DataFrame, distribution: str = 'norm', alpha:
             num_bins = 3
 
         # 2. Получаем наблюдаемые частоты и границы бинов
-        observed_freq, bin_edges = np.histogram(col_data, bins=num_bins)
+        observed_freq, bin_edges = artifacts.histogram(col_name, bins=num_bins)
 
         # 3. Рассчитываем ожидаемые частоты для нормального распределения
         if distribution == 'norm':
-            mean_val = col_data.mean()
-            std_dev_val = col_data.std(ddof=1)
+            mean_val = moments["mean"]
+            std_dev_val = moments["std_dev"]
 
             if std_dev_val == 0 or pd.isna(std_dev_val):
                 test_result["conclusion"] = "Skipped (zero or NaN variance)"
@@ -0,0 +1,215 @@
+# python-server/analysis_modules/grouped.py
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from analysis_modules.mode_counter import DEFAULT_MAX_MODES
+
+# Максимальное количество групп: при большем количестве группировка не выполняется
+DEFAULT_MAX_GROUPS = 10000
+
+
+def _sort_within_segments(values: np.ndarray, segment_ids: np.ndarray) -> np.ndarray:
+    """
+    Перестановка, упорядочивающая значения по возрастанию внутри сегментов (пропуски - в конце сегмента).
+    Значения сортируются один раз, затем устойчиво по номеру сегмента: для номеров, помещающихся
+    в 16 бит, numpy применяет поразрядную сортировку, что в несколько раз быстрее numpy.lexsort.
+    """
+    by_value = np.argsort(values)
+    keys = segment_ids.astype(np.uint16) if len(segment_ids) and segment_ids.max() <= np.iinfo(np.uint16).max else segment_ids
+    return by_value[np.argsort(keys[by_value], kind="stable")]
+
+
+def _segment_quantile(sorted_values: np.ndarray, starts: np.ndarray, counts: np.ndarray, p: float) -> np.ndarray:
+    """
+    Квантиль p каждого сегмента отсортированных значений (линейная интерполяция, как numpy.quantile).
+    Сегмент i занимает позиции [starts[i], starts[i] + counts[i]); пустые сегменты дают NaN.
+    """
+    result = np.full(len(counts), np.nan)
+    present = counts > 0
+    position = (counts[present] - 1) * p
+    lower = np.floor(position).astype(np.intp)
+    fraction = position - lower
+    upper = np.minimum(lower + 1, counts[present] - 1)
+    a = sorted_values[starts[present] + lower]
+    b = sorted_values[starts[present] + upper]
+    difference = b - a
+    # Та же формула, что в numpy: от ближайшего конца интервала
+    result[present] = np.where(fraction >= 0.5, b - difference * (1 - fraction), a + difference * fraction)
+    return result
+
+
+def _segment_median(sorted_values: np.ndarray, starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Медиана каждого сегмента (среднее двух центральных значений при четном количестве)."""
+    result = np.full(len(counts), np.nan)
+    present = counts > 0
+    half = counts[present] // 2
+    upper = sorted_values[starts[present] + half]
+    lower = sorted_values[starts[present] + np.maximum(half - 1, 0)]
+    result[present] = np.where(counts[present] % 2 == 1, upper, (lower + upper) / 2.0)
+    return result
+
+
+def _segment_modes(sorted_values: np.ndarray, segment_ids: np.ndarray, n_segments: int,
+                   max_modes: int) -> List[Dict[str, Any]]:
+    """
+    Моды сегментов отсортированных значений без пропусков: серии одинаковых значений не пересекают
+    границы сегментов, мода - значения с наибольшей длиной серии (не больше max_modes по возрастанию).
+    """
+    if not len(sorted_values):
+        return [{"values": [], "frequency": 0, "count": 0} for _ in range(n_segments)]
+    starts = np.ones(len(sorted_values), dtype=bool)
+    starts[1:] = (sorted_values[1:] != sorted_values[:-1]) | (segment_ids[1:] != segment_ids[:-1])
+    run_lengths = np.bincount(np.cumsum(starts) - 1)
+    run_values = sorted_values[starts]
+    run_segments = segment_ids[starts]
+
+    longest = np.zeros(n_segments, dtype=np.int64)
+    np.maximum.at(longest, run_segments, run_lengths)
+    is_mode = run_lengths == longest[run_segments]
+    mode_segments = run_segments[is_mode]
+    mode_counts = np.bincount(mode_segments, minlength=n_segments)
+    mode_ranks = np.arange(len(mode_segments)) - np.repeat(np.cumsum(mode_counts) - mode_counts, mode_counts)
+    kept = mode_ranks < max_modes
+    mode_values = np.split(run_values[is_mode][kept], np.cumsum(np.minimum(mode_counts, max_modes))[:-1])
+    return [{"values": values.tolist(), "frequency": int(frequency), "count": int(n_modes)}
+            for values, frequency, n_modes in zip(mode_values, longest, mode_counts)]
+
+
+def calculate_grouped_descriptive_stats(df: pd.DataFrame, group_column: str,
+                                        max_groups: int = DEFAULT_MAX_GROUPS,
+                                        max_modes: int = DEFAULT_MAX_MODES) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Вычисляет описательные статистики каждого числового столбца в каждой группе строк по значению group_column.
+    Группы нумеруются одним вызовом pandas.factorize, строки упорядочиваются по группам одной устойчивой сортировкой,
+    после чего количество, суммы, центральные моменты, минимум и максимум всех столбцов вычисляются
+    сегментными редукциями (numpy.ufunc.reduceat) над блоком (строки x столбцы), а медиана, квартили и мода -
+    по значениям столбца, отсортированным внутри групп. Соглашения совпадают с calculate_descriptive_stats
+    (дисперсия с ddof=1, асимметрия и эксцесс с bias=True); строки с пропущенной группой не учитываются.
+
+    Args:
+        df: Входной DataFrame.
+        group_column: Столбец, задающий группы (любого типа).
+        max_groups: Максимальное количество групп.
+        max_modes: Максимальное количество мод в результате.
+
+    Returns:
+        Кортеж:
+        - Список словарей статистик в порядке групп (по возрастанию значения) и столбцов; кроме полей
+          calculate_descriptive_stats содержат "group_column", "group" (строковое значение группы) и "group_size".
+        - Список строк с логами обработки.
+    """
+    logs = []
+    if group_column not in df.columns:
+        logs.append(f"Warning: Group column '{group_column}' not found; grouped descriptive statistics skipped.")
+        return [], logs
+    numerical_cols = [col for col in df.select_dtypes(include=np.number).columns.tolist() if col != group_column]
+    if not numerical_cols:
+        logs.append("No numerical columns found for grouped descriptive statistics.")
+        return [], logs
+
+    codes, groups = pd.factorize(df[group_column], sort=True)
+    n_groups = len(groups)
+    if n_groups == 0:
+        logs.append(f"Warning: Group column '{group_column}' has no values; grouped descriptive statistics skipped.")
+        return [], logs
+    if n_groups > max_groups:
+        logs.append(f"Warning: Group column '{group_column}' has {n_groups} groups (limit {max_groups}); "
+                    f"grouped descriptive statistics skipped.")
+        return [], logs
+    missing_groups = int((codes < 0).sum())
+    if missing_groups:
+        logs.append(f"Skipped {missing_groups} rows with a missing '{group_column}' value.")
+
+    # Одна сортировка строк по номеру группы; каждая группа - непрерывный сегмент строк
+    present_rows = np.flatnonzero(codes >= 0)
+    order = present_rows[_sort_within_segments(present_rows, codes[present_rows])]
+    row_groups = codes[order]
+    group_sizes = np.bincount(row_groups, minlength=n_groups)
+    group_starts = np.cumsum(group_sizes) - group_sizes
+
+    block = df[numerical_cols].to_numpy(dtype=float, na_value=np.nan)[order]
+    block[~np.isfinite(block)] = np.nan
+    finite = ~np.isnan(block)
+    # Все группы непусты, поэтому reduceat по началам сегментов дает значение каждой группы
+    count = np.add.reduceat(finite, group_starts, axis=0).astype(np.int64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.add.reduceat(np.where(finite, block, 0.0), group_starts, axis=0) / count
+        deviations = np.where(finite, block - np.repeat(mean, group_sizes, axis=0), 0.0)
+        squares = deviations * deviations
+        m2 = np.add.reduceat(squares, group_starts, axis=0)
+        m3 = np.add.reduceat(squares * deviations, group_starts, axis=0)
+        m4 = np.add.reduceat(squares * squares, group_starts, axis=0)
+        variance = np.where(count > 1, m2 / (count - 1), np.nan)
+    min_values = np.minimum.reduceat(np.where(finite, block, np.inf), group_starts, axis=0)
+    max_values = np.maximum.reduceat(np.where(finite, block, -np.inf), group_starts, axis=0)
+
+    # Порядковые статистики: значения каждого столбца сортируются внутри групп (пропуски - в конце группы)
+    order_statistics = []
+    for col in range(len(numerical_cols)):
+        within = _sort_within_segments(block[:, col], row_groups)
+        sorted_values = block[within, col]
+        column_finite = finite[within, col]
+        order_statistics.append({
+            "median": _segment_median(sorted_values, group_starts, count[:, col]),
+            "q1": _segment_quantile(sorted_values, group_starts, count[:, col], 0.25),
+            "q3": _segment_quantile(sorted_values, group_starts, count[:, col], 0.75),
+            "mode": _segment_modes(sorted_values[column_finite], row_groups[column_finite], n_groups, max_modes),
+        })
+
+    # Значения переводятся в списки Python один раз, а не поэлементно для каждой пары (группа, столбец)
+    count, mean, variance = count.tolist(), mean.tolist(), variance.tolist()
+    m2, m3, m4 = m2.tolist(), m3.tolist(), m4.tolist()
+    min_values, max_values = min_values.tolist(), max_values.tolist()
+    for statistics in order_statistics:
+        for key in ("median", "q1", "q3"):
+            statistics[key] = statistics[key].tolist()
+
+    eps = np.finfo(float).eps
+    results = []
+    for group_index, group in enumerate(groups):
+        group_name, group_size = str(group), int(group_sizes[group_index])
+        for col, col_name in enumerate(numerical_cols):
+            n = count[group_index][col]
+            if n == 0:
+                continue
+            mean_val = mean[group_index][col]
+            variance_val = variance[group_index][col]
+            std_dev = float(np.sqrt(variance_val))
+            central_m2 = m2[group_index][col] / n
+            # Как в scipy: для почти постоянных значений асимметрия и эксцесс не определены
+            if central_m2 <= (eps * mean_val) ** 2:
+                skewness = kurtosis = np.nan
+            else:
+                skewness = (m3[group_index][col] / n) / central_m2 ** 1.5
+                kurtosis = (m4[group_index][col] / n) / central_m2 ** 2.0 - 3.0
+            statistics = order_statistics[col]
+            q1 = statistics["q1"][group_index]
+            q3 = statistics["q3"][group_index]
+            mode_info = statistics["mode"][group_index]
+            results.append({
+                "group_column": group_column,
+                "group": group_name,
+                "group_size": group_size,
+                "variable_name": col_name,
+                "count": n,
+                "mean": mean_val,
+                "median": statistics["median"][group_index],
+                "mode": mode_info["values"],
+                "mode_frequency": mode_info["frequency"],
+                "mode_count": mode_info["count"],
+                "variance": variance_val,
+                "std_dev": std_dev,
+                "variation_coefficient": std_dev / mean_val if abs(mean_val) > 1e-9 and not np.isnan(std_dev) else np.nan,
+                "skewness": skewness,
+                "kurtosis": kurtosis,
+                "min_value": min_values[group_index][col],
+                "max_value": max_values[group_index][col],
+                "q1": q1,
+                "q3": q3,
+                "iqr": q3 - q1,
+            })
+    logs.append(f"Calculated grouped descriptive statistics for {len(numerical_cols)} numerical columns "
+                f"in {n_groups} groups of '{group_column}'.")
+    return results, logs
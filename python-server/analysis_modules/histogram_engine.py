@@ -0,0 +1,146 @@
+# python-server/analysis_modules/histogram_engine.py
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+# Правила выбора количества интервалов (совпадают с одноименными правилами numpy.histogram)
+HISTOGRAM_BIN_RULES = ("auto", "fd", "sturges", "sqrt", "rice", "scott")
+DEFAULT_HISTOGRAM_BIN_RULE = "auto"
+
+
+def histogram_bin_count(rule: Union[int, str], count: int, min_val: float, max_val: float,
+                        iqr: Optional[float] = None, std_dev: Optional[float] = None,
+                        integer: bool = False) -> int:
+    """
+    Количество интервалов по правилу rule, вычисленное по сводке данных (первая фаза построения гистограммы):
+    количеству, размаху, межквартильному размаху (правила "auto", "fd") и стандартному отклонению с ddof=1
+    (правило "scott"). Сводка может быть взята из моментов и скетча квантилей или из выборки, без прохода по данным.
+    Для точной сводки результат совпадает с numpy.histogram(bins=rule).
+
+    Args:
+        rule: Имя правила из HISTOGRAM_BIN_RULES или количество интервалов.
+        count: Количество значений.
+        min_val, max_val: Минимум и максимум.
+        iqr: Межквартильный размах.
+        std_dev: Стандартное отклонение (ddof=1).
+        integer: Значения целочисленные (ширина интервала не меньше 1, как в numpy).
+
+    Raises:
+        ValueError: Если правило неизвестно.
+    """
+    if not isinstance(rule, str):
+        return max(1, int(rule))
+    if rule not in HISTOGRAM_BIN_RULES:
+        raise ValueError(f"Unknown histogram bin rule '{rule}', expected one of {', '.join(HISTOGRAM_BIN_RULES)}")
+    if count == 0:
+        return 1
+    span = max_val - min_val
+    sturges_width = span / (np.log2(count) + 1.0)
+    sqrt_width = span / np.sqrt(count)
+    fd_width = 2.0 * iqr * count ** (-1.0 / 3.0) if iqr is not None else 0.0
+    if rule == "auto":
+        # Правило Фридмана-Диакониса, ограниченное снизу половиной ширины по правилу квадратного корня, и Стёрджеса
+        width = min(max(fd_width, sqrt_width / 2.0), sturges_width)
+    elif rule == "fd":
+        width = fd_width
+    elif rule == "sturges":
+        width = sturges_width
+    elif rule == "sqrt":
+        width = sqrt_width
+    elif rule == "rice":
+        width = span / (2.0 * count ** (1.0 / 3.0))
+    else:
+        # numpy использует стандартное отклонение с ddof=0
+        population_std = std_dev * np.sqrt((count - 1) / count) if std_dev is not None and count > 1 else 0.0
+        width = (24.0 * np.pi ** 0.5 / count) ** (1.0 / 3.0) * population_std
+    if not width:
+        # Постоянный столбец или нулевой IQR: один интервал
+        return 1
+    if integer and width < 1:
+        width = 1
+    return int(np.ceil(span / width))
+
+
+def histogram_edges(min_val: float, max_val: float, n_bins: int) -> np.ndarray:
+    """
+    Равные интервалы на отрезке [min_val, max_val] (для постоянных данных - [min_val - 0.5, max_val + 0.5]).
+
+    Raises:
+        ValueError: Если границы не конечны или интервалов слишком много для размаха данных.
+    """
+    first_edge, last_edge = float(min_val), float(max_val)
+    if not (np.isfinite(first_edge) and np.isfinite(last_edge)):
+        raise ValueError(f"Histogram range [{first_edge}, {last_edge}] is not finite")
+    if first_edge == last_edge:
+        first_edge, last_edge = first_edge - 0.5, last_edge + 0.5
+    edges = np.linspace(first_edge, last_edge, n_bins + 1, endpoint=True)
+    if np.any(edges[:-1] >= edges[1:]):
+        raise ValueError(f"Too many bins for data range. Cannot create {n_bins} finite-sized bins.")
+    return edges
+
+
+class StreamingHistogram:
+    """
+    Гистограмма с заранее выбранными равными интервалами (вторая фаза построения): значения порций
+    строк подсчитываются одним проходом без сортировки, а частичные гистограммы порций и рабочих процессов
+    с одинаковыми границами объединяются сложением частот. Значения вне границ подсчитываются отдельно
+    (underflow, overflow). Отнесение значений к интервалам совпадает с numpy.histogram:
+    интервалы полуоткрытые, последний включает правую границу.
+    """
+
+    def __init__(self, edges: np.ndarray):
+        """
+        Args:
+            edges: Возрастающие равноотстоящие границы интервалов (n_bins + 1 значений).
+        """
+        self.edges = np.asarray(edges, dtype=float)
+        self.counts = np.zeros(len(self.edges) - 1, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+    @classmethod
+    def from_summary(cls, rule: Union[int, str], count: int, min_val: float, max_val: float,
+                     iqr: Optional[float] = None, std_dev: Optional[float] = None,
+                     integer: bool = False) -> "StreamingHistogram":
+        """Пустая гистограмма с интервалами, выбранными по правилу rule для сводки данных (см. histogram_bin_count)."""
+        n_bins = histogram_bin_count(rule, count, min_val, max_val, iqr=iqr, std_dev=std_dev, integer=integer)
+        if count == 0:
+            min_val, max_val = 0.0, 1.0
+        return cls(histogram_edges(min_val, max_val, n_bins))
+
+    def update(self, values: np.ndarray) -> None:
+        """Подсчитывает значения (пропуски пропускаются)."""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        first_edge, last_edge = self.edges[0], self.edges[-1]
+        below = values < first_edge
+        above = values > last_edge
+        outside = below | above
+        if outside.any():
+            self.underflow += int(below.sum())
+            self.overflow += int(above.sum())
+            values = values[~outside]
+        n_bins = len(self.counts)
+        indices = ((values - first_edge) / (last_edge - first_edge) * n_bins).astype(np.intp)
+        indices[indices == n_bins] -= 1
+        # Вычисленный номер может отличаться на единицу у самой границы интервала
+        indices[values < self.edges[indices]] -= 1
+        indices[(values >= self.edges[indices + 1]) & (indices != n_bins - 1)] += 1
+        self.counts += np.bincount(indices, minlength=n_bins)
+
+    def merge(self, other: "StreamingHistogram") -> None:
+        """
+        Добавляет частоты другой частичной гистограммы.
+
+        Raises:
+            ValueError: Если границы интервалов различаются.
+        """
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Cannot merge histograms with different bin edges")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+
+    def result(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Частоты и границы интервалов (как numpy.histogram)."""
+        return self.counts.copy(), self.edges.copy()
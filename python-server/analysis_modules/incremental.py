@@ -0,0 +1,313 @@
+# python-server/analysis_modules/incremental.py
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from analysis_modules.descriptive import generate_normal_curve_points
+from analysis_modules.mode_counter import ModeCounter
+from analysis_modules.moment_accumulator import MomentAccumulator
+from analysis_modules.quantile_sketch import DEFAULT_SKETCH_K, KLLSketch
+
+# Максимальное количество интервалов накопленной гистограммы: при выходе за него ширина интервала удваивается
+MAX_HISTOGRAM_BINS = 256
+# Совместные моменты (корреляции и МНК-статистики) хранятся для пар первых столбцов
+MAX_PAIR_COLUMNS = 50
+# Версия формата сохраняемых статистик: увеличивается при любом изменении состава состояния IncrementalStatistics
+# и вложенных в него накопителей; сохраненные в другой версии наборы данных не читаются
+DATASET_FORMAT_VERSION = 1
+
+
+class IncrementalStatistics:
+    """
+    Статистики набора данных, пополняемого строками. Все состояние объединяемо: при добавлении строк
+    вычисляются статистики только новых строк и объединяются с накопленными, поэтому стоимость
+    обновления пропорциональна количеству добавленных строк.
+
+    - моменты столбцов до четвертого порядка, минимум и максимум (MomentAccumulator);
+    - KLL-скетчи квантилей (медиана и квартили с ограниченной ошибкой ранга, пока данных мало - точные);
+    - счетчики частот для моды (ModeCounter: точные, пока различных значений немного, затем - счетчики Мисры-Гриса);
+    - гистограммы на мелкой сетке интервалов (для вывода соседние интервалы объединяются до ширины,
+      которую выбрал бы numpy.histogram(bins="auto"));
+    - совместные моменты пар столбцов (формулы Чана), из которых вычисляются корреляции и линейная регрессия МНК.
+    """
+
+    def __init__(self, columns: List[str], max_pair_columns: int = MAX_PAIR_COLUMNS,
+                 quantile_sketch_k: int = DEFAULT_SKETCH_K):
+        """
+        Args:
+            columns: Отслеживаемые числовые столбцы.
+            max_pair_columns: Количество первых столбцов, для пар которых хранятся совместные моменты.
+            quantile_sketch_k: Параметр точности скетчей квантилей.
+        """
+        self.columns = list(columns)
+        self.row_count = 0
+        n_columns = len(self.columns)
+        self.moments = MomentAccumulator(self.columns)
+        self.sketches = [KLLSketch(quantile_sketch_k) for _ in range(n_columns)]
+        self.mode_counters = [ModeCounter() for _ in range(n_columns)]
+        # Гистограмма столбца: начало сетки, ширина интервала и частоты по номерам интервалов
+        self.bin_origin = np.full(n_columns, np.nan)
+        self.bin_width = np.full(n_columns, np.nan)
+        self.bin_counts: List[Dict[int, int]] = [{} for _ in range(n_columns)]
+
+        n_pairs = min(n_columns, max_pair_columns)
+        self.pair_columns = self.columns[:n_pairs]
+        # Для пары (i, j) по строкам, где заданы оба значения: количество, среднее i,
+        # сумма квадратов отклонений i и сумма произведений отклонений i и j
+        self.pair_count = np.zeros((n_pairs, n_pairs))
+        self.pair_mean = np.zeros((n_pairs, n_pairs))
+        self.pair_m2 = np.zeros((n_pairs, n_pairs))
+        self.pair_cross = np.zeros((n_pairs, n_pairs))
+
+    def append(self, df: pd.DataFrame) -> List[str]:
+        """
+        Добавляет строки к статистикам.
+
+        Args:
+            df: Новые строки. Отсутствующие столбцы считаются пропусками, нечисловые значения - пропусками,
+                лишние столбцы игнорируются.
+
+        Returns:
+            Список строк с логами обработки.
+        """
+        logs = []
+        missing = [col for col in self.columns if col not in df.columns]
+        if missing:
+            logs.append(f"Warning: Appended rows lack columns {', '.join(missing)}; their values are treated as missing")
+        extra = [col for col in df.columns if col not in self.columns]
+        if extra:
+            logs.append(f"Columns not tracked by the dataset are ignored: {', '.join(map(str, extra))}")
+        block = np.column_stack([
+            pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=float) if col in df.columns
+            else np.full(len(df), np.nan)
+            for col in self.columns
+        ]) if self.columns else np.empty((len(df), 0))
+        block[~np.isfinite(block)] = np.nan
+
+        self.moments.add(block)
+        for col in range(len(self.columns)):
+            values = block[:, col][~np.isnan(block[:, col])]
+            self._update_histogram(col, values)
+            self.sketches[col].update(values)
+            self.mode_counters[col].update(values)
+        self._update_pairs(block[:, :len(self.pair_columns)])
+        self.row_count += len(df)
+        logs.append(f"Appended {len(df)} rows; dataset now has {self.row_count} rows")
+        return logs
+
+    def _update_histogram(self, col: int, values: np.ndarray):
+        """
+        Добавляет значения к гистограмме столбца. Сетка задается по первым значениям (MAX_HISTOGRAM_BINS интервалов
+        на их размах) и, если вместе с новыми значениями данные занимают больше MAX_HISTOGRAM_BINS интервалов,
+        укрупняется до вычисления номеров интервалов новых значений.
+        """
+        if not len(values):
+            return
+        if np.isnan(self.bin_width[col]):
+            low, high = float(values.min()), float(values.max())
+            # Максимум попадает в последний, MAX_HISTOGRAM_BINS-й интервал
+            width = (high - low) / (MAX_HISTOGRAM_BINS - 1) if high > low else max(abs(low), 1.0) / MAX_HISTOGRAM_BINS
+            self.bin_origin[col] = low
+            self.bin_width[col] = width
+        counts = self.bin_counts[col]
+        origin, width = float(self.bin_origin[col]), float(self.bin_width[col])
+        # Крайние номера интервалов - целые Python: для значений далеко за пределами сетки они не помещаются в int64
+        first = math.floor((float(values.min()) - origin) / width)
+        last = math.floor((float(values.max()) - origin) / width)
+        if counts:
+            first, last = min(first, min(counts)), max(last, max(counts))
+        # Укрупнение сетки в 2^shift раз: floor(floor(t) / 2^k) = floor(t / 2^k), поэтому частоты складываются точно
+        shift = 0
+        while (last >> shift) - (first >> shift) + 1 > MAX_HISTOGRAM_BINS:
+            shift += 1
+        if shift:
+            coarse: Dict[int, int] = {}
+            for index, frequency in counts.items():
+                coarse[index >> shift] = coarse.get(index >> shift, 0) + frequency
+            counts = coarse
+            width *= 2.0 ** shift
+            self.bin_width[col] = width
+        indexes, frequencies = np.unique(np.floor((values - origin) / width).astype(np.int64), return_counts=True)
+        for index, frequency in zip(indexes.tolist(), frequencies.tolist()):
+            counts[index] = counts.get(index, 0) + frequency
+        self.bin_counts[col] = counts
+
+    def _update_pairs(self, block: np.ndarray):
+        """Объединяет совместные моменты пар столбцов с моментами блока (попарно по строкам без пропусков)."""
+        if block.shape[1] == 0 or not len(block):
+            return
+        finite = ~np.isnan(block)
+        mask = finite.astype(float)
+        # Сдвиг на среднее блока уменьшает потерю точности при вычислении сумм произведений
+        present = finite.sum(axis=0)
+        shift = np.where(finite, block, 0.0).sum(axis=0) / np.maximum(present, 1)
+        shifted = np.where(finite, block - shift, 0.0)
+
+        count_b = mask.T @ mask
+        safe_count = np.maximum(count_b, 1)
+        sums = shifted.T @ mask                      # sums[i, j] - сумма i по строкам, где заданы i и j
+        mean_b = sums / safe_count + shift[:, None]
+        m2_b = (shifted * shifted).T @ mask - sums * sums / safe_count
+        cross_b = shifted.T @ shifted - sums * sums.T / safe_count
+
+        count = self.pair_count + count_b
+        safe_total = np.maximum(count, 1)
+        delta = mean_b - self.pair_mean
+        weight = self.pair_count * count_b / safe_total
+        self.pair_cross = self.pair_cross + cross_b + delta * delta.T * weight
+        self.pair_m2 = self.pair_m2 + m2_b + delta * delta * weight
+        self.pair_mean = self.pair_mean + delta * count_b / safe_total
+        self.pair_count = count
+
+    def histogram(self, col: int, merge_factor: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Частоты и границы интервалов гистограммы столбца (от первого до последнего непустого интервала).
+
+        Args:
+            col: Номер столбца.
+            merge_factor: Количество соседних интервалов накопленной сетки в одном интервале результата.
+        """
+        counts: Dict[int, int] = {}
+        for index, frequency in self.bin_counts[col].items():
+            counts[index // merge_factor] = counts.get(index // merge_factor, 0) + frequency
+        if not counts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        first, last = min(counts), max(counts)
+        frequencies = np.array([counts.get(index, 0) for index in range(first, last + 1)], dtype=np.int64)
+        edges = self.bin_origin[col] + self.bin_width[col] * merge_factor * np.arange(first, last + 2)
+        return frequencies, edges
+
+    def display_merge_factor(self, col: int, q1: float, q3: float) -> int:
+        """
+        Количество интервалов накопленной сетки в интервале выводимой гистограммы: ширина выбирается
+        как в numpy.histogram(bins="auto") - меньшая из ширин по правилам Фридмана-Диакониса и Стёрджеса.
+        """
+        n = int(self.moments.count[col])
+        span = float(self.moments.max_values[col] - self.moments.min_values[col])
+        if n < 2 or span <= 0:
+            return 1
+        width = span / (math.log2(n) + 1.0)
+        fd_width = 2.0 * (q3 - q1) * n ** (-1.0 / 3.0)
+        if fd_width > 0:
+            width = min(width, fd_width)
+        return max(1, int(round(width / self.bin_width[col])))
+
+    def quantile(self, col: int, p: float) -> float:
+        """Квантиль столбца по скетчу (точный, пока значений столбца не больше емкости скетча)."""
+        return float(self.sketches[col].quantiles([p])[0])
+
+    def rank_errors(self) -> Dict[str, float]:
+        """Граница ошибки ранга квантилей по столбцам, квантили которых уже не точные."""
+        return {self.columns[col]: sketch.rank_error() for col, sketch in enumerate(self.sketches) if not sketch.is_exact}
+
+    def mode_frequency_errors(self) -> Dict[str, int]:
+        """Граница занижения частоты моды по столбцам, частоты значений которых уже не точные."""
+        return {self.columns[col]: counter.error for col, counter in enumerate(self.mode_counters) if not counter.is_exact}
+
+    def descriptives(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Описательные статистики и гистограммы в формате calculate_descriptive_stats.
+        Асимметрия и эксцесс вычисляются со смещением (bias=True), дисперсия - с ddof=1.
+        Мода определяется по счетчикам частот.
+
+        Returns:
+            Кортеж (список словарей статистик, список словарей гистограмм).
+        """
+        descriptive_results, histogram_results = [], []
+        column_index = {col_name: col for col, col_name in enumerate(self.columns)}
+        for stats_dict in self.moments.statistics():
+            col_name = stats_dict["variable_name"]
+            col = column_index[col_name]
+            n, mean_val, std_dev = stats_dict["count"], stats_dict["mean"], stats_dict["std_dev"]
+            min_val, max_val = stats_dict["min_value"], stats_dict["max_value"]
+            q1, median, q3 = (self.quantile(col, p) for p in (0.25, 0.5, 0.75))
+            mode_info = self.mode_counters[col].modes()
+            descriptive_results.append({**stats_dict, "median": median, "mode": mode_info["values"],
+                                        "mode_frequency": mode_info["frequency"], "mode_count": mode_info["count"],
+                                        "q1": q1, "q3": q3, "iqr": q3 - q1})
+
+            merge_factor = self.display_merge_factor(col, q1, q3)
+            frequencies, edges = self.histogram(col, merge_factor)
+            normal_curve_x, normal_curve_y = [], []
+            if n > 1 and std_dev > 0:
+                normal_curve_x, normal_curve_y = generate_normal_curve_points(
+                    mean_val, std_dev, min_val, max_val, num_points=100)
+                scale_factor = n * float(self.bin_width[col]) * merge_factor
+                normal_curve_y = [y * scale_factor for y in normal_curve_y]
+            histogram_results.append({
+                "variable_name": col_name,
+                "bins": edges.tolist(),
+                "frequencies": frequencies.tolist(),
+                "normal_curve_x": normal_curve_x,
+                "normal_curve_y": normal_curve_y,
+                "mean": mean_val,
+                "std_dev": float(std_dev) if n > 1 else 0.0,
+            })
+        return descriptive_results, histogram_results
+
+    def correlations(self) -> List[Dict[str, Any]]:
+        """Коэффициенты корреляции Пирсона для пар отслеживаемых столбцов (по строкам, где заданы оба значения)."""
+        results = []
+        for i, x_name in enumerate(self.pair_columns):
+            for j in range(i + 1, len(self.pair_columns)):
+                n = int(self.pair_count[i, j])
+                denominator = self.pair_m2[i, j] * self.pair_m2[j, i]
+                if n < 2 or denominator <= 0:
+                    continue
+                correlation = float(np.clip(self.pair_cross[i, j] / math.sqrt(denominator), -1.0, 1.0))
+                results.append({"variable_x": x_name, "variable_y": self.pair_columns[j],
+                                "count": n, "correlation": correlation})
+        return results
+
+    def linear_regression(self, dependent_var: str, independent_var: str) -> Optional[Dict[str, Any]]:
+        """
+        Линейная регрессия МНК dependent_var ~ independent_var по накопленным совместным моментам.
+        Коэффициенты, стандартные ошибки, R², F-статистика и доверительные интервалы совпадают с результатом OLS по всем строкам.
+
+        Returns:
+            Словарь в формате RegressionResult или None, если пара не отслеживается или данных недостаточно.
+        """
+        if dependent_var not in self.pair_columns or independent_var not in self.pair_columns:
+            return None
+        y, x = self.pair_columns.index(dependent_var), self.pair_columns.index(independent_var)
+        n = int(self.pair_count[x, y])
+        s_xx, s_yy, s_xy = self.pair_m2[x, y], self.pair_m2[y, x], self.pair_cross[x, y]
+        if n < 3 or s_xx <= 0 or s_yy <= 0:
+            return None
+        mean_x, mean_y = self.pair_mean[x, y], self.pair_mean[y, x]
+        slope = s_xy / s_xx
+        intercept = mean_y - slope * mean_x
+        sse = max(0.0, s_yy - slope * s_xy)
+        dof = n - 2
+        residual_variance = sse / dof
+        t_crit = float(stats.t.ppf(0.975, dof))
+
+        coefficients = []
+        for name, value, se in (("const", intercept, math.sqrt(residual_variance * (1.0 / n + mean_x ** 2 / s_xx))),
+                                (independent_var, slope, math.sqrt(residual_variance / s_xx))):
+            t_statistic = value / se if se > 0 else np.inf
+            coefficients.append({
+                "variable_name": name,
+                "coefficient": float(value),
+                "standard_error": float(se),
+                "t_statistic": float(t_statistic),
+                "p_value": float(2.0 * stats.t.sf(abs(t_statistic), dof)),
+                "confidence_interval_lower": float(value - t_crit * se),
+                "confidence_interval_upper": float(value + t_crit * se),
+            })
+        r_squared = 1.0 - sse / s_yy
+        f_statistic = (s_yy - sse) / residual_variance if residual_variance > 0 else np.inf
+        return {
+            "model_type": "Linear",
+            "dependent_variable": dependent_var,
+            "independent_variables": [independent_var],
+            "r_squared": float(r_squared),
+            "adjusted_r_squared": float(1.0 - (1.0 - r_squared) * (n - 1) / dof),
+            "f_statistic": float(f_statistic),
+            "f_p_value": float(stats.f.sf(f_statistic, 1, dof)),
+            "sse": float(sse),
+            "coefficients": coefficients,
+        }
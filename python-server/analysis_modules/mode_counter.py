@@ -0,0 +1,109 @@
+# python-server/analysis_modules/mode_counter.py
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+# Максимальное количество мод в результате (у столбца с уникальными значениями модой является каждое значение)
+DEFAULT_MAX_MODES = 10
+# Количество счетчиков: пока различных значений не больше, частоты точные
+DEFAULT_MODE_CAPACITY = 4096
+# Значения подсчитываются порциями: таблица частот порции не больше UPDATE_CHUNK_SIZE значений
+UPDATE_CHUNK_SIZE = 1 << 16
+
+
+class ModeCounter:
+    """
+    Объединяемый подсчет частот значений для моды. Значения порции считаются точно хэш-таблицей
+    (pandas.Series.value_counts) и добавляются к счетчикам. Если различных значений становится больше
+    capacity, применяется сокращение Мисры-Гриса: из всех счетчиков вычитается (capacity + 1)-я по величине
+    частота, и неположительные счетчики удаляются. После этого частоты занижены не более чем на
+    накопленную погрешность error <= count / (capacity + 1), а любое значение с частотой больше error
+    гарантированно остается среди счетчиков. Счетчики порций строк и рабочих процессов объединяются
+    сложением с тем же сокращением (Agarwal et al., Mergeable Summaries).
+    """
+
+    def __init__(self, capacity: int = DEFAULT_MODE_CAPACITY):
+        """
+        Args:
+            capacity: Количество хранимых счетчиков.
+        """
+        self.capacity = max(1, int(capacity))
+        self.count = 0
+        self.error = 0
+        self.counters: Dict[float, int] = {}
+
+    def update(self, values: np.ndarray) -> None:
+        """
+        Добавляет значения (пропуски пропускаются). Значения подсчитываются порциями по UPDATE_CHUNK_SIZE
+        с сокращением после каждой, поэтому для столбца с уникальными значениями память ограничена
+        O(capacity + UPDATE_CHUNK_SIZE), а не количеством различных значений.
+        """
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        for start in range(0, len(values), UPDATE_CHUNK_SIZE):
+            chunk = values[start:start + UPDATE_CHUNK_SIZE]
+            counts = pd.Series(chunk).value_counts(sort=False)
+            self._add(counts.index.to_numpy(dtype=float), counts.to_numpy(dtype=np.int64), len(chunk), 0)
+
+    def merge(self, other: "ModeCounter") -> None:
+        """
+        Добавляет счетчики другой порции данных.
+
+        Raises:
+            ValueError: Если количество счетчиков различается.
+        """
+        if other.capacity != self.capacity:
+            raise ValueError(f"Cannot merge a mode counter with capacity {other.capacity} "
+                             f"into a counter with capacity {self.capacity}")
+        self._add(np.fromiter(other.counters.keys(), dtype=float, count=len(other.counters)),
+                  np.fromiter(other.counters.values(), dtype=np.int64, count=len(other.counters)),
+                  other.count, other.error)
+
+    def _reduction(self, frequencies: np.ndarray) -> int:
+        """Величина сокращения Мисры-Гриса: (capacity + 1)-я по величине частота (0, если счетчиков хватает)."""
+        if len(frequencies) <= self.capacity:
+            return 0
+        return int(np.partition(frequencies, len(frequencies) - self.capacity - 1)[-self.capacity - 1])
+
+    def _add(self, values: np.ndarray, frequencies: np.ndarray, count: int, error: int) -> None:
+        # Порцию с большим количеством различных значений сначала сокращаем векторно, затем объединяем со счетчиками
+        threshold = self._reduction(frequencies)
+        if threshold:
+            keep = frequencies > threshold
+            values, frequencies = values[keep], frequencies[keep] - threshold
+        counters = self.counters
+        for value, frequency in zip(values.tolist(), frequencies.tolist()):
+            counters[value] = counters.get(value, 0) + frequency
+        self.count += count
+        self.error += error + threshold
+
+        threshold = self._reduction(np.fromiter(counters.values(), dtype=np.int64, count=len(counters)))
+        if threshold:
+            self.counters = {value: frequency - threshold for value, frequency in counters.items()
+                             if frequency > threshold}
+            self.error += threshold
+
+    @property
+    def is_exact(self) -> bool:
+        """Частоты точные (сокращений не было)."""
+        return self.error == 0
+
+    def modes(self, max_modes: int = DEFAULT_MAX_MODES) -> Dict[str, Any]:
+        """
+        Моды: значения с наибольшей частотой по возрастанию, не больше max_modes.
+        При точных частотах результат совпадает с началом pandas.Series.mode; после сокращения
+        возвращаются значения с наибольшей оценкой частоты (истинная частота не больше оценки + error).
+        Если оценка наибольшей частоты не больше error, значения не отличаются по частоте от вытесненных
+        из счетчиков (например, почти все значения уникальны), и мод нет.
+
+        Returns:
+            Словарь {"values": список мод, "frequency": частота (оценка), "count": количество значений с этой частотой,
+            "frequency_error": граница занижения частоты}.
+        """
+        frequency = max(self.counters.values(), default=0)
+        if frequency == 0 or frequency <= self.error:
+            return {"values": [], "frequency": 0, "count": 0, "frequency_error": self.error}
+        tied = sorted(value for value, value_frequency in self.counters.items() if value_frequency == frequency)
+        return {"values": tied[:max_modes], "frequency": frequency,
+                "count": len(tied), "frequency_error": self.error}
@@ -0,0 +1,165 @@
+# python-server/analysis_modules/moment_accumulator.py
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class MomentAccumulator:
+    """
+    Объединяемый накопитель моментов числовых столбцов: количество, среднее, центральные суммы
+    степеней M2, M3, M4, минимум и максимум. Накопители порций строк или разделов данных,
+    обработанных параллельно, объединяются по формулам Пебэя без повторного прохода по данным,
+    а статистики вычисляются в тех же соглашениях, что и calculate_descriptive_stats
+    (дисперсия с ddof=1, асимметрия и эксцесс с bias=True).
+    """
+
+    def __init__(self, columns: Sequence[str]):
+        """
+        Args:
+            columns: Имена столбцов (порядок задает порядок статистик).
+        """
+        self.columns = list(columns)
+        n_columns = len(self.columns)
+        self.count = np.zeros(n_columns)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.m3 = np.zeros(n_columns)
+        self.m4 = np.zeros(n_columns)
+        self.min_values = np.full(n_columns, np.inf)
+        self.max_values = np.full(n_columns, -np.inf)
+
+    @classmethod
+    def from_block(cls, columns: Sequence[str], block: np.ndarray) -> "MomentAccumulator":
+        """
+        Моменты блока значений двухпроходным методом (отклонения от среднего блока).
+
+        Args:
+            columns: Имена столбцов блока.
+            block: Массив формы (строки, столбцы), пропуски - NaN.
+        """
+        accumulator = cls(columns)
+        if not len(block):
+            return accumulator
+        # Значения столбца лежат в памяти подряд: суммы по столбцам вычисляются попарным суммированием numpy
+        values = np.ascontiguousarray(block.T)
+        finite = ~np.isnan(values)
+        count = finite.sum(axis=1).astype(float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(count > 0, np.where(finite, values, 0.0).sum(axis=1) / np.maximum(count, 1), 0.0)
+        centered = np.where(finite, values - mean[:, None], 0.0)
+        squared = centered * centered
+        accumulator.count = count
+        accumulator.mean = mean
+        accumulator.m2 = squared.sum(axis=1)
+        accumulator.m3 = (squared * centered).sum(axis=1)
+        accumulator.m4 = (squared * squared).sum(axis=1)
+        accumulator.min_values = np.where(finite, values, np.inf).min(axis=1)
+        accumulator.max_values = np.where(finite, values, -np.inf).max(axis=1)
+        return accumulator
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, columns: Optional[Sequence[str]] = None) -> "MomentAccumulator":
+        """
+        Моменты строк DataFrame.
+
+        Args:
+            df: Порция или раздел строк.
+            columns: Столбцы накопителя (по умолчанию - числовые столбцы df). Отсутствующие в df столбцы
+                и нечисловые значения считаются пропусками.
+        """
+        if columns is None:
+            columns = df.select_dtypes(include=np.number).columns.tolist()
+        block = np.column_stack([
+            pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=float, na_value=np.nan) if col in df.columns
+            else np.full(len(df), np.nan)
+            for col in columns
+        ]) if len(columns) else np.empty((len(df), 0))
+        block[~np.isfinite(block)] = np.nan
+        return cls.from_block(columns, block)
+
+    def merge(self, other: "MomentAccumulator") -> "MomentAccumulator":
+        """
+        Накопитель объединения двух частей данных (формулы Пебэя для M2-M4).
+
+        Raises:
+            ValueError: Если накопители построены для разных столбцов.
+        """
+        if other.columns != self.columns:
+            raise ValueError(f"Cannot merge moments of columns {other.columns} into moments of columns {self.columns}")
+        n_a, n_b = self.count, other.count
+        n = n_a + n_b
+        delta = other.mean - self.mean
+        delta_n = delta / np.maximum(n, 1)
+
+        merged = MomentAccumulator(self.columns)
+        merged.count = n
+        merged.mean = self.mean + n_b * delta_n
+        merged.m2 = self.m2 + other.m2 + delta * delta_n * n_a * n_b
+        merged.m3 = (self.m3 + other.m3 + delta * delta_n ** 2 * n_a * n_b * (n_a - n_b)
+                     + 3.0 * delta_n * (n_a * other.m2 - n_b * self.m2))
+        merged.m4 = (self.m4 + other.m4 + delta * delta_n ** 3 * n_a * n_b * (n_a * n_a - n_a * n_b + n_b * n_b)
+                     + 6.0 * delta_n ** 2 * (n_a * n_a * other.m2 + n_b * n_b * self.m2)
+                     + 4.0 * delta_n * (n_a * other.m3 - n_b * self.m3))
+        merged.min_values = np.minimum(self.min_values, other.min_values)
+        merged.max_values = np.maximum(self.max_values, other.max_values)
+        return merged
+
+    def add(self, block: np.ndarray) -> None:
+        """Добавляет к накопителю блок строк (строки, столбцы; пропуски - NaN)."""
+        merged = self.merge(MomentAccumulator.from_block(self.columns, block))
+        self.__dict__.update(merged.__dict__)
+
+    @staticmethod
+    def merge_all(accumulators: Sequence["MomentAccumulator"]) -> "MomentAccumulator":
+        """
+        Объединяет накопители попарно (сбалансированным деревом): части объединяются с частями близкого размера,
+        что точнее последовательного добавления многих маленьких частей к большой.
+        """
+        if not accumulators:
+            raise ValueError("No moment accumulators to merge")
+        level = list(accumulators)
+        while len(level) > 1:
+            level = [level[i].merge(level[i + 1]) if i + 1 < len(level) else level[i]
+                     for i in range(0, len(level), 2)]
+        return level[0]
+
+    def statistics(self) -> List[Dict[str, Any]]:
+        """
+        Описательные статистики по накопленным моментам в формате calculate_descriptive_stats
+        (без медианы, квартилей и моды, которые не объединяются через моменты). Столбцы без значений пропускаются.
+
+        Returns:
+            Список словарей {"variable_name", "count", "mean", "variance", "std_dev", "variation_coefficient",
+            "skewness", "kurtosis", "min_value", "max_value"}.
+        """
+        results = []
+        eps = np.finfo(float).eps
+        for col, col_name in enumerate(self.columns):
+            n = int(self.count[col])
+            if n == 0:
+                continue
+            mean_val = float(self.mean[col])
+            m2 = float(self.m2[col])
+            variance = m2 / (n - 1) if n > 1 else np.nan
+            std_dev = float(np.sqrt(variance))
+            # Как в scipy: для почти постоянного столбца асимметрия и эксцесс не определены
+            if m2 / n <= (eps * mean_val) ** 2:
+                skewness = kurtosis = np.nan
+            else:
+                skewness = (float(self.m3[col]) / n) / (m2 / n) ** 1.5
+                kurtosis = (float(self.m4[col]) / n) / (m2 / n) ** 2.0 - 3.0
+            variation = std_dev / mean_val if abs(mean_val) > 1e-9 and not np.isnan(std_dev) else np.nan
+            results.append({
+                "variable_name": col_name,
+                "count": n,
+                "mean": mean_val,
+                "variance": variance,
+                "std_dev": std_dev,
+                "variation_coefficient": variation,
+                "skewness": skewness,
+                "kurtosis": kurtosis,
+                "min_value": float(self.min_values[col]),
+                "max_value": float(self.max_values[col]),
+            })
+        return results
@@ -2,15 +2,26 @@
 import pandas as pd
 import numpy as np
 from scipy import stats
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional
+from analysis_modules.column_artifacts import ColumnArtifacts
 
-def perform_normality_test(df: pd.DataFrame, alpha: float = 0.05) -> Tuple[List[Dict[str, Any]], List[str]]:
+# Размер выборки для упрощенного варианта теста (при большем размере scipy предупреждает о неточности p-значения)
+DEFAULT_SHAPIRO_SAMPLE_SIZE = 5000
+# Фиксированное зерно выборки: результат упрощенного варианта воспроизводим и может кэшироваться
+SHAPIRO_SAMPLE_SEED = 0
+
+def perform_normality_test(df: pd.DataFrame, alpha: float = 0.05,
+                           artifacts: Optional[ColumnArtifacts] = None,
+                           max_sample_size: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
     """
     Выполняет тест Шапиро-Уилка на нормальность для числовых столбцов DataFrame.
 
     Args:
         df: Входной DataFrame.
         alpha: Уровень значимости для определения вывода.
+        artifacts: Общие промежуточные результаты по столбцам (создаются, если не переданы).
+        max_sample_size: Если задан, для столбцов с большим количеством значений тест выполняется
+                         по случайной выборке такого размера (в результат добавляется "sample_size").
 
     Returns:
         Кортеж:
@@ -19,7 +30,9 @@ def perform_normality_test(df: pd.DataFrame, alpha: float = 0.05) -> Tuple[List[
     """
     results = []
     logs = []
-    numerical_cols = df.select_dtypes(include=np.number).columns.tolist()
+    if artifacts is None:
+        artifacts = ColumnArtifacts(df)
+    numerical_cols = artifacts.numerical_columns()
 
     if not numerical_cols:
         logs.append("No numerical columns found for normality tests.")
@@ -28,8 +41,9 @@ def perform_normality_test(df: pd.DataFrame, alpha: float = 0.05) -> Tuple[List[
     logs.append(f"Found numerical columns for normality tests: {', '.join(numerical_cols)}")
 
     for col_name in numerical_cols:
-        col_data = df[col_name].dropna()
-        count = col_data.count()
+        col_data = artifacts.clean(col_name)
+        moments = artifacts.moments(col_name)
+        count = moments["count"]
 
         test_result = {
             "variable_name": col_name,
@@ -44,11 +58,16 @@ def perform_normality_test(df: pd.DataFrame, alpha: float = 0.05) -> Tuple[List[
             test_result["conclusion"] = "Skipped (insufficient data)"
             logs.append(f"Skipped Shapiro-Wilk for '{col_name}' (less than 3 non-NaN values).")
         # Проверка на константность данных (shapiro выдаст ошибку)
-        elif col_data.nunique() == 1:
+        elif moments["min"] == moments["max"]:
             test_result["conclusion"] = "Skipped (constant data)"
             logs.append(f"Skipped Shapiro-Wilk for '{col_name}' (constant values).")
         else:
             try:
+                if max_sample_size and count > max_sample_size:
+                    rng = np.random.default_rng(SHAPIRO_SAMPLE_SEED)
+                    col_data = rng.choice(col_data.to_numpy(), size=max_sample_size, replace=False)
+                    test_result["sample_size"] = max_sample_size
+                    logs.append(f"Shapiro-Wilk for '{col_name}' uses a random sample of {max_sample_size} of {count} values.")
                 shapiro_stat, shapiro_p_value = stats.shapiro(col_data)
                 test_result["statistic"] = float(shapiro_stat)
                 test_result["p_value"] = float(shapiro_p_value)
@@ -0,0 +1,221 @@
+# python-server/analysis_modules/online_aggregation.py
+import math
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from analysis_modules.sampling import (
+    finite_population_correction,
+    moment_estimate_errors,
+    quantile_estimate_errors,
+)
+
+DEFAULT_PROGRESSIVE_BLOCKS = 20
+DEFAULT_PROGRESSIVE_SEED = 0
+# Корреляции оцениваются для всех пар не более чем стольких первых числовых столбцов
+MAX_CORRELATION_COLUMNS = 10
+
+
+def random_row_blocks(n_rows: int, n_blocks: int, seed: int = DEFAULT_PROGRESSIVE_SEED) -> List[np.ndarray]:
+    """
+    Разбивает случайную перестановку номеров строк на n_blocks блоков почти равного размера.
+    Любой префикс блоков - простая случайная выборка без возвращения.
+    """
+    permutation = np.random.default_rng(seed).permutation(n_rows)
+    return [block for block in np.array_split(permutation, max(1, min(n_blocks, n_rows))) if len(block)]
+
+
+class OnlineAggregator:
+    """
+    Накопитель оценок по блокам строк, обрабатываемым в случайном порядке.
+    Моменты столбцов и совместные моменты пар объединяются по блокам (формулы Чана),
+    отсортированные значения столбцов дополняются слиянием, поэтому обновление оценок
+    не требует повторного прохода по уже обработанным строкам.
+    """
+
+    def __init__(self, values: np.ndarray, columns: List[str],
+                 pairs: List[Tuple[int, int]], regression_pair: Optional[Tuple[int, int]] = None,
+                 confidence: float = 0.95):
+        """
+        Args:
+            values: Матрица значений числовых столбцов (строки x столбцы, пропуски - NaN).
+            columns: Имена столбцов матрицы.
+            pairs: Пары номеров столбцов, для которых оценивается корреляция.
+            regression_pair: Пара (зависимая, независимая) для коэффициентов линейной регрессии.
+            confidence: Уровень доверия границ.
+        """
+        self.values = values
+        self.columns = columns
+        # Совместные моменты хранятся для неупорядоченных пар (меньший номер первым)
+        self.pairs = [tuple(sorted(pair)) for pair in pairs]
+        self.regression_pair = regression_pair
+        if regression_pair is not None and tuple(sorted(regression_pair)) not in self.pairs:
+            self.pairs.append(tuple(sorted(regression_pair)))
+        self.confidence = confidence
+
+        finite = ~np.isnan(values)
+        # Объем генеральной совокупности для поправки на конечность: непустые значения столбца или пары
+        self.column_population = finite.sum(axis=0)
+        self.pair_population = {pair: int((finite[:, pair[0]] & finite[:, pair[1]]).sum()) for pair in self.pairs}
+
+        n_columns = values.shape[1]
+        self.count = np.zeros(n_columns)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.sorted_values = [np.empty(0) for _ in range(n_columns)]
+        # Для пары: [n, mean_x, mean_y, C_xx, C_yy, C_xy]
+        self.pair_moments = {pair: np.zeros(6) for pair in self.pairs}
+
+    def update(self, rows: np.ndarray):
+        """Добавляет к оценкам блок строк с номерами rows."""
+        block = self.values[rows]
+        finite = ~np.isnan(block)
+        n_b = finite.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_b = np.where(n_b > 0, np.nansum(block, axis=0) / np.maximum(n_b, 1), 0.0)
+        m2_b = np.nansum((block - mean_b) ** 2, axis=0)
+
+        n = self.count + n_b
+        delta = mean_b - self.mean
+        safe_n = np.maximum(n, 1)
+        self.mean = self.mean + delta * n_b / safe_n
+        self.m2 = self.m2 + m2_b + delta ** 2 * self.count * n_b / safe_n
+        self.count = n
+
+        for col in range(block.shape[1]):
+            column_block = block[finite[:, col], col]
+            if len(column_block):
+                # Сортировка слиянием находит две упорядоченные серии и объединяет их за линейное время
+                merged = np.concatenate([self.sorted_values[col], np.sort(column_block)])
+                self.sorted_values[col] = np.sort(merged, kind="stable")
+
+        for (x_col, y_col), moments in self.pair_moments.items():
+            mask = finite[:, x_col] & finite[:, y_col]
+            n_b = int(mask.sum())
+            if n_b == 0:
+                continue
+            x = block[mask, x_col]
+            y = block[mask, y_col]
+            mean_x, mean_y = x.mean(), y.mean()
+            dx_b, dy_b = x - mean_x, y - mean_y
+            n_a = moments[0]
+            n = n_a + n_b
+            dx, dy = mean_x - moments[1], mean_y - moments[2]
+            weight = n_a * n_b / n
+            moments[3] += float(dx_b @ dx_b) + dx * dx * weight
+            moments[4] += float(dy_b @ dy_b) + dy * dy * weight
+            moments[5] += float(dx_b @ dy_b) + dx * dy * weight
+            moments[1] += dx * n_b / n
+            moments[2] += dy * n_b / n
+            moments[0] = n
+
+    def estimates(self) -> List[Dict[str, Any]]:
+        """
+        Текущие оценки с стандартными ошибками и границами (с поправкой на конечную совокупность,
+        поэтому после обработки всех строк границы совпадают с оценками).
+
+        Returns:
+            Список словарей {"variable_name", "statistic", "estimate", "standard_error", "lower_bound", "upper_bound"}.
+        """
+        estimates = []
+        for col, col_name in enumerate(self.columns):
+            n = int(self.count[col])
+            if n < 2:
+                continue
+            fpc = finite_population_correction(n, int(self.column_population[col]))
+            std_dev = math.sqrt(self.m2[col] / (n - 1))
+            for estimate in moment_estimate_errors(n, float(self.mean[col]), std_dev, fpc, self.confidence):
+                estimates.append({"variable_name": col_name, **estimate})
+            for estimate in quantile_estimate_errors(self.sorted_values[col], fpc, self.confidence):
+                estimates.append({"variable_name": col_name, **estimate})
+
+        for pair, moments in self.pair_moments.items():
+            estimates.extend(self._pair_estimates(pair, moments))
+        return estimates
+
+    def _pair_estimates(self, pair: Tuple[int, int], moments: np.ndarray) -> List[Dict[str, Any]]:
+        """Корреляция (интервал через z-преобразование Фишера) и коэффициенты регрессии для пары столбцов."""
+        n, mean_x, mean_y, c_xx, c_yy, c_xy = moments
+        n = int(n)
+        if n < 4 or c_xx <= 0 or c_yy <= 0:
+            return []
+        x_name, y_name = self.columns[pair[0]], self.columns[pair[1]]
+        fpc = finite_population_correction(n, self.pair_population[pair])
+        z_crit = float(stats.norm.ppf(0.5 + self.confidence / 2.0))
+        estimates = []
+
+        r = float(np.clip(c_xy / math.sqrt(c_xx * c_yy), -1.0, 1.0))
+        fisher_z = math.atanh(min(max(r, -0.9999999), 0.9999999))
+        z_se = fpc / math.sqrt(n - 3)
+        estimates.append({"variable_name": f"{x_name}, {y_name}", "statistic": "correlation", "estimate": r,
+                          "standard_error": (1.0 - r ** 2) * z_se,
+                          "lower_bound": min(r, math.tanh(fisher_z - z_crit * z_se)),
+                          "upper_bound": max(r, math.tanh(fisher_z + z_crit * z_se))})
+
+        if self.regression_pair is not None and pair == tuple(sorted(self.regression_pair)):
+            # Регрессия зависимой переменной на независимую: при необходимости меняем роли столбцов пары
+            if self.regression_pair != pair:
+                x_name, y_name, mean_x, mean_y, c_xx, c_yy = y_name, x_name, mean_y, mean_x, c_yy, c_xx
+            # Теперь x - зависимая, y - независимая переменная
+            slope = c_xy / c_yy
+            intercept = mean_x - slope * mean_y
+            residual_variance = max(0.0, c_xx - slope * c_xy) / (n - 2)
+            t_crit = float(stats.t.ppf(0.5 + self.confidence / 2.0, n - 2))
+            slope_se = math.sqrt(residual_variance / c_yy) * fpc
+            intercept_se = math.sqrt(residual_variance * (1.0 / n + mean_y ** 2 / c_yy)) * fpc
+            name = f"{x_name} ~ {y_name}"
+            for statistic, value, se in (("intercept", intercept, intercept_se), ("slope", slope, slope_se)):
+                estimates.append({"variable_name": name, "statistic": statistic, "estimate": float(value),
+                                  "standard_error": float(se), "lower_bound": float(value - t_crit * se),
+                                  "upper_bound": float(value + t_crit * se)})
+        return estimates
+
+
+def progressive_estimates(df: pd.DataFrame, n_blocks: int = DEFAULT_PROGRESSIVE_BLOCKS,
+                          seed: int = DEFAULT_PROGRESSIVE_SEED, dependent_var: Optional[str] = None,
+                          independent_var: Optional[str] = None,
+                          confidence: float = 0.95) -> Iterator[Tuple[int, List[Dict[str, Any]], List[str]]]:
+    """
+    Онлайн-агрегация: обрабатывает строки блоками в случайном порядке и после каждого блока
+    возвращает уточненные оценки среднего, стандартного отклонения, квартилей, корреляций
+    и коэффициентов регрессии с сужающимися доверительными границами.
+    Генератор можно прекратить после любого блока (например, при отмене запроса клиентом).
+
+    Args:
+        df: Входной DataFrame.
+        n_blocks: Количество блоков (и обновлений оценок).
+        seed: Зерно случайного порядка строк.
+        dependent_var: Зависимая переменная регрессии (None - без регрессии).
+        independent_var: Независимая переменная регрессии.
+        confidence: Уровень доверия границ.
+
+    Returns:
+        Итератор кортежей (обработано строк, список оценок, логи обновления).
+    """
+    columns = df.select_dtypes(include=np.number).columns.tolist()
+    values = df[columns].to_numpy(dtype=float)
+    logs = [f"Online aggregation over {len(df)} rows and {len(columns)} numerical columns (seed {seed})"]
+
+    regression_pair = None
+    if dependent_var or independent_var:
+        if dependent_var in columns and independent_var in columns and dependent_var != independent_var:
+            regression_pair = (columns.index(dependent_var), columns.index(independent_var))
+        else:
+            logs.append(f"Warning: Regression variables '{dependent_var}' ~ '{independent_var}' are not two distinct "
+                        f"numerical columns, skipping regression coefficients")
+    correlation_columns = min(len(columns), MAX_CORRELATION_COLUMNS)
+    if len(columns) > MAX_CORRELATION_COLUMNS:
+        logs.append(f"Correlations estimated for the first {MAX_CORRELATION_COLUMNS} of {len(columns)} numerical columns")
+    pairs = [(i, j) for i in range(correlation_columns) for j in range(i + 1, correlation_columns)]
+
+    aggregator = OnlineAggregator(values, columns, pairs, regression_pair, confidence)
+    blocks = random_row_blocks(len(df), n_blocks, seed)
+    processed = 0
+    for index, rows in enumerate(blocks):
+        aggregator.update(rows)
+        processed += len(rows)
+        logs.append(f"Processed block {index + 1} of {len(blocks)}: {processed} of {len(df)} rows")
+        yield processed, aggregator.estimates(), logs
+        logs = []
@@ -0,0 +1,114 @@
+# python-server/analysis_modules/outliers.py
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Границы Тьюки: выбросы лежат дальше DEFAULT_IQR_MULTIPLIER * IQR от квартилей
+DEFAULT_IQR_MULTIPLIER = 1.5
+# Порог модуля z-оценки (x - среднее) / s
+DEFAULT_Z_THRESHOLD = 3.0
+# Порог модифицированной z-оценки Иглевича-Хоглина 0.6745 * (x - медиана) / MAD
+DEFAULT_MAD_THRESHOLD = 3.5
+# Квантиль 0.75 стандартного нормального распределения: MAD / 0.6745 оценивает стандартное отклонение
+MODIFIED_Z_FACTOR = 0.6745
+# Максимальное количество выбросов столбца, передаваемых вместе с номерами строк
+DEFAULT_MAX_OUTLIER_ROWS = 100
+
+
+def detect_outliers(df: pd.DataFrame, descriptives: List[Dict[str, Any]],
+                    max_rows: int = DEFAULT_MAX_OUTLIER_ROWS,
+                    iqr_multiplier: float = DEFAULT_IQR_MULTIPLIER,
+                    z_threshold: float = DEFAULT_Z_THRESHOLD,
+                    mad_threshold: float = DEFAULT_MAD_THRESHOLD) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Находит выбросы числовых столбцов тремя правилами: границы Тьюки по IQR, z-оценка и устойчивая
+    z-оценка по медианному абсолютному отклонению (MAD). Квартили, медиана, среднее и стандартное
+    отклонение берутся из уже вычисленных описательных статистик, а маски выбросов, количества, усы
+    диаграммы размаха и MAD вычисляются одним проходом по блоку (строки x столбцы) для всех столбцов.
+    Для каждого столбца возвращаются не больше max_rows выбросов по IQR, наиболее удаленных от границ,
+    чтобы клиент мог построить диаграмму размаха без передачи всего столбца.
+
+    Args:
+        df: Входной DataFrame.
+        descriptives: Словари calculate_descriptive_stats ("variable_name", "mean", "median", "std_dev", "q1", "q3").
+        max_rows: Максимальное количество передаваемых выбросов столбца.
+        iqr_multiplier: Множитель IQR для границ Тьюки.
+        z_threshold: Порог модуля z-оценки.
+        mad_threshold: Порог модуля модифицированной z-оценки.
+
+    Returns:
+        Кортеж:
+        - Список словарей по столбцам: границы и количества выбросов по каждому правилу, усы диаграммы
+          размаха (крайние значения внутри границ Тьюки), номера строк и значения выбросов по IQR.
+        - Список строк с логами обработки.
+    """
+    logs = []
+    descriptives = [stats for stats in descriptives if stats.get("variable_name") in df.columns]
+    if not descriptives:
+        logs.append("No numerical columns found for outlier detection.")
+        return [], logs
+
+    columns = [stats["variable_name"] for stats in descriptives]
+    summary = {key: np.array([stats.get(key, np.nan) for stats in descriptives], dtype=float)
+               for key in ("mean", "median", "std_dev", "q1", "q3")}
+    block = df[columns].to_numpy(dtype=float, na_value=np.nan, copy=True)
+    block[~np.isfinite(block)] = np.nan
+    finite = ~np.isnan(block)
+
+    iqr = summary["q3"] - summary["q1"]
+    lower_fence = summary["q1"] - iqr_multiplier * iqr
+    upper_fence = summary["q3"] + iqr_multiplier * iqr
+    z_margin = z_threshold * summary["std_dev"]
+    with np.errstate(invalid="ignore"):
+        # Сравнения с NaN ложны, поэтому пропуски не считаются выбросами
+        iqr_outliers = (block < lower_fence) | (block > upper_fence)
+        z_outliers = np.abs(block - summary["mean"]) > z_margin
+        absolute_deviation = np.abs(block - summary["median"])
+    mad = np.nanmedian(absolute_deviation, axis=0) if len(block) else np.full(len(columns), np.nan)
+    mad_margin = mad_threshold * mad / MODIFIED_Z_FACTOR
+    with np.errstate(invalid="ignore"):
+        # При MAD = 0 (больше половины значений равны медиане) модифицированная z-оценка не определена
+        mad_outliers = (absolute_deviation > mad_margin) & (mad_margin > 0)
+    inside = finite & ~iqr_outliers
+    lower_whisker = np.where(inside, block, np.inf).min(axis=0, initial=np.inf)
+    upper_whisker = np.where(inside, block, -np.inf).max(axis=0, initial=-np.inf)
+
+    iqr_counts = iqr_outliers.sum(axis=0)
+    z_counts = z_outliers.sum(axis=0)
+    mad_counts = mad_outliers.sum(axis=0)
+    row_labels = df.index.to_numpy() if pd.api.types.is_integer_dtype(df.index) else np.arange(len(df))
+
+    results = []
+    for col, col_name in enumerate(columns):
+        n_outliers = int(iqr_counts[col])
+        rows = np.flatnonzero(iqr_outliers[:, col])
+        if n_outliers > max_rows:
+            # Передаются выбросы, наиболее удаленные от ближайшей границы
+            values = block[rows, col]
+            distance = np.maximum(lower_fence[col] - values, values - upper_fence[col])
+            rows = np.sort(rows[np.argpartition(distance, n_outliers - max_rows)[n_outliers - max_rows:]])
+        has_whiskers = np.isfinite(lower_whisker[col])
+        results.append({
+            "variable_name": col_name,
+            "iqr_multiplier": iqr_multiplier,
+            "lower_fence": float(lower_fence[col]),
+            "upper_fence": float(upper_fence[col]),
+            "lower_whisker": float(lower_whisker[col]) if has_whiskers else np.nan,
+            "upper_whisker": float(upper_whisker[col]) if has_whiskers else np.nan,
+            "iqr_outlier_count": n_outliers,
+            "z_threshold": z_threshold,
+            "z_lower_bound": float(summary["mean"][col] - z_margin[col]),
+            "z_upper_bound": float(summary["mean"][col] + z_margin[col]),
+            "z_outlier_count": int(z_counts[col]),
+            "mad": float(mad[col]),
+            "mad_threshold": mad_threshold,
+            "mad_lower_bound": float(summary["median"][col] - mad_margin[col]) if mad_margin[col] > 0 else np.nan,
+            "mad_upper_bound": float(summary["median"][col] + mad_margin[col]) if mad_margin[col] > 0 else np.nan,
+            "mad_outlier_count": int(mad_counts[col]),
+            "outlier_rows": row_labels[rows].astype(np.int64).tolist(),
+            "outlier_values": block[rows, col].tolist(),
+        })
+    logs.append(f"Detected outliers in {len(columns)} numerical columns (IQR x{iqr_multiplier}, "
+                f"|z| > {z_threshold}, |modified z| > {mad_threshold}).")
+    return results, logs
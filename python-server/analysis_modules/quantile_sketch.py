@@ -0,0 +1,151 @@
+# python-server/analysis_modules/quantile_sketch.py
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+# Параметр точности скетча по умолчанию: ошибка ранга около 1.3% при памяти порядка 3k значений
+DEFAULT_SKETCH_K = 200
+MIN_SKETCH_K = 8
+# Емкость уровня уменьшается в CAPACITY_DECAY раз с каждым уровнем ниже верхнего, но не ниже MIN_CAPACITY
+CAPACITY_DECAY = 2.0 / 3.0
+MIN_CAPACITY = 8
+DEFAULT_SKETCH_SEED = 0
+# Значения добавляются в нижний уровень порциями: сортируется порция, а не весь переданный массив
+UPDATE_CHUNK_SIZE = 1 << 16
+
+
+def rank_error_bound(k: int) -> float:
+    """
+    Граница нормированной ошибки ранга одного квантиля KLL-скетча с параметром k
+    (эмпирическая формула Apache DataSketches, доверие 99%).
+    """
+    return 2.296 / k ** 0.9723
+
+
+class KLLSketch:
+    """
+    Скетч квантилей KLL (Karnin, Lang, Liberty): уровни-компакторы с весами 2^h. Переполненный уровень
+    сортируется, и каждое второе значение (со случайным сдвигом) переходит на следующий уровень с удвоенным весом.
+    Память ограничена O(k) значений независимо от объема данных, скетчи порций строк и рабочих процессов
+    объединяются поуровневым слиянием. Пока данные помещаются в нижний уровень, квантили точные.
+    """
+
+    def __init__(self, k: int = DEFAULT_SKETCH_K, seed: int = DEFAULT_SKETCH_SEED):
+        """
+        Args:
+            k: Параметр точности (ошибка ранга около 2.3 / k^0.97).
+            seed: Зерно выбора сдвига при сжатии уровней (результат воспроизводим).
+        """
+        self.k = max(MIN_SKETCH_K, int(k))
+        self.count = 0
+        self.min_value = np.inf
+        self.max_value = -np.inf
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(MIN_CAPACITY, int(np.ceil(self.k * CAPACITY_DECAY ** depth)))
+
+    def update(self, values: np.ndarray) -> None:
+        """
+        Добавляет значения (пропуски и бесконечности пропускаются). Значения добавляются порциями
+        по UPDATE_CHUNK_SIZE со сжатием после каждой, поэтому для целого столбца память ограничена
+        размером порции, а сортируются только порции.
+        """
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        if not len(values):
+            return
+        self.count += len(values)
+        self.min_value = min(self.min_value, float(values.min()))
+        self.max_value = max(self.max_value, float(values.max()))
+        for start in range(0, len(values), UPDATE_CHUNK_SIZE):
+            self.levels[0] = np.concatenate([self.levels[0], values[start:start + UPDATE_CHUNK_SIZE]])
+            self._compress()
+
+    def merge(self, other: "KLLSketch") -> None:
+        """
+        Добавляет к скетчу значения другого скетча (например, порции строк или рабочего процесса).
+
+        Raises:
+            ValueError: Если параметры точности скетчей различаются.
+        """
+        if other.k != self.k:
+            raise ValueError(f"Cannot merge a quantile sketch with k={other.k} into a sketch with k={self.k}")
+        if not other.count:
+            return
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, values in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], values])
+        self.count += other.count
+        self.min_value = min(self.min_value, other.min_value)
+        self.max_value = max(self.max_value, other.max_value)
+        self._compress()
+
+    def _compress(self) -> None:
+        """Сжимает переполненные уровни снизу вверх: половина отсортированных значений уровня переходит выше."""
+        level = 0
+        while level < len(self.levels):
+            values = self.levels[level]
+            if len(values) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                values = np.sort(values)
+                # При нечетном количестве одно значение остается на уровне
+                kept = values[len(values) - len(values) % 2:]
+                promoted = values[int(self._rng.integers(2)):len(values) - len(values) % 2:2]
+                self.levels[level] = kept
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    @property
+    def is_exact(self) -> bool:
+        """Скетч хранит все добавленные значения (сжатия не было)."""
+        return len(self.levels) == 1
+
+    def rank_error(self) -> float:
+        """Нормированная граница ошибки ранга квантилей (0 - квантили точные)."""
+        return 0.0 if self.is_exact else rank_error_bound(self.k)
+
+    def quantiles(self, probabilities: Sequence[float]) -> np.ndarray:
+        """
+        Квантили для вероятностей probabilities. Пока скетч точный, квантили совпадают с numpy.quantile
+        (медиана - с numpy.median); после сжатия возвращается значение, накопленный вес которого
+        впервые достигает p * count.
+        """
+        probabilities = np.clip(np.asarray(probabilities, dtype=float), 0.0, 1.0)
+        if not self.count:
+            return np.full(len(probabilities), np.nan)
+        if self.is_exact:
+            values = np.sort(self.levels[0])
+            result = np.quantile(values, probabilities)
+            result[probabilities == 0.5] = np.median(values)
+            return result
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(values), 2.0 ** level) for level, values in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+        indexes = np.searchsorted(cumulative, probabilities * self.count, side="left")
+        result = items[np.minimum(indexes, len(items) - 1)]
+        result[probabilities == 0.0] = self.min_value
+        result[probabilities == 1.0] = self.max_value
+        return result
+
+    def quantile_bounds(self, probabilities: Sequence[float]) -> Dict[str, np.ndarray]:
+        """
+        Квантили и значения на границах доверительного диапазона рангов p ± rank_error().
+
+        Returns:
+            Словарь массивов "estimate", "lower_bound", "upper_bound".
+        """
+        probabilities = np.asarray(probabilities, dtype=float)
+        error = self.rank_error()
+        return {
+            "estimate": self.quantiles(probabilities),
+            "lower_bound": self.quantiles(probabilities - error),
+            "upper_bound": self.quantiles(probabilities + error),
+        }
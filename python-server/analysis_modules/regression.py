@@ -3,12 +3,15 @@ import pandas as pd
 import numpy as np
 import statsmodels.api as sm
 from statsmodels.tools.sm_exceptions import PerfectSeparationError
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional
+from concurrent.futures import Executor, Future
 from scipy.optimize import curve_fit
 from scipy.signal import find_peaks
 import sys 
 from scipy import stats # <--- ВАЖНЫЙ ИМПОРТ
 import inspect
+from analysis_modules.downsampling import build_chart_points, DEFAULT_MAX_CHART_POINTS, DOWNSAMPLING_METHODS
+from analysis_modules.density import build_density, evaluate_curve, DENSITY_AGGREGATIONS, DEFAULT_DENSITY_BINS
 
 # Создаем классы для доменной модели, отдельно от protobuf
 class RegressionData:
@@ -24,6 +27,8 @@ class RegressionData:
         self.coefficients = []
         self.data_points = []
         self.residuals = []  # Остатки регрессии для анализа нормальности
+        self.fitted_curve = []  # Значения модели на фиксированной сетке по X (режим агрегации)
+        self.density = {}  # Агрегированная плотность точек пары (режим агрегации)
 
 class RegressionCoefficient:
     def __init__(self, variable_name="", coefficient=0.0, standard_error=0.0,
@@ -60,6 +65,10 @@ def sigmoid_func(x, a, b, c): # a=k (steepness), b=x0 (midpoint), c=L (max value
     z = np.clip(z, -709, 709) # clip to avoid overflow in exp
     return c / (1 + np.exp(z))
 
+# Минимальный размер выборки, начиная с которого модели подгоняются в пуле процессов:
+# на малых выборках передача данных в процессы дороже самой подгонки
+DEFAULT_PARALLEL_FIT_MIN_POINTS = 5000
+
 regression_types = [
     ("Power", power_func, 2),
     ("Logarithmic", log_func, 2),
@@ -102,7 +111,256 @@ def estimate_dominant_frequency(x_data: np.ndarray, y_data: np.ndarray, min_poin
     dominant_freq = freq[positive_freq_indices[dominant_peak_index_in_amplitudes]]
     return dominant_freq
 
-def perform_simple_linear_regression(df: pd.DataFrame, dependent_var: str = None, independent_var: str = None) -> Tuple[List[RegressionData], List[str]]:
+def fit_curve_model(reg_type: str, func, n_params: int, x_data: np.ndarray, y_data: np.ndarray,
+                    x_col_name: str, y_col_name: str, ss_total_for_pair: float, log_prefix: str = "",
+                    curve_range: Optional[Tuple[float, float]] = None,
+                    max_restarts: Optional[int] = None) -> Tuple[Optional[RegressionData], List[str], Optional[str]]:
+    """
+    Подгоняет одну модель методом curve_fit и вычисляет ее статистики.
+    Функция верхнего уровня без общего состояния, поэтому может выполняться в отдельном процессе.
+
+    Args:
+        reg_type: Название модели ("Power", "Sigmoid", "Linear (curve_fit)" и т.д.).
+        func: Функция модели.
+        n_params: Количество параметров модели.
+        x_data: Значения независимой переменной.
+        y_data: Значения зависимой переменной.
+        x_col_name: Имя независимой переменной.
+        y_col_name: Имя зависимой переменной.
+        ss_total_for_pair: Общая сумма квадратов для Y.
+        log_prefix: Префикс записей журнала.
+        curve_range: Диапазон X для кривой модели на фиксированной сетке (режим агрегации) или None.
+        max_restarts: Максимальное количество повторных подгонок с другими начальными значениями
+                      (None - все варианты, 0 - только одна подгонка).
+
+    Returns:
+        Кортеж (результат или None, логи, запись журнала об успешной подгонке или None).
+    """
+    logs = []
+    is_linear_curve_fit = (reg_type == "Linear (curve_fit)")
+    current_n_params = n_params
+    n_valid = len(x_data)
+
+    try:
+        p0 = np.ones(current_n_params)
+        bounds = (-np.inf, np.inf)
+        method_for_curve_fit = 'lm' 
+        current_maxfev = 10000 * current_n_params 
+
+        if reg_type == "Trigonometric":
+            y_mean_trig = np.mean(y_data); y_amplitude_trig = (np.max(y_data) - np.min(y_data)) / 2.0
+            if y_amplitude_trig < 1e-6: y_amplitude_trig = 1.0
+            x_range_trig = np.max(x_data) - np.min(x_data)
+            b_initial_trig = (2 * np.pi) / x_range_trig if x_range_trig > 1e-6 else np.pi
+            dominant_freq_est = estimate_dominant_frequency(x_data, y_data)
+            if dominant_freq_est is not None and dominant_freq_est > 1e-6:
+                b_fft_est = 2 * np.pi * dominant_freq_est
+                if 1e-3 < b_fft_est < 1000: b_initial_trig = b_fft_est
+            b_low_trig = max(1e-3, (2 * np.pi) / (x_range_trig * 20)) if x_range_trig > 1e-6 else 1e-3
+            b_high_trig = min(1000, (2 * np.pi * (n_valid / 2)) / x_range_trig) if x_range_trig > 1e-6 else 1000
+            if b_low_trig >= b_high_trig : b_low_trig = 1e-3; b_high_trig = max(b_low_trig*10, 100.0)
+            b_initial_trig = np.clip(b_initial_trig, b_low_trig, b_high_trig)
+            p0 = [y_amplitude_trig, b_initial_trig, 0.0, y_mean_trig]
+            bounds = ([1e-9, b_low_trig, -np.pi, -np.inf], [np.inf, b_high_trig, np.pi, np.inf])
+            method_for_curve_fit = 'trf'; current_maxfev = max(current_maxfev, 30000 * current_n_params)
+
+            if reg_type == "Sigmoid":
+                y_min_s, y_max_s = np.min(y_data), np.max(y_data)
+                x_min_s, x_max_s = np.min(x_data), np.max(x_data)
+                l_param0 = y_max_s
+                if abs(y_max_s - y_min_s) < 1e-6: l_param0 = y_max_s + 1.0 if abs(y_max_s) < 1e-6 else y_max_s
+                x0_0 = np.median(x_data)
+                k0_val = 1.0
+                y_range_s = y_max_s - y_min_s; x_range_s = x_max_s - x_min_s
+                try:
+                    if x_range_s > 1e-6 and y_range_s > 1e-6:
+                        # Улучшенная оценка начального наклона
+                        mid_y = y_min_s + y_range_s * 0.5
+                        mid_indices = np.argsort(np.abs(y_data - mid_y))[:max(3, n_valid // 5)]
+                        if len(mid_indices) >= 3:
+                            mid_x = x_data[mid_indices]
+                            mid_y_actual = y_data[mid_indices]
+                            slope_mid = np.polyfit(mid_x, mid_y_actual, 1)[0]
+                            k0_val = 4 * slope_mid / l_param0 if abs(l_param0) > 1e-6 else slope_mid
+                            p0 = [k0_val, x0_0, l_param0]
+                except (np.linalg.LinAlgError, ValueError):
+                    # Если расчеты не удались, p0 остается [1.0, median(x), max(y)]
+                    pass
+
+        if reg_type == "Linear (curve_fit)":
+            slope_init = (np.mean(y_data*x_data) - np.mean(y_data)*np.mean(x_data)) / (np.mean(x_data**2) - np.mean(x_data)**2) if np.var(x_data)>1e-9 else 1.0
+            if np.isnan(slope_init) or np.isinf(slope_init): slope_init = 1.0
+            intercept_init = np.mean(y_data) - slope_init*np.mean(x_data)
+            if np.isnan(intercept_init) or np.isinf(intercept_init): intercept_init = 0.0
+            p0 = [slope_init, intercept_init]
+
+            if reg_type in ["Power", "Logarithmic"] and np.any(x_data <= 1e-9):
+                logs.append(log_prefix + f"Skipped {reg_type} (non-positive X values).")
+                return None, logs, None
+
+        params, pcov = curve_fit(func, x_data, y_data, p0=p0, bounds=bounds, method=method_for_curve_fit, maxfev=current_maxfev, check_finite=True, ftol=1e-7, xtol=1e-7, gtol=1e-7)
+        
+        valid_covariance = False
+        diag_pcov_elements = np.array([np.nan] * current_n_params) 
+        if pcov is not None and not np.any(np.isinf(pcov)) and not np.any(np.isnan(pcov)):
+            try:
+                diag_pcov_raw = np.diag(pcov)
+                valid_indices = ~np.isinf(diag_pcov_raw) & ~np.isnan(diag_pcov_raw)
+                if np.all(diag_pcov_raw[valid_indices] >= -1e-9): 
+                    diag_pcov_elements = np.where(valid_indices, diag_pcov_raw, np.nan)
+                    diag_pcov_elements[diag_pcov_elements < 0] = 0 
+                    valid_covariance = not np.all(np.isnan(diag_pcov_elements)) 
+            except Exception as e_cov: 
+                logs.append(log_prefix + f"Warning: Could not extract covariance diagonal: {e_cov}")
+        else:
+            # Если ковариация не может быть оценена, логируем это
+            if pcov is None:
+                logs.append(log_prefix + f"Warning: Covariance matrix is None for {reg_type} model.")
+            elif np.any(np.isinf(pcov)):
+                logs.append(log_prefix + f"Warning: Infinite values in covariance matrix for {reg_type} model.")
+            elif np.any(np.isnan(pcov)):
+                logs.append(log_prefix + f"Warning: NaN values in covariance matrix for {reg_type} model.")
+            
+            # Для сигмоидной модели это частая проблема, попробуем улучшить оценку
+            if reg_type == "Sigmoid" and not valid_covariance and max_restarts != 0:
+                logs.append(log_prefix + f"Attempting to improve Sigmoid model fit with different initial values.")
+                # Пробуем альтернативные начальные значения
+                try:
+                    # Пробуем несколько разных начальных значений для k
+                    k_factors = [0.5, 2.0, 0.1, 10.0]
+                    if max_restarts is not None:
+                        k_factors = k_factors[:max_restarts]
+                    for k_factor in k_factors:
+                        alt_p0 = [p0[0] * k_factor, p0[1], p0[2]]
+                        try:
+                            alt_params, alt_pcov = curve_fit(func, x_data, y_data, p0=alt_p0, bounds=bounds, 
+                                                            method=method_for_curve_fit, maxfev=current_maxfev)
+                            if alt_pcov is not None and not np.any(np.isinf(alt_pcov)) and not np.any(np.isnan(alt_pcov)):
+                                params, pcov = alt_params, alt_pcov
+                                logs.append(log_prefix + f"Found better initial values with k_factor={k_factor}")
+                                break
+                        except:
+                            continue
+                except Exception as alt_e:
+                    logs.append(log_prefix + f"Alternative fitting attempt failed: {alt_e}")
+
+        y_pred = func(x_data, *params)
+        r_squared_val = calculate_r_squared(y_data, y_pred)
+        sse_val = calculate_sse(y_data, y_pred)
+        
+        adj_r_squared_val = np.nan
+        if pd.notna(r_squared_val) and n_valid > current_n_params : 
+            if (n_valid - current_n_params -1) > 0 : 
+                 adj_r_squared_val = 1 - (1 - r_squared_val) * (n_valid - 1) / (n_valid - current_n_params - 1)
+            elif n_valid > current_n_params:
+                adj_r_squared_val = r_squared_val 
+
+        f_statistic_val, prob_f_statistic_val = np.nan, np.nan
+        
+        # F-статистика теперь вычисляется для всех моделей, если это возможно
+        if pd.notna(sse_val) and ss_total_for_pair > 1e-12 and n_valid > current_n_params:
+            df_model_cf = current_n_params - 1
+            df_error_cf = n_valid - current_n_params 
+            if df_error_cf > 0 and df_model_cf > 0: 
+                ss_model_cf = ss_total_for_pair - sse_val
+                if ss_model_cf < 0: ss_model_cf = 0 
+                ms_model_cf = ss_model_cf / df_model_cf
+                ms_error_cf = sse_val / df_error_cf
+                if ms_error_cf > 1e-12: 
+                    f_statistic_val = ms_model_cf / ms_error_cf
+                    if f_statistic_val < 0: f_statistic_val = 0.0 
+                    try: prob_f_statistic_val = stats.f.sf(f_statistic_val, df_model_cf, df_error_cf)
+                    except (ValueError, FloatingPointError): prob_f_statistic_val = np.nan
+                elif sse_val <= 1e-12 : 
+                    f_statistic_val = np.inf if ss_model_cf > 1e-12 else 0.0
+                    prob_f_statistic_val = 0.0 if ss_model_cf > 1e-12 else 1.0
+        
+        # Вычисление t-статистики и доверительных интервалов
+        coefficients = []
+        pcov_is_valid = pcov is not None and not np.any(np.isinf(pcov)) and not np.any(np.isnan(pcov))
+
+        try:
+            if not pcov_is_valid:
+                raise ValueError("Covariance matrix could not be estimated.")
+
+            # Стандартные ошибки
+            perr = np.sqrt(np.diag(pcov))
+            
+            # Степени свободы
+            dof = n_valid - len(params)
+            if dof <= 0:
+                raise ValueError("Degrees of freedom must be > 0")
+
+            # t-статистика и p-значения
+            t_stats_vals = params / perr
+            p_values_vals = 2 * stats.t.sf(np.abs(t_stats_vals), dof)
+
+            # Доверительный интервал (95%)
+            alpha = 0.05
+            t_crit_val = stats.t.ppf(1.0 - alpha / 2.0, dof)
+            ci_lower_vals = params - t_crit_val * perr
+            ci_upper_vals = params + t_crit_val * perr
+            
+            # Получаем имена параметров из сигнатуры функции
+            if is_linear_curve_fit:
+                # Для линейной модели, подогнанной через curve_fit, имена "a" и "b" нужно заменить
+                # на имя независимой переменной и "const" для совместимости с фронтендом.
+                # linear_func(x, a, b) -> a=slope, b=intercept.
+                param_names_list = [x_col_name, 'const']
+            else:
+                param_names_list = list(inspect.signature(func).parameters.keys())[1:] # Пропускаем 'x'
+
+            for i, param_name in enumerate(param_names_list):
+                coefficients.append(RegressionCoefficient(
+                    variable_name=param_name,
+                    coefficient=float(params[i]),
+                    standard_error=float(perr[i]),
+                    t_statistic=float(t_stats_vals[i]),
+                    p_value=float(p_values_vals[i]),
+                    ci_lower=float(ci_lower_vals[i]),
+                    ci_upper=float(ci_upper_vals[i])
+                ))
+        except (RuntimeWarning, ValueError, np.linalg.LinAlgError) as stat_err:
+             logs.append(log_prefix + f"Stats calculation for {reg_type} failed: {stat_err}. Storing coefficients only.")
+             # Если расчет статистики не удался, сохраняем только коэффициенты
+             param_names_list = list(inspect.signature(func).parameters.keys())[1:]
+             for i, param_name in enumerate(param_names_list):
+                coefficients.append(RegressionCoefficient(variable_name=param_name, coefficient=float(params[i])))
+
+        final_model_type_name = "Linear" if is_linear_curve_fit else reg_type
+
+        regression_result_cf = RegressionData()
+        regression_result_cf.model_type = final_model_type_name
+        regression_result_cf.dependent_variable = y_col_name
+        regression_result_cf.independent_variables = [x_col_name]
+        regression_result_cf.r_squared = float(r_squared_val) if pd.notna(r_squared_val) else 0.0
+        regression_result_cf.adjusted_r_squared = float(adj_r_squared_val) if pd.notna(adj_r_squared_val) else 0.0
+        regression_result_cf.f_statistic = float(f_statistic_val) if pd.notna(f_statistic_val) else 0.0
+        regression_result_cf.prob_f_statistic = float(prob_f_statistic_val) if pd.notna(prob_f_statistic_val) else 1.0
+        regression_result_cf.sse = float(sse_val) if pd.notna(sse_val) else 0.0
+        regression_result_cf.coefficients = coefficients
+        if curve_range is not None:
+            regression_result_cf.fitted_curve = evaluate_curve(func, params, *curve_range)
+        regression_result_cf.residuals = (y_data - y_pred).tolist()
+        return regression_result_cf, logs, log_prefix + f"{reg_type} model fitted. R²={r_squared_val:.4f}, F={f_statistic_val:.2f} (p={prob_f_statistic_val:.3g})"
+
+    except RuntimeError as rte_cf: 
+        logs.append(log_prefix + f"Skipped {reg_type} (RuntimeError: {rte_cf}).")
+    except ValueError as ve_cf:
+        logs.append(log_prefix + f"Skipped {reg_type} (ValueError: {ve_cf}).")
+    except Exception as e_cf_model: 
+        logs.append(log_prefix + f"Skipped {reg_type} (Unexpected error: {e_cf_model}). Details: {str(e_cf_model)}")
+    return None, logs, None
+
+def perform_simple_linear_regression(df: pd.DataFrame, dependent_var: str = None, independent_var: str = None,
+                                     max_points: int = DEFAULT_MAX_CHART_POINTS,
+                                     downsample_method: str = "lttb",
+                                     aggregation: str = None,
+                                     aggregation_bins: int = DEFAULT_DENSITY_BINS,
+                                     executor: Optional[Executor] = None,
+                                     parallel_min_points: int = DEFAULT_PARALLEL_FIT_MIN_POINTS,
+                                     linear_only: bool = False,
+                                     max_fit_restarts: Optional[int] = None) -> Tuple[List[RegressionData], List[str]]:
     logs = []
     results_list = []
     numerical_cols = df.select_dtypes(include=np.number).columns.tolist()
@@ -112,6 +370,14 @@ def perform_simple_linear_regression(df: pd.DataFrame, dependent_var: str = None
         logs.append("Skipping regression analysis: Need at least 2 numerical columns.")
         return [], logs
 
+    if downsample_method not in DOWNSAMPLING_METHODS:
+        logs.append(f"Unknown chart downsampling method '{downsample_method}', using 'lttb'.")
+        downsample_method = "lttb"
+
+    if aggregation is not None and aggregation not in DENSITY_AGGREGATIONS:
+        logs.append(f"Unknown scatter aggregation '{aggregation}', sending scatter points instead.")
+        aggregation = None
+
     if dependent_var is not None and independent_var is not None:
         if dependent_var not in df.columns or independent_var not in df.columns or \
            dependent_var not in numerical_cols or independent_var not in numerical_cols:
@@ -141,6 +407,19 @@ def perform_simple_linear_regression(df: pd.DataFrame, dependent_var: str = None
             continue
 
         all_models_for_pair = []
+        # Точки для графика строятся один раз на пару и разделяются всеми моделями.
+        # Статистики моделей при этом считаются по полным данным.
+        # В режиме агрегации вместо точек отправляется сетка частот и кривые моделей на фиксированной сетке
+        density = {}
+        if aggregation is not None:
+            data_points = []
+            density = build_density(x_data, y_data, kind=aggregation, bins=aggregation_bins)
+            logs.append(log_prefix + f"Chart data aggregated ({aggregation}, {density['x_bins']}x{density['y_bins']} bins).")
+        else:
+            data_points = build_chart_points(x_data, y_data, max_points=max_points, method=downsample_method)
+            if len(data_points) < n_valid:
+                logs.append(log_prefix + f"Chart data downsampled ({downsample_method}): {len(data_points)} of {n_valid} points.")
+        curve_range = (float(np.min(x_data)), float(np.max(x_data))) if aggregation is not None else None
         ss_total_for_pair = np.sum((y_data - np.mean(y_data))**2)
         if ss_total_for_pair < 1e-12: 
             logs.append(log_prefix + f"Skipped (near zero variance in dependent variable Y).")
@@ -177,7 +456,12 @@ def perform_simple_linear_regression(df: pd.DataFrame, dependent_var: str = None
                 regression_result.prob_f_statistic = float(results.f_pvalue)
                 regression_result.sse = float(results.ssr)
                 regression_result.coefficients = coefficients
-                regression_result.data_points = [{"x": float(xv), "y": float(yv)} for xv, yv in zip(x_data, y_data)]
+                regression_result.data_points = data_points
+                if aggregation is not None:
+                    regression_result.density = density
+                    regression_result.fitted_curve = evaluate_curve(
+                        linear_func, [float(results.params[1]), float(results.params[0])], *curve_range
+                    )
                 y_pred_ols = results.predict(x_data_with_const)
                 regression_result.residuals = (y_data - y_pred_ols).tolist()
                 all_models_for_pair.append(regression_result)
@@ -193,232 +477,42 @@ def perform_simple_linear_regression(df: pd.DataFrame, dependent_var: str = None
 
         # 2. Нелинейные регрессии и линейная через curve_fit
         models_to_try_cf = regression_types 
+        if linear_only:
+            # Упрощенный вариант: только линейная модель (через curve_fit, если OLS не удалась)
+            models_to_try_cf = []
         if not any(m.model_type == "Linear" for m in all_models_for_pair):
             models_to_try_cf = [("Linear (curve_fit)", linear_func, 2)] + models_to_try_cf
         
-        for reg_type_tuple_cf in models_to_try_cf:
-            reg_type, func, n_params_in_signature = reg_type_tuple_cf
-            is_linear_curve_fit = (reg_type == "Linear (curve_fit)")
-            current_n_params = n_params_in_signature
-            
-            if n_valid <= current_n_params: 
-                logs.append(log_prefix + f"Skipped {reg_type} (insufficient data: n={n_valid} <= n_params={current_n_params}).")
+        fit_jobs = []
+        for reg_type, func, n_params_in_signature in models_to_try_cf:
+            if n_valid <= n_params_in_signature: 
+                fit_jobs.append(log_prefix + f"Skipped {reg_type} (insufficient data: n={n_valid} <= n_params={n_params_in_signature}).")
                 continue
-            
-            try:
-                p0 = np.ones(current_n_params)
-                bounds = (-np.inf, np.inf)
-                method_for_curve_fit = 'lm' 
-                current_maxfev = 10000 * current_n_params 
-
-                if reg_type == "Trigonometric":
-                    y_mean_trig = np.mean(y_data); y_amplitude_trig = (np.max(y_data) - np.min(y_data)) / 2.0
-                    if y_amplitude_trig < 1e-6: y_amplitude_trig = 1.0
-                    x_range_trig = np.max(x_data) - np.min(x_data)
-                    b_initial_trig = (2 * np.pi) / x_range_trig if x_range_trig > 1e-6 else np.pi
-                    dominant_freq_est = estimate_dominant_frequency(x_data, y_data)
-                    if dominant_freq_est is not None and dominant_freq_est > 1e-6:
-                        b_fft_est = 2 * np.pi * dominant_freq_est
-                        if 1e-3 < b_fft_est < 1000: b_initial_trig = b_fft_est
-                    b_low_trig = max(1e-3, (2 * np.pi) / (x_range_trig * 20)) if x_range_trig > 1e-6 else 1e-3
-                    b_high_trig = min(1000, (2 * np.pi * (n_valid / 2)) / x_range_trig) if x_range_trig > 1e-6 else 1000
-                    if b_low_trig >= b_high_trig : b_low_trig = 1e-3; b_high_trig = max(b_low_trig*10, 100.0)
-                    b_initial_trig = np.clip(b_initial_trig, b_low_trig, b_high_trig)
-                    p0 = [y_amplitude_trig, b_initial_trig, 0.0, y_mean_trig]
-                    bounds = ([1e-9, b_low_trig, -np.pi, -np.inf], [np.inf, b_high_trig, np.pi, np.inf])
-                    method_for_curve_fit = 'trf'; current_maxfev = max(current_maxfev, 30000 * current_n_params)
-
-                    if reg_type == "Sigmoid":
-                        y_min_s, y_max_s = np.min(y_data), np.max(y_data)
-                        x_min_s, x_max_s = np.min(x_data), np.max(x_data)
-                        l_param0 = y_max_s
-                        if abs(y_max_s - y_min_s) < 1e-6: l_param0 = y_max_s + 1.0 if abs(y_max_s) < 1e-6 else y_max_s
-                        x0_0 = np.median(x_data)
-                        k0_val = 1.0
-                        y_range_s = y_max_s - y_min_s; x_range_s = x_max_s - x_min_s
-                        try:
-                            if x_range_s > 1e-6 and y_range_s > 1e-6:
-                                # Улучшенная оценка начального наклона
-                                mid_y = y_min_s + y_range_s * 0.5
-                                mid_indices = np.argsort(np.abs(y_data - mid_y))[:max(3, n_valid // 5)]
-                                if len(mid_indices) >= 3:
-                                    mid_x = x_data[mid_indices]
-                                    mid_y_actual = y_data[mid_indices]
-                                    slope_mid = np.polyfit(mid_x, mid_y_actual, 1)[0]
-                                    k0_val = 4 * slope_mid / l_param0 if abs(l_param0) > 1e-6 else slope_mid
-                                    p0 = [k0_val, x0_0, l_param0]
-                        except (np.linalg.LinAlgError, ValueError):
-                            # Если расчеты не удались, p0 остается [1.0, median(x), max(y)]
-                            pass
-
-                if reg_type == "Linear (curve_fit)":
-                    slope_init = (np.mean(y_data*x_data) - np.mean(y_data)*np.mean(x_data)) / (np.mean(x_data**2) - np.mean(x_data)**2) if np.var(x_data)>1e-9 else 1.0
-                    if np.isnan(slope_init) or np.isinf(slope_init): slope_init = 1.0
-                    intercept_init = np.mean(y_data) - slope_init*np.mean(x_data)
-                    if np.isnan(intercept_init) or np.isinf(intercept_init): intercept_init = 0.0
-                    p0 = [slope_init, intercept_init]
-
-                    if reg_type in ["Power", "Logarithmic"] and np.any(x_data <= 1e-9):
-                        logs.append(log_prefix + f"Skipped {reg_type} (non-positive X values).")
-                        continue
-
-                params, pcov = curve_fit(func, x_data, y_data, p0=p0, bounds=bounds, method=method_for_curve_fit, maxfev=current_maxfev, check_finite=True, ftol=1e-7, xtol=1e-7, gtol=1e-7)
-                
-                valid_covariance = False
-                diag_pcov_elements = np.array([np.nan] * current_n_params) 
-                if pcov is not None and not np.any(np.isinf(pcov)) and not np.any(np.isnan(pcov)):
-                    try:
-                        diag_pcov_raw = np.diag(pcov)
-                        valid_indices = ~np.isinf(diag_pcov_raw) & ~np.isnan(diag_pcov_raw)
-                        if np.all(diag_pcov_raw[valid_indices] >= -1e-9): 
-                            diag_pcov_elements = np.where(valid_indices, diag_pcov_raw, np.nan)
-                            diag_pcov_elements[diag_pcov_elements < 0] = 0 
-                            valid_covariance = not np.all(np.isnan(diag_pcov_elements)) 
-                    except Exception as e_cov: 
-                        logs.append(log_prefix + f"Warning: Could not extract covariance diagonal: {e_cov}")
-                else:
-                    # Если ковариация не может быть оценена, логируем это
-                    if pcov is None:
-                        logs.append(log_prefix + f"Warning: Covariance matrix is None for {reg_type} model.")
-                    elif np.any(np.isinf(pcov)):
-                        logs.append(log_prefix + f"Warning: Infinite values in covariance matrix for {reg_type} model.")
-                    elif np.any(np.isnan(pcov)):
-                        logs.append(log_prefix + f"Warning: NaN values in covariance matrix for {reg_type} model.")
-                    
-                    # Для сигмоидной модели это частая проблема, попробуем улучшить оценку
-                    if reg_type == "Sigmoid" and not valid_covariance:
-                        logs.append(log_prefix + f"Attempting to improve Sigmoid model fit with different initial values.")
-                        # Пробуем альтернативные начальные значения
-                        try:
-                            # Пробуем несколько разных начальных значений для k
-                            for k_factor in [0.5, 2.0, 0.1, 10.0]:
-                                alt_p0 = [p0[0] * k_factor, p0[1], p0[2]]
-                                try:
-                                    alt_params, alt_pcov = curve_fit(func, x_data, y_data, p0=alt_p0, bounds=bounds, 
-                                                                    method=method_for_curve_fit, maxfev=current_maxfev)
-                                    if alt_pcov is not None and not np.any(np.isinf(alt_pcov)) and not np.any(np.isnan(alt_pcov)):
-                                        params, pcov = alt_params, alt_pcov
-                                        logs.append(log_prefix + f"Found better initial values with k_factor={k_factor}")
-                                        break
-                                except:
-                                    continue
-                        except Exception as alt_e:
-                            logs.append(log_prefix + f"Alternative fitting attempt failed: {alt_e}")
-
-                y_pred = func(x_data, *params)
-                r_squared_val = calculate_r_squared(y_data, y_pred)
-                sse_val = calculate_sse(y_data, y_pred)
-                
-                adj_r_squared_val = np.nan
-                if pd.notna(r_squared_val) and n_valid > current_n_params : 
-                    if (n_valid - current_n_params -1) > 0 : 
-                         adj_r_squared_val = 1 - (1 - r_squared_val) * (n_valid - 1) / (n_valid - current_n_params - 1)
-                    elif n_valid > current_n_params:
-                        adj_r_squared_val = r_squared_val 
-
-                f_statistic_val, prob_f_statistic_val = np.nan, np.nan
-                
-                # F-статистика теперь вычисляется для всех моделей, если это возможно
-                if pd.notna(sse_val) and ss_total_for_pair > 1e-12 and n_valid > current_n_params:
-                    df_model_cf = current_n_params - 1
-                    df_error_cf = n_valid - current_n_params 
-                    if df_error_cf > 0 and df_model_cf > 0: 
-                        ss_model_cf = ss_total_for_pair - sse_val
-                        if ss_model_cf < 0: ss_model_cf = 0 
-                        ms_model_cf = ss_model_cf / df_model_cf
-                        ms_error_cf = sse_val / df_error_cf
-                        if ms_error_cf > 1e-12: 
-                            f_statistic_val = ms_model_cf / ms_error_cf
-                            if f_statistic_val < 0: f_statistic_val = 0.0 
-                            try: prob_f_statistic_val = stats.f.sf(f_statistic_val, df_model_cf, df_error_cf)
-                            except (ValueError, FloatingPointError): prob_f_statistic_val = np.nan
-                        elif sse_val <= 1e-12 : 
-                            f_statistic_val = np.inf if ss_model_cf > 1e-12 else 0.0
-                            prob_f_statistic_val = 0.0 if ss_model_cf > 1e-12 else 1.0
-                
-                # Вычисление t-статистики и доверительных интервалов
-                coefficients = []
-                pcov_is_valid = pcov is not None and not np.any(np.isinf(pcov)) and not np.any(np.isnan(pcov))
+            fit_args = (reg_type, func, n_params_in_signature, x_data, y_data, x_col_name, y_col_name,
+                        ss_total_for_pair, log_prefix, curve_range, max_fit_restarts)
+            # Крупные выборки подгоняются в пуле процессов параллельно, результаты собираются в исходном порядке моделей
+            if executor is not None and n_valid >= parallel_min_points:
+                fit_jobs.append(executor.submit(fit_curve_model, *fit_args))
+            else:
+                fit_jobs.append(fit_curve_model(*fit_args))
 
-                try:
-                    if not pcov_is_valid:
-                        raise ValueError("Covariance matrix could not be estimated.")
-
-                    # Стандартные ошибки
-                    perr = np.sqrt(np.diag(pcov))
-                    
-                    # Степени свободы
-                    dof = n_valid - len(params)
-                    if dof <= 0:
-                        raise ValueError("Degrees of freedom must be > 0")
-
-                    # t-статистика и p-значения
-                    t_stats_vals = params / perr
-                    p_values_vals = 2 * stats.t.sf(np.abs(t_stats_vals), dof)
-
-                    # Доверительный интервал (95%)
-                    alpha = 0.05
-                    t_crit_val = stats.t.ppf(1.0 - alpha / 2.0, dof)
-                    ci_lower_vals = params - t_crit_val * perr
-                    ci_upper_vals = params + t_crit_val * perr
-                    
-                    # Получаем имена параметров из сигнатуры функции
-                    if is_linear_curve_fit:
-                        # Для линейной модели, подогнанной через curve_fit, имена "a" и "b" нужно заменить
-                        # на имя независимой переменной и "const" для совместимости с фронтендом.
-                        # linear_func(x, a, b) -> a=slope, b=intercept.
-                        param_names_list = [x_col_name, 'const']
-                    else:
-                        param_names_list = list(inspect.signature(func).parameters.keys())[1:] # Пропускаем 'x'
-
-                    for i, param_name in enumerate(param_names_list):
-                        coefficients.append(RegressionCoefficient(
-                            variable_name=param_name,
-                            coefficient=float(params[i]),
-                            standard_error=float(perr[i]),
-                            t_statistic=float(t_stats_vals[i]),
-                            p_value=float(p_values_vals[i]),
-                            ci_lower=float(ci_lower_vals[i]),
-                            ci_upper=float(ci_upper_vals[i])
-                        ))
-                except (RuntimeWarning, ValueError, np.linalg.LinAlgError) as stat_err:
-                     logs.append(log_prefix + f"Stats calculation for {reg_type} failed: {stat_err}. Storing coefficients only.")
-                     # Если расчет статистики не удался, сохраняем только коэффициенты
-                     param_names_list = list(inspect.signature(func).parameters.keys())[1:]
-                     for i, param_name in enumerate(param_names_list):
-                        coefficients.append(RegressionCoefficient(variable_name=param_name, coefficient=float(params[i])))
-
-                final_model_type_name = "Linear" if is_linear_curve_fit else reg_type
-
-                regression_result_cf = RegressionData()
-                regression_result_cf.model_type = final_model_type_name
-                regression_result_cf.dependent_variable = y_col_name
-                regression_result_cf.independent_variables = [x_col_name]
-                regression_result_cf.r_squared = float(r_squared_val) if pd.notna(r_squared_val) else 0.0
-                regression_result_cf.adjusted_r_squared = float(adj_r_squared_val) if pd.notna(adj_r_squared_val) else 0.0
-                regression_result_cf.f_statistic = float(f_statistic_val) if pd.notna(f_statistic_val) else 0.0
-                regression_result_cf.prob_f_statistic = float(prob_f_statistic_val) if pd.notna(prob_f_statistic_val) else 1.0
-                regression_result_cf.sse = float(sse_val) if pd.notna(sse_val) else 0.0
-                regression_result_cf.coefficients = coefficients
-                regression_result_cf.data_points = [{"x": float(xv), "y": float(yv)} for xv, yv in zip(x_data, y_data)]
-                regression_result_cf.residuals = (y_data - y_pred).tolist()
-                
-                can_add_cf_model = True
-                if is_linear_curve_fit: 
-                    if any(m.model_type == "Linear" for m in all_models_for_pair): 
-                        can_add_cf_model = False 
-                        logs.append(log_prefix + "Skipping Linear (curve_fit) as OLS Linear model already exists.")
-                
-                if can_add_cf_model:
-                    all_models_for_pair.append(regression_result_cf)
-                    logs.append(log_prefix + f"{reg_type} model fitted. R²={r_squared_val:.4f}, F={f_statistic_val:.2f} (p={prob_f_statistic_val:.3g})")
-
-            except RuntimeError as rte_cf: 
-                logs.append(log_prefix + f"Skipped {reg_type} (RuntimeError: {rte_cf}).")
-            except ValueError as ve_cf:
-                logs.append(log_prefix + f"Skipped {reg_type} (ValueError: {ve_cf}).")
-            except Exception as e_cf_model: 
-                logs.append(log_prefix + f"Skipped {reg_type} (Unexpected error: {e_cf_model}). Details: {str(e_cf_model)}")
+        for job in fit_jobs:
+            if isinstance(job, str):
+                logs.append(job)
+                continue
+            regression_result_cf, model_logs, fitted_message = job.result() if isinstance(job, Future) else job
+            logs.extend(model_logs)
+            if regression_result_cf is None:
+                continue
+            regression_result_cf.data_points = data_points
+            if aggregation is not None:
+                regression_result_cf.density = density
+
+            if regression_result_cf.model_type == "Linear" and any(m.model_type == "Linear" for m in all_models_for_pair):
+                logs.append(log_prefix + "Skipping Linear (curve_fit) as OLS Linear model already exists.")
+                continue
+            all_models_for_pair.append(regression_result_cf)
+            logs.append(fitted_message)
 
         results_list.extend(all_models_for_pair)
 
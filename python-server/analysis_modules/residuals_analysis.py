@@ -1,7 +1,9 @@
 import pandas as pd
 import numpy as np
 from scipy import stats
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Union
+
+from analysis_modules.histogram_engine import StreamingHistogram
 
 def perform_residuals_normality_test(residuals: List[float], alpha: float = 0.05) -> Dict[str, Any]:
     """
@@ -55,13 +57,13 @@ def perform_residuals_normality_test(residuals: List[float], alpha: float = 0.05
             "conclusion": f"Error performing test: {str(e)}"
         }
 
-def generate_residuals_histogram_data(residuals: List[float], n_bins: int = 10) -> Dict[str, Any]:
+def generate_residuals_histogram_data(residuals: List[float], n_bins: Union[int, str] = 10) -> Dict[str, Any]:
     """
     Генерирует данные гистограммы для остатков регрессии.
     
     Args:
         residuals: Список остатков регрессии.
-        n_bins: Количество интервалов гистограммы.
+        n_bins: Количество интервалов гистограммы (0 - по правилу Стёрджеса) или правило из HISTOGRAM_BIN_RULES.
         
     Returns:
         Словарь с данными гистограммы.
@@ -74,11 +76,16 @@ def generate_residuals_histogram_data(residuals: List[float], n_bins: int = 10)
     
     try:
         # Определение количества интервалов по правилу Стёрджеса
-        if n_bins <= 0:
+        if not isinstance(n_bins, str) and n_bins <= 0:
             n_bins = int(np.ceil(1 + 3.322 * np.log10(len(residuals))))
         
-        # Вычисление гистограммы
-        hist, bin_edges = np.histogram(residuals, bins=n_bins)
+        # Вычисление гистограммы: интервалы по сводке остатков, затем один проход подсчета
+        values = np.asarray(residuals, dtype=float)
+        q1, q3 = np.percentile(values, [25, 75]) if n_bins in ("auto", "fd") else (0.0, 0.0)
+        histogram = StreamingHistogram.from_summary(n_bins, len(values), values.min(), values.max(),
+                                                    iqr=q3 - q1, std_dev=values.std(ddof=1))
+        histogram.update(values)
+        hist, bin_edges = histogram.result()
         
         return {
             "bins": bin_edges.tolist(),
@@ -0,0 +1,235 @@
+# python-server/analysis_modules/sampling.py
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+SAMPLING_METHODS = ("reservoir", "stratified")
+DEFAULT_SAMPLE_SEED = 0
+# Количество строк CSV, читаемых за один шаг при выборке
+SAMPLE_READ_CHUNK_ROWS = 100_000
+# Максимальное количество страт: при потоковой выборке хранится до sample_size строк каждой страты
+MAX_SAMPLE_STRATA = 100
+
+
+def _group_labels(groups: pd.Series) -> pd.Series:
+    """
+    Метки страт: значения столбца групп в виде строк (пропуски образуют отдельную страту "nan").
+    Целые значения получают одну метку независимо от типа столбца: в порции CSV с пропусками
+    pandas читает целые числа как float, и 1.0 должно попасть в ту же страту, что и 1.
+    """
+    labels = groups.astype(object)
+    if pd.api.types.is_float_dtype(groups):
+        values = groups.to_numpy(dtype=float, na_value=np.nan)
+        integral = np.isfinite(values) & (np.floor(values) == values) & (np.abs(values) < 2.0 ** 63)
+        labels[integral] = values[integral].astype(np.int64)
+    return labels.where(groups.notna(), "nan").astype(str)
+
+
+def _allocate_proportionally(strata_sizes: Dict[Any, int], sample_size: int) -> Dict[Any, int]:
+    """Пропорциональное размещение выборки по стратам методом наибольших остатков."""
+    population_size = sum(strata_sizes.values())
+    quotas = {group: sample_size * size / population_size for group, size in strata_sizes.items()}
+    allocation = {group: min(strata_sizes[group], int(math.floor(quota))) for group, quota in quotas.items()}
+    remainders = sorted(strata_sizes, key=lambda group: quotas[group] - math.floor(quotas[group]), reverse=True)
+    missing = sample_size - sum(allocation.values())
+    for group in remainders:
+        if missing <= 0:
+            break
+        if allocation[group] < strata_sizes[group]:
+            allocation[group] += 1
+            missing -= 1
+    return allocation
+
+
+def reservoir_sample(frames: Iterable[pd.DataFrame], sample_size: int, seed: int = DEFAULT_SAMPLE_SEED,
+                     stratify_by: Optional[str] = None) -> pd.DataFrame:
+    """
+    Формирует случайную выборку без возвращения за один проход по порциям строк.
+    Каждой строке назначается случайный ключ, и сохраняются строки с наименьшими ключами
+    (для стратифицированной выборки - не более sample_size строк каждой страты), поэтому в памяти
+    одновременно находятся только выборка и текущая порция. Для стратифицированной выборки
+    размер каждой страты в итоговой выборке пропорционален ее размеру в исходных данных.
+    Если страт больше MAX_SAMPLE_STRATA, стратификация отменяется и строится простая случайная
+    выборка (столбец записывается в df.attrs["sampling"]["rejected_stratify_by"]): сохраненные
+    строки содержат строки с наименьшими ключами, поэтому выборка совпадает с простой выборкой.
+
+    Args:
+        frames: Порции строк исходных данных (например, pandas.read_csv(..., chunksize=...)).
+        sample_size: Размер выборки.
+        seed: Зерно генератора случайных чисел (выборка воспроизводима).
+        stratify_by: Столбец групп для стратифицированной выборки или None.
+
+    Returns:
+        DataFrame выборки в исходном порядке строк. Если исходных строк не больше sample_size, возвращаются все строки.
+        В df.attrs["sampling"] записываются метод, размеры генеральной совокупности и выборки и размеры страт.
+    """
+    rng = np.random.default_rng(seed)
+    kept: Optional[pd.DataFrame] = None
+    kept_keys = np.empty(0)
+    population_size = 0
+    strata_sizes: Dict[Any, int] = {}
+    rejected_stratify_by = None
+
+    for chunk in frames:
+        if chunk.empty:
+            continue
+        chunk = chunk.set_axis(pd.RangeIndex(population_size, population_size + len(chunk)), axis=0)
+        population_size += len(chunk)
+        chunk_keys = rng.random(len(chunk))
+        candidates = chunk if kept is None else pd.concat([kept, chunk])
+        keys = np.concatenate([kept_keys, chunk_keys])
+
+        if stratify_by is not None:
+            for group, size in _group_labels(chunk[stratify_by]).value_counts().items():
+                strata_sizes[group] = strata_sizes.get(group, 0) + int(size)
+            if len(strata_sizes) > MAX_SAMPLE_STRATA:
+                rejected_stratify_by, stratify_by, strata_sizes = stratify_by, None, {}
+        if stratify_by is not None:
+            order = np.argsort(keys, kind="stable")
+            groups = _group_labels(candidates[stratify_by]).iloc[order]
+            ranks = groups.groupby(groups, sort=False).cumcount().to_numpy()
+            keep = np.sort(order[ranks < sample_size])
+        elif len(candidates) > sample_size:
+            keep = np.sort(np.argpartition(keys, sample_size - 1)[:sample_size])
+        else:
+            keep = np.arange(len(candidates))
+        kept = candidates.iloc[keep]
+        kept_keys = keys[keep]
+
+    if kept is None:
+        return pd.DataFrame()
+
+    strata = None
+    if stratify_by is not None:
+        allocation = _allocate_proportionally(strata_sizes, min(sample_size, population_size))
+        order = np.argsort(kept_keys, kind="stable")
+        groups = _group_labels(kept[stratify_by]).iloc[order]
+        ranks = groups.groupby(groups, sort=False).cumcount().to_numpy()
+        quota = groups.map(allocation).to_numpy()
+        kept = kept.iloc[np.sort(order[ranks < quota])]
+        strata = {group: {"population_size": strata_sizes[group], "sample_size": allocation[group]}
+                  for group in strata_sizes}
+
+    sample = kept.reset_index(drop=True)
+    sample.attrs["sampling"] = {
+        "method": "stratified" if stratify_by is not None else "reservoir",
+        "population_size": population_size,
+        "sample_size": len(sample),
+        "seed": seed,
+        "stratify_by": stratify_by,
+        "strata": strata,
+        "rejected_stratify_by": rejected_stratify_by,
+    }
+    return sample
+
+
+def finite_population_correction(sample_size: int, population_size: int) -> float:
+    """Множитель стандартной ошибки при выборке без возвращения: sqrt(1 - m/N)."""
+    if population_size <= 0 or sample_size >= population_size:
+        return 0.0
+    return math.sqrt(1.0 - sample_size / population_size)
+
+
+def _stratified_mean_error(values: pd.Series, groups: pd.Series, strata: Dict[str, Dict[str, int]]) -> float:
+    """Стандартная ошибка стратифицированной оценки среднего: sqrt(sum W_h^2 (1 - f_h) s_h^2 / m_h)."""
+    population_size = sum(stratum["population_size"] for stratum in strata.values())
+    variance = 0.0
+    for group, group_values in values.groupby(_group_labels(groups).loc[values.index]):
+        stratum = strata.get(group)
+        m_h = len(group_values)
+        # Страты с одним наблюдением не дают оценки дисперсии и не учитываются
+        if stratum is None or m_h < 2:
+            continue
+        weight = stratum["population_size"] / population_size
+        fpc = 1.0 - m_h / stratum["population_size"]
+        variance += weight ** 2 * fpc * group_values.var(ddof=1) / m_h
+    return math.sqrt(variance)
+
+
+def moment_estimate_errors(n: int, mean: float, std_dev: float, fpc: float, confidence: float = 0.95,
+                           mean_se: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    Стандартные ошибки и границы оценок среднего (t-интервал) и стандартного отклонения
+    (нормальное приближение s / sqrt(2(n-1))) по n наблюдениям выборки без возвращения.
+
+    Args:
+        n: Количество наблюдений в выборке.
+        mean: Выборочное среднее.
+        std_dev: Выборочное стандартное отклонение (ddof=1).
+        fpc: Поправка для конечной совокупности (множитель стандартной ошибки).
+        confidence: Уровень доверия границ.
+        mean_se: Стандартная ошибка среднего, если она вычислена иначе (например, по стратам).
+
+    Returns:
+        Список словарей {"statistic", "estimate", "standard_error", "lower_bound", "upper_bound"}.
+    """
+    z = float(stats.norm.ppf(0.5 + confidence / 2.0))
+    if mean_se is None:
+        mean_se = std_dev / math.sqrt(n) * fpc
+    t_crit = float(stats.t.ppf(0.5 + confidence / 2.0, n - 1))
+    std_se = std_dev / math.sqrt(2.0 * (n - 1)) * fpc
+    return [
+        {"statistic": "mean", "estimate": mean, "standard_error": mean_se,
+         "lower_bound": mean - t_crit * mean_se, "upper_bound": mean + t_crit * mean_se},
+        {"statistic": "std_dev", "estimate": std_dev, "standard_error": std_se,
+         "lower_bound": max(0.0, std_dev - z * std_se), "upper_bound": std_dev + z * std_se},
+    ]
+
+
+def quantile_estimate_errors(sorted_values: np.ndarray, fpc: float, confidence: float = 0.95) -> List[Dict[str, Any]]:
+    """
+    Оценки медианы и квартилей с непараметрическими границами по порядковым статистикам.
+
+    Args:
+        sorted_values: Отсортированные значения выборки (не менее двух).
+        fpc: Поправка для конечной совокупности.
+        confidence: Уровень доверия границ.
+
+    Returns:
+        Список словарей {"statistic", "estimate", "standard_error", "lower_bound", "upper_bound"} для q1, median, q3.
+    """
+    n = len(sorted_values)
+    z = float(stats.norm.ppf(0.5 + confidence / 2.0))
+    estimates = []
+    for name, p in (("q1", 0.25), ("median", 0.5), ("q3", 0.75)):
+        estimate = float(np.median(sorted_values)) if p == 0.5 else float(np.quantile(sorted_values, p))
+        half_width = z * math.sqrt(n * p * (1.0 - p)) * fpc
+        lower = float(sorted_values[max(0, int(math.floor(n * p - half_width)) - 1)])
+        upper = float(sorted_values[min(n - 1, int(math.ceil(n * p + half_width)))])
+        estimates.append({"statistic": name, "estimate": estimate, "standard_error": (upper - lower) / (2.0 * z),
+                          "lower_bound": min(lower, estimate), "upper_bound": max(upper, estimate)})
+    return estimates
+
+
+def sample_estimate_errors(values: pd.Series, sampling: Dict[str, Any], confidence: float = 0.95,
+                           groups: Optional[pd.Series] = None) -> List[Dict[str, Any]]:
+    """
+    Стандартные ошибки и границы оценок описательных статистик, вычисленных по выборке.
+    Для среднего используется t-интервал, для стандартного отклонения - нормальное приближение
+    s / sqrt(2(n-1)), для медианы и квартилей - непараметрические границы по порядковым статистикам.
+    Все ошибки умножаются на поправку для конечной совокупности sqrt(1 - m/N); для стратифицированной
+    выборки ошибка среднего вычисляется по стратам.
+
+    Args:
+        values: Значения столбца в выборке (без пропусков).
+        sampling: Описание выборки из df.attrs["sampling"].
+        confidence: Уровень доверия границ.
+        groups: Значения столбца страт для строк выборки (для стратифицированной выборки).
+
+    Returns:
+        Список словарей {"statistic", "estimate", "standard_error", "lower_bound", "upper_bound"}.
+    """
+    n = len(values)
+    if n < 2:
+        return []
+    fpc = finite_population_correction(sampling["sample_size"], sampling["population_size"])
+
+    mean_se = None
+    if groups is not None and sampling.get("strata"):
+        mean_se = _stratified_mean_error(values, groups, sampling["strata"])
+    estimates = moment_estimate_errors(n, float(values.mean()), float(values.std(ddof=1)), fpc, confidence, mean_se)
+    estimates.extend(quantile_estimate_errors(np.sort(values.to_numpy(dtype=float)), fpc, confidence))
+    return estimates
@@ -0,0 +1,215 @@
+# python-server/analysis_modules/weighted.py
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from analysis_modules.sampling import finite_population_correction
+
+
+def _weighted_block(df: pd.DataFrame, weight_column: str,
+                    logs: List[str]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Блок значений числовых столбцов (без столбца весов) и матрица весов той же формы:
+    вес пары (строка, столбец) равен весу строки, если значение конечно, и 0 иначе.
+    Строки с пропущенным, бесконечным или неположительным весом не учитываются.
+
+    Returns:
+        Кортеж (столбцы, значения с NaN на месте неучитываемых пар, веса).
+    """
+    numerical_cols = [col for col in df.select_dtypes(include=np.number).columns.tolist() if col != weight_column]
+    weights = pd.to_numeric(df[weight_column], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    valid_rows = np.isfinite(weights) & (weights > 0)
+    excluded = int(len(weights) - valid_rows.sum())
+    if excluded:
+        logs.append(f"Excluded {excluded} rows with a missing, non-finite or non-positive weight in '{weight_column}'.")
+    block = df[numerical_cols].to_numpy(dtype=float, na_value=np.nan, copy=True) if numerical_cols else np.empty((len(df), 0))
+    block[~np.isfinite(block) | ~valid_rows[:, None]] = np.nan
+    weight_block = np.where(np.isnan(block), 0.0, np.where(valid_rows, weights, 0.0)[:, None])
+    return numerical_cols, block, weight_block
+
+
+def _weighted_moments(block: np.ndarray, weight_block: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Взвешенные моменты всех столбцов блока одной операцией над матрицей:
+    сумма весов W, сумма квадратов весов, среднее, центральные взвешенные суммы степеней M2-M4,
+    эффективный объем выборки Киша W^2 / sum(w^2) и несмещенная дисперсия M2 / (W - sum(w^2) / W)
+    (для весов надежности; при единичных весах совпадает с дисперсией с ddof=1).
+    """
+    count = (weight_block > 0).sum(axis=0)
+    weight_sum = weight_block.sum(axis=0)
+    weight_square_sum = (weight_block * weight_block).sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(weight_block > 0, block * weight_block, 0.0).sum(axis=0) / weight_sum
+        deviations = np.where(weight_block > 0, block - mean, 0.0)
+        weighted_squares = weight_block * deviations * deviations
+        m2 = weighted_squares.sum(axis=0)
+        m3 = (weighted_squares * deviations).sum(axis=0)
+        m4 = (weighted_squares * deviations * deviations).sum(axis=0)
+        effective_size = weight_sum * weight_sum / weight_square_sum
+        denominator = weight_sum - weight_square_sum / weight_sum
+        variance = np.where(count > 1, m2 / denominator, np.nan)
+    return {
+        "count": count,
+        "weight_sum": weight_sum,
+        "mean": mean,
+        "m2": m2,
+        "m3": m3,
+        "m4": m4,
+        "effective_size": effective_size,
+        "variance": variance,
+    }
+
+
+def _weighted_quantiles(values: np.ndarray, weights: np.ndarray, probabilities: List[float]) -> np.ndarray:
+    """
+    Взвешенные квантили отсортированных значений с положительными весами. Каждому значению сопоставляется
+    середина его доли накопленного веса, отмасштабированная так, что первое значение имеет уровень 0,
+    а последнее - 1; квантиль находится линейной интерполяцией. При равных весах результат совпадает
+    с numpy.quantile (линейная интерполяция).
+    """
+    if len(values) == 1:
+        return np.full(len(probabilities), values[0])
+    midpoints = np.cumsum(weights) - weights / 2.0
+    first, last = midpoints[0], midpoints[-1]
+    return np.interp(probabilities, (midpoints - first) / (last - first), values)
+
+
+def calculate_weighted_descriptive_stats(df: pd.DataFrame, weight_column: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Вычисляет взвешенные описательные статистики числовых столбцов (веса строк - значения weight_column,
+    например веса наблюдений опроса). Моменты всех столбцов вычисляются одним блоком (строки x столбцы):
+    взвешенное среднее, несмещенная дисперсия для весов надежности, асимметрия и эксцесс по взвешенным
+    центральным моментам (аналог bias=True). Квантили определяются по значениям, отсортированным
+    одной сортировкой блока, и накопленным весам. При единичных весах результаты совпадают
+    с calculate_descriptive_stats.
+
+    Args:
+        df: Входной DataFrame.
+        weight_column: Столбец весов строк.
+
+    Returns:
+        Кортеж:
+        - Список словарей статистик в формате calculate_descriptive_stats (без моды) с дополнительными полями
+          "weight_sum" (сумма весов) и "effective_sample_size" (эффективный объем выборки Киша).
+        - Список строк с логами обработки.
+    """
+    logs = []
+    if weight_column not in df.columns:
+        logs.append(f"Warning: Weight column '{weight_column}' not found; weighted descriptive statistics skipped.")
+        return [], logs
+    numerical_cols, block, weight_block = _weighted_block(df, weight_column, logs)
+    if not numerical_cols:
+        logs.append("No numerical columns found for weighted descriptive statistics.")
+        return [], logs
+
+    moments = _weighted_moments(block, weight_block)
+    # Одна сортировка всех столбцов: неучитываемые значения (NaN) оказываются в конце столбца
+    order = np.argsort(block, axis=0)
+    sorted_values = np.take_along_axis(block, order, axis=0)
+    sorted_weights = np.take_along_axis(weight_block, order, axis=0)
+
+    eps = np.finfo(float).eps
+    results = []
+    for col, col_name in enumerate(numerical_cols):
+        n = int(moments["count"][col])
+        if n == 0:
+            continue
+        weight_sum = float(moments["weight_sum"][col])
+        mean_val = float(moments["mean"][col])
+        variance = float(moments["variance"][col])
+        std_dev = float(np.sqrt(variance))
+        central_m2 = float(moments["m2"][col]) / weight_sum
+        # Как в scipy: для почти постоянного столбца асимметрия и эксцесс не определены
+        if central_m2 <= (eps * mean_val) ** 2:
+            skewness = kurtosis = np.nan
+        else:
+            skewness = (float(moments["m3"][col]) / weight_sum) / central_m2 ** 1.5
+            kurtosis = (float(moments["m4"][col]) / weight_sum) / central_m2 ** 2.0 - 3.0
+        q1, median, q3 = _weighted_quantiles(sorted_values[:n, col], sorted_weights[:n, col], [0.25, 0.5, 0.75])
+        results.append({
+            "variable_name": col_name,
+            "count": n,
+            "weight_sum": weight_sum,
+            "effective_sample_size": float(moments["effective_size"][col]),
+            "mean": mean_val,
+            "median": float(median),
+            "variance": variance,
+            "std_dev": std_dev,
+            "variation_coefficient": std_dev / mean_val if abs(mean_val) > 1e-9 and not np.isnan(std_dev) else np.nan,
+            "skewness": skewness,
+            "kurtosis": kurtosis,
+            "min_value": float(sorted_values[0, col]),
+            "max_value": float(sorted_values[n - 1, col]),
+            "q1": float(q1),
+            "q3": float(q3),
+            "iqr": float(q3 - q1),
+        })
+    logs.append(f"Calculated weighted descriptive statistics for {len(results)} numerical columns "
+                f"with weights from '{weight_column}'.")
+    return results, logs
+
+
+def calculate_weighted_confidence_intervals(df: pd.DataFrame, weight_column: str, confidence: float = 0.95,
+                                            population_size: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Вычисляет доверительные интервалы взвешенного среднего числовых столбцов. Стандартная ошибка равна
+    sqrt(s_w^2 / n_eff), где s_w^2 - взвешенная несмещенная дисперсия, а n_eff = (sum w)^2 / sum(w^2) -
+    эффективный объем выборки Киша; число степеней свободы t-распределения равно n_eff - 1.
+    При единичных весах интервалы совпадают с calculate_confidence_intervals.
+
+    Args:
+        df: Входной DataFrame.
+        weight_column: Столбец весов строк.
+        confidence: Уровень доверия (например, 0.95 для 95%).
+        population_size: Количество строк исходных данных, если df - случайная выборка без возвращения.
+
+    Returns:
+        Кортеж:
+        - Список словарей доверительных интервалов в формате calculate_confidence_intervals
+          с дополнительным полем "effective_sample_size".
+        - Список строк с логами обработки.
+    """
+    logs = []
+    if weight_column not in df.columns:
+        logs.append(f"Warning: Weight column '{weight_column}' not found; weighted confidence intervals skipped.")
+        return [], logs
+    numerical_cols, block, weight_block = _weighted_block(df, weight_column, logs)
+    if not numerical_cols:
+        logs.append("No numerical columns found for weighted confidence intervals.")
+        return [], logs
+
+    moments = _weighted_moments(block, weight_block)
+    fpc = 1.0
+    if population_size:
+        fpc = finite_population_correction(len(df), population_size)
+        logs.append(f"Applying finite population correction {fpc:.4f} (sample of {len(df)} of {population_size} rows).")
+    effective_size = moments["effective_size"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        standard_error = np.sqrt(moments["variance"] / effective_size) * fpc
+        # Интервалы всех столбцов вычисляются одним вызовом t-распределения
+        t_quantile = stats.t.ppf(0.5 + confidence / 2.0, effective_size - 1.0)
+    lower = moments["mean"] - t_quantile * standard_error
+    upper = moments["mean"] + t_quantile * standard_error
+
+    results = []
+    for col, col_name in enumerate(numerical_cols):
+        mean_val = float(moments["mean"][col]) if moments["count"][col] else np.nan
+        ci_result = {
+            "variable_name": col_name,
+            "parameter_name": "Mean",
+            "confidence_level": confidence,
+            "point_estimate": mean_val,
+            "effective_sample_size": float(effective_size[col]) if moments["count"][col] else 0.0,
+            "lower_bound": float(lower[col]),
+            "upper_bound": float(upper[col]),
+        }
+        if moments["count"][col] < 2 or np.isnan(standard_error[col]):
+            ci_result["lower_bound"] = ci_result["upper_bound"] = mean_val
+            logs.append(f"Skipped weighted CI for mean of '{col_name}' (less than 2 weighted values).")
+        else:
+            logs.append(f"Calculated {confidence*100:.0f}% weighted CI for mean of '{col_name}' "
+                        f"(effective sample size {effective_size[col]:.1f}).")
+        results.append(ci_result)
+    return results, logs
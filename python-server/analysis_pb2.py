@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0e\x61nalysis.proto\x12\x08\x61nalysis\"U\n\x0f\x41nalysisRequest\x12\x14\n\x0c\x66ile_content\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\x12\x19\n\x11selected_analyses\x18\x03 \x03(\t\"\xcf\x02\n\x13\x41nalyzeDataResponse\x12\x42\n\x11\x64\x65scriptive_stats\x18\x01 \x01(\x0b\x32\'.analysis.DescriptiveStatisticsResponse\x12\x39\n\x0fnormality_tests\x18\x02 \x01(\x0b\x32 .analysis.NormalityTestsResponse\x12\x41\n\x13regression_analysis\x18\x03 \x01(\x0b\x32$.analysis.RegressionAnalysisResponse\x12\x16\n\x0eprocessing_log\x18\x04 \x03(\t\x12%\n\x05\x65rror\x18\x05 \x01(\x0b\x32\x16.analysis.ErrorDetails\x12\x37\n\x0ewilcoxon_tests\x18\x06 \x01(\x0b\x32\x1f.analysis.WilcoxonTestsResponse\">\n\x0c\x45rrorDetails\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0f\n\x07\x64\x65tails\x18\x03 \x03(\t\"\xbf\x01\n\x1d\x44\x65scriptiveStatisticsResponse\x12\x35\n\x0c\x64\x65scriptives\x18\x01 \x03(\x0b\x32\x1f.analysis.DescriptiveStatistics\x12+\n\nhistograms\x18\x02 \x03(\x0b\x32\x17.analysis.HistogramData\x12:\n\x14\x63onfidence_intervals\x18\x04 \x03(\x0b\x32\x1c.analysis.ConfidenceInterval\"\x9a\x02\n\x15\x44\x65scriptiveStatistics\x12\x15\n\rvariable_name\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\t\x12\x0c\n\x04mean\x18\x03 \x01(\x01\x12\x0e\n\x06median\x18\x04 \x01(\x01\x12\x0c\n\x04mode\x18\x05 \x03(\t\x12\x10\n\x08variance\x18\x06 \x01(\x01\x12\x0f\n\x07std_dev\x18\x07 \x01(\x01\x12\x1d\n\x15variation_coefficient\x18\x08 \x01(\x01\x12\x10\n\x08skewness\x18\t \x01(\x01\x12\x10\n\x08kurtosis\x18\n \x01(\x01\x12\x11\n\tmin_value\x18\x0b \x01(\x01\x12\x11\n\tmax_value\x18\x0c \x01(\x01\x12\n\n\x02q1\x18\r \x01(\x01\x12\n\n\x02q3\x18\x0e \x01(\x01\x12\x0b\n\x03iqr\x18\x0f \x01(\x01\"\x96\x01\n\rHistogramData\x12\x13\n\x0b\x63olumn_name\x18\x01 \x01(\t\x12\x0c\n\x04\x62ins\x18\x02 \x03(\x01\x12\x13\n\x0b\x66requencies\x18\x03 \x03(\x05\x12\x16\n\x0enormal_curve_x\x18\x04 \x03(\x01\x12\x16\n\x0enormal_curve_y\x18\x05 \x03(\x01\x12\x0c\n\x04mean\x18\x06 \x01(\x01\x12\x0f\n\x07std_dev\x18\x07 \x01(\x01\"\x93\x01\n\x12\x43onfidenceInterval\x12\x13\n\x0b\x63olumn_name\x18\x01 \x01(\t\x12\x18\n\x10\x63onfidence_level\x18\x02 \x01(\x01\x12\x13\n\x0blower_bound\x18\x03 \x01(\x01\x12\x13\n\x0bupper_bound\x18\x04 \x01(\x01\x12\x0c\n\x04mean\x18\x05 \x01(\x01\x12\x16\n\x0estandard_error\x18\x06 \x01(\x01\"\x93\x01\n\x16NormalityTestsResponse\x12;\n\x14shapiro_wilk_results\x18\x01 \x03(\x0b\x32\x1d.analysis.NormalityTestResult\x12<\n\x12\x63hi_square_results\x18\x02 \x03(\x0b\x32 .analysis.PearsonChiSquareResult\"t\n\x13NormalityTestResult\x12\x13\n\x0b\x63olumn_name\x18\x01 \x01(\t\x12\x11\n\ttest_name\x18\x02 \x01(\t\x12\x11\n\tstatistic\x18\x03 \x01(\x01\x12\x0f\n\x07p_value\x18\x04 \x01(\x01\x12\x11\n\tis_normal\x18\x05 \x01(\x08\"\x93\x01\n\x16PearsonChiSquareResult\x12\x13\n\x0b\x63olumn_name\x18\x01 \x01(\t\x12\x11\n\tstatistic\x18\x02 \x01(\x01\x12\x0f\n\x07p_value\x18\x03 \x01(\x01\x12\x1a\n\x12\x64\x65grees_of_freedom\x18\x04 \x01(\x05\x12\x11\n\tintervals\x18\x05 \x01(\x05\x12\x11\n\tis_normal\x18\x06 \x01(\x08\"\x9b\x01\n\x15WilcoxonTestsResponse\x12\x43\n\x13signed_rank_results\x18\x01 \x03(\x0b\x32&.analysis.WilcoxonSignedRankTestResult\x12=\n\x14mann_whitney_results\x18\x02 \x03(\x0b\x32\x1f.analysis.MannWhitneyTestResult\"\xa4\x01\n\x1cWilcoxonSignedRankTestResult\x12\x11\n\ttest_type\x18\x01 \x01(\t\x12\x11\n\tvariable1\x18\x02 \x01(\t\x12\x11\n\tvariable2\x18\x03 \x01(\t\x12\x11\n\tstatistic\x18\x04 \x01(\x01\x12\x0f\n\x07p_value\x18\x05 \x01(\x01\x12\x12\n\nconclusion\x18\x06 \x01(\t\x12\x13\n\x0bsample_size\x18\x07 \x01(\x05\"\x86\x02\n\x15MannWhitneyTestResult\x12\x11\n\ttest_type\x18\x01 \x01(\t\x12\x14\n\x0cgroup_column\x18\x02 \x01(\t\x12\x14\n\x0cvalue_column\x18\x03 \x01(\t\x12\x0e\n\x06group1\x18\x04 \x01(\t\x12\x0e\n\x06group2\x18\x05 \x01(\t\x12\x13\n\x0bgroup1_size\x18\x06 \x01(\x05\x12\x13\n\x0bgroup2_size\x18\x07 \x01(\x05\x12\x15\n\rgroup1_median\x18\x08 \x01(\x01\x12\x15\n\rgroup2_median\x18\t \x01(\x01\x12\x11\n\tstatistic\x18\n \x01(\x01\x12\x0f\n\x07p_value\x18\x0b \x01(\x01\x12\x12\n\nconclusion\x18\x0c \x01(\t\"\xac\x01\n\x1aRegressionAnalysisResponse\x12\x1a\n\x12\x64\x65pendent_variable\x18\x01 \x01(\t\x12\x1d\n\x15independent_variables\x18\x02 \x03(\t\x12(\n\x0b\x64\x61ta_points\x18\x03 \x03(\x0b\x32\x13.analysis.DataPoint\x12)\n\x06models\x18\x04 \x03(\x0b\x32\x19.analysis.RegressionModel\"\x9e\x02\n\x0fRegressionModel\x12\x17\n\x0fregression_type\x18\x01 \x01(\t\x12\x11\n\tr_squared\x18\x02 \x01(\x01\x12\x1a\n\x12\x61\x64justed_r_squared\x18\x03 \x01(\x01\x12\x13\n\x0b\x66_statistic\x18\x04 \x01(\x01\x12\x18\n\x10prob_f_statistic\x18\x05 \x01(\x01\x12\x0b\n\x03sse\x18\x06 \x01(\x01\x12\x35\n\x0c\x63oefficients\x18\x07 \x03(\x0b\x32\x1f.analysis.RegressionCoefficient\x12\x11\n\tresiduals\x18\x08 \x03(\x01\x12=\n\x12residuals_analysis\x18\t \x01(\x0b\x32!.analysis.ResidualsAnalysisResult\"\xc2\x01\n\x15RegressionCoefficient\x12\x15\n\rvariable_name\x18\x01 \x01(\t\x12\x13\n\x0b\x63oefficient\x18\x02 \x01(\x01\x12\x11\n\tstd_error\x18\x03 \x01(\x01\x12\x13\n\x0bt_statistic\x18\x04 \x01(\x01\x12\x0f\n\x07p_value\x18\x05 \x01(\x01\x12!\n\x19\x63onfidence_interval_lower\x18\x06 \x01(\x01\x12!\n\x19\x63onfidence_interval_upper\x18\x07 \x01(\x01\"!\n\tDataPoint\x12\t\n\x01x\x18\x01 \x01(\x01\x12\t\n\x01y\x18\x02 \x01(\x01\"\xa1\x01\n\x17ResidualsAnalysisResult\x12\x33\n\x0cshapiro_test\x18\x01 \x01(\x0b\x32\x1d.analysis.NormalityTestResult\x12*\n\thistogram\x18\x02 \x01(\x0b\x32\x17.analysis.HistogramData\x12%\n\x07qq_plot\x18\x03 \x01(\x0b\x32\x14.analysis.QQPlotData\"E\n\nQQPlotData\x12\x1d\n\x15theoretical_quantiles\x18\x01 \x03(\x01\x12\x18\n\x10sample_quantiles\x18\x02 \x03(\x01\x32Z\n\x0f\x41nalysisService\x12G\n\x0b\x41nalyzeData\x12\x19.analysis.AnalysisRequest\x1a\x1d.analysis.AnalyzeDataResponseB\x17Z\x15./go-server/generatedb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0e\x61nalysis.proto\x12\x08\x61nalysis\"U\n\x0f\x41nalysisRequest\x12\x14\n\x0c\x66ile_content\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\x12\x19\n\x11selected_analyses\x18\x03 \x03(\t\"\x84\x03\n\x13\x41nalyzeDataResponse\x12\x42\n\x11\x64\x65scriptive_stats\x18\x01 \x01(\x0b\x32\'.analysis.DescriptiveStatisticsResponse\x12\x39\n\x0fnormality_tests\x18\x02 \x01(\x0b\x32 .analysis.NormalityTestsResponse\x12\x41\n\x13regression_analysis\x18\x03 \x01(\x0b\x32$.analysis.RegressionAnalysisResponse\x12\x16\n\x0eprocessing_log\x18\x04 \x03(\t\x12%\n\x05\x65rror\x18\x05 \x01(\x0b\x32\x16.analysis.ErrorDetails\x12\x37\n\x0ewilcoxon_tests\x18\x06 \x01(\x0b\x32\x1f.analysis.WilcoxonTestsResponse\x12\x33\n\x0e\x61pproximations\x18\x07 \x03(\x0b\x32\x1b.analysis.ApproximationInfo\"\xcb\x01\n\x11\x41pproximationInfo\x12\x0f\n\x07section\x18\x01 \x01(\t\x12\x0f\n\x07variant\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x11\n\tvariables\x18\x04 \x03(\t\x12\x13\n\x0bsample_size\x18\x05 \x01(\x03\x12\x17\n\x0fpopulation_size\x18\x06 \x01(\x03\x12*\n\testimates\x18\x07 \x03(\x0b\x32\x17.analysis.EstimateError\x12\x12\n\nrank_error\x18\x08 \x01(\x01\"\x8d\x01\n\rEstimateError\x12\x15\n\rvariable_name\x18\x01 \x01(\t\x12\x11\n\tstatistic\x18\x02 \x01(\t\x12\x10\n\x08\x65stimate\x18\x03 \x01(\x01\x12\x16\n\x0estandard_error\x18\x04 \x01(\x01\x12\x13\n\x0blower_bound\x18\x05 \x01(\x01\x12\x13\n\x0bupper_bound\x18\x06 \x01(\x01\"\xbe\x01\n\x11ProgressiveUpdate\x12\x16\n\x0erows_processed\x18\x01 \x01(\x03\x12\x17\n\x0fpopulation_size\x18\x02 \x01(\x03\x12*\n\testimates\x18\x03 \x03(\x0b\x32\x17.analysis.EstimateError\x12\r\n\x05\x66inal\x18\x04 \x01(\x08\x12\x16\n\x0eprocessing_log\x18\x05 \x03(\t\x12%\n\x05\x65rror\x18\x06 \x01(\x0b\x32\x16.analysis.ErrorDetails\"h\n\x0e\x44\x61tasetRequest\x12\x12\n\ndataset_id\x18\x01 \x01(\t\x12\x14\n\x0c\x66ile_content\x18\x02 \x01(\x0c\x12\x11\n\tfile_name\x18\x03 \x01(\t\x12\x19\n\x11selected_analyses\x18\x04 \x03(\t\"\xb3\x01\n\x0f\x44\x61tasetResponse\x12\x12\n\ndataset_id\x18\x01 \x01(\t\x12\x11\n\trow_count\x18\x02 \x01(\x03\x12\x15\n\rappended_rows\x18\x03 \x01(\x03\x12/\n\x08\x61nalysis\x18\x04 \x01(\x0b\x32\x1d.analysis.AnalyzeDataResponse\x12\x31\n\x0c\x63orrelations\x18\x05 \x03(\x0b\x32\x1b.analysis.CorrelationResult\"_\n\x11\x43orrelationResult\x12\x12\n\nvariable_x\x18\x01 \x01(\t\x12\x12\n\nvariable_y\x18\x02 \x01(\t\x12\r\n\x05\x63ount\x18\x03 \x01(\x03\x12\x13\n\x0b\x63orrelation\x18\x04 \x01(\x01\">\n\x0c\x45rrorDetails\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0f\n\x07\x64\x65tails\x18\x03 \x03(\t\"\xb1\x02\n\x1d\x44\x65scriptiveStatisticsResponse\x12\x35\n\x0c\x64\x65scriptives\x18\x01 \x03(\x0b\x32\x1f.analysis.DescriptiveStatistics\x12+\n\nhistograms\x18\x02 \x03(\x0b\x32\x17.analysis.HistogramData\x12:\n\x14\x63onfidence_intervals\x18\x04 \x03(\x0b\x32\x1c.analysis.ConfidenceInterval\x12\x44\n\x14grouped_descriptives\x18\x05 \x03(\x0b\x32&.analysis.GroupedDescriptiveStatistics\x12*\n\x08outliers\x18\x06 \x03(\x0b\x32\x18.analysis.OutlierSummary\"\xc5\x03\n\x0eOutlierSummary\x12\x15\n\rvariable_name\x18\x01 \x01(\t\x12\x16\n\x0eiqr_multiplier\x18\x02 \x01(\x01\x12\x13\n\x0blower_fence\x18\x03 \x01(\x01\x12\x13\n\x0bupper_fence\x18\x04 \x01(\x01\x12\x15\n\rlower_whisker\x18\x05 \x01(\x01\x12\x15\n\rupper_whisker\x18\x06 \x01(\x01\x12\x19\n\x11iqr_outlier_count\x18\x07 \x01(\x03\x12\x13\n\x0bz_threshold\x18\x08 \x01(\x01\x12\x15\n\rz_lower_bound\x18\t \x01(\x01\x12\x15\n\rz_upper_bound\x18\n \x01(\x01\x12\x17\n\x0fz_outlier_count\x18\x0b \x01(\x03\x12\x0b\n\x03mad\x18\x0c \x01(\x01\x12\x15\n\rmad_threshold\x18\r \x01(\x01\x12\x17\n\x0fmad_lower_bound\x18\x0e \x01(\x01\x12\x17\n\x0fmad_upper_bound\x18\x0f \x01(\x01\x12\x19\n\x11mad_outlier_count\x18\x10 \x01(\x03\x12\x14\n\x0coutlier_rows\x18\x11 \x03(\x03\x12\x16\n\x0eoutlier_values\x18\x12 \x03(\x01\x12\x16\n\x0emissing_fields\x18\x13 \x03(\t\"\x8c\x01\n\x1cGroupedDescriptiveStatistics\x12\x14\n\x0cgroup_column\x18\x01 \x01(\t\x12\r\n\x05group\x18\x02 \x01(\t\x12\x12\n\ngroup_size\x18\x03 \x01(\x03\x12\x33\n\nstatistics\x18\x04 \x01(\x0b\x32\x1f.analysis.DescriptiveStatistics\"\xfd\x02\n\x15\x44\x65scriptiveStatistics\x12\x15\n\rvariable_name\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\t\x12\x0c\n\x04mean\x18\x03 \x01(\x01\x12\x0e\n\x06median\x18\x04 \x01(\x01\x12\x0c\n\x04mode\x18\x05 \x03(\t\x12\x10\n\x08variance\x18\x06 \x01(\x01\x12\x0f\n\x07std_dev\x18\x07 \x01(\x01\x12\x1d\n\x15variation_coefficient\x18\x08 \x01(\x01\x12\x10\n\x08skewness\x18\t \x01(\x01\x12\x10\n\x08kurtosis\x18\n \x01(\x01\x12\x11\n\tmin_value\x18\x0b \x01(\x01\x12\x11\n\tmax_value\x18\x0c \x01(\x01\x12\n\n\x02q1\x18\r \x01(\x01\x12\n\n\x02q3\x18\x0e \x01(\x01\x12\x0b\n\x03iqr\x18\x0f \x01(\x01\x12\x16\n\x0emissing_fields\x18\x10 \x03(\t\x12\x16\n\x0emode_frequency\x18\x11 \x01(\x03\x12\x12\n\nmode_count\x18\x12 \x01(\x03\x12\x1d\n\x15\x65\x66\x66\x65\x63tive_sample_size\x18\x13 \x01(\x01\"\xcb\x01\n\rHistogramData\x12\x13\n\x0b\x63olumn_name\x18\x01 \x01(\t\x12\x0c\n\x04\x62ins\x18\x02 \x03(\x01\x12\x13\n\x0b\x66requencies\x18\x03 \x03(\x05\x12\x16\n\x0enormal_curve_x\x18\x04 \x03(\x01\x12\x16\n\x0enormal_curve_y\x18\x05 \x03(\x01\x12\x0c\n\x04mean\x18\x06 \x01(\x01\x12\x0f\n\x07std_dev\x18\x07 \x01(\x01\x12\r\n\x05kde_x\x18\x08 \x03(\x01\x12\r\n\x05kde_y\x18\t \x03(\x01\x12\x15\n\rkde_bandwidth\x18\n \x01(\x01\"\xca\x01\n\x12\x43onfidenceInterval\x12\x13\n\x0b\x63olumn_name\x18\x01 \x01(\t\x12\x18\n\x10\x63onfidence_level\x18\x02 \x01(\x01\x12\x13\n\x0blower_bound\x18\x03 \x01(\x01\x12\x13\n\x0bupper_bound\x18\x04 \x01(\x01\x12\x0c\n\x04mean\x18\x05 \x01(\x01\x12\x16\n\x0estandard_error\x18\x06 \x01(\x01\x12\x16\n\x0emissing_fields\x18\x07 \x03(\t\x12\x1d\n\x15\x65\x66\x66\x65\x63tive_sample_size\x18\x08 \x01(\x01\"\x93\x01\n\x16NormalityTestsResponse\x12;\n\x14shapiro_wilk_results\x18\x01 \x03(\x0b\x32\x1d.analysis.NormalityTestResult\x12<\n\x12\x63hi_square_results\x18\x02 \x03(\x0b\x32 .analysis.PearsonChiSquareResult\"\x8c\x01\n\x13NormalityTestResult\x12\x13\n\x0b\x63olumn_name\x18\x01 \x01(\t\x12\x11\n\ttest_name\x18\x02 \x01(\t\x12\x11\n\tstatistic\x18\x03 \x01(\x01\x12\x0f\n\x07p_value\x18\x04 \x01(\x01\x12\x11\n\tis_normal\x18\x05 \x01(\x08\x12\x16\n\x0emissing_fields\x18\x06 \x03(\t\"\xab\x01\n\x16PearsonChiSquareResult\x12\x13\n\x0b\x63olumn_name\x18\x01 \x01(\t\x12\x11\n\tstatistic\x18\x02 \x01(\x01\x12\x0f\n\x07p_value\x18\x03 \x01(\x01\x12\x1a\n\x12\x64\x65grees_of_freedom\x18\x04 \x01(\x05\x12\x11\n\tintervals\x18\x05 \x01(\x05\x12\x11\n\tis_normal\x18\x06 \x01(\x08\x12\x16\n\x0emissing_fields\x18\x07 \x03(\t\"\x9b\x01\n\x15WilcoxonTestsResponse\x12\x43\n\x13signed_rank_results\x18\x01 \x03(\x0b\x32&.analysis.WilcoxonSignedRankTestResult\x12=\n\x14mann_whitney_results\x18\x02 \x03(\x0b\x32\x1f.analysis.MannWhitneyTestResult\"\xbc\x01\n\x1cWilcoxonSignedRankTestResult\x12\x11\n\ttest_type\x18\x01 \x01(\t\x12\x11\n\tvariable1\x18\x02 \x01(\t\x12\x11\n\tvariable2\x18\x03 \x01(\t\x12\x11\n\tstatistic\x18\x04 \x01(\x01\x12\x0f\n\x07p_value\x18\x05 \x01(\x01\x12\x12\n\nconclusion\x18\x06 \x01(\t\x12\x13\n\x0bsample_size\x18\x07 \x01(\x05\x12\x16\n\x0emissing_fields\x18\x08 \x03(\t\"\x9e\x02\n\x15MannWhitneyTestResult\x12\x11\n\ttest_type\x18\x01 \x01(\t\x12\x14\n\x0cgroup_column\x18\x02 \x01(\t\x12\x14\n\x0cvalue_column\x18\x03 \x01(\t\x12\x0e\n\x06group1\x18\x04 \x01(\t\x12\x0e\n\x06group2\x18\x05 \x01(\t\x12\x13\n\x0bgroup1_size\x18\x06 \x01(\x05\x12\x13\n\x0bgroup2_size\x18\x07 \x01(\x05\x12\x15\n\rgroup1_median\x18\x08 \x01(\x01\x12\x15\n\rgroup2_median\x18\t \x01(\x01\x12\x11\n\tstatistic\x18\n \x01(\x01\x12\x0f\n\x07p_value\x18\x0b \x01(\x01\x12\x12\n\nconclusion\x18\x0c \x01(\t\x12\x16\n\x0emissing_fields\x18\r \x03(\t\"\xd4\x01\n\x1aRegressionAnalysisResponse\x12\x1a\n\x12\x64\x65pendent_variable\x18\x01 \x01(\t\x12\x1d\n\x15independent_variables\x18\x02 \x03(\t\x12(\n\x0b\x64\x61ta_points\x18\x03 \x03(\x0b\x32\x13.analysis.DataPoint\x12)\n\x06models\x18\x04 \x03(\x0b\x32\x19.analysis.RegressionModel\x12&\n\x07\x64\x65nsity\x18\x05 \x01(\x0b\x32\x15.analysis.DensityGrid\"\xc9\x01\n\x0b\x44\x65nsityGrid\x12\x0c\n\x04kind\x18\x01 \x01(\t\x12\x0e\n\x06x_bins\x18\x02 \x01(\x05\x12\x0e\n\x06y_bins\x18\x03 \x01(\x05\x12\x0f\n\x07x_edges\x18\x04 \x03(\x01\x12\x0f\n\x07y_edges\x18\x05 \x03(\x01\x12\x0e\n\x06\x63ounts\x18\x06 \x03(\x03\x12\x11\n\tcenters_x\x18\x07 \x03(\x01\x12\x11\n\tcenters_y\x18\x08 \x03(\x01\x12\x0e\n\x06step_x\x18\t \x01(\x01\x12\x0e\n\x06step_y\x18\n \x01(\x01\x12\x14\n\x0ctotal_points\x18\x0b \x01(\x03\"\xe1\x02\n\x0fRegressionModel\x12\x17\n\x0fregression_type\x18\x01 \x01(\t\x12\x11\n\tr_squared\x18\x02 \x01(\x01\x12\x1a\n\x12\x61\x64justed_r_squared\x18\x03 \x01(\x01\x12\x13\n\x0b\x66_statistic\x18\x04 \x01(\x01\x12\x18\n\x10prob_f_statistic\x18\x05 \x01(\x01\x12\x0b\n\x03sse\x18\x06 \x01(\x01\x12\x35\n\x0c\x63oefficients\x18\x07 \x03(\x0b\x32\x1f.analysis.RegressionCoefficient\x12\x11\n\tresiduals\x18\x08 \x03(\x01\x12=\n\x12residuals_analysis\x18\t \x01(\x0b\x32!.analysis.ResidualsAnalysisResult\x12)\n\x0c\x66itted_curve\x18\n \x03(\x0b\x32\x13.analysis.DataPoint\x12\x16\n\x0emissing_fields\x18\x0b \x03(\t\"\xda\x01\n\x15RegressionCoefficient\x12\x15\n\rvariable_name\x18\x01 \x01(\t\x12\x13\n\x0b\x63oefficient\x18\x02 \x01(\x01\x12\x11\n\tstd_error\x18\x03 \x01(\x01\x12\x13\n\x0bt_statistic\x18\x04 \x01(\x01\x12\x0f\n\x07p_value\x18\x05 \x01(\x01\x12!\n\x19\x63onfidence_interval_lower\x18\x06 \x01(\x01\x12!\n\x19\x63onfidence_interval_upper\x18\x07 \x01(\x01\x12\x16\n\x0emissing_fields\x18\x08 \x03(\t\"!\n\tDataPoint\x12\t\n\x01x\x18\x01 \x01(\x01\x12\t\n\x01y\x18\x02 \x01(\x01\"\xa1\x01\n\x17ResidualsAnalysisResult\x12\x33\n\x0cshapiro_test\x18\x01 \x01(\x0b\x32\x1d.analysis.NormalityTestResult\x12*\n\thistogram\x18\x02 \x01(\x0b\x32\x17.analysis.HistogramData\x12%\n\x07qq_plot\x18\x03 \x01(\x0b\x32\x14.analysis.QQPlotData\"E\n\nQQPlotData\x12\x1d\n\x15theoretical_quantiles\x18\x01 \x03(\x01\x12\x18\n\x10sample_quantiles\x18\x02 \x03(\x01\x32\xb7\x02\n\x0f\x41nalysisService\x12G\n\x0b\x41nalyzeData\x12\x19.analysis.AnalysisRequest\x1a\x1d.analysis.AnalyzeDataResponse\x12R\n\x16\x41nalyzeDataProgressive\x12\x19.analysis.AnalysisRequest\x1a\x1b.analysis.ProgressiveUpdate0\x01\x12\x44\n\rCreateDataset\x12\x18.analysis.DatasetRequest\x1a\x19.analysis.DatasetResponse\x12\x41\n\nAppendRows\x12\x18.analysis.DatasetRequest\x1a\x19.analysis.DatasetResponseB\x17Z\x15./go-server/generatedb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -35,41 +35,59 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_ANALYSISREQUEST']._serialized_start=28
   _globals['_ANALYSISREQUEST']._serialized_end=113
   _globals['_ANALYZEDATARESPONSE']._serialized_start=116
-  _globals['_ANALYZEDATARESPONSE']._serialized_end=451
-  _globals['_ERRORDETAILS']._serialized_start=453
-  _globals['_ERRORDETAILS']._serialized_end=515
-  _globals['_DESCRIPTIVESTATISTICSRESPONSE']._serialized_start=518
-  _globals['_DESCRIPTIVESTATISTICSRESPONSE']._serialized_end=709
-  _globals['_DESCRIPTIVESTATISTICS']._serialized_start=712
-  _globals['_DESCRIPTIVESTATISTICS']._serialized_end=994
-  _globals['_HISTOGRAMDATA']._serialized_start=997
-  _globals['_HISTOGRAMDATA']._serialized_end=1147
-  _globals['_CONFIDENCEINTERVAL']._serialized_start=1150
-  _globals['_CONFIDENCEINTERVAL']._serialized_end=1297
-  _globals['_NORMALITYTESTSRESPONSE']._serialized_start=1300
-  _globals['_NORMALITYTESTSRESPONSE']._serialized_end=1447
-  _globals['_NORMALITYTESTRESULT']._serialized_start=1449
-  _globals['_NORMALITYTESTRESULT']._serialized_end=1565
-  _globals['_PEARSONCHISQUARERESULT']._serialized_start=1568
-  _globals['_PEARSONCHISQUARERESULT']._serialized_end=1715
-  _globals['_WILCOXONTESTSRESPONSE']._serialized_start=1718
-  _globals['_WILCOXONTESTSRESPONSE']._serialized_end=1873
-  _globals['_WILCOXONSIGNEDRANKTESTRESULT']._serialized_start=1876
-  _globals['_WILCOXONSIGNEDRANKTESTRESULT']._serialized_end=2040
-  _globals['_MANNWHITNEYTESTRESULT']._serialized_start=2043
-  _globals['_MANNWHITNEYTESTRESULT']._serialized_end=2305
-  _globals['_REGRESSIONANALYSISRESPONSE']._serialized_start=2308
-  _globals['_REGRESSIONANALYSISRESPONSE']._serialized_end=2480
-  _globals['_REGRESSIONMODEL']._serialized_start=2483
-  _globals['_REGRESSIONMODEL']._serialized_end=2769
-  _globals['_REGRESSIONCOEFFICIENT']._serialized_start=2772
-  _globals['_REGRESSIONCOEFFICIENT']._serialized_end=2966
-  _globals['_DATAPOINT']._serialized_start=2968
-  _globals['_DATAPOINT']._serialized_end=3001
-  _globals['_RESIDUALSANALYSISRESULT']._serialized_start=3004
-  _globals['_RESIDUALSANALYSISRESULT']._serialized_end=3165
-  _globals['_QQPLOTDATA']._serialized_start=3167
-  _globals['_QQPLOTDATA']._serialized_end=3236
-  _globals['_ANALYSISSERVICE']._serialized_start=3238
-  _globals['_ANALYSISSERVICE']._serialized_end=3328
+  _globals['_ANALYZEDATARESPONSE']._serialized_end=504
+  _globals['_APPROXIMATIONINFO']._serialized_start=507
+  _globals['_APPROXIMATIONINFO']._serialized_end=710
+  _globals['_ESTIMATEERROR']._serialized_start=713
+  _globals['_ESTIMATEERROR']._serialized_end=854
+  _globals['_PROGRESSIVEUPDATE']._serialized_start=857
+  _globals['_PROGRESSIVEUPDATE']._serialized_end=1047
+  _globals['_DATASETREQUEST']._serialized_start=1049
+  _globals['_DATASETREQUEST']._serialized_end=1153
+  _globals['_DATASETRESPONSE']._serialized_start=1156
+  _globals['_DATASETRESPONSE']._serialized_end=1335
+  _globals['_CORRELATIONRESULT']._serialized_start=1337
+  _globals['_CORRELATIONRESULT']._serialized_end=1432
+  _globals['_ERRORDETAILS']._serialized_start=1434
+  _globals['_ERRORDETAILS']._serialized_end=1496
+  _globals['_DESCRIPTIVESTATISTICSRESPONSE']._serialized_start=1499
+  _globals['_DESCRIPTIVESTATISTICSRESPONSE']._serialized_end=1804
+  _globals['_OUTLIERSUMMARY']._serialized_start=1807
+  _globals['_OUTLIERSUMMARY']._serialized_end=2260
+  _globals['_GROUPEDDESCRIPTIVESTATISTICS']._serialized_start=2263
+  _globals['_GROUPEDDESCRIPTIVESTATISTICS']._serialized_end=2403
+  _globals['_DESCRIPTIVESTATISTICS']._serialized_start=2406
+  _globals['_DESCRIPTIVESTATISTICS']._serialized_end=2787
+  _globals['_HISTOGRAMDATA']._serialized_start=2790
+  _globals['_HISTOGRAMDATA']._serialized_end=2993
+  _globals['_CONFIDENCEINTERVAL']._serialized_start=2996
+  _globals['_CONFIDENCEINTERVAL']._serialized_end=3198
+  _globals['_NORMALITYTESTSRESPONSE']._serialized_start=3201
+  _globals['_NORMALITYTESTSRESPONSE']._serialized_end=3348
+  _globals['_NORMALITYTESTRESULT']._serialized_start=3351
+  _globals['_NORMALITYTESTRESULT']._serialized_end=3491
+  _globals['_PEARSONCHISQUARERESULT']._serialized_start=3494
+  _globals['_PEARSONCHISQUARERESULT']._serialized_end=3665
+  _globals['_WILCOXONTESTSRESPONSE']._serialized_start=3668
+  _globals['_WILCOXONTESTSRESPONSE']._serialized_end=3823
+  _globals['_WILCOXONSIGNEDRANKTESTRESULT']._serialized_start=3826
+  _globals['_WILCOXONSIGNEDRANKTESTRESULT']._serialized_end=4014
+  _globals['_MANNWHITNEYTESTRESULT']._serialized_start=4017
+  _globals['_MANNWHITNEYTESTRESULT']._serialized_end=4303
+  _globals['_REGRESSIONANALYSISRESPONSE']._serialized_start=4306
+  _globals['_REGRESSIONANALYSISRESPONSE']._serialized_end=4518
+  _globals['_DENSITYGRID']._serialized_start=4521
+  _globals['_DENSITYGRID']._serialized_end=4722
+  _globals['_REGRESSIONMODEL']._serialized_start=4725
+  _globals['_REGRESSIONMODEL']._serialized_end=5078
+  _globals['_REGRESSIONCOEFFICIENT']._serialized_start=5081
+  _globals['_REGRESSIONCOEFFICIENT']._serialized_end=5299
+  _globals['_DATAPOINT']._serialized_start=5301
+  _globals['_DATAPOINT']._serialized_end=5334
+  _globals['_RESIDUALSANALYSISRESULT']._serialized_start=5337
+  _globals['_RESIDUALSANALYSISRESULT']._serialized_end=5498
+  _globals['_QQPLOTDATA']._serialized_start=5500
+  _globals['_QQPLOTDATA']._serialized_end=5569
+  _globals['_ANALYSISSERVICE']._serialized_start=5572
+  _globals['_ANALYSISSERVICE']._serialized_end=5883
 # @@protoc_insertion_point(module_scope)
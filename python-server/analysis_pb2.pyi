@@ -16,20 +16,112 @@ class AnalysisRequest(_message.Message):
     def __init__(self, file_content: _Optional[bytes] = ..., file_name: _Optional[str] = ..., selected_analyses: _Optional[_Iterable[str]] = ...) -> None: ...
 
 class AnalyzeDataResponse(_message.Message):
-    __slots__ = ("descriptive_stats", "normality_tests", "regression_analysis", "processing_log", "error", "wilcoxon_tests")
+    __slots__ = ("descriptive_stats", "normality_tests", "regression_analysis", "processing_log", "error", "wilcoxon_tests", "approximations")
     DESCRIPTIVE_STATS_FIELD_NUMBER: _ClassVar[int]
     NORMALITY_TESTS_FIELD_NUMBER: _ClassVar[int]
     REGRESSION_ANALYSIS_FIELD_NUMBER: _ClassVar[int]
     PROCESSING_LOG_FIELD_NUMBER: _ClassVar[int]
     ERROR_FIELD_NUMBER: _ClassVar[int]
     WILCOXON_TESTS_FIELD_NUMBER: _ClassVar[int]
+    APPROXIMATIONS_FIELD_NUMBER: _ClassVar[int]
     descriptive_stats: DescriptiveStatisticsResponse
     normality_tests: NormalityTestsResponse
     regression_analysis: RegressionAnalysisResponse
     processing_log: _containers.RepeatedScalarFieldContainer[str]
     error: ErrorDetails
     wilcoxon_tests: WilcoxonTestsResponse
-    def __init__(self, descriptive_stats: _Optional[_Union[DescriptiveStatisticsResponse, _Mapping]] = ..., normality_tests: _Optional[_Union[NormalityTestsResponse, _Mapping]] = ..., regression_analysis: _Optional[_Union[RegressionAnalysisResponse, _Mapping]] = ..., processing_log: _Optional[_Iterable[str]] = ..., error: _Optional[_Union[ErrorDetails, _Mapping]] = ..., wilcoxon_tests: _Optional[_Union[WilcoxonTestsResponse, _Mapping]] = ...) -> None: ...
+    approximations: _containers.RepeatedCompositeFieldContainer[ApproximationInfo]
+    def __init__(self, descriptive_stats: _Optional[_Union[DescriptiveStatisticsResponse, _Mapping]] = ..., normality_tests: _Optional[_Union[NormalityTestsResponse, _Mapping]] = ..., regression_analysis: _Optional[_Union[RegressionAnalysisResponse, _Mapping]] = ..., processing_log: _Optional[_Iterable[str]] = ..., error: _Optional[_Union[ErrorDetails, _Mapping]] = ..., wilcoxon_tests: _Optional[_Union[WilcoxonTestsResponse, _Mapping]] = ..., approximations: _Optional[_Iterable[_Union[ApproximationInfo, _Mapping]]] = ...) -> None: ...
+
+class ApproximationInfo(_message.Message):
+    __slots__ = ("section", "variant", "description", "variables", "sample_size", "population_size", "estimates", "rank_error")
+    SECTION_FIELD_NUMBER: _ClassVar[int]
+    VARIANT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    VARIABLES_FIELD_NUMBER: _ClassVar[int]
+    SAMPLE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    POPULATION_SIZE_FIELD_NUMBER: _ClassVar[int]
+    ESTIMATES_FIELD_NUMBER: _ClassVar[int]
+    RANK_ERROR_FIELD_NUMBER: _ClassVar[int]
+    section: str
+    variant: str
+    description: str
+    variables: _containers.RepeatedScalarFieldContainer[str]
+    sample_size: int
+    population_size: int
+    estimates: _containers.RepeatedCompositeFieldContainer[EstimateError]
+    rank_error: float
+    def __init__(self, section: _Optional[str] = ..., variant: _Optional[str] = ..., description: _Optional[str] = ..., variables: _Optional[_Iterable[str]] = ..., sample_size: _Optional[int] = ..., population_size: _Optional[int] = ..., estimates: _Optional[_Iterable[_Union[EstimateError, _Mapping]]] = ..., rank_error: _Optional[float] = ...) -> None: ...
+
+class EstimateError(_message.Message):
+    __slots__ = ("variable_name", "statistic", "estimate", "standard_error", "lower_bound", "upper_bound")
+    VARIABLE_NAME_FIELD_NUMBER: _ClassVar[int]
+    STATISTIC_FIELD_NUMBER: _ClassVar[int]
+    ESTIMATE_FIELD_NUMBER: _ClassVar[int]
+    STANDARD_ERROR_FIELD_NUMBER: _ClassVar[int]
+    LOWER_BOUND_FIELD_NUMBER: _ClassVar[int]
+    UPPER_BOUND_FIELD_NUMBER: _ClassVar[int]
+    variable_name: str
+    statistic: str
+    estimate: float
+    standard_error: float
+    lower_bound: float
+    upper_bound: float
+    def __init__(self, variable_name: _Optional[str] = ..., statistic: _Optional[str] = ..., estimate: _Optional[float] = ..., standard_error: _Optional[float] = ..., lower_bound: _Optional[float] = ..., upper_bound: _Optional[float] = ...) -> None: ...
+
+class ProgressiveUpdate(_message.Message):
+    __slots__ = ("rows_processed", "population_size", "estimates", "final", "processing_log", "error")
+    ROWS_PROCESSED_FIELD_NUMBER: _ClassVar[int]
+    POPULATION_SIZE_FIELD_NUMBER: _ClassVar[int]
+    ESTIMATES_FIELD_NUMBER: _ClassVar[int]
+    FINAL_FIELD_NUMBER: _ClassVar[int]
+    PROCESSING_LOG_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    rows_processed: int
+    population_size: int
+    estimates: _containers.RepeatedCompositeFieldContainer[EstimateError]
+    final: bool
+    processing_log: _containers.RepeatedScalarFieldContainer[str]
+    error: ErrorDetails
+    def __init__(self, rows_processed: _Optional[int] = ..., population_size: _Optional[int] = ..., estimates: _Optional[_Iterable[_Union[EstimateError, _Mapping]]] = ..., final: bool = ..., processing_log: _Optional[_Iterable[str]] = ..., error: _Optional[_Union[ErrorDetails, _Mapping]] = ...) -> None: ...
+
+class DatasetRequest(_message.Message):
+    __slots__ = ("dataset_id", "file_content", "file_name", "selected_analyses")
+    DATASET_ID_FIELD_NUMBER: _ClassVar[int]
+    FILE_CONTENT_FIELD_NUMBER: _ClassVar[int]
+    FILE_NAME_FIELD_NUMBER: _ClassVar[int]
+    SELECTED_ANALYSES_FIELD_NUMBER: _ClassVar[int]
+    dataset_id: str
+    file_content: bytes
+    file_name: str
+    selected_analyses: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, dataset_id: _Optional[str] = ..., file_content: _Optional[bytes] = ..., file_name: _Optional[str] = ..., selected_analyses: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class DatasetResponse(_message.Message):
+    __slots__ = ("dataset_id", "row_count", "appended_rows", "analysis", "correlations")
+    DATASET_ID_FIELD_NUMBER: _ClassVar[int]
+    ROW_COUNT_FIELD_NUMBER: _ClassVar[int]
+    APPENDED_ROWS_FIELD_NUMBER: _ClassVar[int]
+    ANALYSIS_FIELD_NUMBER: _ClassVar[int]
+    CORRELATIONS_FIELD_NUMBER: _ClassVar[int]
+    dataset_id: str
+    row_count: int
+    appended_rows: int
+    analysis: AnalyzeDataResponse
+    correlations: _containers.RepeatedCompositeFieldContainer[CorrelationResult]
+    def __init__(self, dataset_id: _Optional[str] = ..., row_count: _Optional[int] = ..., appended_rows: _Optional[int] = ..., analysis: _Optional[_Union[AnalyzeDataResponse, _Mapping]] = ..., correlations: _Optional[_Iterable[_Union[CorrelationResult, _Mapping]]] = ...) -> None: ...
+
+class CorrelationResult(_message.Message):
+    __slots__ = ("variable_x", "variable_y", "count", "correlation")
+    VARIABLE_X_FIELD_NUMBER: _ClassVar[int]
+    VARIABLE_Y_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    CORRELATION_FIELD_NUMBER: _ClassVar[int]
+    variable_x: str
+    variable_y: str
+    count: int
+    correlation: float
+    def __init__(self, variable_x: _Optional[str] = ..., variable_y: _Optional[str] = ..., count: _Optional[int] = ..., correlation: _Optional[float] = ...) -> None: ...
 
 class ErrorDetails(_message.Message):
     __slots__ = ("code", "message", "details")
@@ -42,17 +134,75 @@ class ErrorDetails(_message.Message):
     def __init__(self, code: _Optional[str] = ..., message: _Optional[str] = ..., details: _Optional[_Iterable[str]] = ...) -> None: ...
 
 class DescriptiveStatisticsResponse(_message.Message):
-    __slots__ = ("descriptives", "histograms", "confidence_intervals")
+    __slots__ = ("descriptives", "histograms", "confidence_intervals", "grouped_descriptives", "outliers")
     DESCRIPTIVES_FIELD_NUMBER: _ClassVar[int]
     HISTOGRAMS_FIELD_NUMBER: _ClassVar[int]
     CONFIDENCE_INTERVALS_FIELD_NUMBER: _ClassVar[int]
+    GROUPED_DESCRIPTIVES_FIELD_NUMBER: _ClassVar[int]
+    OUTLIERS_FIELD_NUMBER: _ClassVar[int]
     descriptives: _containers.RepeatedCompositeFieldContainer[DescriptiveStatistics]
     histograms: _containers.RepeatedCompositeFieldContainer[HistogramData]
     confidence_intervals: _containers.RepeatedCompositeFieldContainer[ConfidenceInterval]
-    def __init__(self, descriptives: _Optional[_Iterable[_Union[DescriptiveStatistics, _Mapping]]] = ..., histograms: _Optional[_Iterable[_Union[HistogramData, _Mapping]]] = ..., confidence_intervals: _Optional[_Iterable[_Union[ConfidenceInterval, _Mapping]]] = ...) -> None: ...
+    grouped_descriptives: _containers.RepeatedCompositeFieldContainer[GroupedDescriptiveStatistics]
+    outliers: _containers.RepeatedCompositeFieldContainer[OutlierSummary]
+    def __init__(self, descriptives: _Optional[_Iterable[_Union[DescriptiveStatistics, _Mapping]]] = ..., histograms: _Optional[_Iterable[_Union[HistogramData, _Mapping]]] = ..., confidence_intervals: _Optional[_Iterable[_Union[ConfidenceInterval, _Mapping]]] = ..., grouped_descriptives: _Optional[_Iterable[_Union[GroupedDescriptiveStatistics, _Mapping]]] = ..., outliers: _Optional[_Iterable[_Union[OutlierSummary, _Mapping]]] = ...) -> None: ...
+
+class OutlierSummary(_message.Message):
+    __slots__ = ("variable_name", "iqr_multiplier", "lower_fence", "upper_fence", "lower_whisker", "upper_whisker", "iqr_outlier_count", "z_threshold", "z_lower_bound", "z_upper_bound", "z_outlier_count", "mad", "mad_threshold", "mad_lower_bound", "mad_upper_bound", "mad_outlier_count", "outlier_rows", "outlier_values", "missing_fields")
+    VARIABLE_NAME_FIELD_NUMBER: _ClassVar[int]
+    IQR_MULTIPLIER_FIELD_NUMBER: _ClassVar[int]
+    LOWER_FENCE_FIELD_NUMBER: _ClassVar[int]
+    UPPER_FENCE_FIELD_NUMBER: _ClassVar[int]
+    LOWER_WHISKER_FIELD_NUMBER: _ClassVar[int]
+    UPPER_WHISKER_FIELD_NUMBER: _ClassVar[int]
+    IQR_OUTLIER_COUNT_FIELD_NUMBER: _ClassVar[int]
+    Z_THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+    Z_LOWER_BOUND_FIELD_NUMBER: _ClassVar[int]
+    Z_UPPER_BOUND_FIELD_NUMBER: _ClassVar[int]
+    Z_OUTLIER_COUNT_FIELD_NUMBER: _ClassVar[int]
+    MAD_FIELD_NUMBER: _ClassVar[int]
+    MAD_THRESHOLD_FIELD_NUMBER: _ClassVar[int]
+    MAD_LOWER_BOUND_FIELD_NUMBER: _ClassVar[int]
+    MAD_UPPER_BOUND_FIELD_NUMBER: _ClassVar[int]
+    MAD_OUTLIER_COUNT_FIELD_NUMBER: _ClassVar[int]
+    OUTLIER_ROWS_FIELD_NUMBER: _ClassVar[int]
+    OUTLIER_VALUES_FIELD_NUMBER: _ClassVar[int]
+    MISSING_FIELDS_FIELD_NUMBER: _ClassVar[int]
+    variable_name: str
+    iqr_multiplier: float
+    lower_fence: float
+    upper_fence: float
+    lower_whisker: float
+    upper_whisker: float
+    iqr_outlier_count: int
+    z_threshold: float
+    z_lower_bound: float
+    z_upper_bound: float
+    z_outlier_count: int
+    mad: float
+    mad_threshold: float
+    mad_lower_bound: float
+    mad_upper_bound: float
+    mad_outlier_count: int
+    outlier_rows: _containers.RepeatedScalarFieldContainer[int]
+    outlier_values: _containers.RepeatedScalarFieldContainer[float]
+    missing_fields: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, variable_name: _Optional[str] = ..., iqr_multiplier: _Optional[float] = ..., lower_fence: _Optional[float] = ..., upper_fence: _Optional[float] = ..., lower_whisker: _Optional[float] = ..., upper_whisker: _Optional[float] = ..., iqr_outlier_count: _Optional[int] = ..., z_threshold: _Optional[float] = ..., z_lower_bound: _Optional[float] = ..., z_upper_bound: _Optional[float] = ..., z_outlier_count: _Optional[int] = ..., mad: _Optional[float] = ..., mad_threshold: _Optional[float] = ..., mad_lower_bound: _Optional[float] = ..., mad_upper_bound: _Optional[float] = ..., mad_outlier_count: _Optional[int] = ..., outlier_rows: _Optional[_Iterable[int]] = ..., outlier_values: _Optional[_Iterable[float]] = ..., missing_fields: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class GroupedDescriptiveStatistics(_message.Message):
+    __slots__ = ("group_column", "group", "group_size", "statistics")
+    GROUP_COLUMN_FIELD_NUMBER: _ClassVar[int]
+    GROUP_FIELD_NUMBER: _ClassVar[int]
+    GROUP_SIZE_FIELD_NUMBER: _ClassVar[int]
+    STATISTICS_FIELD_NUMBER: _ClassVar[int]
+    group_column: str
+    group: str
+    group_size: int
+    statistics: DescriptiveStatistics
+    def __init__(self, group_column: _Optional[str] = ..., group: _Optional[str] = ..., group_size: _Optional[int] = ..., statistics: _Optional[_Union[DescriptiveStatistics, _Mapping]] = ...) -> None: ...
 
 class DescriptiveStatistics(_message.Message):
-    __slots__ = ("variable_name", "count", "mean", "median", "mode", "variance", "std_dev", "variation_coefficient", "skewness", "kurtosis", "min_value", "max_value", "q1", "q3", "iqr")
+    __slots__ = ("variable_name", "count", "mean", "median", "mode", "variance", "std_dev", "variation_coefficient", "skewness", "kurtosis", "min_value", "max_value", "q1", "q3", "iqr", "missing_fields", "mode_frequency", "mode_count", "effective_sample_size")
     VARIABLE_NAME_FIELD_NUMBER: _ClassVar[int]
     COUNT_FIELD_NUMBER: _ClassVar[int]
     MEAN_FIELD_NUMBER: _ClassVar[int]
@@ -68,6 +218,10 @@ class DescriptiveStatistics(_message.Message):
     Q1_FIELD_NUMBER: _ClassVar[int]
     Q3_FIELD_NUMBER: _ClassVar[int]
     IQR_FIELD_NUMBER: _ClassVar[int]
+    MISSING_FIELDS_FIELD_NUMBER: _ClassVar[int]
+    MODE_FREQUENCY_FIELD_NUMBER: _ClassVar[int]
+    MODE_COUNT_FIELD_NUMBER: _ClassVar[int]
+    EFFECTIVE_SAMPLE_SIZE_FIELD_NUMBER: _ClassVar[int]
     variable_name: str
     count: str
     mean: float
@@ -83,10 +237,14 @@ class DescriptiveStatistics(_message.Message):
     q1: float
     q3: float
     iqr: float
-    def __init__(self, variable_name: _Optional[str] = ..., count: _Optional[str] = ..., mean: _Optional[float] = ..., median: _Optional[float] = ..., mode: _Optional[_Iterable[str]] = ..., variance: _Optional[float] = ..., std_dev: _Optional[float] = ..., variation_coefficient: _Optional[float] = ..., skewness: _Optional[float] = ..., kurtosis: _Optional[float] = ..., min_value: _Optional[float] = ..., max_value: _Optional[float] = ..., q1: _Optional[float] = ..., q3: _Optional[float] = ..., iqr: _Optional[float] = ...) -> None: ...
+    missing_fields: _containers.RepeatedScalarFieldContainer[str]
+    mode_frequency: int
+    mode_count: int
+    effective_sample_size: float
+    def __init__(self, variable_name: _Optional[str] = ..., count: _Optional[str] = ..., mean: _Optional[float] = ..., median: _Optional[float] = ..., mode: _Optional[_Iterable[str]] = ..., variance: _Optional[float] = ..., std_dev: _Optional[float] = ..., variation_coefficient: _Optional[float] = ..., skewness: _Optional[float] = ..., kurtosis: _Optional[float] = ..., min_value: _Optional[float] = ..., max_value: _Optional[float] = ..., q1: _Optional[float] = ..., q3: _Optional[float] = ..., iqr: _Optional[float] = ..., missing_fields: _Optional[_Iterable[str]] = ..., mode_frequency: _Optional[int] = ..., mode_count: _Optional[int] = ..., effective_sample_size: _Optional[float] = ...) -> None: ...
 
 class HistogramData(_message.Message):
-    __slots__ = ("column_name", "bins", "frequencies", "normal_curve_x", "normal_curve_y", "mean", "std_dev")
+    __slots__ = ("column_name", "bins", "frequencies", "normal_curve_x", "normal_curve_y", "mean", "std_dev", "kde_x", "kde_y", "kde_bandwidth")
     COLUMN_NAME_FIELD_NUMBER: _ClassVar[int]
     BINS_FIELD_NUMBER: _ClassVar[int]
     FREQUENCIES_FIELD_NUMBER: _ClassVar[int]
@@ -94,6 +252,9 @@ class HistogramData(_message.Message):
     NORMAL_CURVE_Y_FIELD_NUMBER: _ClassVar[int]
     MEAN_FIELD_NUMBER: _ClassVar[int]
     STD_DEV_FIELD_NUMBER: _ClassVar[int]
+    KDE_X_FIELD_NUMBER: _ClassVar[int]
+    KDE_Y_FIELD_NUMBER: _ClassVar[int]
+    KDE_BANDWIDTH_FIELD_NUMBER: _ClassVar[int]
     column_name: str
     bins: _containers.RepeatedScalarFieldContainer[float]
     frequencies: _containers.RepeatedScalarFieldContainer[int]
@@ -101,23 +262,30 @@ class HistogramData(_message.Message):
     normal_curve_y: _containers.RepeatedScalarFieldContainer[float]
     mean: float
     std_dev: float
-    def __init__(self, column_name: _Optional[str] = ..., bins: _Optional[_Iterable[float]] = ..., frequencies: _Optional[_Iterable[int]] = ..., normal_curve_x: _Optional[_Iterable[float]] = ..., normal_curve_y: _Optional[_Iterable[float]] = ..., mean: _Optional[float] = ..., std_dev: _Optional[float] = ...) -> None: ...
+    kde_x: _containers.RepeatedScalarFieldContainer[float]
+    kde_y: _containers.RepeatedScalarFieldContainer[float]
+    kde_bandwidth: float
+    def __init__(self, column_name: _Optional[str] = ..., bins: _Optional[_Iterable[float]] = ..., frequencies: _Optional[_Iterable[int]] = ..., normal_curve_x: _Optional[_Iterable[float]] = ..., normal_curve_y: _Optional[_Iterable[float]] = ..., mean: _Optional[float] = ..., std_dev: _Optional[float] = ..., kde_x: _Optional[_Iterable[float]] = ..., kde_y: _Optional[_Iterable[float]] = ..., kde_bandwidth: _Optional[float] = ...) -> None: ...
 
 class ConfidenceInterval(_message.Message):
-    __slots__ = ("column_name", "confidence_level", "lower_bound", "upper_bound", "mean", "standard_error")
+    __slots__ = ("column_name", "confidence_level", "lower_bound", "upper_bound", "mean", "standard_error", "missing_fields", "effective_sample_size")
     COLUMN_NAME_FIELD_NUMBER: _ClassVar[int]
     CONFIDENCE_LEVEL_FIELD_NUMBER: _ClassVar[int]
     LOWER_BOUND_FIELD_NUMBER: _ClassVar[int]
     UPPER_BOUND_FIELD_NUMBER: _ClassVar[int]
     MEAN_FIELD_NUMBER: _ClassVar[int]
     STANDARD_ERROR_FIELD_NUMBER: _ClassVar[int]
+    MISSING_FIELDS_FIELD_NUMBER: _ClassVar[int]
+    EFFECTIVE_SAMPLE_SIZE_FIELD_NUMBER: _ClassVar[int]
     column_name: str
     confidence_level: float
     lower_bound: float
     upper_bound: float
     mean: float
     standard_error: float
-    def __init__(self, column_name: _Optional[str] = ..., confidence_level: _Optional[float] = ..., lower_bound: _Optional[float] = ..., upper_bound: _Optional[float] = ..., mean: _Optional[float] = ..., standard_error: _Optional[float] = ...) -> None: ...
+    missing_fields: _containers.RepeatedScalarFieldContainer[str]
+    effective_sample_size: float
+    def __init__(self, column_name: _Optional[str] = ..., confidence_level: _Optional[float] = ..., lower_bound: _Optional[float] = ..., upper_bound: _Optional[float] = ..., mean: _Optional[float] = ..., standard_error: _Optional[float] = ..., missing_fields: _Optional[_Iterable[str]] = ..., effective_sample_size: _Optional[float] = ...) -> None: ...
 
 class NormalityTestsResponse(_message.Message):
     __slots__ = ("shapiro_wilk_results", "chi_square_results")
@@ -128,34 +296,38 @@ class NormalityTestsResponse(_message.Message):
     def __init__(self, shapiro_wilk_results: _Optional[_Iterable[_Union[NormalityTestResult, _Mapping]]] = ..., chi_square_results: _Optional[_Iterable[_Union[PearsonChiSquareResult, _Mapping]]] = ...) -> None: ...
 
 class NormalityTestResult(_message.Message):
-    __slots__ = ("column_name", "test_name", "statistic", "p_value", "is_normal")
+    __slots__ = ("column_name", "test_name", "statistic", "p_value", "is_normal", "missing_fields")
     COLUMN_NAME_FIELD_NUMBER: _ClassVar[int]
     TEST_NAME_FIELD_NUMBER: _ClassVar[int]
     STATISTIC_FIELD_NUMBER: _ClassVar[int]
     P_VALUE_FIELD_NUMBER: _ClassVar[int]
     IS_NORMAL_FIELD_NUMBER: _ClassVar[int]
+    MISSING_FIELDS_FIELD_NUMBER: _ClassVar[int]
     column_name: str
     test_name: str
     statistic: float
     p_value: float
     is_normal: bool
-    def __init__(self, column_name: _Optional[str] = ..., test_name: _Optional[str] = ..., statistic: _Optional[float] = ..., p_value: _Optional[float] = ..., is_normal: bool = ...) -> None: ...
+    missing_fields: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, column_name: _Optional[str] = ..., test_name: _Optional[str] = ..., statistic: _Optional[float] = ..., p_value: _Optional[float] = ..., is_normal: bool = ..., missing_fields: _Optional[_Iterable[str]] = ...) -> None: ...
 
 class PearsonChiSquareResult(_message.Message):
-    __slots__ = ("column_name", "statistic", "p_value", "degrees_of_freedom", "intervals", "is_normal")
+    __slots__ = ("column_name", "statistic", "p_value", "degrees_of_freedom", "intervals", "is_normal", "missing_fields")
     COLUMN_NAME_FIELD_NUMBER: _ClassVar[int]
     STATISTIC_FIELD_NUMBER: _ClassVar[int]
     P_VALUE_FIELD_NUMBER: _ClassVar[int]
     DEGREES_OF_FREEDOM_FIELD_NUMBER: _ClassVar[int]
     INTERVALS_FIELD_NUMBER: _ClassVar[int]
     IS_NORMAL_FIELD_NUMBER: _ClassVar[int]
+    MISSING_FIELDS_FIELD_NUMBER: _ClassVar[int]
     column_name: str
     statistic: float
     p_value: float
     degrees_of_freedom: int
     intervals: int
     is_normal: bool
-    def __init__(self, column_name: _Optional[str] = ..., statistic: _Optional[float] = ..., p_value: _Optional[float] = ..., degrees_of_freedom: _Optional[int] = ..., intervals: _Optional[int] = ..., is_normal: bool = ...) -> None: ...
+    missing_fields: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, column_name: _Optional[str] = ..., statistic: _Optional[float] = ..., p_value: _Optional[float] = ..., degrees_of_freedom: _Optional[int] = ..., intervals: _Optional[int] = ..., is_normal: bool = ..., missing_fields: _Optional[_Iterable[str]] = ...) -> None: ...
 
 class WilcoxonTestsResponse(_message.Message):
     __slots__ = ("signed_rank_results", "mann_whitney_results")
@@ -166,7 +338,7 @@ class WilcoxonTestsResponse(_message.Message):
     def __init__(self, signed_rank_results: _Optional[_Iterable[_Union[WilcoxonSignedRankTestResult, _Mapping]]] = ..., mann_whitney_results: _Optional[_Iterable[_Union[MannWhitneyTestResult, _Mapping]]] = ...) -> None: ...
 
 class WilcoxonSignedRankTestResult(_message.Message):
-    __slots__ = ("test_type", "variable1", "variable2", "statistic", "p_value", "conclusion", "sample_size")
+    __slots__ = ("test_type", "variable1", "variable2", "statistic", "p_value", "conclusion", "sample_size", "missing_fields")
     TEST_TYPE_FIELD_NUMBER: _ClassVar[int]
     VARIABLE1_FIELD_NUMBER: _ClassVar[int]
     VARIABLE2_FIELD_NUMBER: _ClassVar[int]
@@ -174,6 +346,7 @@ class WilcoxonSignedRankTestResult(_message.Message):
     P_VALUE_FIELD_NUMBER: _ClassVar[int]
     CONCLUSION_FIELD_NUMBER: _ClassVar[int]
     SAMPLE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    MISSING_FIELDS_FIELD_NUMBER: _ClassVar[int]
     test_type: str
     variable1: str
     variable2: str
@@ -181,10 +354,11 @@ class WilcoxonSignedRankTestResult(_message.Message):
     p_value: float
     conclusion: str
     sample_size: int
-    def __init__(self, test_type: _Optional[str] = ..., variable1: _Optional[str] = ..., variable2: _Optional[str] = ..., statistic: _Optional[float] = ..., p_value: _Optional[float] = ..., conclusion: _Optional[str] = ..., sample_size: _Optional[int] = ...) -> None: ...
+    missing_fields: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, test_type: _Optional[str] = ..., variable1: _Optional[str] = ..., variable2: _Optional[str] = ..., statistic: _Optional[float] = ..., p_value: _Optional[float] = ..., conclusion: _Optional[str] = ..., sample_size: _Optional[int] = ..., missing_fields: _Optional[_Iterable[str]] = ...) -> None: ...
 
 class MannWhitneyTestResult(_message.Message):
-    __slots__ = ("test_type", "group_column", "value_column", "group1", "group2", "group1_size", "group2_size", "group1_median", "group2_median", "statistic", "p_value", "conclusion")
+    __slots__ = ("test_type", "group_column", "value_column", "group1", "group2", "group1_size", "group2_size", "group1_median", "group2_median", "statistic", "p_value", "conclusion", "missing_fields")
     TEST_TYPE_FIELD_NUMBER: _ClassVar[int]
     GROUP_COLUMN_FIELD_NUMBER: _ClassVar[int]
     VALUE_COLUMN_FIELD_NUMBER: _ClassVar[int]
@@ -197,6 +371,7 @@ class MannWhitneyTestResult(_message.Message):
     STATISTIC_FIELD_NUMBER: _ClassVar[int]
     P_VALUE_FIELD_NUMBER: _ClassVar[int]
     CONCLUSION_FIELD_NUMBER: _ClassVar[int]
+    MISSING_FIELDS_FIELD_NUMBER: _ClassVar[int]
     test_type: str
     group_column: str
     value_column: str
@@ -209,22 +384,51 @@ class MannWhitneyTestResult(_message.Message):
     statistic: float
     p_value: float
     conclusion: str
-    def __init__(self, test_type: _Optional[str] = ..., group_column: _Optional[str] = ..., value_column: _Optional[str] = ..., group1: _Optional[str] = ..., group2: _Optional[str] = ..., group1_size: _Optional[int] = ..., group2_size: _Optional[int] = ..., group1_median: _Optional[float] = ..., group2_median: _Optional[float] = ..., statistic: _Optional[float] = ..., p_value: _Optional[float] = ..., conclusion: _Optional[str] = ...) -> None: ...
+    missing_fields: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, test_type: _Optional[str] = ..., group_column: _Optional[str] = ..., value_column: _Optional[str] = ..., group1: _Optional[str] = ..., group2: _Optional[str] = ..., group1_size: _Optional[int] = ..., group2_size: _Optional[int] = ..., group1_median: _Optional[float] = ..., group2_median: _Optional[float] = ..., statistic: _Optional[float] = ..., p_value: _Optional[float] = ..., conclusion: _Optional[str] = ..., missing_fields: _Optional[_Iterable[str]] = ...) -> None: ...
 
 class RegressionAnalysisResponse(_message.Message):
-    __slots__ = ("dependent_variable", "independent_variables", "data_points", "models")
+    __slots__ = ("dependent_variable", "independent_variables", "data_points", "models", "density")
     DEPENDENT_VARIABLE_FIELD_NUMBER: _ClassVar[int]
     INDEPENDENT_VARIABLES_FIELD_NUMBER: _ClassVar[int]
     DATA_POINTS_FIELD_NUMBER: _ClassVar[int]
     MODELS_FIELD_NUMBER: _ClassVar[int]
+    DENSITY_FIELD_NUMBER: _ClassVar[int]
     dependent_variable: str
     independent_variables: _containers.RepeatedScalarFieldContainer[str]
     data_points: _containers.RepeatedCompositeFieldContainer[DataPoint]
     models: _containers.RepeatedCompositeFieldContainer[RegressionModel]
-    def __init__(self, dependent_variable: _Optional[str] = ..., independent_variables: _Optional[_Iterable[str]] = ..., data_points: _Optional[_Iterable[_Union[DataPoint, _Mapping]]] = ..., models: _Optional[_Iterable[_Union[RegressionModel, _Mapping]]] = ...) -> None: ...
+    density: DensityGrid
+    def __init__(self, dependent_variable: _Optional[str] = ..., independent_variables: _Optional[_Iterable[str]] = ..., data_points: _Optional[_Iterable[_Union[DataPoint, _Mapping]]] = ..., models: _Optional[_Iterable[_Union[RegressionModel, _Mapping]]] = ..., density: _Optional[_Union[DensityGrid, _Mapping]] = ...) -> None: ...
+
+class DensityGrid(_message.Message):
+    __slots__ = ("kind", "x_bins", "y_bins", "x_edges", "y_edges", "counts", "centers_x", "centers_y", "step_x", "step_y", "total_points")
+    KIND_FIELD_NUMBER: _ClassVar[int]
+    X_BINS_FIELD_NUMBER: _ClassVar[int]
+    Y_BINS_FIELD_NUMBER: _ClassVar[int]
+    X_EDGES_FIELD_NUMBER: _ClassVar[int]
+    Y_EDGES_FIELD_NUMBER: _ClassVar[int]
+    COUNTS_FIELD_NUMBER: _ClassVar[int]
+    CENTERS_X_FIELD_NUMBER: _ClassVar[int]
+    CENTERS_Y_FIELD_NUMBER: _ClassVar[int]
+    STEP_X_FIELD_NUMBER: _ClassVar[int]
+    STEP_Y_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_POINTS_FIELD_NUMBER: _ClassVar[int]
+    kind: str
+    x_bins: int
+    y_bins: int
+    x_edges: _containers.RepeatedScalarFieldContainer[float]
+    y_edges: _containers.RepeatedScalarFieldContainer[float]
+    counts: _containers.RepeatedScalarFieldContainer[int]
+    centers_x: _containers.RepeatedScalarFieldContainer[float]
+    centers_y: _containers.RepeatedScalarFieldContainer[float]
+    step_x: float
+    step_y: float
+    total_points: int
+    def __init__(self, kind: _Optional[str] = ..., x_bins: _Optional[int] = ..., y_bins: _Optional[int] = ..., x_edges: _Optional[_Iterable[float]] = ..., y_edges: _Optional[_Iterable[float]] = ..., counts: _Optional[_Iterable[int]] = ..., centers_x: _Optional[_Iterable[float]] = ..., centers_y: _Optional[_Iterable[float]] = ..., step_x: _Optional[float] = ..., step_y: _Optional[float] = ..., total_points: _Optional[int] = ...) -> None: ...
 
 class RegressionModel(_message.Message):
-    __slots__ = ("regression_type", "r_squared", "adjusted_r_squared", "f_statistic", "prob_f_statistic", "sse", "coefficients", "residuals", "residuals_analysis")
+    __slots__ = ("regression_type", "r_squared", "adjusted_r_squared", "f_statistic", "prob_f_statistic", "sse", "coefficients", "residuals", "residuals_analysis", "fitted_curve", "missing_fields")
     REGRESSION_TYPE_FIELD_NUMBER: _ClassVar[int]
     R_SQUARED_FIELD_NUMBER: _ClassVar[int]
     ADJUSTED_R_SQUARED_FIELD_NUMBER: _ClassVar[int]
@@ -234,6 +438,8 @@ class RegressionModel(_message.Message):
     COEFFICIENTS_FIELD_NUMBER: _ClassVar[int]
     RESIDUALS_FIELD_NUMBER: _ClassVar[int]
     RESIDUALS_ANALYSIS_FIELD_NUMBER: _ClassVar[int]
+    FITTED_CURVE_FIELD_NUMBER: _ClassVar[int]
+    MISSING_FIELDS_FIELD_NUMBER: _ClassVar[int]
     regression_type: str
     r_squared: float
     adjusted_r_squared: float
@@ -243,10 +449,12 @@ class RegressionModel(_message.Message):
     coefficients: _containers.RepeatedCompositeFieldContainer[RegressionCoefficient]
     residuals: _containers.RepeatedScalarFieldContainer[float]
     residuals_analysis: ResidualsAnalysisResult
-    def __init__(self, regression_type: _Optional[str] = ..., r_squared: _Optional[float] = ..., adjusted_r_squared: _Optional[float] = ..., f_statistic: _Optional[float] = ..., prob_f_statistic: _Optional[float] = ..., sse: _Optional[float] = ..., coefficients: _Optional[_Iterable[_Union[RegressionCoefficient, _Mapping]]] = ..., residuals: _Optional[_Iterable[float]] = ..., residuals_analysis: _Optional[_Union[ResidualsAnalysisResult, _Mapping]] = ...) -> None: ...
+    fitted_curve: _containers.RepeatedCompositeFieldContainer[DataPoint]
+    missing_fields: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, regression_type: _Optional[str] = ..., r_squared: _Optional[float] = ..., adjusted_r_squared: _Optional[float] = ..., f_statistic: _Optional[float] = ..., prob_f_statistic: _Optional[float] = ..., sse: _Optional[float] = ..., coefficients: _Optional[_Iterable[_Union[RegressionCoefficient, _Mapping]]] = ..., residuals: _Optional[_Iterable[float]] = ..., residuals_analysis: _Optional[_Union[ResidualsAnalysisResult, _Mapping]] = ..., fitted_curve: _Optional[_Iterable[_Union[DataPoint, _Mapping]]] = ..., missing_fields: _Optional[_Iterable[str]] = ...) -> None: ...
 
 class RegressionCoefficient(_message.Message):
-    __slots__ = ("variable_name", "coefficient", "std_error", "t_statistic", "p_value", "confidence_interval_lower", "confidence_interval_upper")
+    __slots__ = ("variable_name", "coefficient", "std_error", "t_statistic", "p_value", "confidence_interval_lower", "confidence_interval_upper", "missing_fields")
     VARIABLE_NAME_FIELD_NUMBER: _ClassVar[int]
     COEFFICIENT_FIELD_NUMBER: _ClassVar[int]
     STD_ERROR_FIELD_NUMBER: _ClassVar[int]
@@ -254,6 +462,7 @@ class RegressionCoefficient(_message.Message):
     P_VALUE_FIELD_NUMBER: _ClassVar[int]
     CONFIDENCE_INTERVAL_LOWER_FIELD_NUMBER: _ClassVar[int]
     CONFIDENCE_INTERVAL_UPPER_FIELD_NUMBER: _ClassVar[int]
+    MISSING_FIELDS_FIELD_NUMBER: _ClassVar[int]
     variable_name: str
     coefficient: float
     std_error: float
@@ -261,7 +470,8 @@ class RegressionCoefficient(_message.Message):
     p_value: float
     confidence_interval_lower: float
     confidence_interval_upper: float
-    def __init__(self, variable_name: _Optional[str] = ..., coefficient: _Optional[float] = ..., std_error: _Optional[float] = ..., t_statistic: _Optional[float] = ..., p_value: _Optional[float] = ..., confidence_interval_lower: _Optional[float] = ..., confidence_interval_upper: _Optional[float] = ...) -> None: ...
+    missing_fields: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, variable_name: _Optional[str] = ..., coefficient: _Optional[float] = ..., std_error: _Optional[float] = ..., t_statistic: _Optional[float] = ..., p_value: _Optional[float] = ..., confidence_interval_lower: _Optional[float] = ..., confidence_interval_upper: _Optional[float] = ..., missing_fields: _Optional[_Iterable[str]] = ...) -> None: ...
 
 class DataPoint(_message.Message):
     __slots__ = ("x", "y")
@@ -39,6 +39,21 @@ class AnalysisServiceStub(object):
                 request_serializer=analysis__pb2.AnalysisRequest.SerializeToString,
                 response_deserializer=analysis__pb2.AnalyzeDataResponse.FromString,
                 _registered_method=True)
+        self.AnalyzeDataProgressive = channel.unary_stream(
+                '/analysis.AnalysisService/AnalyzeDataProgressive',
+                request_serializer=analysis__pb2.AnalysisRequest.SerializeToString,
+                response_deserializer=analysis__pb2.ProgressiveUpdate.FromString,
+                _registered_method=True)
+        self.CreateDataset = channel.unary_unary(
+                '/analysis.AnalysisService/CreateDataset',
+                request_serializer=analysis__pb2.DatasetRequest.SerializeToString,
+                response_deserializer=analysis__pb2.DatasetResponse.FromString,
+                _registered_method=True)
+        self.AppendRows = channel.unary_unary(
+                '/analysis.AnalysisService/AppendRows',
+                request_serializer=analysis__pb2.DatasetRequest.SerializeToString,
+                response_deserializer=analysis__pb2.DatasetResponse.FromString,
+                _registered_method=True)
 
 
 class AnalysisServiceServicer(object):
@@ -50,6 +65,27 @@ class AnalysisServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def AnalyzeDataProgressive(self, request, context):
+        """Онлайн-агрегация: уточняющиеся оценки после каждого блока строк, обработанных в случайном порядке.
+        Клиент может прекратить чтение потока (отменить вызов), когда оценки стабилизировались
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CreateDataset(self, request, context):
+        """Пополняемые наборы данных, хранимые на сервере: статистики обновляются только по добавленным строкам
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def AppendRows(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_AnalysisServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -58,6 +94,21 @@ def add_AnalysisServiceServicer_to_server(servicer, server):
                     request_deserializer=analysis__pb2.AnalysisRequest.FromString,
                     response_serializer=analysis__pb2.AnalyzeDataResponse.SerializeToString,
             ),
+            'AnalyzeDataProgressive': grpc.unary_stream_rpc_method_handler(
+                    servicer.AnalyzeDataProgressive,
+                    request_deserializer=analysis__pb2.AnalysisRequest.FromString,
+                    response_serializer=analysis__pb2.ProgressiveUpdate.SerializeToString,
+            ),
+            'CreateDataset': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateDataset,
+                    request_deserializer=analysis__pb2.DatasetRequest.FromString,
+                    response_serializer=analysis__pb2.DatasetResponse.SerializeToString,
+            ),
+            'AppendRows': grpc.unary_unary_rpc_method_handler(
+                    servicer.AppendRows,
+                    request_deserializer=analysis__pb2.DatasetRequest.FromString,
+                    response_serializer=analysis__pb2.DatasetResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'analysis.AnalysisService', rpc_method_handlers)
@@ -95,3 +146,84 @@ class AnalysisService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def AnalyzeDataProgressive(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/analysis.AnalysisService/AnalyzeDataProgressive',
+            analysis__pb2.AnalysisRequest.SerializeToString,
+            analysis__pb2.ProgressiveUpdate.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CreateDataset(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/analysis.AnalysisService/CreateDataset',
+            analysis__pb2.DatasetRequest.SerializeToString,
+            analysis__pb2.DatasetResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def AppendRows(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/analysis.AnalysisService/AppendRows',
+            analysis__pb2.DatasetRequest.SerializeToString,
+            analysis__pb2.DatasetResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -1,18 +1,35 @@
-from typing import List, Dict, Any, Tuple
+from concurrent.futures import Executor
+from typing import List, Dict, Any, Tuple, Optional
 import pandas as pd
 
 from internal.core.ports.analysis_ports import ConfidenceIntervalPort
+from analysis_modules.column_artifacts import ColumnArtifacts
+from analysis_modules.column_partition import map_column_chunks, DEFAULT_COLUMN_CHUNK_SIZE
 from analysis_modules.confidence_interval import calculate_confidence_intervals
+from analysis_modules.weighted import calculate_weighted_confidence_intervals
 
 class ConfidenceIntervalAdapter(ConfidenceIntervalPort):
     """Адаптер для модуля расчета доверительных интервалов"""
+
+    def __init__(self, column_executor: Optional[Executor] = None,
+                 column_chunk_size: int = DEFAULT_COLUMN_CHUNK_SIZE):
+        """
+        Args:
+            column_executor: Пул процессов для обработки порций столбцов широких наборов данных (None - в текущем потоке).
+            column_chunk_size: Количество столбцов в одной порции.
+        """
+        self.column_executor = column_executor
+        self.column_chunk_size = column_chunk_size
     
-    def calculate_confidence_intervals(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], List[str]]:
+    def calculate_confidence_intervals(self, df: pd.DataFrame, artifacts: Optional[ColumnArtifacts] = None,
+                                       population_size: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
         """
         Вычисляет доверительные интервалы для числовых столбцов DataFrame.
         
         Args:
             df: Входной DataFrame.
+            artifacts: Общие промежуточные результаты по столбцам для повторного использования между анализами.
+            population_size: Количество строк исходных данных, если df - выборка (для поправки на конечную совокупность).
             
         Returns:
             Кортеж:
@@ -21,4 +38,24 @@ class ConfidenceIntervalAdapter(ConfidenceIntervalPort):
         """
         
         # Делегируем расчеты существующей функции из analysis_modules
-        return calculate_confidence_intervals(df) 
\ No newline at end of file
+        return map_column_chunks(calculate_confidence_intervals, df, artifacts=artifacts,
+                                 executor=self.column_executor, chunk_size=self.column_chunk_size,
+                                 population_size=population_size)
+
+    def calculate_weighted_confidence_intervals(self, df: pd.DataFrame, weight_column: str,
+                                                population_size: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Вычисляет доверительные интервалы взвешенного среднего числовых столбцов.
+
+        Args:
+            df: Входной DataFrame.
+            weight_column: Столбец весов строк.
+            population_size: Количество строк исходных данных, если df - выборка (для поправки на конечную совокупность).
+
+        Returns:
+            Кортеж:
+            - Список словарей с доверительными интервалами (с эффективным объемом выборки)
+            - Список логов обработки
+        """
+        # Порции столбцов не содержат столбец весов, поэтому все столбцы обрабатываются одним блоком
+        return calculate_weighted_confidence_intervals(df, weight_column, population_size=population_size)
@@ -3,20 +3,28 @@ import pandas as pd
 from typing import List, Tuple, Optional
 
 from internal.core.ports.analysis_ports import DataLoaderPort
+from analysis_modules.sampling import reservoir_sample, DEFAULT_SAMPLE_SEED, MAX_SAMPLE_STRATA, SAMPLE_READ_CHUNK_ROWS
 
 class FileDataLoader(DataLoaderPort):
     """Загрузчик данных из файлов различных форматов"""
     
-    def load_data(self, file_content: bytes, file_name: str) -> Tuple[Optional[pd.DataFrame], List[str]]:
+    def load_data(self, file_content: bytes, file_name: str, sample_size: Optional[int] = None,
+                  stratify_by: Optional[str] = None,
+                  sample_seed: int = DEFAULT_SAMPLE_SEED) -> Tuple[Optional[pd.DataFrame], List[str]]:
         """
         Загружает данные из байтового содержимого файла.
         
         Args:
             file_content: Байтовое содержимое файла
             file_name: Имя файла (для определения формата)
+            sample_size: Размер случайной выборки строк (None - все строки). CSV читается порциями
+                         за один проход, и в памяти хранится только выборка.
+            stratify_by: Столбец групп для стратифицированной выборки (None - простая случайная выборка).
+            sample_seed: Зерно генератора выборки.
             
         Returns:
-            Кортеж (DataFrame с загруженными данными, список логов)
+            Кортеж (DataFrame с загруженными данными, список логов).
+            Для выборки ее описание записывается в df.attrs["sampling"].
         """
         logs = []
         df = None
@@ -36,7 +44,14 @@ class FileDataLoader(DataLoaderPort):
             # Оборачиваем байты в BytesIO, чтобы pandas мог их прочитать как файл
             file_like_object = io.BytesIO(file_content)
             
-            if file_type == "csv":
+            if file_type == "csv" and sample_size:
+                columns = pd.read_csv(io.BytesIO(file_content), nrows=0).columns
+                stratify_by = self._check_stratify_column(stratify_by, columns, logs)
+                reader = pd.read_csv(file_like_object, chunksize=SAMPLE_READ_CHUNK_ROWS)
+                df = self._finish_sample(reservoir_sample(reader, sample_size, seed=sample_seed, stratify_by=stratify_by), logs)
+                logs.append(f"Successfully parsed CSV data. Shape: {df.shape}")
+                sample_size = None
+            elif file_type == "csv":
                 df = pd.read_csv(file_like_object)
                 logs.append(f"Successfully parsed CSV data. Shape: {df.shape}")
             elif file_type == "xlsx":
@@ -59,6 +74,11 @@ class FileDataLoader(DataLoaderPort):
             if df is None or df.empty:
                 logs.append("Error: Loaded dataframe is empty")
                 return None, logs
+
+            # Файлы остальных форматов читаются целиком, выборка строится одним проходом по DataFrame
+            if sample_size and len(df) > sample_size:
+                stratify_by = self._check_stratify_column(stratify_by, df.columns, logs)
+                df = self._finish_sample(reservoir_sample([df], sample_size, seed=sample_seed, stratify_by=stratify_by), logs)
             
             # Базовая очистка данных
             # Проверка на наличие пропущенных значений
@@ -68,10 +88,36 @@ class FileDataLoader(DataLoaderPort):
                 logs.append(f"Warning: Found missing values in columns: {list(na_cols.index)}")
                 
             # Информация о типах данных
-            logs.append(f"DataFrame dtypes: {df.dtypes.to_dict()}")
+            logs.append(f"Debug: DataFrame dtypes: {df.dtypes.to_dict()}")
             
             return df, logs
         
         except Exception as e:
             logs.append(f"Error loading data: {str(e)}")
-            return None, logs 
\ No newline at end of file
+            return None, logs
+
+    @staticmethod
+    def _check_stratify_column(stratify_by: Optional[str], columns, logs: List[str]) -> Optional[str]:
+        """Проверяет наличие столбца страт; при его отсутствии выборка строится без стратификации."""
+        if stratify_by is not None and stratify_by not in columns:
+            logs.append(f"Warning: Stratification column '{stratify_by}' not found, using simple random sampling")
+            return None
+        return stratify_by
+
+    @staticmethod
+    def _finish_sample(sample: pd.DataFrame, logs: List[str]) -> pd.DataFrame:
+        """Записывает выборку в журнал; если в выборку попали все строки, данные считаются полными."""
+        sampling = sample.attrs.get("sampling")
+        if sampling is None:
+            return sample
+        if sampling.get("rejected_stratify_by"):
+            logs.append(f"Warning: Stratification column '{sampling['rejected_stratify_by']}' has more than "
+                        f"{MAX_SAMPLE_STRATA} groups, using simple random sampling")
+        if sampling["sample_size"] >= sampling["population_size"]:
+            sample.attrs.pop("sampling")
+            logs.append(f"Sampling skipped: file has only {sampling['population_size']} rows")
+            return sample
+        logs.append(f"Using {sampling['method']} sample of {sampling['sample_size']} of {sampling['population_size']} rows"
+                    + (f" stratified by '{sampling['stratify_by']}'" if sampling["stratify_by"] else "")
+                    + f" (seed {sampling['seed']})")
+        return sample
@@ -0,0 +1,142 @@
+import contextlib
+import fcntl
+import logging
+import os
+import pickle
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from analysis_modules.incremental import DATASET_FORMAT_VERSION
+from internal.core.ports.analysis_ports import DatasetStorePort
+
+logger = logging.getLogger(__name__)
+
+# Идентификатор набора данных используется в имени файла
+DATASET_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class FileDatasetStore(DatasetStorePort):
+    """
+    Хранилище пополняемых наборов данных:
+    - LRU в памяти процесса;
+    - необязательный каталог на диске, общий для всех рабочих процессов. Изменения набора данных
+      сериализуются блокировкой файла, а копия в памяти используется, только если файл с тех пор не менялся.
+      Файл содержит версию формата статистик и сами статистики; файл другой версии не читается.
+    """
+
+    def __init__(self, max_entries: int = 16, disk_dir: Optional[str] = None,
+                 format_version: int = DATASET_FORMAT_VERSION):
+        """
+        Args:
+            max_entries: Максимальное количество наборов данных в памяти (0 - уровень в памяти отключен).
+            disk_dir: Каталог для хранения на диске. None - наборы данных хранятся только в памяти процесса.
+            format_version: Версия формата сохраняемых статистик.
+        """
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.format_version = format_version
+        # Накопленные статистики и время изменения файла, из которого они прочитаны
+        self._memory: "OrderedDict[str, Tuple[Any, Optional[int]]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+        # Блокировки наборов данных с количеством ожидающих и удерживающих их потоков:
+        # блокировка удаляется, когда она больше никому не нужна, поэтому словарь не растет с числом наборов
+        self._dataset_locks: Dict[str, Tuple[threading.Lock, int]] = {}
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    @staticmethod
+    def _check_id(dataset_id: str):
+        if not DATASET_ID_PATTERN.match(dataset_id or ""):
+            raise ValueError(f"Invalid dataset id '{dataset_id}': use 1-64 letters, digits, '_' or '-'")
+
+    def _path(self, dataset_id: str, suffix: str = ".pkl") -> str:
+        return os.path.join(self.disk_dir, f"{dataset_id}{suffix}")
+
+    @contextlib.contextmanager
+    def lock(self, dataset_id: str) -> Iterator[None]:
+        self._check_id(dataset_id)
+        with self._memory_lock:
+            thread_lock, users = self._dataset_locks.get(dataset_id, (None, 0))
+            if thread_lock is None:
+                thread_lock = threading.Lock()
+            self._dataset_locks[dataset_id] = (thread_lock, users + 1)
+        try:
+            with thread_lock:
+                if not self.disk_dir:
+                    yield
+                    return
+                # Блокировка файла согласует изменения одного набора данных в разных рабочих процессах
+                with open(self._path(dataset_id, ".lock"), "a") as lock_file:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                    try:
+                        yield
+                    finally:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+        finally:
+            with self._memory_lock:
+                thread_lock, users = self._dataset_locks[dataset_id]
+                if users > 1:
+                    self._dataset_locks[dataset_id] = (thread_lock, users - 1)
+                else:
+                    del self._dataset_locks[dataset_id]
+
+    def get(self, dataset_id: str) -> Optional[Any]:
+        self._check_id(dataset_id)
+        disk_mtime = None
+        if self.disk_dir:
+            try:
+                disk_mtime = os.stat(self._path(dataset_id)).st_mtime_ns
+            except FileNotFoundError:
+                return None
+
+        with self._memory_lock:
+            cached = self._memory.get(dataset_id)
+            if cached is not None and cached[1] == disk_mtime:
+                self._memory.move_to_end(dataset_id)
+                return cached[0]
+
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._path(dataset_id), "rb") as dataset_file:
+                stored = pickle.load(dataset_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            raise ValueError(f"Dataset '{dataset_id}' could not be read: {e}") from e
+        format_version = stored.get("format_version") if isinstance(stored, dict) else None
+        if format_version != self.format_version:
+            stored_format = f"format version {format_version}" if format_version is not None else "an unversioned format"
+            raise ValueError(f"Dataset '{dataset_id}' was stored in {stored_format}, "
+                             f"this server reads version {self.format_version}; create the dataset again")
+        statistics = stored["statistics"]
+        self._put_in_memory(dataset_id, statistics, disk_mtime)
+        return statistics
+
+    def put(self, dataset_id: str, statistics: Any) -> None:
+        self._check_id(dataset_id)
+        disk_mtime = None
+        if self.disk_dir:
+            # Пишем во временный файл и атомарно переименовываем, чтобы другие процессы
+            # никогда не прочитали частично записанный набор данных
+            fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as tmp_file:
+                pickle.dump({"format_version": self.format_version, "statistics": statistics},
+                            tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(dataset_id))
+            disk_mtime = os.stat(self._path(dataset_id)).st_mtime_ns
+        self._put_in_memory(dataset_id, statistics, disk_mtime)
+
+    def _put_in_memory(self, dataset_id: str, statistics: Any, disk_mtime: Optional[int]):
+        if self.max_entries <= 0:
+            return
+        with self._memory_lock:
+            self._memory[dataset_id] = (statistics, disk_mtime)
+            self._memory.move_to_end(dataset_id)
+            while len(self._memory) > self.max_entries:
+                evicted, _ = self._memory.popitem(last=False)
+                if not self.disk_dir:
+                    logger.warning("Dataset %s evicted from memory; start the server with --dataset-dir to keep datasets", evicted)
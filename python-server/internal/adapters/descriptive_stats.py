@@ -1,18 +1,41 @@
-from typing import List, Dict, Any, Tuple
+from concurrent.futures import Executor
+from typing import List, Dict, Any, Tuple, Optional, Union
 import pandas as pd
 
 from internal.core.ports.analysis_ports import DescriptiveStatsPort
+from analysis_modules.column_artifacts import ColumnArtifacts
+from analysis_modules.column_partition import map_column_chunks, DEFAULT_COLUMN_CHUNK_SIZE
 from analysis_modules.descriptive import calculate_descriptive_stats
+from analysis_modules.grouped import calculate_grouped_descriptive_stats
+from analysis_modules.histogram_engine import DEFAULT_HISTOGRAM_BIN_RULE
+from analysis_modules.moment_accumulator import MomentAccumulator
+from analysis_modules.outliers import detect_outliers
+from analysis_modules.weighted import calculate_weighted_descriptive_stats
 
 class DescriptiveStatsAdapter(DescriptiveStatsPort):
     """Адаптер для модуля расчета описательных статистик"""
+
+    def __init__(self, column_executor: Optional[Executor] = None,
+                 column_chunk_size: int = DEFAULT_COLUMN_CHUNK_SIZE):
+        """
+        Args:
+            column_executor: Пул процессов для обработки порций столбцов широких наборов данных (None - в текущем потоке).
+            column_chunk_size: Количество столбцов в одной порции.
+        """
+        self.column_executor = column_executor
+        self.column_chunk_size = column_chunk_size
     
-    def calculate_descriptive_stats(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[str]]:
+    def calculate_descriptive_stats(self, df: pd.DataFrame, artifacts: Optional[ColumnArtifacts] = None,
+                                    quantile_sketch_k: Optional[int] = None,
+                                    histogram_bins: Union[int, str] = DEFAULT_HISTOGRAM_BIN_RULE) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[str]]:
         """
         Вычисляет описательные статистики и данные гистограмм для числовых столбцов DataFrame.
         
         Args:
             df: Входной DataFrame.
+            artifacts: Общие промежуточные результаты по столбцам для повторного использования между анализами.
+            quantile_sketch_k: Параметр точности KLL-скетча для медианы и квартилей (None - точные значения).
+            histogram_bins: Правило выбора интервалов гистограмм или их количество.
             
         Returns:
             Кортеж из трех элементов:
@@ -22,4 +45,92 @@ class DescriptiveStatsAdapter(DescriptiveStatsPort):
         """
         
         # Делегируем расчеты существующей функции из analysis_modules
-        return calculate_descriptive_stats(df) 
\ No newline at end of file
+        return map_column_chunks(calculate_descriptive_stats, df, artifacts=artifacts,
+                                 executor=self.column_executor, chunk_size=self.column_chunk_size,
+                                 quantile_sketch_k=quantile_sketch_k, histogram_bins=histogram_bins)
+
+    def calculate_grouped_descriptive_stats(self, df: pd.DataFrame, group_column: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Вычисляет описательные статистики числовых столбцов в каждой группе строк.
+
+        Args:
+            df: Входной DataFrame.
+            group_column: Столбец, задающий группы.
+
+        Returns:
+            Кортеж из двух элементов:
+            - Список словарей со статистиками пар (группа, столбец)
+            - Список логов обработки
+        """
+        # Порции столбцов не содержат столбец групп, поэтому все столбцы обрабатываются одним блоком
+        return calculate_grouped_descriptive_stats(df, group_column)
+
+    def detect_outliers(self, df: pd.DataFrame, descriptives: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Находит выбросы числовых столбцов для диаграмм размаха.
+
+        Args:
+            df: Входной DataFrame.
+            descriptives: Описательные статистики столбцов (квартили, медиана, среднее, стандартное отклонение).
+
+        Returns:
+            Кортеж из двух элементов:
+            - Список словарей с границами, количествами и наиболее удаленными выбросами столбцов
+            - Список логов обработки
+        """
+        # Маски выбросов всех столбцов вычисляются одним блоком, поэтому порции столбцов не используются
+        return detect_outliers(df, descriptives)
+
+    def calculate_weighted_descriptive_stats(self, df: pd.DataFrame, weight_column: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Вычисляет взвешенные описательные статистики числовых столбцов.
+
+        Args:
+            df: Входной DataFrame.
+            weight_column: Столбец весов строк.
+
+        Returns:
+            Кортеж из двух элементов:
+            - Список словарей с описательными статистиками (с эффективным объемом выборки)
+            - Список логов обработки
+        """
+        # Порции столбцов не содержат столбец весов, поэтому все столбцы обрабатываются одним блоком
+        return calculate_weighted_descriptive_stats(df, weight_column)
+
+    def accumulate_moments(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> MomentAccumulator:
+        """
+        Вычисляет моменты порции строк или раздела данных.
+
+        Args:
+            df: Порция или раздел строк.
+            columns: Столбцы накопителя (по умолчанию - числовые столбцы df). Накопители объединяются,
+                только если построены для одних и тех же столбцов.
+
+        Returns:
+            Накопитель моментов MomentAccumulator
+        """
+        return MomentAccumulator.from_frame(df, columns)
+
+    def merge_moments(self, accumulators: List[MomentAccumulator]) -> MomentAccumulator:
+        """
+        Объединяет накопители моментов порций или разделов данных (попарно, сбалансированным деревом).
+
+        Args:
+            accumulators: Накопители, построенные для одних и тех же столбцов.
+
+        Returns:
+            Накопитель моментов объединения
+        """
+        return MomentAccumulator.merge_all(accumulators)
+
+    def moment_statistics(self, accumulator: MomentAccumulator) -> List[Dict[str, Any]]:
+        """
+        Вычисляет описательные статистики по накопителю моментов.
+
+        Args:
+            accumulator: Накопитель моментов.
+
+        Returns:
+            Список словарей со статистиками столбцов (без медианы, квартилей и моды)
+        """
+        return accumulator.statistics()
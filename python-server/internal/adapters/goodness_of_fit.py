@@ -1,18 +1,32 @@
-from typing import List, Dict, Any, Tuple
+from concurrent.futures import Executor
+from typing import List, Dict, Any, Tuple, Optional
 import pandas as pd
 
 from internal.core.ports.analysis_ports import GoodnessOfFitPort
+from analysis_modules.column_artifacts import ColumnArtifacts
+from analysis_modules.column_partition import map_column_chunks, DEFAULT_COLUMN_CHUNK_SIZE
 from analysis_modules.goodness_of_fit import perform_chi_square_test
 
 class GoodnessOfFitAdapter(GoodnessOfFitPort):
     """Адаптер для модуля критерия согласия хи-квадрат"""
+
+    def __init__(self, column_executor: Optional[Executor] = None,
+                 column_chunk_size: int = DEFAULT_COLUMN_CHUNK_SIZE):
+        """
+        Args:
+            column_executor: Пул процессов для обработки порций столбцов широких наборов данных (None - в текущем потоке).
+            column_chunk_size: Количество столбцов в одной порции.
+        """
+        self.column_executor = column_executor
+        self.column_chunk_size = column_chunk_size
     
-    def perform_chi_square_test(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], List[str]]:
+    def perform_chi_square_test(self, df: pd.DataFrame, artifacts: Optional[ColumnArtifacts] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
         """
         Выполняет критерий хи-квадрат для проверки нормальности распределения.
         
         Args:
             df: Входной DataFrame.
+            artifacts: Общие промежуточные результаты по столбцам для повторного использования между анализами.
             
         Returns:
             Кортеж:
@@ -21,4 +35,5 @@ class GoodnessOfFitAdapter(GoodnessOfFitPort):
         """
         
         # Делегируем расчеты существующей функции из analysis_modules
-        return perform_chi_square_test(df) 
\ No newline at end of file
+        return map_column_chunks(perform_chi_square_test, df, artifacts=artifacts,
+                                 executor=self.column_executor, chunk_size=self.column_chunk_size) 
\ No newline at end of file
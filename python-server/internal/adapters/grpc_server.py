@@ -1,16 +1,56 @@
 import grpc
+import logging
 from concurrent import futures
 import time
 import sys
-from typing import Optional
+from typing import Optional, List, Tuple, Any, Sequence
 
 import analysis_pb2
 import analysis_pb2_grpc
 
-from internal.core.domain.entities import DataFileRequest
+from internal.core.domain.entities import DataFileRequest, DatasetRequest
 from internal.core.ports.analysis_ports import AnalysisServicePort
 from internal.core.services.analysis_service import WILCOXON_SIGNED_RANK_ANALYSIS, MANN_WHITNEY_ANALYSIS
 
+logger = logging.getLogger(__name__)
+
+# Поля доменных объектов, которые называются в сообщениях gRPC иначе
+PROTO_FIELD_NAMES = {
+    "point_estimate": "mean",
+    "standard_error": "std_error",
+    "f_p_value": "prob_f_statistic",
+}
+
+
+def _proto_missing_fields(missing_fields: Sequence[str]) -> List[str]:
+    """Имена неопределенных полей результата в терминах сообщения gRPC."""
+    return [PROTO_FIELD_NAMES.get(name, name) for name in missing_fields]
+
+
+def _descriptive_stats_message(stat) -> analysis_pb2.DescriptiveStatistics:
+    """Сообщение gRPC с описательными статистиками переменной."""
+    pb_stat = analysis_pb2.DescriptiveStatistics()
+    pb_stat.variable_name = stat.variable_name
+    pb_stat.count = str(stat.count)  # Преобразуем в строку для совместимости
+    pb_stat.mean = stat.mean
+    pb_stat.median = stat.median
+    pb_stat.mode.extend([str(m) for m in stat.mode])  # Преобразуем в строки
+    pb_stat.mode_frequency = stat.mode_frequency
+    pb_stat.mode_count = stat.mode_count
+    pb_stat.variance = stat.variance
+    pb_stat.std_dev = stat.std_dev
+    pb_stat.variation_coefficient = stat.variation_coefficient
+    pb_stat.skewness = stat.skewness
+    pb_stat.kurtosis = stat.kurtosis
+    pb_stat.min_value = stat.min_value
+    pb_stat.max_value = stat.max_value
+    pb_stat.q1 = stat.q1
+    pb_stat.q3 = stat.q3
+    pb_stat.iqr = stat.iqr
+    pb_stat.effective_sample_size = stat.effective_sample_size
+    pb_stat.missing_fields.extend(stat.missing_fields)
+    return pb_stat
+
 
 class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
     """gRPC адаптер для сервиса анализа данных"""
@@ -28,7 +68,7 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
             self.data_loader = analysis_service.data_loader
         else:
             self.data_loader = None
-            print("Warning: analysis_service does not have data_loader attribute")
+            logger.warning("analysis_service does not have data_loader attribute")
     
     def AnalyzeData(self, request, context):
         """
@@ -41,8 +81,8 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
         Returns:
             Ответ с результатами анализа в формате protobuf
         """
-        print(f"Received request to analyze file: {request.file_name}")
-        print(f"Selected analyses from gRPC request: {list(request.selected_analyses)}")
+        logger.info("Received request to analyze file: %s", request.file_name)
+        logger.debug("Selected analyses from gRPC request: %s", request.selected_analyses)
         
         # Создаем объект ответа
         grpc_response = analysis_pb2.AnalyzeDataResponse()
@@ -50,11 +90,11 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
         try:
             # Проверяем, это запрос на получение списка столбцов
             if "get_columns" in request.selected_analyses:
-                print("Detected request for column names")
+                logger.debug("Detected request for column names")
                 # Проверяем доступность data_loader
                 if self.data_loader is None:
                     error_msg = "ERROR: data_loader is not available for column extraction"
-                    print(error_msg)
+                    logger.error(error_msg)
                     grpc_response.processing_log.append(error_msg)
                     
                     error_details_msg = analysis_pb2.ErrorDetails()
@@ -77,11 +117,17 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
                         # Добавляем имена столбцов в лог обработки с особым префиксом
                         columns_str = ",".join(df.columns.tolist())
                         grpc_response.processing_log.append(f"COLUMNS:{columns_str}")
-                        print(f"Returning {len(df.columns)} columns: {columns_str}")
+                        logger.info("Returning %d columns for %s", len(df.columns), request.file_name)
+                        
+                        # В спекулятивном режиме сервис сохраняет разобранные данные
+                        # и заранее начинает независимые от параметров расчеты
+                        if hasattr(self.analysis_service, 'prefetch_dataset'):
+                            if self.analysis_service.prefetch_dataset(request.file_content, request.file_name, df, load_logs):
+                                logger.info("Started speculative pre-analysis for %s", request.file_name)
                     else:
                         error_msg = "ERROR: Failed to load data for column extraction"
                         grpc_response.processing_log.append(error_msg)
-                        print(error_msg)
+                        logger.error(error_msg)
                         
                         # Добавляем информацию об ошибке
                         error_details_msg = analysis_pb2.ErrorDetails()
@@ -94,7 +140,7 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
                     import traceback
                     error_message = f"Error loading data for column extraction: {e}"
                     full_traceback = traceback.format_exc()
-                    print(f"{error_message}\n{full_traceback}")
+                    logger.error("Error loading data for column extraction: %s", e, exc_info=True)
                     
                     grpc_response.processing_log.append(error_message)
                     grpc_response.processing_log.append(full_traceback)
@@ -126,7 +172,7 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
             import traceback
             error_message = f"Error analyzing data: {e}"
             full_traceback = traceback.format_exc()
-            print(f"{error_message}\n{full_traceback}")
+            logger.error("Error analyzing data: %s", e, exc_info=True)
             
             grpc_response.processing_log.append(error_message)
             
@@ -172,21 +218,21 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
                     if hasattr(hist, 'normal_curve_x') and hist.normal_curve_x:
                         pb_hist.normal_curve_x.extend(hist.normal_curve_x)
                         has_normal_curve = True
-                        print(f"Adding normal_curve_x for {hist.variable_name}: {len(hist.normal_curve_x)} points")
+                        logger.debug("Adding normal_curve_x for %s: %d points", hist.variable_name, len(hist.normal_curve_x))
                     if hasattr(hist, 'normal_curve_y') and hist.normal_curve_y:
                         pb_hist.normal_curve_y.extend(hist.normal_curve_y)
-                        print(f"Adding normal_curve_y for {hist.variable_name}: {len(hist.normal_curve_y)} points")
+                        logger.debug("Adding normal_curve_y for %s: %d points", hist.variable_name, len(hist.normal_curve_y))
                     if hasattr(hist, 'mean'):
                         pb_hist.mean = hist.mean
-                        print(f"Adding mean for {hist.variable_name}: {hist.mean}")
+                        logger.debug("Adding mean for %s: %s", hist.variable_name, hist.mean)
                     if hasattr(hist, 'std_dev'):
                         pb_hist.std_dev = hist.std_dev
-                        print(f"Adding std_dev for {hist.variable_name}: {hist.std_dev}")
+                        logger.debug("Adding std_dev for %s: %s", hist.variable_name, hist.std_dev)
                     
                     if has_normal_curve:
-                        print(f"Normal curve data added for {hist.variable_name}")
+                        logger.debug("Normal curve data added for %s", hist.variable_name)
                     else:
-                        print(f"No normal curve data for {hist.variable_name}")
+                        logger.debug("No normal curve data for %s", hist.variable_name)
                     
                     desc_stats_response.histograms.append(pb_hist)
                 
@@ -261,8 +307,7 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
                     else:
                         model.regression_type = "Linear"
                     
-                    # Debug logging
-                    grpc_response.processing_log.append(f"DEBUG: Adding regression model of type: {model.regression_type}")
+                    logger.debug("Adding regression model of type: %s", model.regression_type)
                     
                     # Set model metrics
                     model.r_squared = reg_domain_data.r_squared
@@ -357,7 +402,7 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
             import traceback
             error_message = f"Error analyzing data: {e}"
             full_traceback = traceback.format_exc()
-            print(f"{error_message}\n{full_traceback}")
+            logger.error("Error analyzing data: %s", e, exc_info=True)
             
             grpc_response.processing_log.append(error_message)
             grpc_response.processing_log.append(full_traceback)
@@ -372,6 +417,112 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
             context.set_details(error_message)
             return grpc_response
 
+    def AnalyzeDataProgressive(self, request, context):
+        """
+        Обрабатывает потоковый gRPC запрос онлайн-агрегации: после каждого блока строк
+        отправляет клиенту уточненные оценки. Обработка прекращается, когда клиент отменяет вызов.
+        
+        Args:
+            request: gRPC запрос с файлом для анализа
+            context: Контекст gRPC запроса
+        
+        Returns:
+            Поток сообщений ProgressiveUpdate
+        """
+        logger.info("Received progressive analysis request for file: %s", request.file_name)
+        domain_request = DataFileRequest(
+            file_content=request.file_content,
+            file_name=request.file_name,
+            selected_analyses=list(request.selected_analyses)
+        )
+        try:
+            for update in self.analysis_service.analyze_data_progressive(domain_request, is_active=context.is_active):
+                yield self._convert_progressive_update(update)
+        except Exception as e:
+            import traceback
+            logger.error("Error in progressive analysis: %s", e, exc_info=True)
+            grpc_update = analysis_pb2.ProgressiveUpdate()
+            grpc_update.processing_log.append(f"Error analyzing data: {e}")
+            grpc_update.error.code = "ANALYSIS_ERROR"
+            grpc_update.error.message = str(e)
+            grpc_update.error.details.append(traceback.format_exc())
+            yield grpc_update
+
+    def CreateDataset(self, request, context):
+        """
+        Обрабатывает gRPC запрос на создание хранимого на сервере набора данных.
+        
+        Args:
+            request: gRPC запрос с исходными строками набора данных
+            context: Контекст gRPC запроса
+        
+        Returns:
+            Статистики набора данных в формате protobuf
+        """
+        logger.info("Received request to create dataset from file: %s", request.file_name)
+        return self._convert_dataset_update(self.analysis_service.create_dataset(self._to_dataset_request(request)))
+
+    def AppendRows(self, request, context):
+        """
+        Обрабатывает gRPC запрос на добавление строк к хранимому набору данных.
+        
+        Args:
+            request: gRPC запрос с идентификатором набора данных и добавляемыми строками
+            context: Контекст gRPC запроса
+        
+        Returns:
+            Обновленные статистики набора данных в формате protobuf
+        """
+        logger.info("Received request to append rows to dataset %s from file: %s", request.dataset_id, request.file_name)
+        return self._convert_dataset_update(self.analysis_service.append_rows(self._to_dataset_request(request)))
+
+    @staticmethod
+    def _to_dataset_request(request):
+        """Преобразует gRPC-запрос DatasetRequest в доменный объект."""
+        return DatasetRequest(
+            dataset_id=request.dataset_id,
+            file_content=request.file_content,
+            file_name=request.file_name,
+            selected_analyses=list(request.selected_analyses)
+        )
+
+    def _convert_dataset_update(self, update):
+        """Конвертирует доменный DatasetUpdate в gRPC-сообщение DatasetResponse."""
+        grpc_response = analysis_pb2.DatasetResponse()
+        grpc_response.dataset_id = update.dataset_id
+        grpc_response.row_count = update.row_count
+        grpc_response.appended_rows = update.appended_rows
+        grpc_response.analysis.CopyFrom(self._convert_analysis_response(update.analysis, []))
+        if update.analysis.error:
+            grpc_response.analysis.processing_log.extend(update.analysis.processing_log)
+        for correlation in update.correlations:
+            correlation_msg = grpc_response.correlations.add()
+            correlation_msg.variable_x = correlation.variable_x
+            correlation_msg.variable_y = correlation.variable_y
+            correlation_msg.count = correlation.count
+            correlation_msg.correlation = correlation.correlation
+        return grpc_response
+
+    def _convert_progressive_update(self, update):
+        """Конвертирует доменный ProgressiveUpdate в gRPC-сообщение ProgressiveUpdate."""
+        grpc_update = analysis_pb2.ProgressiveUpdate()
+        grpc_update.rows_processed = update.rows_processed
+        grpc_update.population_size = update.population_size
+        grpc_update.final = update.final
+        grpc_update.processing_log.extend(update.processing_log)
+        if update.error:
+            grpc_update.error.code = "ANALYSIS_ERROR"
+            grpc_update.error.message = update.error
+        for estimate in update.estimates:
+            estimate_msg = grpc_update.estimates.add()
+            estimate_msg.variable_name = estimate.variable_name
+            estimate_msg.statistic = estimate.statistic
+            estimate_msg.estimate = estimate.estimate
+            estimate_msg.standard_error = estimate.standard_error
+            estimate_msg.lower_bound = estimate.lower_bound
+            estimate_msg.upper_bound = estimate.upper_bound
+        return grpc_update
+
     def _convert_analysis_response(self, python_response, selected_analyses=None):
         """
         Конвертирует объект Python AnalysisResponse 
@@ -399,23 +550,41 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
         
         # Дескриптивная статистика
         for stat in python_response.descriptives:
-            pb_stat = analysis_pb2.DescriptiveStatistics()
-            pb_stat.variable_name = stat.variable_name
-            pb_stat.count = str(stat.count)  # Преобразуем в строку для совместимости
-            pb_stat.mean = stat.mean
-            pb_stat.median = stat.median
-            pb_stat.mode.extend([str(m) for m in stat.mode])  # Преобразуем в строки
-            pb_stat.variance = stat.variance
-            pb_stat.std_dev = stat.std_dev
-            pb_stat.variation_coefficient = stat.variation_coefficient
-            pb_stat.skewness = stat.skewness
-            pb_stat.kurtosis = stat.kurtosis
-            pb_stat.min_value = stat.min_value
-            pb_stat.max_value = stat.max_value
-            pb_stat.q1 = stat.q1
-            pb_stat.q3 = stat.q3
-            pb_stat.iqr = stat.iqr
-            desc_stats_response.descriptives.append(pb_stat)
+            desc_stats_response.descriptives.append(_descriptive_stats_message(stat))
+
+        # Описательные статистики по группам
+        for grouped in python_response.grouped_descriptives:
+            pb_grouped = analysis_pb2.GroupedDescriptiveStatistics()
+            pb_grouped.group_column = grouped.group_column
+            pb_grouped.group = grouped.group
+            pb_grouped.group_size = grouped.group_size
+            if grouped.statistics is not None:
+                pb_grouped.statistics.CopyFrom(_descriptive_stats_message(grouped.statistics))
+            desc_stats_response.grouped_descriptives.append(pb_grouped)
+
+        # Выбросы для диаграмм размаха
+        for outlier in python_response.outliers:
+            pb_outlier = analysis_pb2.OutlierSummary()
+            pb_outlier.variable_name = outlier.variable_name
+            pb_outlier.iqr_multiplier = outlier.iqr_multiplier
+            pb_outlier.lower_fence = outlier.lower_fence
+            pb_outlier.upper_fence = outlier.upper_fence
+            pb_outlier.lower_whisker = outlier.lower_whisker
+            pb_outlier.upper_whisker = outlier.upper_whisker
+            pb_outlier.iqr_outlier_count = outlier.iqr_outlier_count
+            pb_outlier.z_threshold = outlier.z_threshold
+            pb_outlier.z_lower_bound = outlier.z_lower_bound
+            pb_outlier.z_upper_bound = outlier.z_upper_bound
+            pb_outlier.z_outlier_count = outlier.z_outlier_count
+            pb_outlier.mad = outlier.mad
+            pb_outlier.mad_threshold = outlier.mad_threshold
+            pb_outlier.mad_lower_bound = outlier.mad_lower_bound
+            pb_outlier.mad_upper_bound = outlier.mad_upper_bound
+            pb_outlier.mad_outlier_count = outlier.mad_outlier_count
+            pb_outlier.outlier_rows.extend(outlier.outlier_rows)
+            pb_outlier.outlier_values.extend(outlier.outlier_values)
+            pb_outlier.missing_fields.extend(outlier.missing_fields)
+            desc_stats_response.outliers.append(pb_outlier)
         
         # Гистограммы
         for hist in python_response.histograms:
@@ -429,21 +598,24 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
             if hasattr(hist, 'normal_curve_x') and hist.normal_curve_x:
                 pb_hist.normal_curve_x.extend(hist.normal_curve_x)
                 has_normal_curve = True
-                print(f"Adding normal_curve_x for {hist.variable_name}: {len(hist.normal_curve_x)} points")
+                logger.debug("Adding normal_curve_x for %s: %d points", hist.variable_name, len(hist.normal_curve_x))
             if hasattr(hist, 'normal_curve_y') and hist.normal_curve_y:
                 pb_hist.normal_curve_y.extend(hist.normal_curve_y)
-                print(f"Adding normal_curve_y for {hist.variable_name}: {len(hist.normal_curve_y)} points")
+                logger.debug("Adding normal_curve_y for %s: %d points", hist.variable_name, len(hist.normal_curve_y))
             if hasattr(hist, 'mean'):
                 pb_hist.mean = hist.mean
-                print(f"Adding mean for {hist.variable_name}: {hist.mean}")
+                logger.debug("Adding mean for %s: %s", hist.variable_name, hist.mean)
             if hasattr(hist, 'std_dev'):
                 pb_hist.std_dev = hist.std_dev
-                print(f"Adding std_dev for {hist.variable_name}: {hist.std_dev}")
+                logger.debug("Adding std_dev for %s: %s", hist.variable_name, hist.std_dev)
+            pb_hist.kde_x.extend(hist.kde_x)
+            pb_hist.kde_y.extend(hist.kde_y)
+            pb_hist.kde_bandwidth = hist.kde_bandwidth
                 
             if has_normal_curve:
-                print(f"Normal curve data added for {hist.variable_name}")
+                logger.debug("Normal curve data added for %s", hist.variable_name)
             else:
-                print(f"No normal curve data for {hist.variable_name}")
+                logger.debug("No normal curve data for %s", hist.variable_name)
                 
             desc_stats_response.histograms.append(pb_hist)
         
@@ -456,6 +628,8 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
             pb_ci.upper_bound = ci.upper_bound
             pb_ci.mean = ci.point_estimate
             pb_ci.standard_error = (ci.upper_bound - ci.lower_bound) / (2 * 1.96)  # Примерный расчет SE из CI
+            pb_ci.effective_sample_size = ci.effective_sample_size
+            pb_ci.missing_fields.extend(_proto_missing_fields(ci.missing_fields))
             desc_stats_response.confidence_intervals.append(pb_ci)
         
         grpc_response.descriptive_stats.CopyFrom(desc_stats_response)
@@ -471,6 +645,7 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
             pb_test.statistic = test.statistic
             pb_test.p_value = test.p_value
             pb_test.is_normal = test.is_normal
+            pb_test.missing_fields.extend(test.missing_fields)
             normality_response.shapiro_wilk_results.append(pb_test)
         
         # Тесты хи-квадрат
@@ -482,6 +657,7 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
             pb_test.degrees_of_freedom = test.degrees_of_freedom
             pb_test.intervals = test.intervals
             pb_test.is_normal = test.is_normal
+            pb_test.missing_fields.extend(test.missing_fields)
             normality_response.chi_square_results.append(pb_test)
         
         grpc_response.normality_tests.CopyFrom(normality_response)
@@ -503,6 +679,22 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
                     data_point.y = point["y"] if isinstance(point, dict) else point.y
                     regression_response.data_points.append(data_point)
 
+            # Агрегированная плотность точек (общая для всех моделей пары)
+            if getattr(first_regression, 'density', None):
+                density = first_regression.density
+                density_msg = regression_response.density
+                density_msg.kind = density.get("kind", "")
+                density_msg.x_bins = density.get("x_bins", 0)
+                density_msg.y_bins = density.get("y_bins", 0)
+                density_msg.x_edges.extend(density.get("x_edges", []))
+                density_msg.y_edges.extend(density.get("y_edges", []))
+                density_msg.counts.extend(density.get("counts", []))
+                density_msg.centers_x.extend(density.get("centers_x", []))
+                density_msg.centers_y.extend(density.get("centers_y", []))
+                density_msg.step_x = density.get("step_x", 0.0)
+                density_msg.step_y = density.get("step_y", 0.0)
+                density_msg.total_points = density.get("total_points", 0)
+
             # Модели регрессии
             for reg in python_response.regressions:
                 reg_model = analysis_pb2.RegressionModel()
@@ -512,6 +704,7 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
                 reg_model.f_statistic = reg.f_statistic if hasattr(reg, 'f_statistic') else 0.0
                 reg_model.prob_f_statistic = reg.prob_f_statistic if hasattr(reg, 'prob_f_statistic') else 0.0
                 reg_model.sse = reg.sse if hasattr(reg, 'sse') else 0.0
+                reg_model.missing_fields.extend(_proto_missing_fields(reg.missing_fields))
 
                 # Коэффициенты
                 for coef in reg.coefficients:
@@ -523,12 +716,17 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
                     reg_coef.p_value = coef.p_value
                     reg_coef.confidence_interval_lower = coef.confidence_interval_lower
                     reg_coef.confidence_interval_upper = coef.confidence_interval_upper
+                    reg_coef.missing_fields.extend(_proto_missing_fields(coef.missing_fields))
                     reg_model.coefficients.append(reg_coef)
 
                 # Остатки
                 if hasattr(reg, 'residuals') and reg.residuals:
                     reg_model.residuals.extend(reg.residuals)
 
+                # Кривая модели для режима агрегации
+                for point in getattr(reg, 'fitted_curve', None) or []:
+                    reg_model.fitted_curve.append(analysis_pb2.DataPoint(x=point["x"], y=point["y"]))
+
                 # Анализ остатков
                 if hasattr(reg, 'residuals_analysis') and reg.residuals_analysis:
                     residuals_analysis_data = reg.residuals_analysis
@@ -572,9 +770,8 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
             wilcoxon_response = analysis_pb2.WilcoxonTestsResponse()
             
             # Лог для отладки
-            print(f"Debug: Wilcoxon tests requested. Selected analyses: {selected_analyses}")
-            print(f"Debug: wilcoxon_signed_rank_tests count: {len(python_response.wilcoxon_signed_rank_tests)}")
-            print(f"Debug: mann_whitney_tests count: {len(python_response.mann_whitney_tests)}")
+            logger.debug("Wilcoxon tests requested: %d signed-rank, %d Mann-Whitney results",
+                         len(python_response.wilcoxon_signed_rank_tests), len(python_response.mann_whitney_tests))
             
             # Критерий знаковых рангов Вилкоксона
             for test in python_response.wilcoxon_signed_rank_tests:
@@ -586,6 +783,7 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
                 pb_test.p_value = test.p_value
                 pb_test.conclusion = test.conclusion
                 pb_test.sample_size = test.sample_size
+                pb_test.missing_fields.extend(test.missing_fields)
                 wilcoxon_response.signed_rank_results.append(pb_test)
                 
             # Критерий Манна-Уитни
@@ -603,10 +801,30 @@ class AnalysisServiceGrpcAdapter(analysis_pb2_grpc.AnalysisServiceServicer):
                 pb_test.statistic = test.statistic
                 pb_test.p_value = test.p_value
                 pb_test.conclusion = test.conclusion
+                pb_test.missing_fields.extend(test.missing_fields)
                 wilcoxon_response.mann_whitney_results.append(pb_test)
             
             # Записываем данные в ответ, даже если списки результатов пустые
             grpc_response.wilcoxon_tests.CopyFrom(wilcoxon_response)
+
+        # Разделы, вычисленные приближенно (ограничение времени или выборка строк)
+        for approximation in python_response.approximations:
+            approximation_msg = grpc_response.approximations.add()
+            approximation_msg.section = approximation.section
+            approximation_msg.variant = approximation.variant
+            approximation_msg.description = approximation.description
+            approximation_msg.variables.extend(approximation.variables)
+            approximation_msg.sample_size = approximation.sample_size
+            approximation_msg.population_size = approximation.population_size
+            approximation_msg.rank_error = approximation.rank_error
+            for estimate in approximation.estimates:
+                estimate_msg = approximation_msg.estimates.add()
+                estimate_msg.variable_name = estimate.variable_name
+                estimate_msg.statistic = estimate.statistic
+                estimate_msg.estimate = estimate.estimate
+                estimate_msg.standard_error = estimate.standard_error
+                estimate_msg.lower_bound = estimate.lower_bound
+                estimate_msg.upper_bound = estimate.upper_bound
         
         return grpc_response
 
@@ -617,7 +835,9 @@ class GrpcServer:
     def __init__(self, 
                  analysis_service: AnalysisServicePort, 
                  host: str = "[::]:9000", 
-                 max_workers: int = 10):
+                 max_workers: int = 10,
+                 options: Optional[List[Tuple[str, Any]]] = None,
+                 interceptors: Optional[Sequence[grpc.ServerInterceptor]] = None):
         """
         Инициализирует gRPC сервер.
         
@@ -625,22 +845,30 @@ class GrpcServer:
             analysis_service: Сервис анализа данных
             host: Адрес и порт в формате "хост:порт"
             max_workers: Максимальное количество рабочих потоков
+            options: Дополнительные опции канала gRPC (например, grpc.so_reuseport)
+            interceptors: Серверные перехватчики, применяемые ко всем вызовам
         """
         self.analysis_service = analysis_service
         self.host = host
         self.max_workers = max_workers
+        self.options = options or []
+        self.interceptors = interceptors or []
         self.server = None
     
     def start(self):
         """Запускает gRPC сервер"""
-        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=self.max_workers))
+        self.server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=self.max_workers),
+            interceptors=self.interceptors,
+            options=self.options
+        )
         analysis_pb2_grpc.add_AnalysisServiceServicer_to_server(
             AnalysisServiceGrpcAdapter(self.analysis_service), 
             self.server
         )
         self.server.add_insecure_port(self.host)
         self.server.start()
-        print(f"--- Server started, listening on {self.host} ---")
+        logger.info("Server started, listening on %s", self.host)
         return self.server
     
     def wait(self):
@@ -648,8 +876,13 @@ class GrpcServer:
         if self.server:
             self.server.wait_for_termination()
     
-    def stop(self):
-        """Останавливает gRPC сервер"""
+    def stop(self, grace: Optional[float] = None):
+        """
+        Останавливает gRPC сервер.
+        
+        Args:
+            grace: Время (в секундах) на завершение активных запросов. None - немедленная остановка.
+        """
         if self.server:
-            self.server.stop(0)
-            print("--- Server stopped ---")
\ No newline at end of file
+            self.server.stop(grace).wait()
+            logger.info("Server stopped")
\ No newline at end of file
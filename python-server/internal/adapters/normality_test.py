@@ -1,18 +1,34 @@
-from typing import List, Dict, Any, Tuple
+from concurrent.futures import Executor
+from typing import List, Dict, Any, Tuple, Optional
 import pandas as pd
 
 from internal.core.ports.analysis_ports import NormalityTestPort
+from analysis_modules.column_artifacts import ColumnArtifacts
+from analysis_modules.column_partition import map_column_chunks, DEFAULT_COLUMN_CHUNK_SIZE
 from analysis_modules.normality import perform_normality_test
 
 class NormalityTestAdapter(NormalityTestPort):
     """Адаптер для модуля тестов на нормальность"""
+
+    def __init__(self, column_executor: Optional[Executor] = None,
+                 column_chunk_size: int = DEFAULT_COLUMN_CHUNK_SIZE):
+        """
+        Args:
+            column_executor: Пул процессов для обработки порций столбцов широких наборов данных (None - в текущем потоке).
+            column_chunk_size: Количество столбцов в одной порции.
+        """
+        self.column_executor = column_executor
+        self.column_chunk_size = column_chunk_size
     
-    def perform_normality_test(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], List[str]]:
+    def perform_normality_test(self, df: pd.DataFrame, artifacts: Optional[ColumnArtifacts] = None,
+                               max_sample_size: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
         """
         Выполняет тесты на нормальность для числовых столбцов DataFrame.
         
         Args:
             df: Входной DataFrame.
+            artifacts: Общие промежуточные результаты по столбцам для повторного использования между анализами.
+            max_sample_size: Размер случайной выборки для теста по длинным столбцам (None - по всем значениям).
             
         Returns:
             Кортеж:
@@ -21,4 +37,6 @@ class NormalityTestAdapter(NormalityTestPort):
         """
         
         # Делегируем расчеты существующей функции из analysis_modules
-        return perform_normality_test(df) 
\ No newline at end of file
+        return map_column_chunks(perform_normality_test, df, artifacts=artifacts,
+                                 executor=self.column_executor, chunk_size=self.column_chunk_size,
+                                 max_sample_size=max_sample_size) 
\ No newline at end of file
@@ -0,0 +1,305 @@
+import gc
+import importlib
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import grpc
+
+from internal.adapters.grpc_server import GrpcServer
+from internal.core.ports.analysis_ports import AnalysisServicePort
+
+logger = logging.getLogger(__name__)
+
+# Тяжелые модули, которые импортируются в мастер-процессе до fork,
+# чтобы рабочие процессы разделяли их страницы памяти (copy-on-write)
+PRELOAD_MODULES = [
+    "numpy",
+    "pandas",
+    "scipy.stats",
+    "scipy.optimize",
+    "scipy.signal",
+    "statsmodels.api",
+]
+
+# Рабочий процесс, завершившийся с ошибкой раньше WORKER_MIN_UPTIME_SECONDS после запуска, считается
+# упавшим при старте: перед его перезапуском мастер ждет RESTART_BACKOFF_SECONDS * 2^(n-1) секунд
+# (не больше MAX_RESTART_BACKOFF_SECONDS), где n - количество таких падений подряд
+WORKER_MIN_UPTIME_SECONDS = 10.0
+RESTART_BACKOFF_SECONDS = 0.5
+MAX_RESTART_BACKOFF_SECONDS = 30.0
+DEFAULT_MAX_STARTUP_FAILURES = 5
+
+
+def preload_modules() -> None:
+    """
+    Импортирует тяжелые научные библиотеки в текущий процесс и замораживает
+    созданные объекты для сборщика мусора, чтобы он не трогал разделяемые страницы после fork.
+    """
+    for module_name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            logger.warning("Could not preload module '%s': %s", module_name, e)
+    gc.collect()
+    gc.freeze()
+
+
+def current_rss_mb() -> float:
+    """Возвращает текущий размер резидентной памяти процесса в мегабайтах."""
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        # Не Linux: используем пиковое значение (ru_maxrss в килобайтах)
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class WorkerRecyclingInterceptor(grpc.ServerInterceptor):
+    """
+    Перехватчик, считающий обработанные запросы и проверяющий потребление памяти.
+    При превышении лимитов сигнализирует рабочему процессу о необходимости перезапуска.
+    """
+
+    def __init__(self, max_requests: int = 0, max_rss_mb: float = 0.0,
+                 on_limit_reached: Optional[Callable[[str], None]] = None):
+        """
+        Args:
+            max_requests: Максимальное число запросов на процесс (0 - без ограничения).
+            max_rss_mb: Порог резидентной памяти в МБ (0 - без ограничения).
+            on_limit_reached: Колбэк, вызываемый один раз с описанием причины.
+        """
+        self.max_requests = max_requests
+        self.max_rss_mb = max_rss_mb
+        self.on_limit_reached = on_limit_reached
+        self.requests_handled = 0
+        self._lock = threading.Lock()
+        self._limit_reported = False
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return handler
+
+        if handler.unary_unary is not None:
+            behavior = handler.unary_unary
+
+            def counted_behavior(request, context):
+                try:
+                    return behavior(request, context)
+                finally:
+                    self._after_request()
+
+            return grpc.unary_unary_rpc_method_handler(
+                counted_behavior,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer
+            )
+
+        if handler.unary_stream is not None:
+            stream_behavior = handler.unary_stream
+
+            def counted_stream_behavior(request, context):
+                # Запрос учитывается после того, как поток ответов исчерпан (или прерван клиентом)
+                try:
+                    yield from stream_behavior(request, context)
+                finally:
+                    self._after_request()
+
+            return grpc.unary_stream_rpc_method_handler(
+                counted_stream_behavior,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer
+            )
+
+        return handler
+
+    def _after_request(self):
+        with self._lock:
+            self.requests_handled += 1
+            if self._limit_reported:
+                return
+            reason = None
+            if self.max_requests and self.requests_handled >= self.max_requests:
+                reason = f"handled {self.requests_handled} requests (limit {self.max_requests})"
+            elif self.max_rss_mb:
+                rss = current_rss_mb()
+                if rss >= self.max_rss_mb:
+                    reason = f"RSS {rss:.0f} MB exceeds limit {self.max_rss_mb:.0f} MB"
+            if reason is None:
+                return
+            self._limit_reported = True
+        if self.on_limit_reached is not None:
+            self.on_limit_reached(reason)
+
+
+class PreforkGrpcServer:
+    """
+    Мастер-процесс, запускающий несколько рабочих gRPC серверов на одном порту (SO_REUSEPORT).
+    Рабочие процессы перезапускаются после заданного числа запросов или при превышении порога памяти,
+    что ограничивает фрагментацию кучи после обработки больших DataFrame.
+    """
+
+    def __init__(self,
+                 service_factory: Callable[[], AnalysisServicePort],
+                 host: str = "[::]:9000",
+                 workers: int = 2,
+                 threads_per_worker: int = 10,
+                 max_requests: int = 0,
+                 max_rss_mb: float = 0.0,
+                 shutdown_grace: float = 30.0,
+                 max_startup_failures: int = DEFAULT_MAX_STARTUP_FAILURES):
+        """
+        Args:
+            service_factory: Функция, создающая сервис анализа внутри рабочего процесса.
+            host: Адрес и порт в формате "хост:порт", общий для всех рабочих процессов.
+            workers: Количество рабочих процессов.
+            threads_per_worker: Количество потоков gRPC в каждом рабочем процессе.
+            max_requests: Число запросов, после которого рабочий процесс перезапускается (0 - никогда).
+            max_rss_mb: Порог резидентной памяти рабочего процесса в МБ (0 - не проверять).
+            shutdown_grace: Время на завершение активных запросов при остановке рабочего процесса.
+            max_startup_failures: Количество падений рабочего процесса при старте подряд, после которого
+                мастер останавливает все рабочие процессы и завершается с ошибкой.
+        """
+        self.service_factory = service_factory
+        self.host = host
+        self.workers = workers
+        self.threads_per_worker = threads_per_worker
+        self.max_requests = max_requests
+        self.max_rss_mb = max_rss_mb
+        self.shutdown_grace = shutdown_grace
+        self.max_startup_failures = max_startup_failures
+        self._children: Dict[int, int] = {}  # pid -> номер слота
+        self._spawned_at: Dict[int, float] = {}  # номер слота -> время запуска рабочего процесса
+        self._startup_failures: Dict[int, int] = {}  # номер слота -> падений при старте подряд
+        self._stopping = False
+        self._failure: Optional[str] = None
+
+    def serve(self):
+        """
+        Предзагружает модули, запускает рабочие процессы и следит за ними до остановки.
+
+        Raises:
+            RuntimeError: Если рабочий процесс подряд max_startup_failures раз упал при старте.
+        """
+        preload_modules()
+        signal.signal(signal.SIGINT, self._handle_stop_signal)
+        signal.signal(signal.SIGTERM, self._handle_stop_signal)
+
+        for slot in range(self.workers):
+            self._spawn_worker(slot)
+        logger.info("Prefork server started: %d workers on %s", self.workers, self.host)
+
+        while self._children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+            slot = self._children.pop(pid, None)
+            if slot is None:
+                continue
+            if self._stopping:
+                continue
+            exit_code = os.waitstatus_to_exitcode(status)
+            if exit_code == 0:
+                # Плановый перезапуск после достижения лимита запросов или памяти
+                logger.info("Worker %d (slot %d) exited after recycling, respawning", pid, slot)
+            elif exit_code < 0:
+                logger.warning("Worker %d (slot %d) was killed by signal %d", pid, slot, -exit_code)
+            else:
+                logger.warning("Worker %d (slot %d) exited with code %d", pid, slot, exit_code)
+            if exit_code != 0 and time.monotonic() - self._spawned_at[slot] < WORKER_MIN_UPTIME_SECONDS:
+                failures = self._startup_failures.get(slot, 0) + 1
+                self._startup_failures[slot] = failures
+                if failures >= self.max_startup_failures:
+                    self._failure = (f"worker slot {slot} failed {failures} times in a row within "
+                                     f"{WORKER_MIN_UPTIME_SECONDS:.0f}s of starting")
+                    logger.error("Stopping prefork server: %s", self._failure)
+                    self._stop_workers()
+                    continue
+                self._wait_before_restart(min(MAX_RESTART_BACKOFF_SECONDS, RESTART_BACKOFF_SECONDS * 2 ** (failures - 1)))
+                if self._stopping:
+                    continue
+            else:
+                self._startup_failures.pop(slot, None)
+            self._spawn_worker(slot)
+
+        if self._failure is not None:
+            raise RuntimeError(f"Prefork server stopped: {self._failure}")
+        logger.info("Prefork server stopped")
+
+    def _wait_before_restart(self, delay: float):
+        """Ждет delay секунд перед перезапуском упавшего рабочего процесса, прерываясь при остановке сервера."""
+        logger.info("Waiting %.1fs before restarting the worker", delay)
+        deadline = time.monotonic() + delay
+        while not self._stopping:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(remaining, 0.5))
+
+    def _handle_stop_signal(self, signum, frame):
+        if self._stopping:
+            return
+        logger.info("Received signal %d, stopping %d workers...", signum, len(self._children))
+        self._stop_workers()
+
+    def _stop_workers(self):
+        self._stopping = True
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _spawn_worker(self, slot: int):
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                self._run_worker(slot)
+            except Exception as e:
+                logger.exception("Worker slot %d failed: %s", slot, e)
+                exit_code = 1
+            finally:
+                sys.stdout.flush()
+                os._exit(exit_code)
+        self._children[pid] = slot
+        self._spawned_at[slot] = time.monotonic()
+
+    def _run_worker(self, slot: int):
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        stop_requested = threading.Event()
+
+        def request_recycle(reason: str):
+            logger.info("Worker %d (slot %d) recycling: %s", os.getpid(), slot, reason)
+            stop_requested.set()
+
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop_requested.set())
+
+        interceptor = WorkerRecyclingInterceptor(
+            max_requests=self.max_requests,
+            max_rss_mb=self.max_rss_mb,
+            on_limit_reached=request_recycle
+        )
+        server = GrpcServer(
+            self.service_factory(),
+            host=self.host,
+            max_workers=self.threads_per_worker,
+            options=[("grpc.so_reuseport", 1)],
+            interceptors=[interceptor]
+        )
+        server.start()
+        logger.info("Worker %d (slot %d) is serving", os.getpid(), slot)
+
+        while not stop_requested.wait(timeout=1.0):
+            pass
+        server.stop(self.shutdown_grace)
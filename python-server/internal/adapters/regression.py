@@ -1,4 +1,5 @@
-from typing import List, Dict, Any, Tuple
+from concurrent.futures import Executor
+from typing import List, Dict, Any, Tuple, Optional
 import pandas as pd
 
 from internal.core.ports.analysis_ports import RegressionPort
@@ -6,9 +7,19 @@ from analysis_modules.regression import perform_simple_linear_regression
 
 class RegressionAdapter(RegressionPort):
     """Адаптер для модуля регрессионного анализа"""
+
+    def __init__(self, fit_executor: Optional[Executor] = None):
+        """
+        Args:
+            fit_executor: Пул процессов для параллельной подгонки нелинейных моделей (None - подгонка в текущем потоке).
+        """
+        self.fit_executor = fit_executor
     
     def perform_simple_linear_regression(self, df: pd.DataFrame, dependent_var: str = None, 
-                                        independent_var: str = None) -> Tuple[List[Dict[str, Any]], List[str]]:
+                                        independent_var: str = None, max_points: Optional[int] = None,
+                                        downsample_method: str = "lttb", aggregation: Optional[str] = None,
+                                        aggregation_bins: Optional[int] = None, linear_only: bool = False,
+                                        max_fit_restarts: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
         """
         Выполняет регрессионный анализ для числовых столбцов DataFrame.
         Поддерживает линейную, степенную, логарифмическую, квадратичную, 
@@ -18,6 +29,12 @@ class RegressionAdapter(RegressionPort):
             df: Входной DataFrame.
             dependent_var: Имя зависимой переменной (Y). Если None, будут перебраны все числовые столбцы.
             independent_var: Имя независимой переменной (X). Если None, будут перебраны все числовые столбцы.
+            max_points: Максимальное количество точек для графика. None - значение по умолчанию, 0 - без прореживания.
+            downsample_method: Метод прореживания точек графика: "lttb" или "stratified".
+            aggregation: Вместо точек вернуть плотность "grid" или "hexbin" и кривые моделей. None - точки.
+            aggregation_bins: Количество интервалов сетки плотности по оси X. None - значение по умолчанию.
+            linear_only: Подгонять только линейную модель (упрощенный вариант при ограничении времени).
+            max_fit_restarts: Максимальное количество повторных подгонок нелинейных моделей (None - без ограничения).
             
         Returns:
             Кортеж:
@@ -26,7 +43,14 @@ class RegressionAdapter(RegressionPort):
         """
         
         # Делегируем расчеты существующей функции из analysis_modules
-        regression_results, logs = perform_simple_linear_regression(df, dependent_var, independent_var)
+        options = {"downsample_method": downsample_method, "aggregation": aggregation,
+                   "executor": self.fit_executor, "linear_only": linear_only,
+                   "max_fit_restarts": max_fit_restarts}
+        if max_points is not None:
+            options["max_points"] = max_points
+        if aggregation_bins is not None:
+            options["aggregation_bins"] = aggregation_bins
+        regression_results, logs = perform_simple_linear_regression(df, dependent_var, independent_var, **options)
         
         # Преобразуем результаты в словари для передачи через порты
         result_dicts = []
@@ -55,7 +79,9 @@ class RegressionAdapter(RegressionPort):
                 "sse": reg_result.sse,  # Добавляем SSE
                 "coefficients": coef_dicts,
                 "data_points": reg_result.data_points,  # Добавляем точки данных
-                "residuals": reg_result.residuals  # Добавляем остатки регрессии
+                "residuals": reg_result.residuals,  # Добавляем остатки регрессии
+                "fitted_curve": reg_result.fitted_curve,
+                "density": reg_result.density
             }
             result_dicts.append(result_dict)
         
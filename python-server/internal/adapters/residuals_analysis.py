@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 from internal.core.ports.analysis_ports import ResidualsAnalysisPort
 from analysis_modules.residuals_analysis import (
     perform_residuals_normality_test,
@@ -9,12 +9,13 @@ from analysis_modules.residuals_analysis import (
 class ResidualsAnalysisAdapter(ResidualsAnalysisPort):
     """Адаптер для анализа остатков регрессии"""
     
-    def analyze_residuals(self, residuals: List[float]) -> Dict[str, Any]:
+    def analyze_residuals(self, residuals: List[float], histogram_bins: Union[int, str] = 10) -> Dict[str, Any]:
         """
         Выполняет анализ остатков регрессии.
         
         Args:
             residuals: Список остатков регрессии.
+            histogram_bins: Количество интервалов гистограммы остатков или правило их выбора.
             
         Returns:
             Словарь с результатами анализа.
@@ -23,7 +24,7 @@ class ResidualsAnalysisAdapter(ResidualsAnalysisPort):
         shapiro_test_result = perform_residuals_normality_test(residuals)
         
         # Генерация данных для гистограммы
-        histogram_data = generate_residuals_histogram_data(residuals)
+        histogram_data = generate_residuals_histogram_data(residuals, n_bins=histogram_bins)
         
         # Генерация данных для QQ-графика
         qq_plot_data = generate_qq_plot_data(residuals)
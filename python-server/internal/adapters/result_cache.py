@@ -0,0 +1,187 @@
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from internal.core.domain.entities import AnalysisResponse
+from internal.core.ports.analysis_ports import ResultCachePort
+
+logger = logging.getLogger(__name__)
+
+# Минимальный интервал между очистками дискового уровня одним процессом в секундах
+DISK_SWEEP_INTERVAL_SECONDS = 300.0
+
+
+class TieredResultCache(ResultCachePort):
+    """
+    Двухуровневый кэш результатов анализа:
+    - LRU в памяти процесса (быстрый доступ к недавним результатам), ограниченный количеством записей
+      и, при заданном max_bytes, суммарным размером сериализованных записей;
+    - необязательный уровень на диске с временем жизни записей (общий для всех рабочих процессов).
+      При записи не чаще раза в DISK_SWEEP_INTERVAL_SECONDS удаляются просроченные записи и оставшиеся
+      от прерванной записи временные файлы, а при заданном disk_max_bytes - самые старые записи сверх лимита.
+    """
+
+    def __init__(self, max_entries: int = 32, disk_dir: Optional[str] = None,
+                 disk_ttl_seconds: float = 24 * 3600, max_bytes: int = 0, disk_max_bytes: int = 0):
+        """
+        Args:
+            max_entries: Максимальное количество записей в памяти (0 - уровень в памяти отключен).
+            disk_dir: Каталог для дискового уровня. None - дисковый уровень отключен.
+            disk_ttl_seconds: Время жизни записи на диске в секундах.
+            max_bytes: Максимальный суммарный размер записей в памяти в байтах (0 - без ограничения).
+                Размер записи оценивается по длине ее pickle-представления; запись больше лимита в памяти не хранится.
+            disk_max_bytes: Максимальный суммарный размер записей на диске в байтах (0 - без ограничения).
+        """
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.disk_ttl_seconds = disk_ttl_seconds
+        self.max_bytes = max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self._next_sweep = 0.0
+        self._memory: "OrderedDict[str, AnalysisResponse]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    def get(self, key: str) -> Optional[AnalysisResponse]:
+        with self._lock:
+            response = self._memory.get(key)
+            if response is not None:
+                self._memory.move_to_end(key)
+                return response
+
+        response, size = self._load_from_disk(key)
+        if response is not None:
+            self._put_in_memory(key, response, size)
+        return response
+
+    def put(self, key: str, response: AnalysisResponse) -> None:
+        # Ответ сериализуется один раз: длина нужна для ограничения памяти, байты - для дискового уровня
+        payload = None
+        if self.disk_dir or (self.max_bytes > 0 and self.max_entries > 0):
+            payload = pickle.dumps(response, protocol=pickle.HIGHEST_PROTOCOL)
+        self._put_in_memory(key, response, len(payload) if payload is not None else 0)
+        if self.disk_dir:
+            self._save_to_disk(key, payload)
+            self._maybe_sweep_disk()
+
+    def _put_in_memory(self, key: str, response: AnalysisResponse, size: int = 0):
+        if self.max_entries <= 0:
+            return
+        if self.max_bytes > 0 and size > self.max_bytes:
+            logger.debug("Cached result %s (%d bytes) exceeds the memory limit of %d bytes", key[:12], size, self.max_bytes)
+            return
+        with self._lock:
+            self._memory_bytes += size - self._sizes.get(key, 0)
+            self._memory[key] = response
+            self._sizes[key] = size
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries or (self.max_bytes > 0 and self._memory_bytes > self.max_bytes):
+                evicted_key, _ = self._memory.popitem(last=False)
+                self._memory_bytes -= self._sizes.pop(evicted_key)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.pkl")
+
+    def _load_from_disk(self, key: str) -> Tuple[Optional[AnalysisResponse], int]:
+        """Возвращает запись с диска и размер ее сериализованного представления ((None, 0) - записи нет)."""
+        if not self.disk_dir:
+            return None, 0
+        path = self._disk_path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.disk_ttl_seconds:
+                os.remove(path)
+                return None, 0
+            with open(path, "rb") as cache_file:
+                payload = cache_file.read()
+            return pickle.loads(payload), len(payload)
+        except FileNotFoundError:
+            return None, 0
+        except Exception as e:
+            logger.warning("Could not read cached result %s: %s", path, e)
+            return None, 0
+
+    def _save_to_disk(self, key: str, payload: bytes):
+        tmp_path = None
+        try:
+            # Пишем во временный файл и атомарно переименовываем, чтобы параллельные процессы
+            # никогда не прочитали частично записанную запись
+            fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(payload)
+            os.replace(tmp_path, self._disk_path(key))
+        except Exception as e:
+            logger.warning("Could not write cached result for %s: %s", key, e)
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _maybe_sweep_disk(self):
+        now = time.time()
+        with self._lock:
+            if now < self._next_sweep:
+                return
+            self._next_sweep = now + DISK_SWEEP_INTERVAL_SECONDS
+        self.sweep_disk(now)
+
+    def sweep_disk(self, now: Optional[float] = None) -> int:
+        """
+        Удаляет с диска просроченные записи и временные файлы старше времени жизни, затем, если задан
+        disk_max_bytes, самые старые записи, пока суммарный размер превышает лимит. Файлы могут
+        одновременно удалять другие рабочие процессы, поэтому уже удаленные файлы пропускаются.
+
+        Returns:
+            Количество удаленных файлов.
+        """
+        if not self.disk_dir:
+            return 0
+        now = time.time() if now is None else now
+        entries = []
+        removed = 0
+        try:
+            with os.scandir(self.disk_dir) as scan:
+                for entry in scan:
+                    if not entry.name.endswith((".pkl", ".tmp")) or not entry.is_file(follow_symlinks=False):
+                        continue
+                    try:
+                        stat = entry.stat(follow_symlinks=False)
+                    except FileNotFoundError:
+                        continue
+                    if now - stat.st_mtime > self.disk_ttl_seconds:
+                        removed += self._remove_file(entry.path)
+                    elif entry.name.endswith(".pkl"):
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError as e:
+            logger.warning("Could not sweep cache directory %s: %s", self.disk_dir, e)
+            return removed
+
+        total_bytes = sum(size for _, size, _ in entries)
+        if self.disk_max_bytes > 0 and total_bytes > self.disk_max_bytes:
+            for _, size, path in sorted(entries):
+                if total_bytes <= self.disk_max_bytes:
+                    break
+                removed += self._remove_file(path)
+                total_bytes -= size
+        if removed:
+            logger.info("Removed %d files from cache directory %s", removed, self.disk_dir)
+        return removed
+
+    @staticmethod
+    def _remove_file(path: str) -> int:
+        try:
+            os.remove(path)
+            return 1
+        except FileNotFoundError:
+            return 0
+        except OSError as e:
+            logger.warning("Could not remove cached result %s: %s", path, e)
+            return 0
@@ -17,7 +17,9 @@ class DescriptiveStats:
     count: int
     mean: float = 0.0
     median: float = 0.0
-    mode: List[float] = field(default_factory=list)
+    mode: List[float] = field(default_factory=list)  # Не больше DEFAULT_MAX_MODES значений с наибольшей частотой
+    mode_frequency: int = 0  # Частота моды (оценка снизу, если мода определялась приближенно)
+    mode_count: int = 0  # Количество значений с наибольшей частотой (больше len(mode), если список сокращен)
     variance: float = 0.0
     std_dev: float = 0.0
     variation_coefficient: float = 0.0
@@ -28,6 +30,39 @@ class DescriptiveStats:
     q1: float = 0.0  # Первый квартиль (25%)
     q3: float = 0.0  # Третий квартиль (75%)
     iqr: float = 0.0  # Межквартильный размах
+    effective_sample_size: float = 0.0  # Эффективный объем выборки Киша (только для взвешенных статистик)
+    missing_fields: List[str] = field(default_factory=list)  # Числовые поля, значение которых не определено (передается 0.0)
+
+@dataclass
+class GroupedDescriptiveStats:
+    """Описательные статистики переменной в группе строк"""
+    group_column: str
+    group: str  # Значение столбца групп (строкой)
+    group_size: int = 0  # Количество строк группы (включая пропуски переменной)
+    statistics: Optional[DescriptiveStats] = None
+
+@dataclass
+class OutlierSummary:
+    """Выбросы переменной по правилам IQR (границы Тьюки), z-оценки и модифицированной z-оценки (MAD)"""
+    variable_name: str
+    iqr_multiplier: float = 1.5
+    lower_fence: float = 0.0  # Q1 - iqr_multiplier * IQR
+    upper_fence: float = 0.0  # Q3 + iqr_multiplier * IQR
+    lower_whisker: float = 0.0  # Наименьшее значение внутри границ Тьюки
+    upper_whisker: float = 0.0  # Наибольшее значение внутри границ Тьюки
+    iqr_outlier_count: int = 0
+    z_threshold: float = 3.0
+    z_lower_bound: float = 0.0  # Среднее - z_threshold * s
+    z_upper_bound: float = 0.0  # Среднее + z_threshold * s
+    z_outlier_count: int = 0
+    mad: float = 0.0  # Медианное абсолютное отклонение
+    mad_threshold: float = 3.5
+    mad_lower_bound: float = 0.0  # Медиана - mad_threshold * MAD / 0.6745
+    mad_upper_bound: float = 0.0  # Медиана + mad_threshold * MAD / 0.6745
+    mad_outlier_count: int = 0
+    outlier_rows: List[int] = field(default_factory=list)  # Номера строк выбросов по IQR (не больше 100, наиболее удаленные)
+    outlier_values: List[float] = field(default_factory=list)  # Значения тех же выбросов
+    missing_fields: List[str] = field(default_factory=list)  # Числовые поля, значение которых не определено (передается 0.0)
 
 @dataclass
 class HistogramData:
@@ -39,6 +74,9 @@ class HistogramData:
     normal_curve_y: List[float] = field(default_factory=list)  # Y-координаты точек нормальной кривой
     mean: float = 0.0                                          # Среднее значение для нормальной кривой
     std_dev: float = 0.0                                       # Стандартное отклонение для нормальной кривой
+    kde_x: List[float] = field(default_factory=list)           # X-координаты точек оценки плотности
+    kde_y: List[float] = field(default_factory=list)           # Y-координаты точек оценки плотности (в масштабе гистограммы)
+    kde_bandwidth: float = 0.0                                 # Ширина окна гауссова ядра
 
 @dataclass
 class ConfidenceInterval:
@@ -49,6 +87,8 @@ class ConfidenceInterval:
     point_estimate: float = 0.0
     lower_bound: float = 0.0
     upper_bound: float = 0.0
+    effective_sample_size: float = 0.0  # Эффективный объем выборки Киша (только для взвешенного среднего)
+    missing_fields: List[str] = field(default_factory=list)  # Числовые поля, значение которых не определено (передается 0.0)
 
 @dataclass
 class NormalityTestResult:
@@ -59,6 +99,7 @@ class NormalityTestResult:
     p_value: float = 0.0
     is_normal: bool = False
     conclusion: str = ""
+    missing_fields: List[str] = field(default_factory=list)  # Числовые поля, значение которых не определено (передается 0.0)
 
 @dataclass
 class PearsonChiSquareResult:
@@ -72,6 +113,7 @@ class PearsonChiSquareResult:
     intervals: int = 0
     is_normal: bool = False
     conclusion: str = ""
+    missing_fields: List[str] = field(default_factory=list)  # Числовые поля, значение которых не определено (передается 0.0)
 
 @dataclass
 class RegressionCoefficient:
@@ -83,6 +125,7 @@ class RegressionCoefficient:
     p_value: float = 0.0
     confidence_interval_lower: float = 0.0  # Нижняя граница доверительного интервала
     confidence_interval_upper: float = 0.0  # Верхняя граница доверительного интервала
+    missing_fields: List[str] = field(default_factory=list)  # Числовые поля, значение которых не определено (передается 0.0)
 
 @dataclass
 class RegressionResult:
@@ -98,6 +141,9 @@ class RegressionResult:
     data_points: List[Dict[str, float]] = field(default_factory=list)
     residuals: List[float] = field(default_factory=list)  # Остатки регрессии
     residuals_analysis: Dict[str, Any] = field(default_factory=dict)  # Результаты анализа остатков
+    fitted_curve: List[Dict[str, float]] = field(default_factory=list)  # Кривая модели на сетке по X
+    density: Dict[str, Any] = field(default_factory=dict)  # Агрегированная плотность точек
+    missing_fields: List[str] = field(default_factory=list)  # Числовые поля, значение которых не определено (передается 0.0)
 
 # Класс WilcoxonTestResult переносим выше класса AnalysisResponse
 class WilcoxonTestResult:
@@ -111,7 +157,8 @@ class WilcoxonTestResult:
                 statistic: float = 0.0,
                 p_value: float = 0.0,
                 conclusion: str = "",
-                sample_size: int = 0):
+                sample_size: int = 0,
+                missing_fields: Optional[List[str]] = None):
         self.test_type = test_type
         self.variable1 = variable1
         self.variable2 = variable2
@@ -119,6 +166,7 @@ class WilcoxonTestResult:
         self.p_value = p_value
         self.conclusion = conclusion
         self.sample_size = sample_size
+        self.missing_fields = missing_fields or []
 
 
 class MannWhitneyTestResult:
@@ -137,7 +185,8 @@ class MannWhitneyTestResult:
                 group2_median: float = 0.0,
                 statistic: float = 0.0,
                 p_value: float = 0.0,
-                conclusion: str = ""):
+                conclusion: str = "",
+                missing_fields: Optional[List[str]] = None):
         self.test_type = test_type
         self.group_column = group_column
         self.value_column = value_column
@@ -150,11 +199,36 @@ class MannWhitneyTestResult:
         self.statistic = statistic
         self.p_value = p_value
         self.conclusion = conclusion
+        self.missing_fields = missing_fields or []
+
+@dataclass
+class EstimateError:
+    """Стандартная ошибка и границы оценки, вычисленной по выборке"""
+    variable_name: str
+    statistic: str
+    estimate: float = 0.0
+    standard_error: float = 0.0
+    lower_bound: float = 0.0
+    upper_bound: float = 0.0
+
+@dataclass
+class ApproximationInfo:
+    """Отметка о разделе, вычисленном приближенно: упрощенным вариантом или по выборке строк"""
+    section: str
+    variant: str
+    description: str = ""
+    variables: List[str] = field(default_factory=list)
+    sample_size: int = 0
+    population_size: int = 0
+    estimates: List[EstimateError] = field(default_factory=list)
+    rank_error: float = 0.0
 
 @dataclass
 class AnalysisResponse:
     """Ответ с результатами анализа данных"""
     descriptives: List[DescriptiveStats] = field(default_factory=list)
+    grouped_descriptives: List[GroupedDescriptiveStats] = field(default_factory=list)
+    outliers: List[OutlierSummary] = field(default_factory=list)
     histograms: List[HistogramData] = field(default_factory=list)
     normality_tests: List[NormalityTestResult] = field(default_factory=list)
     confidence_intervals: List[ConfidenceInterval] = field(default_factory=list)
@@ -162,5 +236,41 @@ class AnalysisResponse:
     regressions: List[RegressionResult] = field(default_factory=list)
     wilcoxon_signed_rank_tests: List[WilcoxonTestResult] = field(default_factory=list)
     mann_whitney_tests: List[MannWhitneyTestResult] = field(default_factory=list)
+    approximations: List[ApproximationInfo] = field(default_factory=list)
+    processing_log: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+@dataclass
+class ProgressiveUpdate:
+    """Промежуточный результат онлайн-агрегации: оценки по обработанной части строк"""
+    rows_processed: int = 0
+    population_size: int = 0
+    estimates: List[EstimateError] = field(default_factory=list)
+    final: bool = False
     processing_log: List[str] = field(default_factory=list)
-    error: Optional[str] = None 
\ No newline at end of file
+    error: Optional[str] = None
+
+@dataclass
+class DatasetRequest:
+    """Запрос к набору данных, хранимому на сервере: создание или добавление строк"""
+    dataset_id: str
+    file_content: bytes
+    file_name: str
+    selected_analyses: List[str] = field(default_factory=list)
+
+@dataclass
+class CorrelationResult:
+    """Коэффициент корреляции Пирсона пары переменных"""
+    variable_x: str
+    variable_y: str
+    count: int = 0
+    correlation: float = 0.0
+
+@dataclass
+class DatasetUpdate:
+    """Статистики набора данных после создания или добавления строк"""
+    dataset_id: str
+    row_count: int = 0
+    appended_rows: int = 0
+    analysis: AnalysisResponse = field(default_factory=AnalysisResponse)
+    correlations: List[CorrelationResult] = field(default_factory=list)
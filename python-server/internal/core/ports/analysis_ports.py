@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 import pandas as pd
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional, Callable, Iterator, ContextManager, Union
 
 from internal.core.domain.entities import (
     DataFileRequest,
@@ -10,7 +10,10 @@ from internal.core.domain.entities import (
     NormalityTestResult,
     ConfidenceInterval,
     PearsonChiSquareResult, 
-    RegressionResult
+    RegressionResult,
+    ProgressiveUpdate,
+    DatasetRequest,
+    DatasetUpdate
 )
 
 # Порты для первичных адаптеров (Primary/Driving adapters)
@@ -22,44 +25,114 @@ class AnalysisServicePort(ABC):
         """Анализирует данные и возвращает результаты"""
         pass
 
+    @abstractmethod
+    def analyze_data_progressive(self, request: DataFileRequest,
+                                 is_active: Optional[Callable[[], bool]] = None) -> Iterator[ProgressiveUpdate]:
+        """Обрабатывает строки блоками в случайном порядке и возвращает уточняющиеся оценки, пока is_active() истинно"""
+        pass
+
+    @abstractmethod
+    def create_dataset(self, request: DatasetRequest) -> DatasetUpdate:
+        """Создает хранимый на сервере набор данных из файла и возвращает его статистики"""
+        pass
+
+    @abstractmethod
+    def append_rows(self, request: DatasetRequest) -> DatasetUpdate:
+        """Добавляет строки файла к хранимому набору данных и возвращает обновленные статистики"""
+        pass
+
 # Порты для вторичных адаптеров (Secondary/Driven adapters)
 class DataLoaderPort(ABC):
     """Интерфейс для загрузки данных"""
     
     @abstractmethod
-    def load_data(self, file_content: bytes, file_name: str) -> Tuple[pd.DataFrame, List[str]]:
-        """Загружает данные из байтового содержимого файла"""
+    def load_data(self, file_content: bytes, file_name: str, sample_size: Optional[int] = None,
+                  stratify_by: Optional[str] = None, sample_seed: int = 0) -> Tuple[pd.DataFrame, List[str]]:
+        """
+        Загружает данные из байтового содержимого файла.
+        При заданном sample_size возвращает случайную выборку строк (описание выборки - в df.attrs["sampling"]).
+        """
         pass
 
 class DescriptiveStatsPort(ABC):
     """Интерфейс для вычисления описательных статистик"""
     
     @abstractmethod
-    def calculate_descriptive_stats(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[str]]:
-        """Вычисляет описательные статистики и гистограммы для числовых столбцов DataFrame"""
+    def calculate_descriptive_stats(self, df: pd.DataFrame, artifacts: Optional[Any] = None,
+                                    quantile_sketch_k: Optional[int] = None,
+                                    histogram_bins: Union[int, str] = "auto") -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[str]]:
+        """
+        Вычисляет описательные статистики и гистограммы для числовых столбцов DataFrame.
+        При заданном quantile_sketch_k медиана и квартили оцениваются KLL-скетчем с указанной границей ошибки ранга.
+        histogram_bins - правило выбора интервалов гистограмм (auto, fd, sturges, sqrt, rice, scott) или их количество.
+        """
+        pass
+
+    @abstractmethod
+    def calculate_grouped_descriptive_stats(self, df: pd.DataFrame, group_column: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Вычисляет описательные статистики числовых столбцов в каждой группе строк по значению group_column"""
+        pass
+
+    @abstractmethod
+    def detect_outliers(self, df: pd.DataFrame, descriptives: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Находит выбросы числовых столбцов (IQR, z-оценка, MAD) по квартилям и моментам из описательных статистик"""
+        pass
+
+    @abstractmethod
+    def calculate_weighted_descriptive_stats(self, df: pd.DataFrame, weight_column: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Вычисляет описательные статистики числовых столбцов с весами строк из weight_column"""
+        pass
+
+    @abstractmethod
+    def accumulate_moments(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> Any:
+        """Вычисляет объединяемый накопитель моментов для порции строк или раздела данных"""
+        pass
+
+    @abstractmethod
+    def merge_moments(self, accumulators: List[Any]) -> Any:
+        """Объединяет накопители моментов порций или разделов данных"""
+        pass
+
+    @abstractmethod
+    def moment_statistics(self, accumulator: Any) -> List[Dict[str, Any]]:
+        """Вычисляет описательные статистики (ddof=1, bias=True) по накопителю моментов"""
         pass
 
 class NormalityTestPort(ABC):
     """Интерфейс для тестов на нормальность"""
     
     @abstractmethod
-    def perform_normality_test(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], List[str]]:
-        """Выполняет тесты на нормальность для числовых столбцов DataFrame"""
+    def perform_normality_test(self, df: pd.DataFrame, artifacts: Optional[Any] = None,
+                               max_sample_size: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Выполняет тесты на нормальность для числовых столбцов DataFrame.
+        При заданном max_sample_size тест выполняется по случайной выборке из более длинных столбцов.
+        """
         pass
 
 class ConfidenceIntervalPort(ABC):
     """Интерфейс для расчета доверительных интервалов"""
     
     @abstractmethod
-    def calculate_confidence_intervals(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], List[str]]:
-        """Вычисляет доверительные интервалы для числовых столбцов DataFrame"""
+    def calculate_confidence_intervals(self, df: pd.DataFrame, artifacts: Optional[Any] = None,
+                                       population_size: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Вычисляет доверительные интервалы для числовых столбцов DataFrame.
+        Если df - выборка из population_size строк, интервалы учитывают поправку на конечную совокупность.
+        """
+        pass
+
+    @abstractmethod
+    def calculate_weighted_confidence_intervals(self, df: pd.DataFrame, weight_column: str,
+                                                population_size: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Вычисляет доверительные интервалы взвешенного среднего по эффективному объему выборки Киша"""
         pass
 
 class GoodnessOfFitPort(ABC):
     """Интерфейс для критерия согласия хи-квадрат"""
     
     @abstractmethod
-    def perform_chi_square_test(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], List[str]]:
+    def perform_chi_square_test(self, df: pd.DataFrame, artifacts: Optional[Any] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
         """Выполняет критерий хи-квадрат для проверки нормальности распределения"""
         pass
 
@@ -68,7 +141,10 @@ class RegressionPort(ABC):
     
     @abstractmethod
     def perform_simple_linear_regression(self, df: pd.DataFrame, dependent_var: str = None, 
-                                      independent_var: str = None) -> Tuple[List[Dict[str, Any]], List[str]]:
+                                      independent_var: str = None, max_points: Optional[int] = None,
+                                      downsample_method: str = "lttb", aggregation: Optional[str] = None,
+                                      aggregation_bins: Optional[int] = None, linear_only: bool = False,
+                                      max_fit_restarts: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
         """
         Выполняет простой линейный регрессионный анализ для числовых столбцов DataFrame
         
@@ -76,6 +152,12 @@ class RegressionPort(ABC):
             df: Входной DataFrame.
             dependent_var: Имя зависимой переменной (Y). Если None, будут перебраны все числовые столбцы.
             independent_var: Имя независимой переменной (X). Если None, будут перебраны все числовые столбцы.
+            max_points: Бюджет точек для графика рассеяния. None - значение по умолчанию, 0 - без прореживания.
+            downsample_method: Метод прореживания точек графика: "lttb" или "stratified".
+            aggregation: Вместо точек вернуть плотность "grid" или "hexbin" и кривые моделей. None - точки.
+            aggregation_bins: Количество интервалов сетки плотности по оси X. None - значение по умолчанию.
+            linear_only: Подгонять только линейную модель (упрощенный вариант при ограничении времени).
+            max_fit_restarts: Максимальное количество повторных подгонок нелинейных моделей (None - без ограничения).
         """
         pass
 
@@ -83,14 +165,80 @@ class ResidualsAnalysisPort(ABC):
     """Интерфейс для анализа остатков регрессии"""
     
     @abstractmethod
-    def analyze_residuals(self, residuals: List[float]) -> Dict[str, Any]:
+    def analyze_residuals(self, residuals: List[float], histogram_bins: Union[int, str] = 10) -> Dict[str, Any]:
         """
         Выполняет анализ остатков регрессии.
         
         Args:
             residuals: Список остатков регрессии.
+            histogram_bins: Количество интервалов гистограммы остатков или правило их выбора.
             
         Returns:
             Словарь с результатами анализа.
         """
-        pass 
\ No newline at end of file
+        pass
+
+class ResultCachePort(ABC):
+    """Интерфейс кэша результатов анализа"""
+    
+    @abstractmethod
+    def get(self, key: str) -> Optional[AnalysisResponse]:
+        """
+        Возвращает сохраненный результат анализа по ключу.
+        
+        Args:
+            key: Ключ запроса (хэш данных и нормализованного набора анализов).
+            
+        Returns:
+            Сохраненный ответ или None, если записи нет или она устарела.
+        """
+        pass
+
+    @abstractmethod
+    def put(self, key: str, response: AnalysisResponse) -> None:
+        """
+        Сохраняет результат анализа.
+        
+        Args:
+            key: Ключ запроса.
+            response: Ответ сервиса анализа.
+        """
+        pass
+
+class DatasetStorePort(ABC):
+    """Интерфейс хранилища пополняемых наборов данных (накопленных статистик)"""
+
+    @abstractmethod
+    def lock(self, dataset_id: str) -> ContextManager[None]:
+        """
+        Возвращает контекстный менеджер, на время которого изменения набора данных других запросов ожидают.
+
+        Args:
+            dataset_id: Идентификатор набора данных.
+        """
+        pass
+
+    @abstractmethod
+    def get(self, dataset_id: str) -> Optional[Any]:
+        """
+        Возвращает накопленные статистики набора данных.
+
+        Args:
+            dataset_id: Идентификатор набора данных.
+
+        Returns:
+            Статистики или None, если набора данных нет.
+        """
+        pass
+
+    @abstractmethod
+    def put(self, dataset_id: str, statistics: Any) -> None:
+        """
+        Сохраняет накопленные статистики набора данных.
+
+        Args:
+            dataset_id: Идентификатор набора данных.
+            statistics: Накопленные статистики.
+        """
+        pass
+
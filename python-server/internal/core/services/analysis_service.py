@@ -1,12 +1,24 @@
 import io
+import os
+import copy
+import uuid
+import json
+import hashlib
+import dataclasses
+import functools
+import logging
+import time
 import numpy as np
 import pandas as pd
-from typing import Tuple, List, Dict, Any, Optional
+from concurrent.futures import Executor
+from typing import Tuple, List, Dict, Any, Optional, Callable, Iterator, Union
 
 from internal.core.domain.entities import (
     DataFileRequest,
     AnalysisResponse,
     DescriptiveStats,
+    GroupedDescriptiveStats,
+    OutlierSummary,
     HistogramData,
     NormalityTestResult,
     ConfidenceInterval,
@@ -14,7 +26,13 @@ from internal.core.domain.entities import (
     RegressionResult,
     RegressionCoefficient,
     WilcoxonTestResult,
-    MannWhitneyTestResult
+    MannWhitneyTestResult,
+    ApproximationInfo,
+    EstimateError,
+    ProgressiveUpdate,
+    DatasetRequest,
+    DatasetUpdate,
+    CorrelationResult
 )
 from internal.core.ports.analysis_ports import (
     AnalysisServicePort,
@@ -24,9 +42,43 @@ from internal.core.ports.analysis_ports import (
     ConfidenceIntervalPort,
     GoodnessOfFitPort,
     RegressionPort,
-    ResidualsAnalysisPort
+    ResidualsAnalysisPort,
+    ResultCachePort,
+    DatasetStorePort
 )
 from internal.core.ports.wilcoxon_test_port import WilcoxonTestPort
+from internal.core.services.single_flight import SingleFlight
+from internal.core.services.speculative import SpeculativeAnalysisStore, SpeculativeDataset
+from analysis_modules.column_artifacts import ColumnArtifacts
+from analysis_modules.normality import DEFAULT_SHAPIRO_SAMPLE_SIZE
+from analysis_modules.sampling import sample_estimate_errors, DEFAULT_SAMPLE_SEED
+from analysis_modules.incremental import IncrementalStatistics
+from analysis_modules.quantile_sketch import DEFAULT_SKETCH_K
+from analysis_modules.histogram_engine import DEFAULT_HISTOGRAM_BIN_RULE, HISTOGRAM_BIN_RULES
+from analysis_modules.online_aggregation import (
+    progressive_estimates,
+    DEFAULT_PROGRESSIVE_BLOCKS,
+    DEFAULT_PROGRESSIVE_SEED
+)
+from internal.core.services.result_encoding import (
+    encode_numeric_fields,
+    DESCRIPTIVE_FIELDS,
+    NORMALITY_FIELDS,
+    CHI_SQUARE_FIELDS,
+    WILCOXON_FIELDS,
+    MANN_WHITNEY_FIELDS,
+    CONFIDENCE_INTERVAL_FIELDS,
+    OUTLIER_FIELDS,
+    REGRESSION_FIELDS,
+    COEFFICIENT_FIELDS
+)
+from internal.core.services.processing_log import (
+    ProcessingLog,
+    DEFAULT_PROCESSING_LOG_LEVEL,
+    DEFAULT_MAX_LOG_ENTRIES
+)
+
+logger = logging.getLogger(__name__)
 
 # Определим константы для имен анализов, чтобы избежать опечаток
 DESCRIPTIVE_STATS_ANALYSIS = "descriptive_stats"
@@ -39,6 +91,256 @@ CONFIDENCE_INTERVALS_ANALYSIS = "confidence_intervals"
 WILCOXON_SIGNED_RANK_ANALYSIS = "wilcoxon_signed_rank"
 MANN_WHITNEY_ANALYSIS = "mann_whitney"
 
+# Версия алгоритмов анализа. Входит в ключ кэша результатов:
+# увеличивайте при любом изменении, влияющем на содержимое ответа.
+ANALYSIS_CODE_VERSION = "17"
+
+# Параметры анализов, передаваемые в selected_analyses в виде "префикс:значение",
+# и анализы, к которым они относятся
+ANALYSIS_PARAMETER_PREFIXES = {
+    "wilcoxon_var1:": WILCOXON_SIGNED_RANK_ANALYSIS,
+    "wilcoxon_var2:": WILCOXON_SIGNED_RANK_ANALYSIS,
+    "mann_whitney_group:": MANN_WHITNEY_ANALYSIS,
+    "mann_whitney_value:": MANN_WHITNEY_ANALYSIS,
+    "regression_dependent:": REGRESSION_ANALYSIS,
+    "regression_independent:": REGRESSION_ANALYSIS,
+    "regression_max_points:": REGRESSION_ANALYSIS,
+    "regression_downsample:": REGRESSION_ANALYSIS,
+    "regression_aggregation:": REGRESSION_ANALYSIS,
+    "regression_bins:": REGRESSION_ANALYSIS,
+    "quantile_sketch:": DESCRIPTIVE_STATS_ANALYSIS,
+    "histogram_bins:": DESCRIPTIVE_STATS_ANALYSIS,
+    "group_by:": DESCRIPTIVE_STATS_ANALYSIS,
+    "residual_histogram_bins:": REGRESSION_ANALYSIS,
+}
+
+# Параметры, которые меняют сами входные данные (выборка строк, веса строк) и поэтому влияют на результат любого раздела
+DATASET_PARAMETER_PREFIXES = ("sample_size:", "sample_stratify:", "sample_seed:", "weight_column:")
+
+# Поля моды: с весами строк мода берется из невзвешенных описательных статистик
+MODE_FIELDS = ("mode", "mode_frequency", "mode_count", "mode_frequency_error")
+
+# Порядок выполнения разделов анализа
+ANALYSIS_SECTION_ORDER = [
+    DESCRIPTIVE_STATS_ANALYSIS,
+    NORMALITY_TEST_ANALYSIS,
+    CHI_SQUARE_ANALYSIS,
+    WILCOXON_SIGNED_RANK_ANALYSIS,
+    MANN_WHITNEY_ANALYSIS,
+    CONFIDENCE_INTERVALS_ANALYSIS,
+    REGRESSION_ANALYSIS,
+]
+
+# Разделы, которые выполняются вместе с выбранным анализом, даже если не выбраны явно
+IMPLIED_SECTIONS = {
+    NORMALITY_TEST_ANALYSIS: [CHI_SQUARE_ANALYSIS],
+    DESCRIPTIVE_STATS_ANALYSIS: [CONFIDENCE_INTERVALS_ANALYSIS],
+}
+
+# Промежуточные результаты по столбцам (ColumnArtifacts), которые использует каждый раздел
+SECTION_ARTIFACTS = {
+    DESCRIPTIVE_STATS_ANALYSIS: ["clean", "moments", "sorted", "quantiles", "histogram:auto"],
+    NORMALITY_TEST_ANALYSIS: ["clean", "moments"],
+    CHI_SQUARE_ANALYSIS: ["clean", "moments", "histogram:sturges"],
+    CONFIDENCE_INTERVALS_ANALYSIS: ["clean", "moments"],
+}
+
+
+# Варианты разделов анализа от полного к самому дешевому. При ограничении времени (time_budget_ms:<мс>)
+# сервис заменяет полные варианты упрощенными, пока оценка времени запроса не уложится в ограничение
+FULL_VARIANT = "full"
+SAMPLED_VARIANT = "sampled"            # тест Шапиро-Уилка по случайной выборке из длинных столбцов
+SINGLE_START_VARIANT = "single_start"  # нелинейные модели без повторных подгонок с другими начальными значениями
+LINEAR_ONLY_VARIANT = "linear_only"    # только линейная модель
+QUANTILE_SKETCH_VARIANT = "quantile_sketch"  # медиана и квартили по KLL-скетчу (задается параметром "quantile_sketch:<k>")
+# Количество интервалов гистограммы остатков регрессии по умолчанию
+DEFAULT_RESIDUAL_HISTOGRAM_BINS = 10
+# Квантиль нормального распределения для 99% границ, в которых скетч гарантирует ошибку ранга
+SKETCH_BOUND_Z = 2.576
+SECTION_VARIANTS = {
+    NORMALITY_TEST_ANALYSIS: [FULL_VARIANT, SAMPLED_VARIANT],
+    REGRESSION_ANALYSIS: [FULL_VARIANT, SINGLE_START_VARIANT, LINEAR_ONLY_VARIANT],
+}
+
+# Модель стоимости вариантов: (постоянная часть в мс, мс на строку, мс на значение, участвующее в тесте)
+# на столбец, на пару переменных для регрессии или на один тест для критериев Вилкоксона.
+# Коэффициенты получены замерами на синтетических данных на одном ядре; для регрессии взяты
+# с запасом, так как время нелинейной подгонки сильно зависит от формы данных
+SECTION_COST_MODEL = {
+    (DESCRIPTIVE_STATS_ANALYSIS, FULL_VARIANT): (1.5, 0.0004, 0.0),
+    (NORMALITY_TEST_ANALYSIS, FULL_VARIANT): (1.0, 0.00004, 0.00003),
+    (NORMALITY_TEST_ANALYSIS, SAMPLED_VARIANT): (1.0, 0.00004, 0.00003),
+    (CHI_SQUARE_ANALYSIS, FULL_VARIANT): (1.0, 0.00005, 0.0),
+    (CONFIDENCE_INTERVALS_ANALYSIS, FULL_VARIANT): (1.0, 0.00004, 0.0),
+    (WILCOXON_SIGNED_RANK_ANALYSIS, FULL_VARIANT): (2.0, 0.0002, 0.0),
+    (MANN_WHITNEY_ANALYSIS, FULL_VARIANT): (2.0, 0.0002, 0.0),
+    (REGRESSION_ANALYSIS, FULL_VARIANT): (30.0, 0.025, 0.0),
+    (REGRESSION_ANALYSIS, SINGLE_START_VARIANT): (20.0, 0.012, 0.0),
+    (REGRESSION_ANALYSIS, LINEAR_ONLY_VARIANT): (3.0, 0.0018, 0.0),
+}
+
+
+def estimate_section_cost_ms(section: str, variant: str, n_rows: int, n_columns: int, n_pairs: int) -> float:
+    """
+    Оценивает время выполнения варианта раздела по размеру данных.
+
+    Args:
+        section: Раздел анализа.
+        variant: Вариант раздела.
+        n_rows: Количество строк.
+        n_columns: Количество числовых столбцов.
+        n_pairs: Количество пар переменных для регрессии.
+    """
+    base_ms, per_row_ms, per_tested_ms = SECTION_COST_MODEL.get(
+        (section, variant), SECTION_COST_MODEL.get((section, FULL_VARIANT), (0.0, 0.0, 0.0)))
+    tested_values = min(n_rows, DEFAULT_SHAPIRO_SAMPLE_SIZE) if variant == SAMPLED_VARIANT else n_rows
+    if section == REGRESSION_ANALYSIS:
+        units = n_pairs
+    elif section in (WILCOXON_SIGNED_RANK_ANALYSIS, MANN_WHITNEY_ANALYSIS):
+        units = 1
+    else:
+        units = n_columns
+    return units * (base_ms + per_row_ms * n_rows + per_tested_ms * tested_values)
+
+
+def choose_section_variants(plan: List[Tuple[str, str]], n_rows: int, n_columns: int, n_pairs: int,
+                            budget_ms: Optional[float]) -> Tuple[Dict[str, str], float]:
+    """
+    Выбирает варианты разделов плана так, чтобы оценка общего времени не превышала ограничение.
+    Выбор зависит только от размера данных, поэтому ответ воспроизводим и может кэшироваться.
+    На каждом шаге упрощается раздел, упрощение которого дает наибольшую экономию.
+
+    Returns:
+        Кортеж (вариант для каждого раздела плана, оценка общего времени в мс).
+    """
+    variants = {section: FULL_VARIANT for section, _ in plan}
+
+    def cost(section: str, variant: str) -> float:
+        return estimate_section_cost_ms(section, variant, n_rows, n_columns, n_pairs)
+
+    total_ms = sum(cost(section, variant) for section, variant in variants.items())
+    while budget_ms is not None and total_ms > budget_ms:
+        best = None
+        for section, variant in variants.items():
+            options = SECTION_VARIANTS.get(section, [FULL_VARIANT])
+            position = options.index(variant)
+            if position + 1 >= len(options):
+                continue
+            saving = cost(section, variant) - cost(section, options[position + 1])
+            if saving > 0 and (best is None or saving > best[2]):
+                best = (section, options[position + 1], saving)
+        if best is None:
+            break
+        section, cheaper_variant, saving = best
+        variants[section] = cheaper_variant
+        total_ms -= saving
+    return variants, total_ms
+
+
+def normalize_selected_analyses(selected_analyses: List[str]) -> List[str]:
+    """
+    Приводит список выбранных анализов к каноническому виду: без дубликатов, в отсортированном порядке
+    и без параметров анализов, которые не были выбраны (они не влияют на результат).
+    """
+    selected = set(selected_analyses)
+    normalized = set()
+    for item in selected:
+        owner = next((analysis for prefix, analysis in ANALYSIS_PARAMETER_PREFIXES.items()
+                      if item.startswith(prefix)), None)
+        if owner is not None and owner not in selected:
+            continue
+        normalized.add(item)
+    return sorted(normalized)
+
+
+def build_analysis_plan(selected_analyses) -> List[Tuple[str, str]]:
+    """
+    Строит план выполнения запроса: разделы анализа в порядке выполнения
+    вместе с причиной включения ("selected" или "implied by <раздел>").
+    """
+    selected = set(selected_analyses)
+    reasons = {section: "selected" for section in ANALYSIS_SECTION_ORDER if section in selected}
+    for parent, implied_sections in IMPLIED_SECTIONS.items():
+        if parent in selected:
+            for section in implied_sections:
+                reasons.setdefault(section, f"implied by {parent}")
+    return [(section, reasons[section]) for section in ANALYSIS_SECTION_ORDER if section in reasons]
+
+
+def describe_analysis_plan(plan: List[Tuple[str, str]]) -> str:
+    """Описание плана для журнала обработки: разделы и общие для нескольких разделов промежуточные результаты."""
+    if not plan:
+        return "Analysis plan: empty"
+    steps = []
+    consumers: Dict[str, int] = {}
+    for section, reason in plan:
+        step = section if reason == "selected" else f"{section} ({reason})"
+        artifacts = SECTION_ARTIFACTS.get(section, [])
+        if artifacts:
+            step += f" [{', '.join(artifacts)}]"
+        for artifact in artifacts:
+            consumers[artifact] = consumers.get(artifact, 0) + 1
+        steps.append(step)
+    description = "Analysis plan: " + " -> ".join(steps)
+    shared = [f"{artifact} x{count}" for artifact, count in consumers.items() if count > 1]
+    if shared:
+        description += f"; shared column artifacts: {', '.join(shared)}"
+    return description
+
+
+def build_dataset_key(file_content: bytes, file_name: str) -> str:
+    """Строит ключ набора данных из хэша содержимого файла и его формата."""
+    content_hash = hashlib.sha256(file_content).hexdigest()
+    file_extension = os.path.splitext(file_name)[1].lower()
+    return f"{content_hash}{file_extension}"
+
+
+def build_request_key(request: DataFileRequest, dataset_key: Optional[str] = None) -> str:
+    """
+    Строит ключ запроса из хэша содержимого файла, формата файла,
+    нормализованного набора анализов и версии алгоритмов.
+    dataset_key - уже вычисленный build_dataset_key (чтобы не хэшировать файл повторно).
+    """
+    spec = json.dumps([
+        ANALYSIS_CODE_VERSION,
+        dataset_key or build_dataset_key(request.file_content, request.file_name),
+        normalize_selected_analyses(request.selected_analyses)
+    ])
+    return hashlib.sha256(spec.encode("utf-8")).hexdigest()
+
+
+def build_section_key(request: DataFileRequest, section: str, variant: str = FULL_VARIANT,
+                      dataset_key: Optional[str] = None) -> str:
+    """
+    Строит ключ результата одного раздела из хэша данных, раздела, его варианта и только тех параметров запроса,
+    от которых зависит раздел (параметры других разделов в ключ не входят).
+    dataset_key - уже вычисленный build_dataset_key (чтобы не хэшировать файл повторно для каждого раздела).
+    """
+    parameters = sorted(
+        item for item in set(request.selected_analyses)
+        if item.startswith(DATASET_PARAMETER_PREFIXES)
+        or any(item.startswith(prefix) and owner == section for prefix, owner in ANALYSIS_PARAMETER_PREFIXES.items())
+    )
+    spec = json.dumps([
+        ANALYSIS_CODE_VERSION,
+        dataset_key or build_dataset_key(request.file_content, request.file_name),
+        section,
+        variant,
+        parameters
+    ])
+    return hashlib.sha256(spec.encode("utf-8")).hexdigest()
+
+
+def mode_frequency_estimate(variable_name: str, frequency: int, frequency_error: int) -> EstimateError:
+    """Оценка частоты моды по счетчикам Мисры-Гриса: истинная частота лежит в [frequency, frequency + frequency_error]."""
+    return EstimateError(
+        variable_name=variable_name,
+        statistic="mode_frequency",
+        estimate=float(frequency),
+        lower_bound=float(frequency),
+        upper_bound=float(frequency + frequency_error)
+    )
+
 
 class AnalysisService(AnalysisServicePort):
     """Реализация основного сервиса анализа данных"""
@@ -51,7 +353,13 @@ class AnalysisService(AnalysisServicePort):
                  goodness_of_fit: GoodnessOfFitPort,
                  regression: RegressionPort,
                  residuals_analysis: ResidualsAnalysisPort,
-                 wilcoxon_test: Optional[WilcoxonTestPort] = None):
+                 wilcoxon_test: Optional[WilcoxonTestPort] = None,
+                 result_cache: Optional[ResultCachePort] = None,
+                 speculative_store: Optional[SpeculativeAnalysisStore] = None,
+                 max_log_entries: int = DEFAULT_MAX_LOG_ENTRIES,
+                 section_executor: Optional[Executor] = None,
+                 section_cache: Optional[ResultCachePort] = None,
+                 dataset_store: Optional[DatasetStorePort] = None):
         self.data_loader = data_loader
         self.descriptive_stats = descriptive_stats
         self.normality_test = normality_test 
@@ -60,263 +368,980 @@ class AnalysisService(AnalysisServicePort):
         self.regression = regression
         self.residuals_analysis = residuals_analysis
         self.wilcoxon_test = wilcoxon_test
+        self.result_cache = result_cache
+        # Одновременные одинаковые запросы разделяют одно вычисление
+        self.in_flight = SingleFlight()
+        # Наборы данных, подготовленные заранее после запроса списка столбцов (None - режим отключен)
+        self.speculative_store = speculative_store
+        # Ограничение количества записей processing_log в ответе (0 - без ограничения)
+        self.max_log_entries = max_log_entries
+        # Пул потоков для одновременного выполнения независимых разделов запроса (None - последовательно)
+        self.section_executor = section_executor
+        # Результаты отдельных разделов (None - не сохраняются): при повторном запросе с измененными
+        # параметрами одного раздела остальные разделы берутся из этого кэша
+        self.section_cache = section_cache
+        # Пополняемые наборы данных, хранимые на сервере (None - режим отключен)
+        self.dataset_store = dataset_store
+
+    def prefetch_dataset(self, file_content: bytes, file_name: str,
+                         df: pd.DataFrame, load_logs: List[str]) -> bool:
+        """
+        Сохраняет разобранный при get_columns набор данных и запускает в фоне разделы анализа,
+        не зависящие от выбора пользователя (описательные статистики и гистограммы,
+        доверительные интервалы, тесты на нормальность).
+        
+        Returns:
+            True, если фоновые вычисления запущены.
+        """
+        if self.speculative_store is None or df is None:
+            return False
+        artifacts = ColumnArtifacts(df)
+        return self.speculative_store.prepare(
+            build_dataset_key(file_content, file_name),
+            df,
+            load_logs,
+            sections={
+                DESCRIPTIVE_STATS_ANALYSIS: lambda data: self.descriptive_stats.calculate_descriptive_stats(data, artifacts=artifacts),
+                CONFIDENCE_INTERVALS_ANALYSIS: lambda data: self.confidence_interval.calculate_confidence_intervals(data, artifacts=artifacts),
+                NORMALITY_TEST_ANALYSIS: lambda data: self.normality_test.perform_normality_test(data, artifacts=artifacts),
+                CHI_SQUARE_ANALYSIS: lambda data: self.goodness_of_fit.perform_chi_square_test(data, artifacts=artifacts),
+            },
+            artifacts=artifacts
+        )
+
+    def _load_dataset(self, request: DataFileRequest, sampling: Optional[Dict[str, Any]] = None,
+                      dataset_key: Optional[str] = None) -> Tuple[Optional[pd.DataFrame], List[str], Optional[SpeculativeDataset]]:
+        """
+        Возвращает DataFrame (из подготовленных заранее или загружая файл), логи загрузки и подготовленный набор.
+        При запросе выборки строк файл загружается с выборкой, а подготовленный заранее полный набор не используется.
+        """
+        if sampling is not None:
+            df, load_logs = self.data_loader.load_data(
+                file_content=request.file_content,
+                file_name=request.file_name,
+                sample_size=sampling["sample_size"],
+                stratify_by=sampling["stratify_by"],
+                sample_seed=sampling["seed"]
+            )
+            return df, load_logs, None
+        if self.speculative_store is not None:
+            prepared = self.speculative_store.get(dataset_key or build_dataset_key(request.file_content, request.file_name))
+            if prepared is not None:
+                return prepared.df, prepared.load_logs + ["Using dataset prepared after column request"], prepared
+        df, load_logs = self.data_loader.load_data(
+            file_content=request.file_content, 
+            file_name=request.file_name
+        )
+        return df, load_logs, None
+
+    @staticmethod
+    def _run_section(prepared: Optional[SpeculativeDataset], section: str, compute):
+        """Берет результат раздела из фоновых вычислений, если они были запущены, иначе вычисляет его."""
+        if prepared is None:
+            return compute()
+        return prepared.take_section(section, compute)
     
     def analyze_data(self, request: DataFileRequest) -> AnalysisResponse:
         """Анализирует данные из запроса и возвращает ответ с результатами анализа"""
+        # Файл хэшируется один раз: ключ набора данных входит в ключ запроса и в ключи разделов
+        dataset_key = build_dataset_key(request.file_content, request.file_name)
+        request_key = build_request_key(request, dataset_key)
+
+        if self.result_cache is not None:
+            cached_response = self.result_cache.get(request_key)
+            if cached_response is not None:
+                return self._with_log_entry(cached_response, f"Result served from cache (key {request_key[:12]})")
+
+        response, shared = self.in_flight.do(request_key, lambda: self._compute_and_cache(request, request_key, dataset_key))
+        if shared:
+            return self._with_log_entry(response, f"Result shared with a concurrent identical request (key {request_key[:12]})")
+        return response
+
+    def analyze_data_progressive(self, request: DataFileRequest,
+                                 is_active: Optional[Callable[[], bool]] = None) -> Iterator[ProgressiveUpdate]:
+        """
+        Онлайн-агрегация: обрабатывает строки блоками в случайном порядке и после каждого блока возвращает
+        оценки среднего, стандартного отклонения, квартилей, корреляций и коэффициентов регрессии
+        с доверительными границами. Параметры: "progressive_blocks:<k>", "progressive_seed:<n>",
+        "regression_dependent:", "regression_independent:".
+        
+        Args:
+            request: Запрос с файлом данных.
+            is_active: Проверка, что клиент еще ожидает результаты; проверяется перед каждым блоком.
         
+        Returns:
+            Итератор обновлений; последнее обновление после обработки всех строк помечено final.
+        """
+        update = ProgressiveUpdate()
+        n_blocks = DEFAULT_PROGRESSIVE_BLOCKS
+        seed = DEFAULT_PROGRESSIVE_SEED
+        dependent_var = None
+        independent_var = None
+        for analysis in request.selected_analyses:
+            try:
+                if analysis.startswith("progressive_blocks:"):
+                    n_blocks = max(1, int(analysis[len("progressive_blocks:"):]))
+                elif analysis.startswith("progressive_seed:"):
+                    seed = int(analysis[len("progressive_seed:"):])
+            except ValueError:
+                update.processing_log.append(f"Warning: Invalid progressive parameter '{analysis}', using default")
+            if analysis.startswith("regression_dependent:"):
+                dependent_var = analysis[len("regression_dependent:"):]
+            elif analysis.startswith("regression_independent:"):
+                independent_var = analysis[len("regression_independent:"):]
+
+        try:
+            df, load_logs, _ = self._load_dataset(request)
+            update.processing_log.extend(load_logs)
+            if df is None:
+                update.error = "Failed to load data"
+                yield update
+                return
+
+            update.population_size = len(df)
+            if df.empty:
+                update.final = True
+                yield update
+                return
+            blocks = progressive_estimates(df, n_blocks, seed, dependent_var, independent_var)
+            while True:
+                # Отмена проверяется до обработки следующего блока
+                if is_active is not None and not is_active():
+                    logger.info("Progressive analysis of %s cancelled after %d of %d rows",
+                                request.file_name, update.rows_processed, len(df))
+                    return
+                block_result = next(blocks, None)
+                if block_result is None:
+                    return
+                rows_processed, estimates, logs = block_result
+                update.rows_processed = rows_processed
+                update.estimates = [EstimateError(**estimate) for estimate in estimates]
+                update.final = rows_processed == len(df)
+                update.processing_log.extend(logs)
+                try:
+                    yield update
+                except GeneratorExit:
+                    # Получатель прекратил чтение обновлений (например, gRPC-вызов отменен)
+                    if not update.final:
+                        logger.info("Progressive analysis of %s stopped by the client after %d of %d rows",
+                                    request.file_name, rows_processed, len(df))
+                    raise
+                update = ProgressiveUpdate(population_size=len(df), rows_processed=rows_processed)
+
+        except Exception as e:
+            import traceback
+            logger.error("Progressive analysis of %s failed: %s", request.file_name, e, exc_info=True)
+            update.processing_log.append(f"Error analyzing data: {e}\n{traceback.format_exc()}")
+            update.error = str(e)
+            yield update
+
+    def create_dataset(self, request: DatasetRequest) -> DatasetUpdate:
+        """
+        Создает хранимый на сервере набор данных: отслеживаются числовые столбцы файла, а по строкам
+        накапливаются объединяемые статистики (моменты, гистограммы, совместные моменты пар столбцов).
+        Если идентификатор не задан, он генерируется.
+        """
+        return self._update_dataset(request, request.dataset_id or uuid.uuid4().hex, create=True)
+
+    def append_rows(self, request: DatasetRequest) -> DatasetUpdate:
+        """
+        Добавляет строки файла к хранимому набору данных. Статистики новых строк объединяются с накопленными,
+        поэтому время обновления пропорционально количеству добавленных строк, а не размеру всего набора.
+        """
+        return self._update_dataset(request, request.dataset_id, create=False)
+
+    def _update_dataset(self, request: DatasetRequest, dataset_id: str, create: bool) -> DatasetUpdate:
+        """Создает набор данных или добавляет к нему строки под блокировкой набора и возвращает его статистики."""
+        update = DatasetUpdate(dataset_id=dataset_id)
+        update.analysis.processing_log = ProcessingLog(max_entries=self.max_log_entries)
+        try:
+            if self.dataset_store is None:
+                update.analysis.error = "Server-held datasets are disabled"
+                return update
+            with self.dataset_store.lock(dataset_id):
+                stored = self.dataset_store.get(dataset_id)
+                if create and stored is not None:
+                    update.analysis.error = f"Dataset '{dataset_id}' already exists"
+                    return update
+                if not create and stored is None:
+                    update.analysis.error = f"Dataset '{dataset_id}' not found"
+                    return update
+                df, load_logs = self.data_loader.load_data(file_content=request.file_content, file_name=request.file_name)
+                update.analysis.processing_log.extend(load_logs)
+                if df is None:
+                    update.analysis.error = "Failed to load data"
+                    return update
+
+                if create:
+                    columns = df.select_dtypes(include=np.number).columns.tolist()
+                    quantile_sketch_k = self._parse_quantile_sketch(request, update.analysis)
+                    statistics = IncrementalStatistics(columns, quantile_sketch_k=quantile_sketch_k or DEFAULT_SKETCH_K)
+                    update.analysis.processing_log.append(f"Created dataset {dataset_id} tracking numerical columns: "
+                                                          f"{', '.join(columns)}")
+                else:
+                    # Изменяем копию, чтобы ошибка посреди добавления не испортила сохраненные статистики
+                    statistics = copy.deepcopy(stored)
+                update.analysis.processing_log.extend(statistics.append(df))
+                self.dataset_store.put(dataset_id, statistics)
+            self._fill_dataset_update(update, statistics, len(df), request)
+        except Exception as e:
+            logger.error("Updating dataset %s failed: %s", dataset_id, e, exc_info=True)
+            update.analysis.error = str(e)
+        finally:
+            update.analysis.processing_log = update.analysis.processing_log.finalize()
+        return update
+
+    @staticmethod
+    def _fill_dataset_update(update: DatasetUpdate, statistics: IncrementalStatistics, appended_rows: int,
+                             request: DatasetRequest):
+        """Заполняет ответ статистиками набора данных; при заданной паре regression_dependent/independent - и регрессией МНК."""
+        update.row_count = statistics.row_count
+        update.appended_rows = appended_rows
+        descriptive_results, histogram_results = statistics.descriptives()
+        update.analysis.descriptives = [
+            DescriptiveStats(**{**stats_dict, **values}, missing_fields=missing_fields)
+            for stats_dict, (values, missing_fields)
+            in zip(descriptive_results, encode_numeric_fields(descriptive_results, DESCRIPTIVE_FIELDS))
+        ]
+        update.analysis.histograms = [HistogramData(**hist_dict) for hist_dict in histogram_results]
+        rank_errors = statistics.rank_errors()
+        mode_errors = statistics.mode_frequency_errors()
+        if rank_errors or mode_errors:
+            approximation = ApproximationInfo(
+                section=DESCRIPTIVE_STATS_ANALYSIS,
+                variant=QUANTILE_SKETCH_VARIANT,
+                description="Median and quartiles of the accumulated rows estimated with KLL quantile sketches; "
+                            "modes of high-cardinality columns are Misra-Gries heavy hitters",
+                variables=list(dict.fromkeys([*rank_errors, *mode_errors])),
+                rank_error=max(rank_errors.values(), default=0.0)
+            )
+            for stats in update.analysis.descriptives:
+                if stats.variable_name in mode_errors:
+                    approximation.estimates.append(mode_frequency_estimate(
+                        stats.variable_name, stats.mode_frequency, mode_errors[stats.variable_name]))
+            update.analysis.approximations.append(approximation)
+        update.correlations = [CorrelationResult(**correlation) for correlation in statistics.correlations()]
+
+        dependent_var = next((item[len("regression_dependent:"):] for item in request.selected_analyses
+                              if item.startswith("regression_dependent:")), None)
+        independent_var = next((item[len("regression_independent:"):] for item in request.selected_analyses
+                                if item.startswith("regression_independent:")), None)
+        if dependent_var and independent_var:
+            reg_dict = statistics.linear_regression(dependent_var, independent_var)
+            if reg_dict is None:
+                update.analysis.processing_log.append(
+                    f"Warning: Linear regression {dependent_var} ~ {independent_var} is not available for this dataset")
+            else:
+                coefficients = reg_dict.pop("coefficients")
+                model_type = reg_dict.pop("model_type")
+                (values, missing_fields), = encode_numeric_fields([reg_dict], REGRESSION_FIELDS)
+                regression = RegressionResult(**{**reg_dict, **values}, missing_fields=missing_fields)
+                regression.model_type = model_type
+                regression.coefficients = [
+                    RegressionCoefficient(**{**coef_dict, **coef_values}, missing_fields=coef_missing_fields)
+                    for coef_dict, (coef_values, coef_missing_fields)
+                    in zip(coefficients, encode_numeric_fields(coefficients, COEFFICIENT_FIELDS))
+                ]
+                update.analysis.regressions.append(regression)
+                update.analysis.processing_log.append(
+                    f"Linear model (OLS) from accumulated statistics: {dependent_var} ~ {independent_var}, "
+                    f"R²={regression.r_squared:.4f}")
+
+    @staticmethod
+    def _with_log_entry(response: AnalysisResponse, entry: str) -> AnalysisResponse:
+        """Возвращает копию разделяемого ответа с дополнительной записью в логе (остальные поля не копируются)."""
+        return dataclasses.replace(response, processing_log=response.processing_log + [entry])
+
+    def _compute_and_cache(self, request: DataFileRequest, request_key: str,
+                           dataset_key: Optional[str] = None) -> AnalysisResponse:
+        """Выполняет анализ и сохраняет успешный результат в кэш."""
+        response, succeeded = self._compute_analysis(request, dataset_key)
+        if succeeded and self.result_cache is not None:
+            self.result_cache.put(request_key, response)
+        return response
+
+    def _compute_analysis(self, request: DataFileRequest, dataset_key: Optional[str] = None) -> Tuple[AnalysisResponse, bool]:
+        """
+        Выполняет анализ без обращения к кэшу.
+        
+        Args:
+            request: Запрос с файлом данных.
+            dataset_key: Ключ набора данных build_dataset_key, если уже вычислен.
+        
+        Returns:
+            Кортеж (ответ, признак успешного завершения без ошибок загрузки и исключений)
+        """
+        started = time.perf_counter()
         response = AnalysisResponse()
+        succeeded = False
         selected_analyses = set(request.selected_analyses) # Используем set для быстрой проверки
+        log_level = next((analysis[len("log_level:"):] for analysis in request.selected_analyses
+                          if analysis.startswith("log_level:")), DEFAULT_PROCESSING_LOG_LEVEL)
+        response.processing_log = ProcessingLog(level=log_level, max_entries=self.max_log_entries)
         response.processing_log.append(f"Selected analyses: {selected_analyses}")
+        budget_ms = self._parse_time_budget(request, response)
+        sampling = self._parse_sampling(request, response)
         
         try:
-            df, load_logs = self.data_loader.load_data(
-                file_content=request.file_content, 
-                file_name=request.file_name
-            )
+            df, load_logs, prepared = self._load_dataset(request, sampling, dataset_key)
             response.processing_log.extend(load_logs)
             
             if df is not None:
                 if not selected_analyses: # Если ничего не выбрано, выполняем все по умолчанию (или логируем предупреждение)
                     response.processing_log.append("Warning: No specific analyses selected. Performing all available analyses.")
-                    # Чтобы выполнить все, можно временно добавить все ключи в selected_analyses
-                    # selected_analyses.update([DESCRIPTIVE_STATS_ANALYSIS, NORMALITY_TEST_ANALYSIS, REGRESSION_ANALYSIS, CHI_SQUARE_ANALYSIS, CONFIDENCE_INTERVALS_ANALYSIS])
-                    # Либо, если пользователь должен ОБЯЗАТЕЛЬНО выбрать, то тут можно вернуть ошибку или пустой результат
-                    # return response # Возвращаем пустой response, если не выбрано ничего и мы не хотим выполнять все по умолчанию
-
-                # --- Описательные статистики и гистограммы ---
-                if DESCRIPTIVE_STATS_ANALYSIS in selected_analyses:
-                    # Возвращает кортеж с тремя элементами вместо четырех
-                    desc_stats_data, hist_data, desc_logs = self.descriptive_stats.calculate_descriptive_stats(df)
-                    response.processing_log.extend(desc_logs)
-                    
-                    for stats_dict in desc_stats_data:
-                        stats = DescriptiveStats(
-                            variable_name=stats_dict.get("variable_name", ""),
-                            count=stats_dict.get("count", 0),
-                            mean=stats_dict.get("mean", 0.0) if pd.notna(stats_dict.get("mean")) else 0.0,
-                            median=stats_dict.get("median", 0.0) if pd.notna(stats_dict.get("median")) else 0.0,
-                            mode=stats_dict.get("mode", []),
-                            variance=stats_dict.get("variance", 0.0) if pd.notna(stats_dict.get("variance")) else 0.0,
-                            std_dev=stats_dict.get("std_dev", 0.0) if pd.notna(stats_dict.get("std_dev")) else 0.0,
-                            variation_coefficient=stats_dict.get("variation_coefficient", 0.0) if pd.notna(stats_dict.get("variation_coefficient")) else 0.0,
-                            skewness=stats_dict.get("skewness", 0.0) if pd.notna(stats_dict.get("skewness")) else 0.0,
-                            kurtosis=stats_dict.get("kurtosis", 0.0) if pd.notna(stats_dict.get("kurtosis")) else 0.0,
-                            min_value=stats_dict.get("min_value", 0.0) if pd.notna(stats_dict.get("min_value")) else 0.0,
-                            max_value=stats_dict.get("max_value", 0.0) if pd.notna(stats_dict.get("max_value")) else 0.0,
-                            q1=stats_dict.get("q1", 0.0) if pd.notna(stats_dict.get("q1")) else 0.0,
-                            q3=stats_dict.get("q3", 0.0) if pd.notna(stats_dict.get("q3")) else 0.0,
-                            iqr=stats_dict.get("iqr", 0.0) if pd.notna(stats_dict.get("iqr")) else 0.0
-                        )
-                        response.descriptives.append(stats)
-                    
-                    for hist_dict in hist_data:
-                        hist = HistogramData(
-                            variable_name=hist_dict.get("variable_name", ""),
-                            bins=hist_dict.get("bins", []),
-                            frequencies=hist_dict.get("frequencies", []),
-                            normal_curve_x=hist_dict.get("normal_curve_x", []),
-                            normal_curve_y=hist_dict.get("normal_curve_y", []),
-                            mean=hist_dict.get("mean", 0.0),
-                            std_dev=hist_dict.get("std_dev", 0.0)
-                        )
-                        response.histograms.append(hist)
-                
-                # --- Тесты на нормальность (Шапиро-Уилка) ---
-                if NORMALITY_TEST_ANALYSIS in selected_analyses:
-                    normality_results, norm_logs = self.normality_test.perform_normality_test(df) # alpha по умолчанию 0.05
-                    response.processing_log.extend(norm_logs)
-                    for test_dict in normality_results:
-                        p_value = test_dict.get("p_value", 0.0)
-                        is_normal_val = p_value > 0.05 # Стандартный alpha = 0.05
-                        if pd.isna(p_value): # Если p_value нет, считаем неопределенным
-                            is_normal_val = False # Или можно ввести третье состояние/оставить conclusion
-
-                        test = NormalityTestResult(
-                            variable_name=test_dict.get("variable_name", ""),
-                            test_name=test_dict.get("test_name", ""),
-                            statistic=test_dict.get("statistic", 0.0) if pd.notna(test_dict.get("statistic")) else 0.0,
-                            p_value=p_value if pd.notna(p_value) else 0.0,
-                            is_normal=is_normal_val, # Используем рассчитанное значение
-                            conclusion=test_dict.get("conclusion", "") # Оставляем для логов/детальной информации
-                        )
-                        response.normality_tests.append(test)
-                
-                    # --- Критерий хи-квадрат (как часть проверки нормальности) ---
-                    # Считаем, что хи-квадрат выполняется, если выбрана проверка нормальности
-                    chi2_results, chi2_logs = self.goodness_of_fit.perform_chi_square_test(df) # alpha по умолчанию 0.05
-                    response.processing_log.extend(chi2_logs)
-                    for chi2_dict in chi2_results:
-                        p_value_chi2 = chi2_dict.get("p_value", 0.0)
-                        is_normal_chi2 = p_value_chi2 > 0.05 # Стандартный alpha = 0.05
-                        if pd.isna(p_value_chi2):
-                            is_normal_chi2 = False
-
-                        # Обработка NaN для degrees_of_freedom
-                        df_value = chi2_dict.get("degrees_of_freedom")
-                        degrees_of_freedom_val = int(df_value) if pd.notna(df_value) and df_value is not None else 0
-                        
-                        # Обработка NaN для intervals
-                        intervals_value = chi2_dict.get("intervals")
-                        intervals_val = int(intervals_value) if pd.notna(intervals_value) and intervals_value is not None else 0
-
-                        chi2 = PearsonChiSquareResult(
-                            variable_name=chi2_dict.get("variable_name", ""),
-                            test_name=chi2_dict.get("test_name", ""), # Убедимся, что это поле есть в chi2_dict
-                            distribution=chi2_dict.get("distribution", ""),
-                            statistic=chi2_dict.get("statistic", 0.0) if pd.notna(chi2_dict.get("statistic")) else 0.0,
-                            p_value=p_value_chi2 if pd.notna(p_value_chi2) else 0.0,
-                            degrees_of_freedom=degrees_of_freedom_val, # Исправлено
-                            intervals=intervals_val, # Исправлено
-                            is_normal=is_normal_chi2, # Используем рассчитанное значение
-                            conclusion=chi2_dict.get("conclusion", "") # Оставляем для логов
-                        )
-                        response.pearson_chi_square_results.append(chi2)
-
-                # --- Тест знаковых рангов Вилкоксона ---
-                if WILCOXON_SIGNED_RANK_ANALYSIS in selected_analyses and self.wilcoxon_test is not None:
-                    # Проверяем, указаны ли переменные для сравнения
-                    var1 = None
-                    var2 = None
-                    
-                    # Извлекаем имена переменных из списка selected_analyses
-                    for analysis in request.selected_analyses:
-                        if analysis.startswith("wilcoxon_var1:"):
-                            var1 = analysis[len("wilcoxon_var1:"):]
-                        elif analysis.startswith("wilcoxon_var2:"):
-                            var2 = analysis[len("wilcoxon_var2:"):]
-                    
-                    # Выполняем тест Вилкоксона
-                    wilcoxon_results, wilc_logs = self.wilcoxon_test.perform_wilcoxon_signed_rank_test(
-                        df, var1=var1, var2=var2
-                    )
-                    response.processing_log.extend(wilc_logs)
-                    
-                    for wilc_dict in wilcoxon_results:
-                        wilc_test = WilcoxonTestResult(
-                            test_type=wilc_dict.get("test_type", "Wilcoxon signed-rank test"),
-                            variable1=wilc_dict.get("variable1", ""),
-                            variable2=wilc_dict.get("variable2", ""),
-                            statistic=wilc_dict.get("statistic", 0.0) if pd.notna(wilc_dict.get("statistic")) else 0.0,
-                            p_value=wilc_dict.get("p_value", 0.0) if pd.notna(wilc_dict.get("p_value")) else 0.0,
-                            conclusion=wilc_dict.get("conclusion", ""),
-                            sample_size=wilc_dict.get("sample_size", 0)
-                        )
-                        response.wilcoxon_signed_rank_tests.append(wilc_test)
-                
-                # --- Тест Манна-Уитни ---
-                if MANN_WHITNEY_ANALYSIS in selected_analyses and self.wilcoxon_test is not None:
-                    # Проверяем, указаны ли переменные для теста
-                    group_column = None
-                    value_column = None
-                    
-                    # Извлекаем имена переменных из списка selected_analyses
-                    for analysis in request.selected_analyses:
-                        if analysis.startswith("mann_whitney_group:"):
-                            group_column = analysis[len("mann_whitney_group:"):]
-                        elif analysis.startswith("mann_whitney_value:"):
-                            value_column = analysis[len("mann_whitney_value:"):]
-                    
-                    # Проверяем, что указаны обе переменные
-                    if group_column is not None and value_column is not None:
-                        # Выполняем тест Манна-Уитни
-                        mw_results, mw_logs = self.wilcoxon_test.perform_mann_whitney_test(
-                            df, group_column=group_column, value_column=value_column
-                        )
-                        response.processing_log.extend(mw_logs)
-                        
-                        for mw_dict in mw_results:
-                            mw_test = MannWhitneyTestResult(
-                                test_type=mw_dict.get("test_type", "Mann-Whitney U test"),
-                                group_column=mw_dict.get("group_column", ""),
-                                value_column=mw_dict.get("value_column", ""),
-                                group1=mw_dict.get("group1", ""),
-                                group2=mw_dict.get("group2", ""),
-                                group1_size=mw_dict.get("group1_size", 0),
-                                group2_size=mw_dict.get("group2_size", 0),
-                                group1_median=mw_dict.get("group1_median", 0.0) if pd.notna(mw_dict.get("group1_median")) else 0.0,
-                                group2_median=mw_dict.get("group2_median", 0.0) if pd.notna(mw_dict.get("group2_median")) else 0.0,
-                                statistic=mw_dict.get("statistic", 0.0) if pd.notna(mw_dict.get("statistic")) else 0.0,
-                                p_value=mw_dict.get("p_value", 0.0) if pd.notna(mw_dict.get("p_value")) else 0.0,
-                                conclusion=mw_dict.get("conclusion", "")
-                            )
-                            response.mann_whitney_tests.append(mw_test)
-                    else:
-                        response.processing_log.append("Mann-Whitney test requires both group_column and value_column parameters")
-
-                # --- Доверительные интервалы (если "descriptive_stats" выбраны, т.к. они часто идут вместе) ---
-                if DESCRIPTIVE_STATS_ANALYSIS in selected_analyses:
-                    ci_results, ci_logs = self.confidence_interval.calculate_confidence_intervals(df)
-                    response.processing_log.extend(ci_logs)
-                    for ci_dict in ci_results:
-                        ci = ConfidenceInterval(
-                            variable_name=ci_dict.get("variable_name", ""),
-                            statistic_name=ci_dict.get("statistic_name", ""),
-                            confidence_level=ci_dict.get("confidence_level", 0.95),
-                            point_estimate=ci_dict.get("point_estimate", 0.0) if pd.notna(ci_dict.get("point_estimate")) else 0.0,
-                            lower_bound=ci_dict.get("lower_bound", 0.0) if pd.notna(ci_dict.get("lower_bound")) else 0.0,
-                            upper_bound=ci_dict.get("upper_bound", 0.0) if pd.notna(ci_dict.get("upper_bound")) else 0.0
-                        )
-                        response.confidence_intervals.append(ci)
-                
-                # --- Регрессионный анализ ---
-                if REGRESSION_ANALYSIS in selected_analyses:
-                    # Check for specified regression variables
-                    dependent_var = None
-                    independent_var = None
-                    
-                    # Extract variable names from selected_analyses
-                    for analysis in request.selected_analyses:
-                        if analysis.startswith("regression_dependent:"):
-                            dependent_var = analysis[len("regression_dependent:"):]
-                        elif analysis.startswith("regression_independent:"):
-                            independent_var = analysis[len("regression_independent:"):]
-                    
-                    # Perform regression with specified variables if provided
-                    reg_results, reg_logs = self.regression.perform_simple_linear_regression(
-                        df, dependent_var=dependent_var, independent_var=independent_var
-                    )
-                    response.processing_log.extend(reg_logs)
-                    
-                    for reg_dict in reg_results:
-                        reg = RegressionResult(
-                            dependent_variable=reg_dict.get("dependent_variable", ""),
-                            independent_variables=reg_dict.get("independent_variables", []),
-                            r_squared=reg_dict.get("r_squared", 0.0) if pd.notna(reg_dict.get("r_squared")) else 0.0,
-                            adjusted_r_squared=reg_dict.get("adjusted_r_squared", 0.0) if pd.notna(reg_dict.get("adjusted_r_squared")) else 0.0,
-                            f_statistic=reg_dict.get("f_statistic", 0.0) if pd.notna(reg_dict.get("f_statistic")) else 0.0,
-                            f_p_value=reg_dict.get("f_p_value", 0.0) if pd.notna(reg_dict.get("f_p_value")) else 0.0,
-                            sse=reg_dict.get("sse", 0.0) if pd.notna(reg_dict.get("sse")) else 0.0,
-                            data_points=reg_dict.get("data_points", []),
-                            residuals=reg_dict.get("residuals", [])  # Добавляем остатки регрессии
-                        )
-                        # Установка типа модели
-                        if "model_type" in reg_dict:
-                            reg.model_type = reg_dict["model_type"]
-                        
-                        coef_list = reg_dict.get("coefficients", [])
-                        for coef_dict in coef_list:
-                            coef = RegressionCoefficient(
-                                variable_name=coef_dict.get("variable_name", ""),
-                                coefficient=coef_dict.get("coefficient", 0.0) if pd.notna(coef_dict.get("coefficient")) else 0.0,
-                                standard_error=coef_dict.get("standard_error", 0.0) if pd.notna(coef_dict.get("standard_error")) else 0.0,
-                                t_statistic=coef_dict.get("t_statistic", 0.0) if pd.notna(coef_dict.get("t_statistic")) else 0.0,
-                                p_value=coef_dict.get("p_value", 0.0) if pd.notna(coef_dict.get("p_value")) else 0.0,
-                                confidence_interval_lower=coef_dict.get("confidence_interval_lower", 0.0) if pd.notna(coef_dict.get("confidence_interval_lower")) else 0.0,
-                                confidence_interval_upper=coef_dict.get("confidence_interval_upper", 0.0) if pd.notna(coef_dict.get("confidence_interval_upper")) else 0.0
-                            )
-                            reg.coefficients.append(coef)
-                        
-                        # Анализ остатков регрессии, если есть остатки
-                        if reg.residuals:
-                            residuals_analysis_result = self.residuals_analysis.analyze_residuals(reg.residuals)
-                            reg.residuals_analysis = residuals_analysis_result
-                            response.processing_log.append(f"Performed residuals analysis for {reg.dependent_variable} ~ {', '.join(reg.independent_variables)}")
-                        
-                        response.regressions.append(reg)
+
+                plan = build_analysis_plan(selected_analyses)
+                if self.wilcoxon_test is None:
+                    plan = [(section, reason) for section, reason in plan
+                            if section not in (WILCOXON_SIGNED_RANK_ANALYSIS, MANN_WHITNEY_ANALYSIS)]
+                response.processing_log.append(describe_analysis_plan(plan))
+
+                # Промежуточные результаты по столбцам общие для всех разделов запроса
+                # (и для фоновых вычислений, если набор данных подготовлен заранее)
+                artifacts = prepared.artifacts if prepared is not None and prepared.artifacts is not None else ColumnArtifacts(df)
+                variants = self._plan_variants(plan, request, df, artifacts, budget_ms, response)
+                self._execute_plan(plan, request, df, artifacts, prepared, response, variants, dataset_key)
+                if "sampling" in df.attrs:
+                    self._report_sampling(plan, df, artifacts, response)
+                response.processing_log.append(artifacts.usage_summary())
+                if budget_ms is not None:
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                    response.processing_log.append(f"Time budget: analysis finished in {elapsed_ms:.0f} ms of {budget_ms:.0f} ms")
+
+                succeeded = True
         
         except Exception as e:
             import traceback
             error_message = f"Error analyzing data: {e}\n{traceback.format_exc()}"
+            logger.error("Analysis of %s failed: %s", request.file_name, e, exc_info=True)
             response.processing_log.append(error_message)
         
-        return response 
\ No newline at end of file
+        response.processing_log = response.processing_log.finalize()
+        return response, succeeded 
+
+    @staticmethod
+    def _parse_time_budget(request: DataFileRequest, response: AnalysisResponse) -> Optional[float]:
+        """Извлекает ограничение времени запроса "time_budget_ms:<мс>" (None - без ограничения)."""
+        for analysis in request.selected_analyses:
+            if analysis.startswith("time_budget_ms:"):
+                try:
+                    budget_ms = float(analysis[len("time_budget_ms:"):])
+                except ValueError:
+                    response.processing_log.append(f"Warning: Invalid time budget '{analysis}', running full analyses")
+                    return None
+                return budget_ms if budget_ms > 0 else None
+        return None
+
+    @staticmethod
+    def _parse_quantile_sketch(request: Any, response: AnalysisResponse) -> Optional[int]:
+        """
+        Извлекает параметр точности скетча квантилей "quantile_sketch:<k>" (пустое значение - k по умолчанию).
+        Возвращает None, если скетч не запрошен.
+        """
+        for analysis in request.selected_analyses:
+            if analysis.startswith("quantile_sketch:"):
+                value = analysis[len("quantile_sketch:"):]
+                try:
+                    return max(1, int(value)) if value else DEFAULT_SKETCH_K
+                except ValueError:
+                    response.processing_log.append(f"Warning: Invalid quantile sketch size '{analysis}', "
+                                                   f"using k={DEFAULT_SKETCH_K}")
+                    return DEFAULT_SKETCH_K
+        return None
+
+    @staticmethod
+    def _parse_weight_column(request: DataFileRequest, df: pd.DataFrame, response: AnalysisResponse) -> Optional[str]:
+        """
+        Извлекает столбец весов строк "weight_column:<столбец>".
+        Возвращает None, если веса не заданы, столбца нет в данных, он не числовой или в нем нет ни одного
+        конечного положительного веса (тогда статистики вычисляются без весов).
+        """
+        for analysis in request.selected_analyses:
+            if analysis.startswith("weight_column:"):
+                weight_column = analysis[len("weight_column:"):]
+                if weight_column not in df.columns:
+                    problem = "not found"
+                elif not pd.api.types.is_numeric_dtype(df[weight_column]):
+                    problem = "is not numeric"
+                else:
+                    weights = df[weight_column].to_numpy(dtype=float, na_value=np.nan)
+                    if np.any(np.isfinite(weights) & (weights > 0)):
+                        return weight_column
+                    problem = "has no finite positive weights"
+                response.processing_log.append(f"Warning: Weight column '{weight_column}' {problem}, "
+                                               f"statistics are calculated without weights")
+                return None
+        return None
+
+    @staticmethod
+    def _parse_histogram_bins(request: DataFileRequest, response: AnalysisResponse, prefix: str,
+                              default: Union[int, str]) -> Union[int, str]:
+        """
+        Извлекает правило выбора интервалов гистограммы "<prefix><правило>" (HISTOGRAM_BIN_RULES)
+        или количество интервалов "<prefix><n>".
+        """
+        for analysis in request.selected_analyses:
+            if analysis.startswith(prefix):
+                value = analysis[len(prefix):]
+                if value in HISTOGRAM_BIN_RULES:
+                    return value
+                try:
+                    n_bins = int(value)
+                except ValueError:
+                    n_bins = 0
+                if n_bins > 0:
+                    return n_bins
+                response.processing_log.append(f"Warning: Invalid histogram bins '{analysis}', expected a bin count "
+                                               f"or one of {', '.join(HISTOGRAM_BIN_RULES)}; using {default}")
+                return default
+        return default
+
+    @staticmethod
+    def _sketch_approximation(desc_stats_data: List[Dict[str, Any]]) -> Optional[ApproximationInfo]:
+        """
+        Отметка о медиане и квартилях, оцененных скетчем: граница ошибки ранга и значения на ее границах,
+        а для мод, найденных счетчиками Мисры-Гриса, - границы частоты моды.
+        Столбцы, которые поместились в скетч и счетчики целиком (результаты точные), не отмечаются.
+        """
+        approximated = [stats_dict for stats_dict in desc_stats_data
+                        if stats_dict.get("quantile_sketch", {}).get("rank_error", 0.0) > 0
+                        or stats_dict.get("mode_frequency_error", 0) > 0]
+        if not approximated:
+            return None
+        sketch_k = approximated[0]["quantile_sketch"]["k"]
+        approximation = ApproximationInfo(
+            section=DESCRIPTIVE_STATS_ANALYSIS,
+            variant=QUANTILE_SKETCH_VARIANT,
+            description=(f"Median, quartiles, IQR and histogram bins estimated with KLL quantile sketches (k={sketch_k}); "
+                         f"bounds are the values at the quantile rank ± the rank error bound; "
+                         f"modes of high-cardinality columns are Misra-Gries heavy hitters"),
+            variables=[stats_dict["variable_name"] for stats_dict in approximated],
+            rank_error=max(stats_dict["quantile_sketch"]["rank_error"] for stats_dict in approximated)
+        )
+        for stats_dict in approximated:
+            for estimate in stats_dict["quantile_sketch"]["estimates"]:
+                approximation.estimates.append(EstimateError(
+                    variable_name=stats_dict["variable_name"],
+                    standard_error=(estimate["upper_bound"] - estimate["lower_bound"]) / (2.0 * SKETCH_BOUND_Z),
+                    **estimate
+                ))
+            if stats_dict.get("mode_frequency_error", 0) > 0:
+                approximation.estimates.append(mode_frequency_estimate(
+                    stats_dict["variable_name"], stats_dict["mode_frequency"], stats_dict["mode_frequency_error"]))
+        return approximation
+
+    @staticmethod
+    def _parse_sampling(request: DataFileRequest, response: AnalysisResponse) -> Optional[Dict[str, Any]]:
+        """
+        Извлекает параметры выборки строк: "sample_size:<m>", "sample_stratify:<столбец>", "sample_seed:<n>".
+        Возвращает None, если выборка не запрошена.
+        """
+        sampling = {"sample_size": None, "stratify_by": None, "seed": DEFAULT_SAMPLE_SEED}
+        for analysis in request.selected_analyses:
+            if analysis.startswith("sample_size:"):
+                try:
+                    sampling["sample_size"] = int(analysis[len("sample_size:"):])
+                except ValueError:
+                    response.processing_log.append(f"Warning: Invalid sample size '{analysis}', using all rows")
+            elif analysis.startswith("sample_stratify:"):
+                sampling["stratify_by"] = analysis[len("sample_stratify:"):] or None
+            elif analysis.startswith("sample_seed:"):
+                try:
+                    sampling["seed"] = int(analysis[len("sample_seed:"):])
+                except ValueError:
+                    response.processing_log.append(f"Warning: Invalid sample seed '{analysis}', using {DEFAULT_SAMPLE_SEED}")
+        if not sampling["sample_size"] or sampling["sample_size"] <= 0:
+            return None
+        return sampling
+
+    @staticmethod
+    def _report_sampling(plan: List[Tuple[str, str]], df: pd.DataFrame, artifacts: ColumnArtifacts,
+                         response: AnalysisResponse):
+        """
+        Отмечает разделы плана как вычисленные по выборке строк; для описательных статистик добавляет
+        стандартные ошибки и 95% границы оценок с поправкой на конечную совокупность.
+        """
+        sampling = df.attrs["sampling"]
+        basis = (f"Computed on a {sampling['method']} sample of {sampling['sample_size']} "
+                 f"of {sampling['population_size']} rows")
+        details = {
+            DESCRIPTIVE_STATS_ANALYSIS: "; estimates carry standard errors and 95% bounds",
+            CONFIDENCE_INTERVALS_ANALYSIS: "; intervals include the finite population correction",
+            REGRESSION_ANALYSIS: "; coefficient standard errors and intervals reflect the sample size",
+        }
+        stratify_by = sampling.get("stratify_by")
+        groups = df[stratify_by] if stratify_by else None
+        for section, _ in plan:
+            approximation = ApproximationInfo(
+                section=section,
+                variant=sampling["method"],
+                description=basis + details.get(section, ""),
+                sample_size=sampling["sample_size"],
+                population_size=sampling["population_size"]
+            )
+            if section == DESCRIPTIVE_STATS_ANALYSIS:
+                for col_name in artifacts.numerical_columns():
+                    for estimate in sample_estimate_errors(artifacts.clean(col_name), sampling, groups=groups):
+                        approximation.estimates.append(EstimateError(variable_name=col_name, **estimate))
+                approximation.variables = artifacts.numerical_columns()
+            response.approximations.append(approximation)
+        response.processing_log.append(basis + f"; {len(plan)} sections marked approximate")
+
+    @staticmethod
+    def _plan_variants(plan: List[Tuple[str, str]], request: DataFileRequest, df: pd.DataFrame,
+                       artifacts: ColumnArtifacts, budget_ms: Optional[float],
+                       response: AnalysisResponse) -> Dict[str, str]:
+        """Выбирает варианты разделов под ограничение времени и записывает выбор в журнал обработки."""
+        if budget_ms is None:
+            return {section: FULL_VARIANT for section, _ in plan}
+        n_columns = len(artifacts.numerical_columns())
+        has_regression_pair = any(analysis.startswith("regression_dependent:") for analysis in request.selected_analyses) and \
+            any(analysis.startswith("regression_independent:") for analysis in request.selected_analyses)
+        n_pairs = 1 if has_regression_pair else n_columns * (n_columns - 1)
+        variants, estimated_ms = choose_section_variants(plan, len(df), n_columns, n_pairs, budget_ms)
+
+        reduced = [f"{section}={variant}" for section, variant in variants.items() if variant != FULL_VARIANT]
+        if reduced:
+            response.processing_log.append(f"Time budget {budget_ms:.0f} ms: using cheaper variants {', '.join(reduced)} "
+                                           f"(estimated {estimated_ms:.0f} ms)")
+        else:
+            response.processing_log.append(f"Time budget {budget_ms:.0f} ms: full analyses fit (estimated {estimated_ms:.0f} ms)")
+        if estimated_ms > budget_ms:
+            response.processing_log.append(f"Warning: Estimated time {estimated_ms:.0f} ms exceeds the time budget "
+                                           f"{budget_ms:.0f} ms even with the cheapest variants")
+        return variants
+
+    def _execute_plan(self, plan: List[Tuple[str, str]], request: DataFileRequest, df: pd.DataFrame,
+                      artifacts: ColumnArtifacts, prepared: Optional[SpeculativeDataset], response: AnalysisResponse,
+                      variants: Optional[Dict[str, str]] = None, dataset_key: Optional[str] = None):
+        """
+        Выполняет разделы плана в выбранных вариантах. Разделы независимы друг от друга, поэтому при наличии пула потоков
+        выполняются одновременно: каждый заполняет собственный частичный ответ, а частичные ответы
+        объединяются в порядке плана, так что порядок результатов и записей журнала не зависит от времени выполнения.
+        """
+        section_runners = {
+            DESCRIPTIVE_STATS_ANALYSIS: self._run_descriptive_stats,
+            NORMALITY_TEST_ANALYSIS: self._run_normality_test,
+            CHI_SQUARE_ANALYSIS: self._run_chi_square,
+            WILCOXON_SIGNED_RANK_ANALYSIS: self._run_wilcoxon_signed_rank,
+            MANN_WHITNEY_ANALYSIS: self._run_mann_whitney,
+            CONFIDENCE_INTERVALS_ANALYSIS: self._run_confidence_intervals,
+            REGRESSION_ANALYSIS: self._run_regression,
+        }
+        if self.section_cache is not None:
+            dataset_key = dataset_key or build_dataset_key(request.file_content, request.file_name)
+            section_runners = {section: functools.partial(self._run_memoized, section, runner, dataset_key)
+                               for section, runner in section_runners.items()}
+        variants = variants or {}
+        if self.section_executor is None or len(plan) < 2:
+            for section, _ in plan:
+                section_runners[section](request, df, artifacts, prepared, response,
+                                         variants.get(section, FULL_VARIANT))
+            return
+
+        submitted = []
+        for section, _ in plan:
+            partial = AnalysisResponse()
+            future = self.section_executor.submit(section_runners[section], request, df, artifacts, prepared, partial,
+                                                  variants.get(section, FULL_VARIANT))
+            submitted.append((partial, future))
+        for partial, future in submitted:
+            # Исключение раздела прерывает сборку ответа так же, как при последовательном выполнении
+            future.result()
+            self._merge_partial_response(response, partial)
+
+    def _run_memoized(self, section: str, runner, dataset_key: str, request: DataFileRequest, df: pd.DataFrame,
+                      artifacts: ColumnArtifacts, prepared: Optional[SpeculativeDataset], response: AnalysisResponse,
+                      variant: str = FULL_VARIANT):
+        """
+        Выполняет раздел с сохранением его частичного ответа (результаты и записи журнала раздела)
+        по ключу build_section_key; если раздел уже вычислялся для тех же данных и параметров, повторяет сохраненный ответ.
+        """
+        section_key = build_section_key(request, section, variant, dataset_key)
+        cached = self.section_cache.get(section_key)
+        if cached is not None:
+            self._merge_partial_response(response, cached)
+            response.processing_log.append(f"Section {section} reused from a previous request (key {section_key[:12]})")
+            return
+
+        partial = AnalysisResponse()
+        runner(request, df, artifacts, prepared, partial, variant)
+        self.section_cache.put(section_key, partial)
+        self._merge_partial_response(response, partial)
+
+    @staticmethod
+    def _merge_partial_response(response: AnalysisResponse, partial: AnalysisResponse):
+        """Добавляет результаты и записи журнала частичного ответа раздела к общему ответу."""
+        for result_field in dataclasses.fields(AnalysisResponse):
+            values = getattr(partial, result_field.name)
+            if isinstance(values, list):
+                getattr(response, result_field.name).extend(values)
+
+    def _run_descriptive_stats(self, request: DataFileRequest, df: pd.DataFrame, artifacts: ColumnArtifacts,
+                               prepared: Optional[SpeculativeDataset], response: AnalysisResponse,
+                               variant: str = FULL_VARIANT):
+        """
+        Описательные статистики и гистограммы. Со столбцом весов статистики заменяются взвешенными
+        (мода остается невзвешенной), а сам столбец весов не входит ни в один из результатов раздела.
+        """
+        quantile_sketch_k = self._parse_quantile_sketch(request, response)
+        histogram_bins = self._parse_histogram_bins(request, response, "histogram_bins:", DEFAULT_HISTOGRAM_BIN_RULE)
+        if quantile_sketch_k is not None or histogram_bins != DEFAULT_HISTOGRAM_BIN_RULE:
+            # Вычисленный заранее раздел построен с параметрами по умолчанию, поэтому этот вариант вычисляется отдельно
+            desc_stats_data, hist_data, desc_logs = self.descriptive_stats.calculate_descriptive_stats(
+                df, artifacts=artifacts, quantile_sketch_k=quantile_sketch_k, histogram_bins=histogram_bins
+            )
+            approximation = self._sketch_approximation(desc_stats_data)
+            if approximation is not None:
+                response.approximations.append(approximation)
+        else:
+            # Возвращает кортеж с тремя элементами вместо четырех
+            desc_stats_data, hist_data, desc_logs = self._run_section(
+                prepared, DESCRIPTIVE_STATS_ANALYSIS,
+                lambda: self.descriptive_stats.calculate_descriptive_stats(df, artifacts=artifacts)
+            )
+        weight_column = self._parse_weight_column(request, df, response)
+        if weight_column is not None:
+            desc_stats_data = [stats_dict for stats_dict in desc_stats_data if stats_dict.get("variable_name") != weight_column]
+            hist_data = [hist_dict for hist_dict in hist_data if hist_dict.get("variable_name") != weight_column]
+
+        # Выбросы для диаграмм размаха по квартилям и моментам описательных статистик (без весов)
+        outlier_data, outlier_logs = self.descriptive_stats.detect_outliers(df, desc_stats_data)
+        desc_logs = desc_logs + outlier_logs
+        encoded = encode_numeric_fields(outlier_data, OUTLIER_FIELDS)
+        for outlier_dict, (values, missing_fields) in zip(outlier_data, encoded):
+            response.outliers.append(OutlierSummary(
+                variable_name=outlier_dict.get("variable_name", ""),
+                iqr_multiplier=outlier_dict.get("iqr_multiplier", 1.5),
+                iqr_outlier_count=outlier_dict.get("iqr_outlier_count", 0),
+                z_threshold=outlier_dict.get("z_threshold", 3.0),
+                z_outlier_count=outlier_dict.get("z_outlier_count", 0),
+                mad_threshold=outlier_dict.get("mad_threshold", 3.5),
+                mad_outlier_count=outlier_dict.get("mad_outlier_count", 0),
+                outlier_rows=outlier_dict.get("outlier_rows", []),
+                outlier_values=outlier_dict.get("outlier_values", []),
+                missing_fields=missing_fields,
+                **values
+            ))
+
+        if weight_column is not None:
+            # Гистограммы и мода остаются невзвешенными, а остальные статистики заменяются взвешенными
+            modes = {stats_dict["variable_name"]: {key: stats_dict[key] for key in MODE_FIELDS if key in stats_dict}
+                     for stats_dict in desc_stats_data}
+            weighted_data, weighted_logs = self.descriptive_stats.calculate_weighted_descriptive_stats(df, weight_column)
+            desc_stats_data = [{**stats_dict, **modes.get(stats_dict["variable_name"], {})} for stats_dict in weighted_data]
+            desc_logs = desc_logs + weighted_logs
+        response.processing_log.extend(desc_logs)
+
+        response.descriptives.extend(self._descriptive_stats_entities(desc_stats_data))
+
+        for hist_dict in hist_data:
+            hist = HistogramData(
+                variable_name=hist_dict.get("variable_name", ""),
+                bins=hist_dict.get("bins", []),
+                frequencies=hist_dict.get("frequencies", []),
+                normal_curve_x=hist_dict.get("normal_curve_x", []),
+                normal_curve_y=hist_dict.get("normal_curve_y", []),
+                kde_x=hist_dict.get("kde_x", []),
+                kde_y=hist_dict.get("kde_y", []),
+                kde_bandwidth=hist_dict.get("kde_bandwidth", 0.0),
+                mean=hist_dict.get("mean", 0.0),
+                std_dev=hist_dict.get("std_dev", 0.0)
+            )
+            response.histograms.append(hist)
+
+        group_column = next((analysis[len("group_by:"):] for analysis in request.selected_analyses
+                             if analysis.startswith("group_by:")), None)
+        if group_column:
+            grouped_data, grouped_logs = self.descriptive_stats.calculate_grouped_descriptive_stats(df, group_column)
+            if weight_column is not None:
+                grouped_data = [stats_dict for stats_dict in grouped_data if stats_dict.get("variable_name") != weight_column]
+            response.processing_log.extend(grouped_logs)
+            for stats_dict, stats in zip(grouped_data, self._descriptive_stats_entities(grouped_data)):
+                response.grouped_descriptives.append(GroupedDescriptiveStats(
+                    group_column=stats_dict.get("group_column", group_column),
+                    group=stats_dict.get("group", ""),
+                    group_size=stats_dict.get("group_size", 0),
+                    statistics=stats
+                ))
+
+    @staticmethod
+    def _descriptive_stats_entities(desc_stats_data: List[Dict[str, Any]]) -> List[DescriptiveStats]:
+        """Описательные статистики из словарей calculate_descriptive_stats (неопределенные значения - в missing_fields)."""
+        encoded = encode_numeric_fields(desc_stats_data, DESCRIPTIVE_FIELDS)
+        return [
+            DescriptiveStats(
+                variable_name=stats_dict.get("variable_name", ""),
+                count=stats_dict.get("count", 0),
+                mode=stats_dict.get("mode", []),
+                mode_frequency=stats_dict.get("mode_frequency", 0),
+                mode_count=stats_dict.get("mode_count", 0),
+                effective_sample_size=stats_dict.get("effective_sample_size", 0.0),
+                missing_fields=missing_fields,
+                **values
+            )
+            for stats_dict, (values, missing_fields) in zip(desc_stats_data, encoded)
+        ]
+
+    def _run_normality_test(self, request: DataFileRequest, df: pd.DataFrame, artifacts: ColumnArtifacts,
+                            prepared: Optional[SpeculativeDataset], response: AnalysisResponse,
+                            variant: str = FULL_VARIANT):
+        """Тест Шапиро-Уилка на нормальность"""
+        if variant == SAMPLED_VARIANT:
+            # Упрощенный вариант не совпадает с вычисленным заранее полным, поэтому вычисляется отдельно
+            normality_results, norm_logs = self.normality_test.perform_normality_test(
+                df, artifacts=artifacts, max_sample_size=DEFAULT_SHAPIRO_SAMPLE_SIZE
+            )
+            sampled_variables = [test_dict.get("variable_name", "") for test_dict in normality_results
+                                 if test_dict.get("sample_size")]
+            if sampled_variables:
+                response.approximations.append(ApproximationInfo(
+                    section=NORMALITY_TEST_ANALYSIS,
+                    variant=SAMPLED_VARIANT,
+                    description=f"Shapiro-Wilk test on a random sample of {DEFAULT_SHAPIRO_SAMPLE_SIZE} values",
+                    variables=sampled_variables,
+                    sample_size=DEFAULT_SHAPIRO_SAMPLE_SIZE
+                ))
+        else:
+            normality_results, norm_logs = self._run_section(
+                prepared, NORMALITY_TEST_ANALYSIS,
+                lambda: self.normality_test.perform_normality_test(df, artifacts=artifacts) # alpha по умолчанию 0.05
+            )
+        response.processing_log.extend(norm_logs)
+        encoded = encode_numeric_fields(normality_results, NORMALITY_FIELDS)
+        for test_dict, (values, missing_fields) in zip(normality_results, encoded):
+            test = NormalityTestResult(
+                variable_name=test_dict.get("variable_name", ""),
+                test_name=test_dict.get("test_name", ""),
+                statistic=values["statistic"],
+                p_value=values["p_value"],
+                # Стандартный alpha = 0.05; если p_value нет, результат считается неопределенным (не нормальным)
+                is_normal="p_value" not in missing_fields and values["p_value"] > 0.05,
+                conclusion=test_dict.get("conclusion", ""), # Оставляем для логов/детальной информации
+                missing_fields=missing_fields
+            )
+            response.normality_tests.append(test)
+
+    def _run_chi_square(self, request: DataFileRequest, df: pd.DataFrame, artifacts: ColumnArtifacts,
+                        prepared: Optional[SpeculativeDataset], response: AnalysisResponse,
+                        variant: str = FULL_VARIANT):
+        """Критерий хи-квадрат Пирсона (по умолчанию выполняется вместе с проверкой нормальности)"""
+        chi2_results, chi2_logs = self._run_section(
+            prepared, CHI_SQUARE_ANALYSIS,
+            lambda: self.goodness_of_fit.perform_chi_square_test(df, artifacts=artifacts) # alpha по умолчанию 0.05
+        )
+        response.processing_log.extend(chi2_logs)
+        encoded = encode_numeric_fields(chi2_results, CHI_SQUARE_FIELDS)
+        for chi2_dict, (values, missing_fields) in zip(chi2_results, encoded):
+            chi2 = PearsonChiSquareResult(
+                variable_name=chi2_dict.get("variable_name", ""),
+                test_name=chi2_dict.get("test_name", ""), # Убедимся, что это поле есть в chi2_dict
+                distribution=chi2_dict.get("distribution", ""),
+                statistic=values["statistic"],
+                p_value=values["p_value"],
+                degrees_of_freedom=int(values["degrees_of_freedom"]),
+                intervals=int(values["intervals"]),
+                is_normal="p_value" not in missing_fields and values["p_value"] > 0.05, # Стандартный alpha = 0.05
+                conclusion=chi2_dict.get("conclusion", ""), # Оставляем для логов
+                missing_fields=missing_fields
+            )
+            response.pearson_chi_square_results.append(chi2)
+
+    def _run_wilcoxon_signed_rank(self, request: DataFileRequest, df: pd.DataFrame, artifacts: ColumnArtifacts,
+                                  prepared: Optional[SpeculativeDataset], response: AnalysisResponse,
+                                  variant: str = FULL_VARIANT):
+        """Тест знаковых рангов Вилкоксона"""
+        # Проверяем, указаны ли переменные для сравнения
+        var1 = None
+        var2 = None
+
+        # Извлекаем имена переменных из списка selected_analyses
+        for analysis in request.selected_analyses:
+            if analysis.startswith("wilcoxon_var1:"):
+                var1 = analysis[len("wilcoxon_var1:"):]
+            elif analysis.startswith("wilcoxon_var2:"):
+                var2 = analysis[len("wilcoxon_var2:"):]
+
+        # Выполняем тест Вилкоксона
+        wilcoxon_results, wilc_logs = self.wilcoxon_test.perform_wilcoxon_signed_rank_test(
+            df, var1=var1, var2=var2
+        )
+        response.processing_log.extend(wilc_logs)
+
+        encoded = encode_numeric_fields(wilcoxon_results, WILCOXON_FIELDS)
+        for wilc_dict, (values, missing_fields) in zip(wilcoxon_results, encoded):
+            wilc_test = WilcoxonTestResult(
+                test_type=wilc_dict.get("test_type", "Wilcoxon signed-rank test"),
+                variable1=wilc_dict.get("variable1", ""),
+                variable2=wilc_dict.get("variable2", ""),
+                conclusion=wilc_dict.get("conclusion", ""),
+                sample_size=wilc_dict.get("sample_size", 0),
+                missing_fields=missing_fields,
+                **values
+            )
+            response.wilcoxon_signed_rank_tests.append(wilc_test)
+
+    def _run_mann_whitney(self, request: DataFileRequest, df: pd.DataFrame, artifacts: ColumnArtifacts,
+                          prepared: Optional[SpeculativeDataset], response: AnalysisResponse,
+                          variant: str = FULL_VARIANT):
+        """Тест Манна-Уитни"""
+        # Проверяем, указаны ли переменные для теста
+        group_column = None
+        value_column = None
+
+        # Извлекаем имена переменных из списка selected_analyses
+        for analysis in request.selected_analyses:
+            if analysis.startswith("mann_whitney_group:"):
+                group_column = analysis[len("mann_whitney_group:"):]
+            elif analysis.startswith("mann_whitney_value:"):
+                value_column = analysis[len("mann_whitney_value:"):]
+
+        # Проверяем, что указаны обе переменные
+        if group_column is not None and value_column is not None:
+            # Выполняем тест Манна-Уитни
+            mw_results, mw_logs = self.wilcoxon_test.perform_mann_whitney_test(
+                df, group_column=group_column, value_column=value_column
+            )
+            response.processing_log.extend(mw_logs)
+
+            encoded = encode_numeric_fields(mw_results, MANN_WHITNEY_FIELDS)
+            for mw_dict, (values, missing_fields) in zip(mw_results, encoded):
+                mw_test = MannWhitneyTestResult(
+                    test_type=mw_dict.get("test_type", "Mann-Whitney U test"),
+                    group_column=mw_dict.get("group_column", ""),
+                    value_column=mw_dict.get("value_column", ""),
+                    group1=mw_dict.get("group1", ""),
+                    group2=mw_dict.get("group2", ""),
+                    group1_size=mw_dict.get("group1_size", 0),
+                    group2_size=mw_dict.get("group2_size", 0),
+                    conclusion=mw_dict.get("conclusion", ""),
+                    missing_fields=missing_fields,
+                    **values
+                )
+                response.mann_whitney_tests.append(mw_test)
+        else:
+            response.processing_log.append("Mann-Whitney test requires both group_column and value_column parameters")
+
+    def _run_confidence_intervals(self, request: DataFileRequest, df: pd.DataFrame, artifacts: ColumnArtifacts,
+                                  prepared: Optional[SpeculativeDataset], response: AnalysisResponse,
+                                  variant: str = FULL_VARIANT):
+        """Доверительные интервалы (по умолчанию выполняются вместе с описательными статистиками)"""
+        # Для выборки строк интервалы учитывают поправку на конечную совокупность
+        population_size = df.attrs.get("sampling", {}).get("population_size")
+        weight_column = self._parse_weight_column(request, df, response)
+        if weight_column is not None:
+            ci_results, ci_logs = self.confidence_interval.calculate_weighted_confidence_intervals(
+                df, weight_column, population_size=population_size)
+        else:
+            ci_results, ci_logs = self._run_section(
+                prepared, CONFIDENCE_INTERVALS_ANALYSIS,
+                lambda: self.confidence_interval.calculate_confidence_intervals(
+                    df, artifacts=artifacts, population_size=population_size)
+            )
+        response.processing_log.extend(ci_logs)
+        encoded = encode_numeric_fields(ci_results, CONFIDENCE_INTERVAL_FIELDS)
+        for ci_dict, (values, missing_fields) in zip(ci_results, encoded):
+            ci = ConfidenceInterval(
+                variable_name=ci_dict.get("variable_name", ""),
+                statistic_name=ci_dict.get("statistic_name", ""),
+                confidence_level=ci_dict.get("confidence_level", 0.95),
+                effective_sample_size=ci_dict.get("effective_sample_size", 0.0),
+                missing_fields=missing_fields,
+                **values
+            )
+            response.confidence_intervals.append(ci)
+
+    def _run_regression(self, request: DataFileRequest, df: pd.DataFrame, artifacts: ColumnArtifacts,
+                        prepared: Optional[SpeculativeDataset], response: AnalysisResponse,
+                        variant: str = FULL_VARIANT):
+        """Регрессионный анализ и анализ остатков"""
+        # Check for specified regression variables
+        dependent_var = None
+        independent_var = None
+        max_points = None
+        downsample_method = "lttb"
+        aggregation = None
+        aggregation_bins = None
+
+        # Extract variable names from selected_analyses
+        for analysis in request.selected_analyses:
+            if analysis.startswith("regression_dependent:"):
+                dependent_var = analysis[len("regression_dependent:"):]
+            elif analysis.startswith("regression_independent:"):
+                independent_var = analysis[len("regression_independent:"):]
+            elif analysis.startswith("regression_max_points:"):
+                try:
+                    max_points = max(0, int(analysis[len("regression_max_points:"):]))
+                except ValueError:
+                    response.processing_log.append(f"Warning: Invalid chart point budget '{analysis}', using default")
+            elif analysis.startswith("regression_downsample:"):
+                downsample_method = analysis[len("regression_downsample:"):]
+            elif analysis.startswith("regression_aggregation:"):
+                aggregation = analysis[len("regression_aggregation:"):] or None
+            elif analysis.startswith("regression_bins:"):
+                try:
+                    aggregation_bins = max(1, int(analysis[len("regression_bins:"):]))
+                except ValueError:
+                    response.processing_log.append(f"Warning: Invalid density bin count '{analysis}', using default")
+
+        residual_histogram_bins = self._parse_histogram_bins(request, response, "residual_histogram_bins:",
+                                                             DEFAULT_RESIDUAL_HISTOGRAM_BINS)
+
+        # Perform regression with specified variables if provided
+        reg_results, reg_logs = self.regression.perform_simple_linear_regression(
+            df, dependent_var=dependent_var, independent_var=independent_var,
+            max_points=max_points, downsample_method=downsample_method,
+            aggregation=aggregation, aggregation_bins=aggregation_bins,
+            linear_only=(variant == LINEAR_ONLY_VARIANT),
+            max_fit_restarts=0 if variant == SINGLE_START_VARIANT else None
+        )
+        response.processing_log.extend(reg_logs)
+        if variant == LINEAR_ONLY_VARIANT:
+            response.approximations.append(ApproximationInfo(
+                section=REGRESSION_ANALYSIS,
+                variant=LINEAR_ONLY_VARIANT,
+                description="Only the linear model was fitted; nonlinear models were skipped"
+            ))
+        elif variant == SINGLE_START_VARIANT:
+            response.approximations.append(ApproximationInfo(
+                section=REGRESSION_ANALYSIS,
+                variant=SINGLE_START_VARIANT,
+                description="Nonlinear models were fitted from a single starting point without restarts"
+            ))
+
+        # Коэффициенты всех моделей проверяются на пропуски одной матрицей
+        coef_lists = [reg_dict.get("coefficients", []) for reg_dict in reg_results]
+        encoded_coefficients = iter(encode_numeric_fields(
+            [coef_dict for coef_list in coef_lists for coef_dict in coef_list], COEFFICIENT_FIELDS))
+        encoded = encode_numeric_fields(reg_results, REGRESSION_FIELDS)
+        for reg_dict, coef_list, (values, missing_fields) in zip(reg_results, coef_lists, encoded):
+            reg = RegressionResult(
+                dependent_variable=reg_dict.get("dependent_variable", ""),
+                independent_variables=reg_dict.get("independent_variables", []),
+                data_points=reg_dict.get("data_points", []),
+                residuals=reg_dict.get("residuals", []),  # Добавляем остатки регрессии
+                fitted_curve=reg_dict.get("fitted_curve", []),
+                density=reg_dict.get("density", {}),
+                missing_fields=missing_fields,
+                **values
+            )
+            # Установка типа модели
+            if "model_type" in reg_dict:
+                reg.model_type = reg_dict["model_type"]
+
+            for coef_dict, (coef_values, coef_missing_fields) in zip(coef_list, encoded_coefficients):
+                coef = RegressionCoefficient(
+                    variable_name=coef_dict.get("variable_name", ""),
+                    missing_fields=coef_missing_fields,
+                    **coef_values
+                )
+                reg.coefficients.append(coef)
+
+            # Анализ остатков регрессии, если есть остатки
+            if reg.residuals:
+                residuals_analysis_result = self.residuals_analysis.analyze_residuals(
+                    reg.residuals, histogram_bins=residual_histogram_bins)
+                reg.residuals_analysis = residuals_analysis_result
+                response.processing_log.append(f"Performed residuals analysis for {reg.dependent_variable} ~ {', '.join(reg.independent_variables)}")
+
+            response.regressions.append(reg)
@@ -0,0 +1,83 @@
+import logging
+from typing import Iterable, List, Optional
+
+# Уровни подробности журнала обработки, передаваемые в selected_analyses как "log_level:<уровень>"
+PROCESSING_LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+DEFAULT_PROCESSING_LOG_LEVEL = "info"
+DEFAULT_MAX_LOG_ENTRIES = 200
+DEFAULT_MAX_ENTRY_LENGTH = 500
+
+
+def infer_log_level(message: str) -> int:
+    """
+    Определяет уровень записи, возвращаемой модулями анализа в виде строки, по ее префиксу.
+    Записи с префиксом "Debug:" считаются отладочными.
+    """
+    head = message.lstrip()[:8].lower()
+    if head.startswith("error"):
+        return logging.ERROR
+    if head.startswith("warning"):
+        return logging.WARNING
+    if head.startswith("debug"):
+        return logging.DEBUG
+    return logging.INFO
+
+
+class ProcessingLog(list):
+    """
+    Журнал обработки запроса, возвращаемый клиенту в processing_log.
+    Записи ниже заданного уровня отбрасываются, длинные записи обрезаются,
+    а количество записей ограничено. Предупреждения и ошибки сохраняются и сверх лимита,
+    ошибки (вместе со стеком вызовов) не обрезаются.
+    """
+
+    def __init__(self, level: str = DEFAULT_PROCESSING_LOG_LEVEL,
+                 max_entries: int = DEFAULT_MAX_LOG_ENTRIES,
+                 max_entry_length: int = DEFAULT_MAX_ENTRY_LENGTH):
+        """
+        Args:
+            level: Минимальный уровень записей ("debug", "info", "warning", "error").
+            max_entries: Максимальное количество информационных записей (0 - без ограничения).
+            max_entry_length: Максимальная длина записи, кроме ошибок, в символах (0 - без ограничения).
+        """
+        super().__init__()
+        self.level = PROCESSING_LOG_LEVELS.get(level, logging.INFO)
+        self.max_entries = max_entries
+        self.max_entry_length = max_entry_length
+        self.dropped = 0
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Проверяет, будет ли сохранена запись данного уровня (чтобы не форматировать ее зря)."""
+        return level >= self.level
+
+    def add(self, message: str, level: Optional[int] = None):
+        """Добавляет запись с явно заданным или определенным по префиксу уровнем."""
+        if level is None:
+            level = infer_log_level(message)
+        if level < self.level:
+            return
+        if self.max_entries and len(self) >= self.max_entries and level < logging.WARNING:
+            self.dropped += 1
+            return
+        if self.max_entry_length and len(message) > self.max_entry_length and level < logging.ERROR:
+            message = message[:self.max_entry_length] + f"... [truncated {len(message) - self.max_entry_length} chars]"
+        super().append(message)
+
+    def append(self, message: str):
+        self.add(message)
+
+    def extend(self, messages: Iterable[str]):
+        for message in messages:
+            self.add(message)
+
+    def finalize(self) -> List[str]:
+        """Возвращает записи обычным списком с пометкой о пропущенных записях."""
+        entries = list(self)
+        if self.dropped:
+            entries.append(f"Processing log truncated: {self.dropped} entries omitted (limit {self.max_entries})")
+        return entries
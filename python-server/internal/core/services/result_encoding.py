@@ -0,0 +1,45 @@
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+# Числовые поля результатов, проверяемые на пропуски при формировании ответа
+DESCRIPTIVE_FIELDS = ("mean", "median", "variance", "std_dev", "variation_coefficient", "skewness", "kurtosis",
+                      "min_value", "max_value", "q1", "q3", "iqr")
+NORMALITY_FIELDS = ("statistic", "p_value")
+CHI_SQUARE_FIELDS = ("statistic", "p_value", "degrees_of_freedom", "intervals")
+WILCOXON_FIELDS = ("statistic", "p_value")
+MANN_WHITNEY_FIELDS = ("group1_median", "group2_median", "statistic", "p_value")
+CONFIDENCE_INTERVAL_FIELDS = ("point_estimate", "lower_bound", "upper_bound")
+OUTLIER_FIELDS = ("lower_fence", "upper_fence", "lower_whisker", "upper_whisker", "z_lower_bound", "z_upper_bound",
+                  "mad", "mad_lower_bound", "mad_upper_bound")
+REGRESSION_FIELDS = ("r_squared", "adjusted_r_squared", "f_statistic", "f_p_value", "sse")
+COEFFICIENT_FIELDS = ("coefficient", "standard_error", "t_statistic", "p_value",
+                      "confidence_interval_lower", "confidence_interval_upper")
+
+
+def encode_numeric_fields(records: Sequence[Dict[str, Any]], fields: Sequence[str],
+                          missing_value: float = 0.0) -> List[Tuple[Dict[str, float], List[str]]]:
+    """
+    Подготавливает числовые поля результатов к передаче клиенту одной операцией над массивом:
+    значения всех записей собираются в матрицу (записи x поля), пропуски (None, NaN) заменяются
+    на missing_value, а имена таких полей возвращаются отдельно, чтобы клиент мог
+    отличить отсутствующее значение от настоящего нуля.
+
+    Args:
+        records: Словари результатов модуля анализа.
+        fields: Имена числовых полей (отсутствующий в словаре ключ считается пропуском).
+        missing_value: Значение, передаваемое вместо пропуска.
+
+    Returns:
+        Для каждой записи кортеж (словарь значений полей в виде float, список имен пропущенных полей).
+    """
+    if not records:
+        return []
+    matrix = np.array([[record.get(name) for name in fields] for record in records], dtype=float)
+    missing = np.isnan(matrix)
+    matrix[missing] = missing_value
+
+    missing_fields: List[List[str]] = [[] for _ in records]
+    for row, column in zip(*np.nonzero(missing)):
+        missing_fields[row].append(fields[column])
+    return [(dict(zip(fields, values)), names) for values, names in zip(matrix.tolist(), missing_fields)]
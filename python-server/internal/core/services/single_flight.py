@@ -0,0 +1,63 @@
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class _InFlightCall:
+    """Состояние выполняющегося вызова, которого ожидают дублирующие запросы"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Объединение одновременных одинаковых запросов (single-flight).
+    Первый запрос с данным ключом выполняет вычисление, остальные ожидают его завершения
+    и получают тот же результат (или то же исключение).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _InFlightCall] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Выполняет fn() не более одного раза для одновременных вызовов с одинаковым ключом.
+
+        Args:
+            key: Ключ запроса.
+            fn: Функция, выполняющая вычисление.
+
+        Returns:
+            Кортеж (результат, признак того, что результат получен от другого выполняющегося вызова).
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _InFlightCall()
+                self._calls[key] = call
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self) -> int:
+        """Возвращает количество выполняющихся в данный момент уникальных вызовов."""
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,114 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+
+def _lower_thread_priority():
+    """Понижает приоритет текущего потока планировщика ОС (на Linux niceness задается для потока)."""
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (AttributeError, OSError):
+        pass
+
+
+class SpeculativeDataset:
+    """Разобранный набор данных и фоновые вычисления, запущенные для него заранее"""
+
+    def __init__(self, df: pd.DataFrame, load_logs: List[str], artifacts: Optional[Any] = None):
+        self.df = df
+        self.load_logs = list(load_logs)
+        # Промежуточные результаты по столбцам, общие для фоновых и последующих вычислений
+        self.artifacts = artifacts
+        self.sections: Dict[str, Future] = {}
+        self.created_at = time.monotonic()
+
+    def take_section(self, section: str, compute: Callable[[], Any]) -> Any:
+        """
+        Возвращает результат заранее запущенного вычисления раздела.
+        Если вычисление еще не начиналось, оно отменяется и выполняется сразу в текущем потоке;
+        если уже выполняется - дожидаемся его, это быстрее повторного расчета.
+        """
+        future = self.sections.get(section)
+        if future is None or future.cancel():
+            return compute()
+        return future.result()
+
+
+class SpeculativeAnalysisStore:
+    """
+    Хранилище наборов данных, разобранных при запросе списка столбцов (get_columns).
+    Для каждого набора в фоне с низким приоритетом вычисляются разделы, не зависящие от параметров
+    пользователя, чтобы последующий запрос анализа получил их готовыми.
+    """
+
+    def __init__(self, max_datasets: int = 4, ttl_seconds: float = 600.0, workers: int = 1):
+        """
+        Args:
+            max_datasets: Максимальное количество хранимых наборов данных (вытесняются давно использованные).
+            ttl_seconds: Время жизни набора данных в секундах.
+            workers: Количество фоновых потоков.
+        """
+        self.max_datasets = max_datasets
+        self.ttl_seconds = ttl_seconds
+        self._datasets: "OrderedDict[str, SpeculativeDataset]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="speculative",
+            initializer=_lower_thread_priority
+        )
+
+    def prepare(self, dataset_key: str, df: pd.DataFrame, load_logs: List[str],
+                sections: Dict[str, Callable[[pd.DataFrame], Any]], artifacts: Optional[Any] = None) -> bool:
+        """
+        Сохраняет набор данных и ставит в очередь фоновые вычисления разделов.
+
+        Args:
+            dataset_key: Ключ набора данных (хэш содержимого и формат файла).
+            df: Разобранный DataFrame.
+            load_logs: Логи загрузки, которые будут добавлены в ответ последующего анализа.
+            sections: Имя раздела -> функция вычисления раздела по DataFrame.
+            artifacts: Промежуточные результаты по столбцам, используемые функциями разделов.
+
+        Returns:
+            True, если набор данных добавлен; False, если он уже был подготовлен ранее.
+        """
+        with self._lock:
+            self._evict_expired()
+            if dataset_key in self._datasets:
+                self._datasets.move_to_end(dataset_key)
+                return False
+            dataset = SpeculativeDataset(df, load_logs, artifacts)
+            for name, compute in sections.items():
+                dataset.sections[name] = self._executor.submit(compute, df)
+            self._datasets[dataset_key] = dataset
+            while len(self._datasets) > self.max_datasets:
+                _, evicted = self._datasets.popitem(last=False)
+                self._cancel(evicted)
+        return True
+
+    def get(self, dataset_key: str) -> Optional[SpeculativeDataset]:
+        """Возвращает подготовленный набор данных или None."""
+        with self._lock:
+            self._evict_expired()
+            dataset = self._datasets.get(dataset_key)
+            if dataset is not None:
+                self._datasets.move_to_end(dataset_key)
+            return dataset
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        expired = [key for key, dataset in self._datasets.items()
+                   if now - dataset.created_at > self.ttl_seconds]
+        for key in expired:
+            self._cancel(self._datasets.pop(key))
+
+    @staticmethod
+    def _cancel(dataset: SpeculativeDataset):
+        for future in dataset.sections.values():
+            future.cancel()
@@ -0,0 +1,55 @@
+import json
+import logging
+import os
+import sys
+from datetime import datetime, timezone
+
+LOG_FORMATS = ("text", "json")
+
+# Атрибуты LogRecord, которые не считаются пользовательскими полями (extra=...)
+_STANDARD_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Форматирует записи журнала в одну строку JSON.
+    Поля, переданные через extra=..., попадают в запись как отдельные ключи.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "pid": record.process,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def configure_logging(level: str = "INFO", fmt: str = "text"):
+    """
+    Настраивает корневой логгер сервера.
+
+    Args:
+        level: Минимальный уровень записей (DEBUG, INFO, WARNING, ERROR).
+            Переменная окружения LOG_LEVEL имеет приоритет.
+        fmt: "text" - человекочитаемые строки, "json" - одна JSON-запись на строку.
+    """
+    level = os.environ.get("LOG_LEVEL", level).upper()
+    handler = logging.StreamHandler(sys.stdout)
+    if fmt == "json":
+        handler.setFormatter(StructuredFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(process)d] %(name)s: %(message)s"))
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(getattr(logging, level, logging.INFO))
@@ -2,12 +2,18 @@
 Основной файл для запуска Python gRPC сервера.
 """
 
+import argparse
+import logging
+import multiprocessing
+import os
 import sys
 import signal
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Импортируем инфраструктуру
 from internal.adapters.grpc_server import GrpcServer
+from internal.adapters.prefork_server import PreforkGrpcServer
 from internal.adapters.data_loader import FileDataLoader
 from internal.adapters.descriptive_stats import DescriptiveStatsAdapter
 from internal.adapters.normality_test import NormalityTestAdapter
@@ -16,61 +22,198 @@ from internal.adapters.goodness_of_fit import GoodnessOfFitAdapter
 from internal.adapters.regression import RegressionAdapter
 from internal.adapters.residuals_analysis import ResidualsAnalysisAdapter
 from internal.adapters.wilcoxon_test import WilcoxonTestAdapter
+from internal.adapters.result_cache import TieredResultCache
+from internal.adapters.dataset_store import FileDatasetStore
+from internal.logging_config import configure_logging, LOG_FORMATS
 
 # Импортируем сервисный слой
 from internal.core.services.analysis_service import AnalysisService
+from internal.core.services.speculative import SpeculativeAnalysisStore
+from internal.core.services.processing_log import DEFAULT_MAX_LOG_ENTRIES
+from analysis_modules.column_partition import ColumnWorkerPool, DEFAULT_COLUMN_CHUNK_SIZE
+
+logger = logging.getLogger("analysis_server")
+
+
+def default_column_processes(workers: int) -> int:
+    """
+    Количество процессов постолбцовых анализов по умолчанию: процессоры делятся между рабочими
+    процессами сервера. Пул меньше двух процессов только добавляет накладные расходы на передачу
+    порций, поэтому в этом случае столбцы обрабатываются в текущем процессе (0).
+    """
+    processes = (os.cpu_count() or 1) // max(1, workers)
+    return processes if processes >= 2 else 0
+
+
+def build_analysis_service(args: argparse.Namespace) -> AnalysisService:
+    """Создает сервис анализа со всеми адаптерами."""
+    # Создаем экземпляры адаптеров (вторичных)
+    data_loader = FileDataLoader()
+    # Широкие наборы данных обрабатываются порциями столбцов в отдельном пуле процессов
+    column_executor = None
+    column_processes = args.column_processes
+    if column_processes is None:
+        column_processes = default_column_processes(args.workers)
+    if column_processes > 0:
+        column_executor = ColumnWorkerPool(column_processes, mp_context=multiprocessing.get_context("spawn"))
+    column_options = {"column_executor": column_executor, "column_chunk_size": args.column_chunk_size}
+    descriptive_stats = DescriptiveStatsAdapter(**column_options)
+    normality_test = NormalityTestAdapter(**column_options)
+    confidence_interval = ConfidenceIntervalAdapter(**column_options)
+    goodness_of_fit = GoodnessOfFitAdapter(**column_options)
+    # Процессы для подгонки моделей запускаются через spawn: fork процесса с потоками gRPC небезопасен
+    fit_executor = None
+    if args.fit_processes > 0:
+        fit_executor = ProcessPoolExecutor(max_workers=args.fit_processes,
+                                           mp_context=multiprocessing.get_context("spawn"))
+    regression = RegressionAdapter(fit_executor=fit_executor)
+    residuals_analysis = ResidualsAnalysisAdapter()
+    wilcoxon_test = WilcoxonTestAdapter()
+
+    result_cache = None
+    if args.cache_size > 0 or args.cache_dir:
+        result_cache = TieredResultCache(
+            max_entries=args.cache_size,
+            disk_dir=args.cache_dir,
+            disk_ttl_seconds=args.cache_ttl,
+            disk_max_bytes=int(args.cache_dir_mb * 1024 * 1024)
+        )
+
+    section_cache = None
+    if args.section_cache_size > 0 or args.cache_dir:
+        section_cache = TieredResultCache(
+            max_entries=args.section_cache_size,
+            disk_dir=os.path.join(args.cache_dir, "sections") if args.cache_dir else None,
+            disk_ttl_seconds=args.cache_ttl,
+            max_bytes=int(args.section_cache_mb * 1024 * 1024),
+            disk_max_bytes=int(args.cache_dir_mb * 1024 * 1024)
+        )
+
+    speculative_store = SpeculativeAnalysisStore() if args.speculative else None
+
+    section_executor = None
+    if args.section_threads > 1:
+        section_executor = ThreadPoolExecutor(max_workers=args.section_threads, thread_name_prefix="section")
+
+    # Создаем экземпляр сервиса анализа
+    return AnalysisService(
+        data_loader=data_loader,
+        descriptive_stats=descriptive_stats,
+        normality_test=normality_test,
+        confidence_interval=confidence_interval,
+        goodness_of_fit=goodness_of_fit,
+        regression=regression,
+        residuals_analysis=residuals_analysis,
+        wilcoxon_test=wilcoxon_test,
+        result_cache=result_cache,
+        speculative_store=speculative_store,
+        max_log_entries=args.processing_log_limit,
+        section_executor=section_executor,
+        section_cache=section_cache,
+        dataset_store=FileDatasetStore(max_entries=args.dataset_store_size, disk_dir=args.dataset_dir)
+    )
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Разбирает аргументы командной строки."""
+    parser = argparse.ArgumentParser(description="Python Analysis Server")
+    parser.add_argument("--host", default="[::]:9000",
+                        help="Адрес и порт для прослушивания (по умолчанию [::]:9000)")
+    parser.add_argument("--threads", type=int, default=10,
+                        help="Количество потоков gRPC в каждом процессе")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Количество процессов сервера на общем порту (SO_REUSEPORT). 1 - однопроцессный режим")
+    parser.add_argument("--max-requests", type=int, default=0,
+                        help="Перезапускать рабочий процесс после указанного числа запросов (0 - не перезапускать)")
+    parser.add_argument("--max-rss-mb", type=float, default=0.0,
+                        help="Перезапускать рабочий процесс при превышении резидентной памяти в МБ (0 - не проверять)")
+    parser.add_argument("--cache-size", type=int, default=32,
+                        help="Количество результатов анализа в LRU-кэше в памяти (0 - отключить)")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Каталог для дискового кэша результатов (по умолчанию отключен)")
+    parser.add_argument("--cache-ttl", type=float, default=24 * 3600,
+                        help="Время жизни записей дискового кэша в секундах")
+    parser.add_argument("--cache-dir-mb", type=float, default=1024,
+                        help="Суммарный размер записей дискового кэша в МБ, отдельно для ответов и для разделов (0 - без ограничения)")
+    parser.add_argument("--dataset-dir", default=None,
+                        help="Каталог для хранения пополняемых наборов данных (AppendRows); общий для рабочих процессов")
+    parser.add_argument("--dataset-store-size", type=int, default=16,
+                        help="Количество пополняемых наборов данных в памяти процесса")
+    parser.add_argument("--section-cache-size", type=int, default=128,
+                        help="Количество результатов отдельных разделов анализа в LRU-кэше в памяти (0 - отключить)")
+    parser.add_argument("--section-cache-mb", type=float, default=64,
+                        help="Суммарный размер результатов разделов в LRU-кэше в памяти в МБ (0 - без ограничения)")
+    parser.add_argument("--speculative", action="store_true",
+                        help="После запроса списка столбцов заранее вычислять в фоне описательные статистики, "
+                             "доверительные интервалы и тесты на нормальность")
+    parser.add_argument("--section-threads", type=int, default=4,
+                        help="Количество потоков для одновременного выполнения независимых разделов запроса (1 - последовательно)")
+    parser.add_argument("--fit-processes", type=int, default=2,
+                        help="Количество процессов для параллельной подгонки нелинейных регрессий на крупных выборках (0 - без процессов)")
+    parser.add_argument("--column-processes", type=int, default=None,
+                        help="Количество процессов для постолбцовых анализов широких наборов данных в каждом рабочем процессе "
+                             "(0 - без процессов; по умолчанию число процессоров, деленное на --workers, или 0, если получается меньше 2)")
+    parser.add_argument("--column-chunk-size", type=int, default=DEFAULT_COLUMN_CHUNK_SIZE,
+                        help="Количество столбцов в одной порции; наборы с меньшим числом числовых столбцов обрабатываются в текущем процессе")
+    parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="Уровень журнала сервера (переменная окружения LOG_LEVEL имеет приоритет)")
+    parser.add_argument("--log-format", default="text", choices=LOG_FORMATS,
+                        help="Формат журнала сервера: text или json (одна запись на строку)")
+    parser.add_argument("--processing-log-limit", type=int, default=DEFAULT_MAX_LOG_ENTRIES,
+                        help="Максимальное количество записей processing_log в ответе (0 - без ограничения)")
+    return parser.parse_args(argv)
+
+
+def run_prefork(args: argparse.Namespace):
+    """Запускает многопроцессный режим с общим портом и перезапуском рабочих процессов."""
+    server = PreforkGrpcServer(
+        service_factory=lambda: build_analysis_service(args),
+        host=args.host,
+        workers=args.workers,
+        threads_per_worker=args.threads,
+        max_requests=args.max_requests,
+        max_rss_mb=args.max_rss_mb
+    )
+    server.serve()
+
 
 def main():
     """Основная функция для запуска сервера."""
-    print("--- Starting Python Analysis Server ---")
-    
+    args = parse_args()
+    configure_logging(args.log_level, args.log_format)
+    logger.info("Starting Python Analysis Server")
+
     try:
-        # Создаем экземпляры адаптеров (вторичных)
-        data_loader = FileDataLoader()
-        descriptive_stats = DescriptiveStatsAdapter()
-        normality_test = NormalityTestAdapter()
-        confidence_interval = ConfidenceIntervalAdapter()
-        goodness_of_fit = GoodnessOfFitAdapter()
-        regression = RegressionAdapter()
-        residuals_analysis = ResidualsAnalysisAdapter()
-        wilcoxon_test = WilcoxonTestAdapter()
-        
-        # Создаем экземпляр сервиса анализа
-        analysis_service = AnalysisService(
-            data_loader=data_loader,
-            descriptive_stats=descriptive_stats,
-            normality_test=normality_test,
-            confidence_interval=confidence_interval,
-            goodness_of_fit=goodness_of_fit,
-            regression=regression,
-            residuals_analysis=residuals_analysis,
-            wilcoxon_test=wilcoxon_test
-        )
-        
+        if args.workers > 1:
+            run_prefork(args)
+            return
+
+        analysis_service = build_analysis_service(args)
+
         # Создаем и запускаем gRPC сервер
-        server = GrpcServer(analysis_service)
+        server = GrpcServer(analysis_service, host=args.host, max_workers=args.threads)
         server.start()
-        
+
         # Настраиваем обработку сигналов для грациозного завершения
         def handle_signal(signum, frame):
-            print(f"Received signal {signum}, shutting down...")
+            logger.info("Received signal %d, shutting down...", signum)
             server.stop()
             sys.exit(0)
-        
+
         signal.signal(signal.SIGINT, handle_signal)
         signal.signal(signal.SIGTERM, handle_signal)
-        
+
         # Блокируем основной поток до сигнала завершения
         try:
             while True:
                 time.sleep(86400)  # 24 часа или любой другой большой интервал
         except KeyboardInterrupt:
             server.stop()
-            print("--- Server stopped by keyboard interrupt ---")
-            
+            logger.info("Server stopped by keyboard interrupt")
+
     except Exception as e:
-        print(f"--- Error starting server: {e} ---")
+        logger.exception("Error starting server: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
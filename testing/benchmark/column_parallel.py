@@ -0,0 +1,96 @@
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+# Модули анализа импортируются из каталога python-server
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "python-server"))
+
+from analysis_modules.column_artifacts import ColumnArtifacts
+from analysis_modules.column_partition import ColumnWorkerPool, map_column_chunks
+from analysis_modules.confidence_interval import calculate_confidence_intervals
+from analysis_modules.descriptive import calculate_descriptive_stats
+from analysis_modules.goodness_of_fit import perform_chi_square_test
+from analysis_modules.normality import perform_normality_test
+
+PER_COLUMN_ANALYSES = (
+    calculate_descriptive_stats,
+    perform_normality_test,
+    perform_chi_square_test,
+    calculate_confidence_intervals,
+)
+
+
+def generate_wide_dataset(n_columns: int, n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """Синтетический набор данных: столбцы с нормальным, равномерным и логнормальным распределениями."""
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for i in range(n_columns):
+        kind = i % 3
+        if kind == 0:
+            columns[f"norm_{i}"] = rng.normal(loc=i, scale=1.0 + i % 5, size=n_rows)
+        elif kind == 1:
+            columns[f"unif_{i}"] = rng.uniform(0.0, 10.0, size=n_rows)
+        else:
+            columns[f"lognorm_{i}"] = rng.lognormal(mean=0.0, sigma=0.5, size=n_rows)
+    return pd.DataFrame(columns)
+
+
+def run_analyses(df: pd.DataFrame, executor=None, chunk_size: int = 64):
+    """Выполняет все постолбцовые анализы так же, как сервис (с общими промежуточными результатами)."""
+    artifacts = ColumnArtifacts(df)
+    results = []
+    for func in PER_COLUMN_ANALYSES:
+        part = map_column_chunks(func, df, artifacts=artifacts, executor=executor, chunk_size=chunk_size)
+        # Журнал обработки отличается строкой о разбиении, сравниваются только результаты
+        results.append(part[:-1])
+    return results
+
+
+def timed(fn, datasets: List[pd.DataFrame]):
+    """Лучшее время по наборам данных; каждый повтор использует новый набор, чтобы не попадать в кэш рабочих процессов."""
+    best = float("inf")
+    result = None
+    for df in datasets:
+        start = time.perf_counter()
+        result = fn(df)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ускорение постолбцовых анализов при разбиении столбцов по процессам")
+    parser.add_argument("--columns", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[16, 64, 256])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"Строк: {args.rows}, процессов: {args.processes}, повторов: {args.repeats} (лучшее время)")
+    print(f"{'столбцов':>9} {'порция':>7} {'последовательно, с':>20} {'параллельно, с':>15} {'ускорение':>10}")
+
+    with ColumnWorkerPool(args.processes, mp_context=multiprocessing.get_context("spawn")) as executor:
+        # Прогрев: запуск процессов и импорт модулей не входит в измерения
+        run_analyses(generate_wide_dataset(2, 50), executor=executor, chunk_size=1)
+
+        for n_columns in args.columns:
+            datasets = [generate_wide_dataset(n_columns, args.rows, seed=repeat) for repeat in range(args.repeats)]
+            sequential_time, sequential = timed(run_analyses, datasets)
+            for chunk_size in args.chunk_sizes:
+                parallel_time, parallel = timed(
+                    lambda df: run_analyses(df, executor=executor, chunk_size=chunk_size), datasets)
+                if repr(parallel) != repr(sequential):
+                    print(f"Результаты для {n_columns} столбцов (порция {chunk_size}) отличаются от последовательных!")
+                    sys.exit(1)
+                print(f"{n_columns:>9} {chunk_size:>7} {sequential_time:>20.3f} {parallel_time:>15.3f} "
+                      f"{sequential_time / parallel_time:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()